@@ -1,5 +1,6 @@
 from typing import Optional
 from fastapi import Header, HTTPException, Depends
+from backend.services.async_db import async_db
 from backend.services.supabase_service import supabase_service
 
 async def get_current_user(authorization: Optional[str] = Header(None)):
@@ -16,7 +17,7 @@ async def get_current_user(authorization: Optional[str] = Header(None)):
     try:
         # Extract token from 'Bearer <token>'
         token = authorization.split(" ")[1] if " " in authorization else authorization
-        user_response = supabase_service.client.auth.get_user(token)
+        user_response = await async_db.run(supabase_service.client.auth.get_user, token, label="auth.get_user")
         if not user_response.user:
             raise HTTPException(status_code=401, detail="Invalid session")
         return user_response.user
@@ -29,8 +30,8 @@ async def get_org_id(user = Depends(get_current_user)):
     Falls back to fixed_org_id only if profile lookup fails (legacy v0 behavior).
     """
     try:
-        response = (
-            supabase_service.client.table("user_profiles")
+        response = await (
+            async_db.bind(supabase_service.client).table("user_profiles")
             .select("org_id")
             .eq("id", user.id)
             .single()
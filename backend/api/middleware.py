@@ -1,6 +1,7 @@
 from typing import Optional
 from uuid import UUID
 from fastapi import HTTPException, status
+from backend.services.async_db import async_db
 from backend.services.supabase_service import supabase_service
 from backend.models.membership import UserRole, MembershipStatus
 
@@ -25,7 +26,7 @@ async def verify_org_membership(
     Raises:
         HTTPException 403: If membership is invalid or role is insufficient.
     """
-    result = supabase_service.client.table("organization_members")\
+    result = await async_db.bind(supabase_service.client).table("organization_members")\
         .select("*")\
         .eq("user_id", str(user_id))\
         .eq("org_id", str(org_id))\
@@ -1,5 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
 from typing import Any, Dict
+from backend.models.dq import EntityType as DQEntityType
+from backend.services.dq_service import dq_service
+from backend.services.async_db import async_db
 from backend.services.supabase_service import supabase_service
 from backend.agents.graph import agent_executor
 from backend.api.deps import get_org_id
@@ -68,7 +71,7 @@ async def get_weekly_stats(org_id: str = Depends(get_org_id)):
         # Fetch recent leads
         leads = await supabase_service.get_recent_leads(days=7, org_id=org_id)
         # Fetch recent recap
-        recaps = supabase_service.client.table("weekly_recaps")\
+        recaps = await async_db.bind(supabase_service.client).table("weekly_recaps")\
             .select("*")\
             .eq("org_id", org_id)\
             .order("created_at", descending=True)\
@@ -99,6 +102,7 @@ async def update_lead(lead_id: str, data: Dict[str, Any], org_id: str = Depends(
         result = await supabase_service.update_lead_scoped(org_id, lead_id, data)
         if not result:
             raise HTTPException(status_code=404, detail="Lead not found")
+        await dq_service.evaluate_entity_safe(org_id, DQEntityType.LEAD, result)
         return result
     except HTTPException:
         raise
@@ -1,5 +1,5 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from uuid import UUID
 
 from backend.api.deps import get_current_user, get_org_id, check_budget_hard_stop
@@ -7,7 +7,9 @@ from backend.models.dq import (
     DQIssuesResponse, DQMetricsResponse, DQResolveRequest,
     EntityType, IssueStatus
 )
+from backend.models.jobs import JobType
 from backend.services.dq_service import dq_service
+from backend.services.job_queue import job_queue
 
 router = APIRouter()
 
@@ -61,13 +63,19 @@ async def resolve_candidate(
 
 @router.post("/recompute")
 async def recompute_dq(
-    background_tasks: BackgroundTasks,
     org_id: UUID = Depends(get_org_id),
     _ = Depends(check_budget_hard_stop)
 ):
     """
     Trigger a full re-computation of quality issues and duplication candidates.
-    This is an expensive operation and runs in the background.
+    This is an expensive operation and runs as a background job; poll
+    /api/jobs/{job_id} for progress. Repeated calls while a recompute is
+    active return the same job.
     """
-    background_tasks.add_task(dq_service.recompute_all, str(org_id))
-    return {"status": "accepted", "message": "Recompute task queued in background"}
+    job = await job_queue.enqueue(str(org_id), JobType.DQ_RECOMPUTE)
+    return {
+        "status": "accepted",
+        "message": "Recompute task queued in background",
+        "job_id": job.id,
+        "deduplicated": job.deduplicated,
+    }
@@ -9,7 +9,8 @@ from backend.models.finops import (
     BudgetUpdate, 
     UsageEventSchema, 
     UsageEventResponse,
-    AlertResponse
+    AlertResponse,
+    LedgerReconcileResponse,
 )
 from backend.services.finops import finops_service
 
@@ -43,6 +44,18 @@ async def update_budget(
     
     return await finops_service.update_budget_policy(org_id, update_data)
 
+@router.post("/ledger/reconcile", response_model=LedgerReconcileResponse)
+async def reconcile_ledger(
+    month_key: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$"),
+    org_id: str = Depends(get_org_id),
+    current_user = Depends(get_current_user)
+):
+    """
+    Reconcile the monthly cost ledger against raw usage events.
+    Defaults to the current month.
+    """
+    return await finops_service.reconcile_ledger(org_id, month_key=month_key)
+
 @router.get("/usage", response_model=List[UsageEventResponse])
 async def get_usage(
     capability: Optional[str] = None,
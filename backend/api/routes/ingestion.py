@@ -1,6 +1,12 @@
 from typing import Any, Dict, List
 from fastapi import APIRouter, HTTPException, Depends
-from backend.models.ingestion import LeadIngestionPayload, PropertyIngestionPayload
+from backend.models.ingestion import (
+    IngestionBatchResponse,
+    LeadIngestionBatch,
+    LeadIngestionPayload,
+    PropertyIngestionBatch,
+    PropertyIngestionPayload,
+)
 from backend.services.ingestion_service import ingestion_service
 from backend.api.deps import get_org_id
 
@@ -30,6 +36,28 @@ async def ingest_property(payload: PropertyIngestionPayload):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/leads:batch", response_model=IngestionBatchResponse)
+async def ingest_leads_batch(batch: LeadIngestionBatch):
+    """
+    Ingest many leads in one call with bulk dedupe and bulk inserts.
+    Returns a per-item status in input order.
+    """
+    try:
+        return await ingestion_service.ingest_leads_batch(batch.items)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/properties:batch", response_model=IngestionBatchResponse)
+async def ingest_properties_batch(batch: PropertyIngestionBatch):
+    """
+    Ingest many properties in one call with bulk dedupe and bulk inserts.
+    Returns a per-item status in input order.
+    """
+    try:
+        return await ingestion_service.ingest_properties_batch(batch.items)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/events", response_model=List[Dict[str, Any]])
 async def get_events(limit: int = 50, org_id: str = Depends(get_org_id)):
     """
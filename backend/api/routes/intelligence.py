@@ -4,12 +4,15 @@ Endpoints for Intelligence orchestrator
 """
 
 from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
 from datetime import datetime, timezone
+import asyncio
 
 # Import Intelligence
 from ...intelligence import create_orchestrator
+from ...intelligence.audit_sink import close_audit_sink
 from ..deps import check_budget_hard_stop
 
 # Create router
@@ -57,6 +60,13 @@ def get_orchestrator():
     return _orchestrator
 
 
+async def shutdown_intelligence() -> None:
+    """Drain deferred audit writes, then flush and stop the audit sink."""
+    if _orchestrator is not None:
+        await _orchestrator.drain_audits()
+    await asyncio.to_thread(close_audit_sink)
+
+
 # ═══════════════════════════════════════════════════════════════
 # ENDPOINTS
 # ═══════════════════════════════════════════════════════════════
@@ -84,7 +94,7 @@ async def process_query(
         orchestrator = get_orchestrator()
         
         # Process query
-        result, error = orchestrator.process_query(
+        result, error = await orchestrator.process_query_async(
             message=request.message,
             user_id=request.user_id
         )
@@ -124,6 +134,7 @@ async def intelligence_status():
         Status information about the Intelligence system
     """
     
+    orchestrator = get_orchestrator()
     return {
         "service": "Anclora Intelligence",
         "version": "1.0.0",
@@ -134,6 +145,9 @@ async def intelligence_status():
             "synthesizer": "ready",
             "orchestrator": "ready",
         },
+        "decision_cache": orchestrator.decision_cache.stats(),
+        "metrics": orchestrator.metrics.snapshot(),
+        "profiler": orchestrator.profiler.stats(),
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
 
@@ -168,10 +182,47 @@ async def intelligence_info():
             "query": "POST /api/intelligence/query",
             "status": "GET /api/intelligence/status",
             "info": "GET /api/intelligence/info",
+            "metrics": "GET /api/intelligence/metrics",
+            "profiles": "GET /api/intelligence/profiles",
         },
     }
 
 
+@router.get("/metrics", response_class=PlainTextResponse)
+async def intelligence_metrics():
+    """
+    Pipeline metrics in Prometheus text format.
+    
+    Returns:
+        Stage latency histograms, query/audit counters and cache/sink gauges
+    """
+    
+    return PlainTextResponse(
+        get_orchestrator().metrics.prometheus_text(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+@router.get("/profiles")
+async def intelligence_profiles():
+    """
+    cProfile stats of the slowest sampled queries.
+    
+    Opt-in: set INTELLIGENCE_PROFILE_SLOWEST=N (and optionally
+    INTELLIGENCE_PROFILE_SAMPLE_RATE) to keep the N slowest.
+    
+    Returns:
+        Profiler settings and the slowest queries, slowest first
+    """
+    
+    profiler = get_orchestrator().profiler
+    return {
+        **profiler.stats(),
+        "queries": profiler.slowest(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
 # ═══════════════════════════════════════════════════════════════
 # HEALTH CHECK
 # ═══════════════════════════════════════════════════════════════
@@ -0,0 +1,62 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from backend.api.deps import check_budget_hard_stop, get_current_user, get_org_id
+from backend.models.jobs import JobEnqueueRequest, JobListResponse, JobResponse, JobType
+from backend.services.job_queue import job_queue
+
+router = APIRouter()
+
+
+@router.post("", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def enqueue_job(
+    payload: JobEnqueueRequest,
+    org_id: str = Depends(get_org_id),
+    user=Depends(get_current_user),
+    _budget=Depends(check_budget_hard_stop),
+) -> JobResponse:
+    """
+    Queue a background job. If the organization already has a queued or
+    running job of the same type, that job is returned with deduplicated=true.
+    """
+    try:
+        return await job_queue.enqueue(
+            org_id=str(org_id),
+            job_type=payload.job_type,
+            params=payload.params,
+            requested_by=str(user.id),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@router.get("", response_model=JobListResponse)
+async def list_jobs(
+    org_id: str = Depends(get_org_id),
+    job_type: Optional[JobType] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+) -> JobListResponse:
+    return await job_queue.list_jobs(str(org_id), limit=limit, job_type=job_type)
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str, org_id: str = Depends(get_org_id)) -> JobResponse:
+    """Poll job status, progress and result."""
+    job = await job_queue.get_job(str(org_id), job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+async def cancel_job(
+    job_id: str,
+    org_id: str = Depends(get_org_id),
+    _user=Depends(get_current_user),
+) -> JobResponse:
+    """Cancel a queued job, or ask a running job to stop at its next checkpoint."""
+    job = await job_queue.cancel(str(org_id), job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
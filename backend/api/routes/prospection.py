@@ -9,7 +9,7 @@ All filtered by org_id for isolation.
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
 from backend.api.deps import get_org_id, check_budget_hard_stop, get_current_user
 from backend.api.middleware import verify_org_membership
@@ -37,6 +37,8 @@ router = APIRouter()
 
 @router.get("/workspace")
 async def get_workspace(
+    request: Request,
+    response: Response,
     org_id: str = Depends(get_org_id),
     user=Depends(get_current_user),
     source_system: Optional[str] = Query(None, description="Filter by source_system"),
@@ -52,6 +54,8 @@ async def get_workspace(
     Unified prospection workspace payload with role scope.
     owner/manager -> full org visibility
     agent -> assigned-only visibility
+
+    Responses carry an ETag; a matching If-None-Match returns 304.
     """
     try:
         parsed_org_id = UUID(org_id)
@@ -64,7 +68,7 @@ async def get_workspace(
     try:
         member = await verify_org_membership(user.id, parsed_org_id)
         role = str(member.get("role") or "agent")
-        return await prospection_service.get_workspace(
+        payload = await prospection_service.get_workspace(
             org_id=org_id,
             role=role,
             user_id=str(user.id),
@@ -85,6 +89,19 @@ async def get_workspace(
             detail=f"Error loading workspace: {str(e)}",
         )
 
+    etag = (payload.get("meta") or {}).get("etag")
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"} if etag else {}
+    if etag and _etag_matches(etag, request.headers.get("if-none-match")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return payload
+
+
+def _etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Weak If-None-Match comparison (RFC 9110 §13.1.2)."""
+    tags = {tag.strip().removeprefix("W/") for tag in (if_none_match or "").split(",") if tag.strip()}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
 
 @router.post("/workspace/actions/followup-task", response_model=WorkspaceActionResponse)
 async def create_workspace_followup_task(
@@ -181,6 +198,7 @@ async def list_properties(
     min_score: Optional[float] = Query(None, ge=0, le=100, description="Minimum high_ticket_score"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page's next_cursor"),
 ) -> dict:
     """List prospected properties ordered by high_ticket_score descending."""
     try:
@@ -191,7 +209,10 @@ async def list_properties(
             min_score=min_score,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -308,14 +329,25 @@ async def recompute_matches(
     Recompute match scores for all or filtered property-buyer pairs.
 
     Creates new matches for unmatched pairs and updates existing scores.
+    Scores are written with bulk upserts of `chunk_size` rows per request.
+    With `incremental=true` only pairs touching properties or buyers changed
+    since their last recompute are rescored. `min_match_score` prunes new
+    pairs that cannot reach that score.
+
+    Runs inside the request; for large organizations queue a
+    `match_recompute` job through /api/jobs instead.
     """
-    property_ids = [str(pid) for pid in data.property_ids] if data and data.property_ids else None
-    buyer_ids = [str(bid) for bid in data.buyer_ids] if data and data.buyer_ids else None
+    data = data or RecomputeRequest()
+    property_ids = [str(pid) for pid in data.property_ids] if data.property_ids else None
+    buyer_ids = [str(bid) for bid in data.buyer_ids] if data.buyer_ids else None
 
     return await prospection_service.recompute_matches(
         org_id=org_id,
         property_ids=property_ids,
         buyer_ids=buyer_ids,
+        chunk_size=data.chunk_size,
+        incremental=data.incremental,
+        min_match_score=data.min_match_score,
     )
 
 
@@ -12,6 +12,17 @@ class Settings(BaseSettings):
     SUPABASE_ANON_KEY: str
     SUPABASE_SERVICE_ROLE_KEY: Optional[str] = None
     PUBLIC_CTA_ORG_ID: str = "00000000-0000-0000-0000-000000000000"
+    SCHEMA_CACHE_TTL_SECONDS: float = 300.0
+    BUDGET_STATUS_CACHE_TTL_SECONDS: float = 5.0
+    DEDUPE_INDEX_REFRESH_SECONDS: float = 60.0
+    # Trust Bloom negatives; keys other workers stored since the last warm are
+    # caught by UNIQUE(org_id, dedupe_key) on the ingestion event insert.
+    DEDUPE_INDEX_AUTHORITATIVE: bool = True
+    JOB_WORKERS: int = 2
+    JOB_STALE_SECONDS: float = 900.0
+    DB_EXECUTOR_WORKERS: int = 16
+    WORKSPACE_CACHE_MAX_ENTRIES: int = 256
+    WORKSPACE_CACHE_TTL_SECONDS: float = 30.0
     
     # LLM Provider Settings
     OPENAI_API_KEY: str
@@ -0,0 +1,416 @@
+"""
+Anclora Intelligence v1 — Write-behind Audit Sink
+Batches audit log inserts off the query path, with a local spool for durability
+
+Flow:
+1. submit(record): append the signed record to this process's spool file, enqueue it
+2. Flusher thread: drain up to batch_size records → one multi-row INSERT
+3. After commit: append an ack line; the spool is truncated once nothing is pending
+4. Spools left by dead processes (no heartbeat) are claimed and replayed (idempotent by id)
+
+Each process writes its own spool file (`intelligence_audit.<pid>-<token>.jsonl`
+under AUDIT_SPOOL_DIR) and touches it as a heartbeat, also while it waits out
+store outages, so workers never truncate or rewrite each other's records. If
+the spool is claimed anyway, the process continues in a fresh one. Transient
+store errors are retried with backoff, skipping ids that already committed;
+a batch rejected for its data is split until the offending records are
+isolated and moved to a dead-letter file.
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .utils.logging import get_intelligence_logger
+
+logger = get_intelligence_logger("audit_sink")
+
+# writer(records, skip_existing) -> None; raises on failure
+BatchWriter = Callable[[List[Dict[str, Any]], bool], None]
+
+DEFAULT_SPOOL_DIR = Path.home() / ".anclora-nexus" / "audit-spool"
+SPOOL_PREFIX = "intelligence_audit."
+DEAD_LETTER_PREFIX = "dead-letter."
+
+
+class AuditRecordRejected(Exception):
+    """Raised by a writer when the store will never accept the batch as is (bad data)."""
+
+
+class AuditSink:
+    """Bounded in-memory queue + background flusher + per-process append-only spool."""
+
+    def __init__(
+        self,
+        writer: BatchWriter,
+        spool_dir: Path = DEFAULT_SPOOL_DIR,
+        batch_size: int = 100,
+        max_queue: int = 10000,
+        flush_interval: float = 0.5,
+        max_backoff: float = 30.0,
+        orphan_after: float = 60.0,
+        fsync: bool = False,
+    ) -> None:
+        self.writer = writer
+        self.spool_dir = Path(spool_dir)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_backoff = max_backoff
+        self.orphan_after = orphan_after
+        self.fsync = fsync
+
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max(1, max_queue))
+        self._backlog: List[Dict[str, Any]] = []  # replayed or re-queued records
+        self._lock = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._spool = None
+        self.spool_path: Optional[Path] = None
+        self.dead_letter_path: Optional[Path] = None
+        self._pending = 0  # spooled records not yet acked
+        self._abandoned = 0  # left unacked at shutdown; the spool must be kept
+        self._respooled = False  # our spool was claimed: records may be written twice
+        self._last_heartbeat = 0.0
+        self._last_claim = 0.0
+
+        self.submitted = 0
+        self.written = 0
+        self.batches = 0
+        self.failures = 0
+        self.replayed = 0
+        self.overflows = 0
+        self.dead_lettered = 0
+
+    # ─── LIFECYCLE ───
+
+    def start(self) -> None:
+        """Open this process's spool, claim orphaned spools and start the flusher (idempotent)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self.spool_dir.mkdir(parents=True, exist_ok=True)
+            self._open_spool()
+            self._stop.clear()
+            self._claim_orphans()
+            self._thread = threading.Thread(target=self._run, name="intelligence-audit-sink", daemon=True)
+            self._thread.start()
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Stop the flusher after one last drain; unwritten records stay spooled for replay."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join(timeout)
+        with self._lock:
+            if self._spool is not None:
+                self._spool.close()
+                self._spool = None
+                if self.spool_path is not None and self._pending == 0 and not self._abandoned:
+                    self.spool_path.unlink(missing_ok=True)
+            self._thread = None
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every submitted record is committed or dead-lettered."""
+        with self._lock:
+            return self._lock.wait_for(lambda: self._pending == 0, timeout)
+
+    # ─── PRODUCER ───
+
+    def submit(self, record: Dict[str, Any]) -> str:
+        """Spool and enqueue a record from build_audit_record; returns its id."""
+        self.start()
+        with self._lock:
+            self._append({"op": "record", "record": record})
+            self._pending += 1
+            self.submitted += 1
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            # Backpressure: write inline rather than grow without bound.
+            self.overflows += 1
+            try:
+                self.writer([record], False)
+                self._ack([record])
+            except Exception as e:
+                logger.warning("Inline audit write failed, re-queued", extra={"reason": str(e)})
+                with self._lock:
+                    self._backlog.append(record)
+        return record["id"]
+
+    # ─── FLUSHER ───
+
+    def _run(self) -> None:
+        while True:
+            self._heartbeat()
+            batch, replay = self._next_batch()
+            if batch:
+                self._flush_batch(batch, replay)
+                continue
+            if self._stop.is_set():
+                with self._lock:
+                    leftover, self._backlog = self._backlog, []
+                self._abandon(leftover + self._drain_queue())
+                return
+
+    def _next_batch(self) -> Tuple[List[Dict[str, Any]], bool]:
+        with self._lock:
+            if self._backlog:
+                batch, self._backlog = self._backlog[: self.batch_size], self._backlog[self.batch_size :]
+                return batch, True
+        try:
+            first = self._queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return [], False
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch, False
+
+    def _drain_queue(self) -> List[Dict[str, Any]]:
+        records: List[Dict[str, Any]] = []
+        while True:
+            try:
+                records.append(self._queue.get_nowait())
+            except queue.Empty:
+                return records
+
+    def _flush_batch(self, records: List[Dict[str, Any]], skip_existing: bool) -> None:
+        """Write a batch: retry transient errors, isolate rejected records."""
+        attempt = 0
+        while True:
+            try:
+                self.writer(records, skip_existing or self._respooled)
+            except AuditRecordRejected as e:
+                self.failures += 1
+                if len(records) == 1:
+                    self._dead_letter(records[0], str(e))
+                    return
+                middle = len(records) // 2
+                self._flush_batch(records[:middle], skip_existing)
+                self._flush_batch(records[middle:], skip_existing)
+                return
+            except Exception as e:
+                self.failures += 1
+                logger.warning("Audit batch write failed", extra={"records": len(records), "reason": str(e)})
+                if self._stop.is_set():
+                    self._abandon(records)
+                    return
+                self._wait_retry(min(self.max_backoff, 0.5 * (2 ** attempt)))
+                attempt += 1
+                # The failed attempt may have committed before the error.
+                skip_existing = True
+                continue
+            self._ack(records)
+            return
+
+    def _wait_retry(self, delay: float) -> None:
+        """Back off before a retry, heartbeating so the spool is not taken for an orphan."""
+        deadline = time.monotonic() + delay
+        while True:
+            self._touch_spool()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._stop.wait(min(remaining, self.orphan_after / 4)):
+                return
+
+    def _ack(self, records: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._append({"op": "ack", "ids": [r["id"] for r in records]})
+            self.written += len(records)
+            self.batches += 1
+            self._settle(len(records))
+
+    def _settle(self, count: int) -> None:
+        """Mark `count` spooled records as resolved; compact the spool when idle. Caller holds the lock."""
+        self._pending -= count
+        if self._pending == 0 and not self._abandoned and self._spool is not None:
+            self._spool.truncate(0)
+        self._lock.notify_all()
+
+    def _dead_letter(self, record: Dict[str, Any], reason: str) -> None:
+        """Move a record the store keeps rejecting out of the write path."""
+        logger.error("Audit record rejected, dead-lettered", extra={"audit_id": record["id"], "reason": reason})
+        with self._lock:
+            if self.dead_letter_path is not None:
+                with open(self.dead_letter_path, "a", encoding="utf-8") as dead:
+                    dead.write(json.dumps({"record": record, "reason": reason}, default=str) + "\n")
+            self._append({"op": "ack", "ids": [record["id"]]})
+            self.dead_lettered += 1
+            self._settle(1)
+
+    def _abandon(self, records: List[Dict[str, Any]]) -> None:
+        """Give up on records at shutdown; they remain in the spool for the next claim."""
+        if not records:
+            return
+        with self._lock:
+            self._pending -= len(records)
+            self._abandoned += len(records)
+            self._lock.notify_all()
+
+    # ─── SPOOL ───
+
+    def _open_spool(self) -> None:
+        """Start a new spool (and dead-letter) file for this process. Caller holds the lock."""
+        token = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.spool_path = self.spool_dir / f"{SPOOL_PREFIX}{token}.jsonl"
+        self.dead_letter_path = self.spool_dir / f"{DEAD_LETTER_PREFIX}{token}.jsonl"
+        self._spool = open(self.spool_path, "a", encoding="utf-8")
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        if self._spool is None:
+            return
+        self._spool.write(json.dumps(entry, default=str) + "\n")
+        self._spool.flush()
+        if self.fsync:
+            os.fsync(self._spool.fileno())
+
+    def _heartbeat(self) -> None:
+        """Touch our spool so other processes know it is live; periodically claim orphans."""
+        now = time.monotonic()
+        if now - self._last_heartbeat >= self.orphan_after / 4:
+            self._touch_spool()
+        if now - self._last_claim >= self.orphan_after / 2:
+            with self._lock:
+                self._claim_orphans()
+
+    def _touch_spool(self) -> None:
+        self._last_heartbeat = time.monotonic()
+        with self._lock:
+            if self.spool_path is None or self._spool is None:
+                return
+            try:
+                os.utime(self.spool_path)
+            except FileNotFoundError:
+                self._respool()
+            except OSError:
+                pass
+
+    def _respool(self) -> None:
+        """
+        Our spool was claimed as an orphan: its unacked records now belong to
+        the claimer's replay. Continue in a fresh spool, and write with
+        skip_existing from now on since both processes may write a record.
+        Caller holds the lock.
+        """
+        logger.warning("Audit spool claimed by another process, continuing in a new spool",
+                       extra={"spool": self.spool_path.name if self.spool_path else None})
+        self._spool.close()
+        self._open_spool()
+        self._respooled = True
+
+    def _claim_orphans(self) -> None:
+        """
+        Take over spools whose owner stopped heartbeating: rename (atomic claim),
+        copy unacked records into our spool and backlog, then delete. Caller
+        holds the lock.
+        """
+        self._last_claim = time.monotonic()
+        cutoff = time.time() - self.orphan_after
+        for path in sorted(self.spool_dir.glob(f"{SPOOL_PREFIX}*.jsonl")):
+            if path == self.spool_path:
+                continue
+            try:
+                if path.stat().st_mtime > cutoff:
+                    continue
+                claimed = path.with_name(f"{path.name}.claimed-{os.getpid()}")
+                os.rename(path, claimed)
+            except OSError:
+                continue  # gone, or claimed by another process
+            records = self._read_unacked(claimed)
+            for record in records:
+                self._append({"op": "record", "record": record})
+            claimed.unlink(missing_ok=True)
+            self._backlog.extend(records)
+            self._pending += len(records)
+            self.replayed += len(records)
+            if records:
+                logger.info("Replaying spooled audit records", extra={"records": len(records), "spool": path.name})
+
+    @staticmethod
+    def _read_unacked(path: Path) -> List[Dict[str, Any]]:
+        pending: Dict[str, Dict[str, Any]] = {}
+        with open(path, encoding="utf-8") as spool:
+            for line in spool:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn write from a crash
+                if entry.get("op") == "record":
+                    pending[entry["record"]["id"]] = entry["record"]
+                elif entry.get("op") == "ack":
+                    for record_id in entry.get("ids", []):
+                        pending.pop(record_id, None)
+        return list(pending.values())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "submitted": self.submitted,
+                "written": self.written,
+                "batches": self.batches,
+                "failures": self.failures,
+                "replayed": self.replayed,
+                "overflows": self.overflows,
+                "dead_lettered": self.dead_lettered,
+                "pending": self._pending,
+                "queued": self._queue.qsize(),
+                "backlog": len(self._backlog),
+            }
+
+
+# ═══════════════════════════════════════════════════════════════
+# SINGLETON INSTANCE
+# ═══════════════════════════════════════════════════════════════
+
+_audit_sink: Optional[AuditSink] = None
+
+
+def write_behind_enabled() -> bool:
+    """Audit writes go through the sink unless INTELLIGENCE_AUDIT_WRITE_BEHIND=0."""
+    return os.getenv("INTELLIGENCE_AUDIT_WRITE_BEHIND", "1").lower() not in ("0", "false", "no")
+
+
+def _db_batch_writer(records: List[Dict[str, Any]], skip_existing: bool) -> None:
+    from .database import get_db_service, is_transient_db_error
+
+    db_service = get_db_service()  # init failures are transient: retried with backoff
+    try:
+        db_service.insert_audit_batch(records, skip_existing=skip_existing)
+    except Exception as e:
+        if is_transient_db_error(e):
+            raise
+        raise AuditRecordRejected(str(e)) from e
+
+
+def get_audit_sink() -> AuditSink:
+    """Get or create the process-wide audit sink (configured from env)."""
+    global _audit_sink
+    if _audit_sink is None:
+        _audit_sink = AuditSink(
+            writer=_db_batch_writer,
+            spool_dir=Path(os.getenv("AUDIT_SPOOL_DIR", str(DEFAULT_SPOOL_DIR))),
+            batch_size=int(os.getenv("AUDIT_SINK_BATCH_SIZE", "100")),
+            max_queue=int(os.getenv("AUDIT_SINK_MAX_QUEUE", "10000")),
+            flush_interval=float(os.getenv("AUDIT_SINK_FLUSH_INTERVAL", "0.5")),
+            fsync=os.getenv("AUDIT_SPOOL_FSYNC", "0").lower() in ("1", "true", "yes"),
+        )
+        atexit.register(_audit_sink.close)
+    return _audit_sink
+
+
+def close_audit_sink(timeout: float = 5.0) -> None:
+    """Stop the process-wide sink if it was started (app shutdown)."""
+    global _audit_sink
+    sink, _audit_sink = _audit_sink, None
+    if sink is not None:
+        atexit.unregister(sink.close)
+        sink.close(timeout)
@@ -0,0 +1,100 @@
+"""
+Anclora Intelligence v1 — Keyword Matcher
+Single-pass, accent-insensitive multi-keyword matching for the Router
+"""
+
+import re
+import unicodedata
+from typing import Dict, FrozenSet, Iterable, List, Set
+
+
+def fold_text(text: str) -> str:
+    """Casefold and strip accents ("Reputación" → "reputacion")."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+# Trie node keys for the end of a whole-word term and of a prefix stem;
+# longer than one character, so they never collide with a term's letters.
+_WORD_END = "<word>"
+_STEM_END = "<stem>"
+_WORD_CHAR = re.compile(r"\w")
+
+
+def _trie_pattern(terms: Iterable[str], stems: Iterable[str]) -> str:
+    """
+    Regex equivalent to the alternation of `terms` (each ending at a word
+    boundary) and `stems` (followed by anything), factored as a prefix trie
+    so each character is tried against one branch set, however many terms
+    are registered. Longer branches are tried first: the longest match wins.
+    """
+    trie: Dict[str, dict] = {}
+    for words, end in ((terms, _WORD_END), (stems, _STEM_END)):
+        for term in words:
+            node = trie
+            for ch in term:
+                node = node.setdefault(ch, {})
+            node[end] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if len(ch) == 1]
+        if _STEM_END in node:
+            return "(?:" + "|".join(branches) + ")?" if branches else ""
+        if _WORD_END in node:
+            branches.append(r"(?!\w)")
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    Matches a registry of tagged terms in one scan of the text.
+
+    Terms match whole words ("lab" does not match "laboral"). A term ending
+    in "*" is a prefix stem and matches any word it starts ("experimen*"
+    matches "experimento"); a stem never matches inside a word ("marca*"
+    does not match "comarca"). Matching is case- and accent-insensitive.
+    """
+
+    def __init__(self, registry: Dict[str, Iterable[str]]) -> None:
+        word_tags: Dict[str, Set[str]] = {}
+        stem_tags: Dict[str, Set[str]] = {}
+        for tag, terms in registry.items():
+            for term in terms:
+                folded = fold_text(term).strip()
+                target = word_tags
+                if folded.endswith("*"):
+                    folded, target = folded[:-1].rstrip(), stem_tags
+                if folded:
+                    target.setdefault(folded, set()).add(tag)
+
+        # A match is the longest term or stem starting at a word; every shorter
+        # stem that is a prefix of it matched there too.
+        self._word_tags: Dict[str, FrozenSet[str]] = {term: frozenset(tags) for term, tags in word_tags.items()}
+        self._stem_tags: Dict[str, FrozenSet[str]] = {
+            term: frozenset(
+                tag
+                for stem, tags in stem_tags.items()
+                if term.startswith(stem)
+                for tag in tags
+            )
+            for term in set(word_tags) | set(stem_tags)
+        }
+        self.terms: List[str] = sorted(word_tags) + sorted(f"{stem}*" for stem in stem_tags)
+        self._pattern = (
+            re.compile(r"(?<!\w)(" + _trie_pattern(word_tags, stem_tags) + ")") if self.terms else None
+        )
+
+    def scan(self, text: str) -> Set[str]:
+        """Tags of every term found in `text`."""
+        hits: Set[str] = set()
+        if self._pattern is None:
+            return hits
+        folded = fold_text(text)
+        for match in self._pattern.finditer(folded):
+            term = match.group(1)
+            hits |= self._stem_tags[term]
+            if term in self._word_tags and not _WORD_CHAR.match(folded, match.end()):
+                hits |= self._word_tags[term]
+        return hits
@@ -5,10 +5,11 @@ Generates QueryPlan from user message
 
 import uuid
 from datetime import datetime, timezone
-from typing import Tuple, List, Optional, Dict, Any
+from typing import Tuple, List, Optional, Dict, Any, Set
 from pydantic import BaseModel, ValidationError
 from .. import intelligence_types as types
 from ..validation import validate_query_plan
+from .keyword_matcher import KeywordMatcher
 from ..utils.logging import get_intelligence_logger
 
 # Initialize structured logger
@@ -43,15 +44,25 @@ class Router:
             types.DomainKey.SYSTEM,
         ]
         
-        # Keywords for domain detection
+        # Keywords for domain detection. Terms match whole words; a trailing
+        # "*" marks a prefix stem that also covers plurals and inflections.
         self.domain_keywords: Dict[types.DomainKey, List[str]] = {
-            types.DomainKey.MARKET: ["mercado", "precio", "comprador", "venta", "propiedad", "inmobiliario"],
-            types.DomainKey.BRAND: ["diferencia", "posicionamiento", "marca", "reputación", "exclusivo"],
-            types.DomainKey.TAX: ["impuesto", "fiscal", "social", "contribución", "retención", "ley"],
-            types.DomainKey.TRANSITION: ["carrera", "trabajo", "excedencia", "renuncia", "laboral", "empleo"],
-            types.DomainKey.SYSTEM: ["proceso", "herramienta", "operación", "eficiencia", "automatización"],
+            types.DomainKey.MARKET: ["mercado*", "precio", "precios", "comprador*", "venta", "ventas", "propiedad*", "inmobiliari*"],
+            types.DomainKey.BRAND: ["diferencia*", "posicionamiento*", "marca", "marcas", "reputación", "exclusiv*"],
+            types.DomainKey.TAX: ["impuesto*", "fiscal*", "social*", "contribución*", "retención*", "ley", "leyes"],
+            types.DomainKey.TRANSITION: ["carrera*", "trabajo*", "excedencia*", "renuncia*", "laboral*", "empleo*"],
+            types.DomainKey.SYSTEM: ["proceso*", "herramienta*", "operación*", "eficiencia*", "automatización*"],
         }
-        logger.info("Router initialized")
+        self.complexity_keywords: List[str] = ["vs", "comparar", "diferencia*", "impacto*"]
+        self.lab_keywords: List[str] = ["lab", "experimen*", "beta"]
+        
+        # One matcher for domain, mode and flag terms: a single scan per message
+        self.keyword_matcher = KeywordMatcher({
+            **{f"domain:{domain.value}": keywords for domain, keywords in self.domain_keywords.items()},
+            "mode:complexity": self.complexity_keywords,
+            "flag:lab": self.lab_keywords,
+        })
+        logger.info("Router initialized", extra={"keywords": len(self.keyword_matcher.terms)})
     
     def validate_request(self, data: Dict[str, Any]) -> Tuple[Optional[RouterRequest], Optional[RouterResponse]]:
         """
@@ -91,8 +102,9 @@ class Router:
         logger.info("Routing query", extra={"message_len": len(message)})
         
         try:
-            # Step 1: Detect domains
-            detected_domains = self._detect_domains(message)
+            # Step 1: Detect domains (single keyword scan, reused below)
+            hits = self.keyword_matcher.scan(message)
+            detected_domains = self._detect_domains(hits)
             
             if not detected_domains:
                 # Default: market (lujo real estate)
@@ -103,7 +115,7 @@ class Router:
             domains_selected = detected_domains[:3]
             
             # Step 3: Determine mode
-            mode = self._determine_mode(message, len(domains_selected))
+            mode = self._determine_mode(message, len(domains_selected), hits)
             
             # Step 4: Calculate confidence
             confidence = self._calculate_confidence(message, len(domains_selected))
@@ -116,7 +128,7 @@ class Router:
             )
             
             # Step 6: Generate flags
-            flags = self._generate_flags(message, domains_selected)
+            flags = self._generate_flags(message, domains_selected, hits)
             
             # Step 7: Create rationale
             rationale = self._generate_rationale(domains_selected, confidence)
@@ -150,22 +162,15 @@ class Router:
             logger.exception("Router failure")
             return None, f"Router internal error: {str(e)} (Code 500)"
     
-    def _detect_domains(self, message: str) -> List[str]:
-        """Detect domains from message keywords."""
-        message_lower = message.lower()
-        detected: List[str] = []
-        
-        for domain, keywords in self.domain_keywords.items():
-            if any(keyword in message_lower for keyword in keywords):
-                detected.append(domain.value)
-        
-        return list(dict.fromkeys(detected))
+    def _detect_domains(self, hits: Set[str]) -> List[str]:
+        """Detect domains from keyword hits, in registry order."""
+        return [domain.value for domain in self.domain_keywords if f"domain:{domain.value}" in hits]
     
-    def _determine_mode(self, message: str, num_domains: int) -> types.QueryMode:
+    def _determine_mode(self, message: str, num_domains: int, hits: Set[str]) -> types.QueryMode:
         """Determine if fast or deep analysis."""
         is_short = len(message.split()) < 15
         is_single_domain = num_domains == 1
-        has_complexity = any(word in message.lower() for word in ["vs", "comparar", "diferencia", "impacto"])
+        has_complexity = "mode:complexity" in hits
         
         if is_short and is_single_domain and not has_complexity:
             return types.QueryMode.FAST
@@ -185,14 +190,14 @@ class Router:
         else:
             return types.Confidence.LOW
     
-    def _generate_flags(self, message: str, domains: List[str]) -> List[str]:
+    def _generate_flags(self, message: str, domains: List[str], hits: Set[str]) -> List[str]:
         """Generate operational flags."""
         flags: List[str] = []
         
         if len(message.split()) < 8:
             flags.append("needs-clarification")
         
-        if any(word in message.lower() for word in ["lab", "experimen", "beta"]):
+        if "flag:lab" in hits:
             flags.append("lab-access-requested")
             flags.append("lab-access-denied")
         
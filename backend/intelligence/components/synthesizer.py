@@ -3,6 +3,8 @@ Anclora Intelligence v1 — Synthesizer Component
 Generates SynthesizerOutput from GovernorDecision and QueryPlan
 """
 
+import asyncio
+import functools
 import uuid
 import time
 import random
@@ -11,7 +13,7 @@ from typing import Tuple, Optional, List, Dict, Any, Callable
 from ..intelligence_types import (
     GovernorDecision, QueryPlan, SynthesizerOutput,
     Meta, MetaVersion, PlanView, Trace, EvidenceView, EvidenceStatus,
-    RiskSummary, RiskLevel
+    RiskSummary, RiskLevel, Confidence
 )
 from ..validation import validate_synthesizer_output
 from ..utils.logging import get_intelligence_logger
@@ -44,6 +46,32 @@ def retry_with_backoff(retries: int = 3, backoff_in_seconds: float = 1.0) -> Cal
     return decorator
 
 
+def async_retry_with_backoff(retries: int = 3, backoff_in_seconds: float = 1.0) -> Callable:
+    """
+    Coroutine variant of retry_with_backoff: waits with asyncio.sleep so a
+    retrying call never blocks the event loop.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            x = 0
+            while True:
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    if x == retries:
+                        logger.error(f"Failed after {retries} retries", extra={"error": str(e)})
+                        raise
+
+                    sleep_time = (backoff_in_seconds * (2 ** x) +
+                                 random.uniform(0, 1))
+                    logger.warning(f"Retry {x+1}/{retries} after {sleep_time:.2f}s", extra={"error": str(e)})
+                    await asyncio.sleep(sleep_time)
+                    x += 1
+        return wrapper
+    return decorator
+
+
 class Synthesizer:
     """
     Synthesizer: Takes GovernorDecision and QueryPlan, generates SynthesizerOutput.
@@ -62,6 +90,30 @@ class Synthesizer:
         self,
         query_plan: QueryPlan,
         governor_decision: GovernorDecision
+    ) -> Tuple[Optional[SynthesizerOutput], Optional[str]]:
+        """Synthesize SynthesizerOutput from decision and plan (blocking retries)."""
+        return self._synthesize(query_plan, governor_decision)
+
+    @async_retry_with_backoff(retries=3)
+    async def synthesize_async(
+        self,
+        query_plan: QueryPlan,
+        governor_decision: GovernorDecision,
+        runner: Optional[Callable[..., Any]] = None
+    ) -> Tuple[Optional[SynthesizerOutput], Optional[str]]:
+        """
+        Awaitable synthesize: runs in a worker thread and backs off with
+        asyncio.sleep, so a degraded synthesis never stalls the event loop.
+        `runner(fn, *args)`, if given, wraps the blocking call (e.g. a profiler).
+        """
+        if runner is not None:
+            return await asyncio.to_thread(runner, self._synthesize, query_plan, governor_decision)
+        return await asyncio.to_thread(self._synthesize, query_plan, governor_decision)
+
+    def _synthesize(
+        self,
+        query_plan: QueryPlan,
+        governor_decision: GovernorDecision
     ) -> Tuple[Optional[SynthesizerOutput], Optional[str]]:
         """
         Synthesize SynthesizerOutput from decision and plan.
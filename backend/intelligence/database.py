@@ -8,11 +8,118 @@ import hmac
 import json
 import os
 from datetime import datetime, timezone
-from typing import Optional, Tuple
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import insert
+from sqlalchemy.exc import DisconnectionError, InterfaceError, OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import Session
 from .models import IntelligenceAuditLog, get_database_session, create_append_only_trigger
 
 
+def build_audit_record(
+    correlation_id: str,
+    user_id: str,
+    message: str,
+    query_plan: dict,
+    query_plan_id: str,
+    governor_decision: dict,
+    governor_decision_id: str,
+    synthesizer_output: dict,
+    synthesizer_output_id: str,
+    status: str,
+    strategic_mode_version: str,
+    confidence_overall: str,
+    execution_times: dict,
+    error_message: Optional[str] = None,
+    warnings: Optional[list] = None,
+) -> Dict[str, Any]:
+    """
+    Build a signed, JSON-serializable audit record.
+    
+    The id, checksum and HMAC signature are fixed here, at query time, so a
+    record persisted later (write-behind, spool replay) is identical to one
+    committed inline.
+    
+    Returns:
+        Dict of intelligence_audit_logs column values (created_at as ISO string)
+    """
+    
+    created_at = datetime.now(timezone.utc).isoformat()
+    
+    # Calculate checksum for integrity
+    checksum_data = {
+        'correlation_id': correlation_id,
+        'user_id': user_id,
+        'message': message,
+        'query_plan_id': query_plan_id,
+        'governor_decision_id': governor_decision_id,
+        'synthesizer_output_id': synthesizer_output_id,
+        'status': status,
+        'created_at': created_at,
+    }
+    checksum = hashlib.sha256(
+        json.dumps(checksum_data, sort_keys=True).encode()
+    ).hexdigest()
+    
+    # HMAC-SHA256 Signature (Constitution Requirement)
+    audit_secret = os.getenv("AUDIT_SECRET", "anclora-nexus-v1-dev-secret")
+    signature = hmac.new(
+        audit_secret.encode(),
+        checksum.encode(),
+        hashlib.sha256
+    ).hexdigest()
+    
+    return {
+        'id': str(uuid.uuid4()),
+        'correlation_id': correlation_id,
+        'user_id': user_id,
+        'message': message,
+        'message_length': len(message),
+        
+        'query_plan_id': query_plan_id,
+        'query_plan': query_plan,
+        
+        'governor_decision_id': governor_decision_id,
+        'governor_decision': governor_decision,
+        
+        'synthesizer_output_id': synthesizer_output_id,
+        'synthesizer_output': synthesizer_output,
+        
+        'strategic_mode_version': strategic_mode_version,
+        'status': status,
+        'error_message': error_message,
+        'warnings': warnings or [],
+        
+        'confidence_overall': confidence_overall,
+        
+        'router_time_ms': execution_times.get('router_ms'),
+        'governor_time_ms': execution_times.get('governor_ms'),
+        'synthesizer_time_ms': execution_times.get('synthesizer_ms'),
+        'total_time_ms': execution_times.get('total_ms'),
+        
+        'created_at': created_at,
+        'checksum': checksum,
+        'signature': signature,
+        'output_ai': True,
+    }
+
+
+def is_transient_db_error(error: Exception) -> bool:
+    """Whether a failed audit write may succeed on retry (connection/timeouts), vs. rejected data."""
+    return isinstance(error, (
+        OperationalError, InterfaceError, DisconnectionError, PoolTimeoutError,
+        ConnectionError, TimeoutError, OSError,
+    ))
+
+
+def audit_row(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Column values for an IntelligenceAuditLog insert from an audit record."""
+    row = dict(record)
+    row['created_at'] = datetime.fromisoformat(record['created_at'])
+    return row
+
+
 class DatabaseService:
     """Service for database operations."""
     
@@ -75,66 +182,29 @@ class DatabaseService:
             (success, message)
         """
         
+        record = build_audit_record(
+            correlation_id=correlation_id,
+            user_id=user_id,
+            message=message,
+            query_plan=query_plan,
+            query_plan_id=query_plan_id,
+            governor_decision=governor_decision,
+            governor_decision_id=governor_decision_id,
+            synthesizer_output=synthesizer_output,
+            synthesizer_output_id=synthesizer_output_id,
+            status=status,
+            strategic_mode_version=strategic_mode_version,
+            confidence_overall=confidence_overall,
+            execution_times=execution_times,
+            error_message=error_message,
+            warnings=warnings,
+        )
+        
         session = None
         
         try:
             session = self.SessionLocal()
-            
-            # Calculate checksum for integrity
-            checksum_data = {
-                'correlation_id': correlation_id,
-                'user_id': user_id,
-                'message': message,
-                'query_plan_id': query_plan_id,
-                'governor_decision_id': governor_decision_id,
-                'synthesizer_output_id': synthesizer_output_id,
-                'status': status,
-                'created_at': datetime.now(timezone.utc).isoformat(),
-            }
-            checksum = hashlib.sha256(
-                json.dumps(checksum_data, sort_keys=True).encode()
-            ).hexdigest()
-            
-            # HMAC-SHA256 Signature (Constitution Requirement)
-            audit_secret = os.getenv("AUDIT_SECRET", "anclora-nexus-v1-dev-secret")
-            signature = hmac.new(
-                audit_secret.encode(),
-                checksum.encode(),
-                hashlib.sha256
-            ).hexdigest()
-            
-            # Create audit log entry
-            audit_entry = IntelligenceAuditLog(
-                correlation_id=correlation_id,
-                user_id=user_id,
-                message=message,
-                message_length=len(message),
-                
-                query_plan_id=query_plan_id,
-                query_plan=query_plan,
-                
-                governor_decision_id=governor_decision_id,
-                governor_decision=governor_decision,
-                
-                synthesizer_output_id=synthesizer_output_id,
-                synthesizer_output=synthesizer_output,
-                
-                strategic_mode_version=strategic_mode_version,
-                status=status,
-                error_message=error_message,
-                warnings=warnings or [],
-                
-                confidence_overall=confidence_overall,
-                
-                router_time_ms=execution_times.get('router_ms'),
-                governor_time_ms=execution_times.get('governor_ms'),
-                synthesizer_time_ms=execution_times.get('synthesizer_ms'),
-                total_time_ms=execution_times.get('total_ms'),
-                
-                checksum=checksum,
-                signature=signature,
-                output_ai=True,
-            )
+            audit_entry = IntelligenceAuditLog(**audit_row(record))
             
             # Save to database
             session.add(audit_entry)
@@ -151,6 +221,60 @@ class DatabaseService:
             if session:
                 session.close()
     
+    def insert_audit_batch(self, records: List[Dict[str, Any]], skip_existing: bool = False) -> int:
+        """
+        Insert pre-built audit records (see build_audit_record) in one
+        multi-row INSERT and a single commit. Raises on failure.
+        
+        Args:
+            records: Records from build_audit_record
+            skip_existing: Drop records whose id is already stored (spool replay)
+        
+        Returns:
+            Number of rows inserted
+        """
+        
+        if not records:
+            return 0
+        
+        session = self.SessionLocal()
+        
+        try:
+            rows = [audit_row(record) for record in records]
+            
+            if skip_existing:
+                stored = {
+                    row_id for (row_id,) in session.query(IntelligenceAuditLog.id).filter(
+                        IntelligenceAuditLog.id.in_([row["id"] for row in rows])
+                    )
+                }
+                rows = [row for row in rows if row["id"] not in stored]
+            
+            if rows:
+                session.execute(insert(IntelligenceAuditLog), rows)
+            session.commit()
+            return len(rows)
+        
+        except Exception:
+            session.rollback()
+            raise
+        
+        finally:
+            session.close()
+    
+    def save_audit_log_batch(self, records: List[Dict[str, Any]], skip_existing: bool = False) -> Tuple[bool, str]:
+        """
+        insert_audit_batch with the (success, message) contract of save_audit_log.
+        
+        Returns:
+            (success, message)
+        """
+        
+        try:
+            return True, f"Audit batch saved: {self.insert_audit_batch(records, skip_existing)}"
+        except Exception as e:
+            return False, f"Database error: {str(e)}"
+    
     def get_audit_log(self, correlation_id: str) -> Optional[dict]:
         """
         Retrieve an audit log entry by correlation_id.
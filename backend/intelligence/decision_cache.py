@@ -0,0 +1,120 @@
+"""
+Anclora Intelligence v1 — Decision Cache
+Content-addressed LRU of Router → Governor → Synthesizer outputs
+
+Router and Governor are pure keyword/rule logic and the Synthesizer formats
+their outputs, so a pipeline result depends only on the normalized message
+and the strategic mode / schema versions. Entries are keyed by a hash of
+those; a hit is returned as fresh copies (new ids and timestamps) so every
+answer still gets its own correlation_id and audit row.
+"""
+
+import hashlib
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from .intelligence_types import GovernorDecision, QueryPlan, SynthesizerOutput
+
+CachedDecision = Tuple[QueryPlan, GovernorDecision, SynthesizerOutput]
+
+
+def normalize_message(message: str) -> str:
+    """
+    Lowercase and collapse whitespace. The Router only looks at lowercase
+    keyword containment, word counts and "?", all invariant under this.
+    """
+    return " ".join(message.lower().split())
+
+
+def decision_cache_key(message: str, *versions: str) -> str:
+    """Content hash of the normalized message and the pipeline versions."""
+    material = "\x1f".join((normalize_message(message),) + tuple(versions))
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def _fresh(cached: CachedDecision) -> CachedDecision:
+    """Copies of a cached decision with new ids and timestamps."""
+    query_plan, governor_decision, synthesizer_output = cached
+    now = datetime.now(timezone.utc).isoformat()
+    query_plan = query_plan.model_copy(deep=True, update={
+        "query_plan_id": str(uuid.uuid4()),
+        "correlation_id": None,
+        "timestamp": now,
+    })
+    governor_decision = governor_decision.model_copy(deep=True, update={
+        "decision_id": str(uuid.uuid4()),
+        "timestamp": now,
+    })
+    trace = synthesizer_output.trace.model_copy(update={
+        "query_plan_id": query_plan.query_plan_id,
+        "governor_decision_id": governor_decision.decision_id,
+        "created_at": now,
+    })
+    synthesizer_output = synthesizer_output.model_copy(deep=True, update={
+        "output_id": str(uuid.uuid4()),
+        "trace": trace,
+    })
+    return query_plan, governor_decision, synthesizer_output
+
+
+class DecisionCache:
+    """Bounded LRU of successful pipeline outputs with hit/miss counters."""
+
+    def __init__(self, max_entries: int = 512) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedDecision]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[CachedDecision]:
+        """Fresh copies of the cached outputs for `key`, else None."""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return _fresh(cached)
+
+    def put(
+        self,
+        key: str,
+        query_plan: QueryPlan,
+        governor_decision: GovernorDecision,
+        synthesizer_output: SynthesizerOutput,
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+        snapshot = (
+            query_plan.model_copy(deep=True),
+            governor_decision.model_copy(deep=True),
+            synthesizer_output.model_copy(deep=True),
+        )
+        with self._lock:
+            self._entries[key] = snapshot
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
@@ -0,0 +1,254 @@
+"""
+Anclora Intelligence v1 — Metrics & Profiling
+In-process stage latency histograms, counters and slow-query profiles
+
+- MetricsRegistry: fixed-bucket histograms per pipeline stage (router,
+  governor, synthesizer, total, audit_save) plus labelled counters, exported
+  as a JSON snapshot (/status) or Prometheus text (/metrics).
+- SlowQueryProfiler: opt-in; samples queries under cProfile and keeps the
+  rendered stats of the N slowest.
+"""
+
+import bisect
+import cProfile
+import heapq
+import io
+import pstats
+import random
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Upper bounds in milliseconds; the last bucket is +Inf.
+DEFAULT_BUCKETS_MS: Tuple[float, ...] = (
+    1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000,
+)
+
+STAGE_METRIC = "intelligence_stage_duration_milliseconds"
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Fixed-bucket latency histogram with bucket-interpolated quantiles."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS_MS) -> None:
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate of the q-quantile, interpolated within its bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else (self.max or lower)
+                estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+                return round(min(max(estimate, self.min or 0.0), self.max or estimate), 3)
+            seen += bucket_count
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum, 3),
+            "avg_ms": round(self.sum / self.count, 3) if self.count else None,
+            "min_ms": self.min,
+            "max_ms": self.max,
+            "p50_ms": self.quantile(0.50),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+        }
+
+
+def _format_labels(labels: Labels, extra: str = "") -> str:
+    parts = [f'{k}="{v}"' for k, v in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class MetricsRegistry:
+    """Thread-safe registry of stage histograms, counters and gauge collectors."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS_MS) -> None:
+        self.buckets = tuple(buckets)
+        self._stages: Dict[str, Histogram] = {}
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._collectors: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, value_ms: float) -> None:
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = Histogram(self.buckets)
+            histogram.observe(value_ms)
+
+    def increment(self, name: str, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + amount
+
+    def register_collector(self, name: str, collect: Callable[[], Dict[str, Any]]) -> None:
+        """Gauges read at export time (e.g. cache or audit sink stats)."""
+        self._collectors[name] = collect
+
+    def _collect(self) -> Dict[str, Dict[str, Any]]:
+        collected: Dict[str, Dict[str, Any]] = {}
+        for name, collect in self._collectors.items():
+            try:
+                collected[name] = collect()
+            except Exception as e:
+                collected[name] = {"error": str(e)}
+        return collected
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            stages = {stage: h.snapshot() for stage, h in sorted(self._stages.items())}
+            counters = {
+                name: {",".join(f"{k}={v}" for k, v in labels) or "total": value for labels, value in series.items()}
+                for name, series in sorted(self._counters.items())
+            }
+        return {"stages": stages, "counters": counters, "gauges": self._collect()}
+
+    def prometheus_text(self) -> str:
+        """Metrics in the Prometheus text exposition format (0.0.4)."""
+        lines: List[str] = []
+        with self._lock:
+            if self._stages:
+                lines.append(f"# HELP {STAGE_METRIC} Intelligence pipeline stage latency.")
+                lines.append(f"# TYPE {STAGE_METRIC} histogram")
+            for stage, h in sorted(self._stages.items()):
+                labels: Labels = (("stage", stage),)
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, h.counts):
+                    cumulative += bucket_count
+                    le = 'le="%s"' % _format_value(bound)
+                    lines.append(f"{STAGE_METRIC}_bucket{_format_labels(labels, le)} {cumulative}")
+                le = 'le="+Inf"'
+                lines.append(f"{STAGE_METRIC}_bucket{_format_labels(labels, le)} {h.count}")
+                lines.append(f"{STAGE_METRIC}_sum{_format_labels(labels)} {_format_value(round(h.sum, 3))}")
+                lines.append(f"{STAGE_METRIC}_count{_format_labels(labels)} {h.count}")
+            for name, series in sorted(self._counters.items()):
+                metric = f"intelligence_{name}_total"
+                lines.append(f"# TYPE {metric} counter")
+                for labels, value in sorted(series.items()):
+                    lines.append(f"{metric}{_format_labels(labels)} {_format_value(value)}")
+        for collector, values in sorted(self._collect().items()):
+            for key, value in sorted(values.items()):
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                metric = f"intelligence_{collector}_{key}"
+                lines.append(f"# TYPE {metric} gauge")
+                lines.append(f"{metric} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class QueryProfile:
+    """cProfile captures of the stages of one query (stages may run in worker threads)."""
+
+    def __init__(self) -> None:
+        self._profiles: List[cProfile.Profile] = []
+
+    def call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler is active in this thread: run unprofiled.
+            return fn(*args)
+        try:
+            return fn(*args)
+        finally:
+            profile.disable()
+            self._profiles.append(profile)
+
+    def render(self, limit: int = 25) -> str:
+        if not self._profiles:
+            return ""
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profiles[0], stream=stream)
+        for profile in self._profiles[1:]:
+            stats.add(profile)
+        stats.sort_stats("cumulative").print_stats(limit)
+        return stream.getvalue()
+
+
+class SlowQueryProfiler:
+    """Keeps rendered cProfile stats of the `top_n` slowest sampled queries."""
+
+    def __init__(self, top_n: int = 0, sample_rate: float = 1.0, limit: int = 25) -> None:
+        self.top_n = top_n
+        self.sample_rate = sample_rate
+        self.limit = limit
+        self._heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._seq = 0
+        self._lock = threading.Lock()
+        self.sampled = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.top_n > 0 and self.sample_rate > 0
+
+    def start(self) -> Optional[QueryProfile]:
+        """A QueryProfile if this query is sampled, else None."""
+        if not self.enabled or random.random() >= self.sample_rate:
+            return None
+        return QueryProfile()
+
+    def record(self, correlation_id: str, total_ms: float, profile: QueryProfile) -> bool:
+        """Keep the profile if the query is among the slowest; returns whether it was kept."""
+        with self._lock:
+            self.sampled += 1
+            if len(self._heap) >= self.top_n and total_ms <= self._heap[0][0]:
+                return False
+        entry = {
+            "correlation_id": correlation_id,
+            "total_ms": round(total_ms, 3),
+            "captured_at": datetime.now(timezone.utc).isoformat(),
+            "stats": profile.render(self.limit),
+        }
+        with self._lock:
+            self._seq += 1
+            item = (total_ms, self._seq, entry)
+            if len(self._heap) < self.top_n:
+                heapq.heappush(self._heap, item)
+            elif total_ms > self._heap[0][0]:
+                heapq.heapreplace(self._heap, item)
+            else:
+                return False
+        return True
+
+    def slowest(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [entry for _, _, entry in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "top_n": self.top_n,
+                "sample_rate": self.sample_rate,
+                "sampled": self.sampled,
+                "kept": len(self._heap),
+            }
@@ -3,14 +3,20 @@ Anclora Intelligence v1 — Orchestrator
 Coordinates Router → Governor → Synthesizer in E2E flow
 """
 
+import asyncio
+import os
+import time
 import uuid
 from datetime import datetime, timezone
-from typing import Tuple, Dict, Any, Optional
+from typing import Callable, Tuple, Dict, Any, Optional, Set
 from ..components.router import create_router
 from ..components.governor import create_governor
 from ..components.synthesizer import create_synthesizer
 from ..intelligence_types import SynthesizerOutput, StateEnum, AuditStatus, Confidence
-from ..database import get_db_service
+from ..database import build_audit_record, get_db_service
+from ..audit_sink import get_audit_sink, write_behind_enabled
+from ..decision_cache import DecisionCache, decision_cache_key
+from ..metrics import MetricsRegistry, QueryProfile, SlowQueryProfiler
 from ..utils.logging import get_intelligence_logger
 
 # Initialize structured logger
@@ -39,6 +45,17 @@ class Orchestrator:
         self.synthesizer = create_synthesizer()
         self.strategic_mode_version = strategic_mode_version
         self.state = StateEnum.IDLE
+        self._pending_audits: Set["asyncio.Task[str]"] = set()
+        self.decision_cache = DecisionCache(int(os.getenv("INTELLIGENCE_DECISION_CACHE_SIZE", "512")))
+        self.metrics = MetricsRegistry()
+        self.metrics.register_collector("decision_cache", self.decision_cache.stats)
+        if write_behind_enabled():
+            self.metrics.register_collector("audit_sink", lambda: get_audit_sink().stats())
+        # Opt-in: INTELLIGENCE_PROFILE_SLOWEST=N keeps cProfile stats of the N slowest sampled queries
+        self.profiler = SlowQueryProfiler(
+            top_n=int(os.getenv("INTELLIGENCE_PROFILE_SLOWEST", "0")),
+            sample_rate=float(os.getenv("INTELLIGENCE_PROFILE_SAMPLE_RATE", "1.0")),
+        )
         logger.info("Orchestrator initialized", extra={"version": strategic_mode_version})
     
     def process_query(self, message: str, user_id: str = "toni") -> Tuple[Dict[str, Any], Optional[str]]:
@@ -54,6 +71,19 @@ class Orchestrator:
                 - result_dict: Metadata and component outputs
                 - error_message: String describing failure, or None
         """
+        started = time.perf_counter()
+        profile = self.profiler.start()
+        result, error = self._process_query(message, user_id, profile)
+        self._observe_query(result, (time.perf_counter() - started) * 1000, profile)
+        return result, error
+
+    def _process_query(
+        self,
+        message: str,
+        user_id: str,
+        profile: Optional[QueryProfile]
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Pipeline body of process_query."""
         
         correlation_id = str(uuid.uuid4())
         self.state = StateEnum.ROUTING
@@ -73,9 +103,17 @@ class Orchestrator:
         synthesizer_output = None
         
         try:
+            # ─── STEP 0: DECISION CACHE ───
+            cache_key = self._decision_cache_key(message)
+            cached = self._cached_result(cache_key, correlation_id, user_id, message, start_total)
+            if cached is not None:
+                cached["audit_id"] = self._save_audit_transaction(cached)
+                self.state = StateEnum.COMPLETED
+                return cached, None
+
             # ─── STEP 1: ROUTER ───
             router_start = datetime.now(timezone.utc)
-            query_plan, router_error = self.router.route_query(message)
+            query_plan, router_error = self._call_stage(profile, self.router.route_query, message)
             router_end = datetime.now(timezone.utc)
             execution_times["router_ms"] = (router_end - router_start).total_seconds() * 1000
             
@@ -96,7 +134,7 @@ class Orchestrator:
             # ─── STEP 2: GOVERNOR ───
             self.state = StateEnum.GOVERNING
             governor_start = datetime.now(timezone.utc)
-            governor_decision, governor_error = self.governor.evaluate(query_plan)
+            governor_decision, governor_error = self._call_stage(profile, self.governor.evaluate, query_plan)
             governor_end = datetime.now(timezone.utc)
             execution_times["governor_ms"] = (governor_end - governor_start).total_seconds() * 1000
             
@@ -113,7 +151,7 @@ class Orchestrator:
             # ─── STEP 3: SYNTHESIZER ───
             self.state = StateEnum.SYNTHESIZING
             synthesizer_start = datetime.now(timezone.utc)
-            synthesizer_output, synthesizer_error = self.synthesizer.synthesize(query_plan, governor_decision)
+            synthesizer_output, synthesizer_error = self._call_stage(profile, self.synthesizer.synthesize, query_plan, governor_decision)
             synthesizer_end = datetime.now(timezone.utc)
             execution_times["synthesizer_ms"] = (synthesizer_end - synthesizer_start).total_seconds() * 1000
             
@@ -124,6 +162,8 @@ class Orchestrator:
                     return self._finalize_with_error(correlation_id, user_id, message, synthesizer_error, "synthesizer_failed", execution_times, query_plan, governor_decision)
                 else:
                     logger.warning("Synthesizer partial success (degraded)", extra={"correlation_id": correlation_id, "error": synthesizer_error})
+            else:
+                self.decision_cache.put(cache_key, query_plan, governor_decision, synthesizer_output)
             
             logger.info("Synthesizer success", extra={
                 "correlation_id": correlation_id,
@@ -145,6 +185,7 @@ class Orchestrator:
                 execution_times=execution_times,
                 status="success"
             )
+            result["decision_cache"] = "miss"
             
             audit_id = self._save_audit_transaction(result)
             result["audit_id"] = audit_id
@@ -161,6 +202,209 @@ class Orchestrator:
             res_dict, _ = self._finalize_with_error(correlation_id, user_id, message, error_msg, "orchestrator_panic", execution_times, query_plan, governor_decision)
             return res_dict, error_msg
 
+    async def process_query_async(self, message: str, user_id: str = "toni") -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Non-blocking variant of process_query for the async API.
+
+        Router and Governor run in worker threads, the Synthesizer retries with
+        asyncio.sleep, and the audit log is persisted in a background task, so
+        concurrent queries overlap instead of serializing on the event loop.
+        The returned audit_id is "DEFERRED"; the persisted id is logged.
+
+        Returns:
+            Tuple[Dict[str, Any], Optional[str]]: Same contract as process_query.
+        """
+        started = time.perf_counter()
+        profile = self.profiler.start()
+        result, error = await self._process_query_async(message, user_id, profile)
+        self._observe_query(result, (time.perf_counter() - started) * 1000, profile)
+        return result, error
+
+    async def _process_query_async(
+        self,
+        message: str,
+        user_id: str,
+        profile: Optional[QueryProfile]
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Pipeline body of process_query_async.
+
+        Leaves self.state alone: the orchestrator is shared by concurrent
+        requests, so per-query progress lives in the result and the logs.
+        """
+
+        correlation_id = str(uuid.uuid4())
+
+        logger.info("Processing new query (async)", extra={
+            "correlation_id": correlation_id,
+            "user_id": user_id,
+            "message_len": len(message)
+        })
+
+        execution_times: Dict[str, float] = {}
+        start_total = datetime.now(timezone.utc)
+
+        query_plan = None
+        governor_decision = None
+        synthesizer_output = None
+
+        try:
+            # ─── STEP 0: DECISION CACHE ───
+            cache_key = self._decision_cache_key(message)
+            cached = self._cached_result(cache_key, correlation_id, user_id, message, start_total)
+            if cached is not None:
+                cached["audit_id"] = self._schedule_audit(cached)
+                return cached, None
+
+            # ─── STEP 1: ROUTER ───
+            router_start = datetime.now(timezone.utc)
+            query_plan, router_error = await asyncio.to_thread(self._call_stage, profile, self.router.route_query, message)
+            execution_times["router_ms"] = (datetime.now(timezone.utc) - router_start).total_seconds() * 1000
+
+            if router_error:
+                return self._finalize_with_error_deferred(correlation_id, user_id, message, router_error, "router_failed", execution_times)
+
+            if query_plan:
+                setattr(query_plan, "correlation_id", correlation_id)
+
+            logger.info("Router success", extra={
+                "correlation_id": correlation_id,
+                "domains": query_plan.domains_selected if query_plan else [],
+                "time_ms": execution_times["router_ms"]
+            })
+
+            # ─── STEP 2: GOVERNOR ───
+            governor_start = datetime.now(timezone.utc)
+            governor_decision, governor_error = await asyncio.to_thread(self._call_stage, profile, self.governor.evaluate, query_plan)
+            execution_times["governor_ms"] = (datetime.now(timezone.utc) - governor_start).total_seconds() * 1000
+
+            if governor_error:
+                return self._finalize_with_error_deferred(correlation_id, user_id, message, governor_error, "governor_failed", execution_times, query_plan)
+
+            logger.info("Governor success", extra={
+                "correlation_id": correlation_id,
+                "recommendation": governor_decision.recommendation if governor_decision else "unknown",
+                "time_ms": execution_times["governor_ms"]
+            })
+
+            # ─── STEP 3: SYNTHESIZER ───
+            synthesizer_start = datetime.now(timezone.utc)
+            synthesizer_output, synthesizer_error = await self.synthesizer.synthesize_async(
+                query_plan, governor_decision, runner=profile.call if profile else None
+            )
+            execution_times["synthesizer_ms"] = (datetime.now(timezone.utc) - synthesizer_start).total_seconds() * 1000
+
+            if synthesizer_error:
+                if not synthesizer_output:
+                    return self._finalize_with_error_deferred(correlation_id, user_id, message, synthesizer_error, "synthesizer_failed", execution_times, query_plan, governor_decision)
+                else:
+                    logger.warning("Synthesizer partial success (degraded)", extra={"correlation_id": correlation_id, "error": synthesizer_error})
+            else:
+                self.decision_cache.put(cache_key, query_plan, governor_decision, synthesizer_output)
+
+            logger.info("Synthesizer success", extra={
+                "correlation_id": correlation_id,
+                "time_ms": execution_times["synthesizer_ms"]
+            })
+
+            # ─── STEP 4: AUDIT (off the request path) ───
+            total_time_ms = (datetime.now(timezone.utc) - start_total).total_seconds() * 1000
+            execution_times["total_ms"] = total_time_ms
+
+            result = self._build_result_dict(
+                correlation_id=correlation_id,
+                user_id=user_id,
+                message=message,
+                query_plan=query_plan,
+                governor_decision=governor_decision,
+                synthesizer_output=synthesizer_output,
+                execution_times=execution_times,
+                status="success"
+            )
+            result["decision_cache"] = "miss"
+            result["audit_id"] = self._schedule_audit(result)
+
+            logger.info("Pipeline complete", extra={"correlation_id": correlation_id, "total_ms": total_time_ms, "audit_id": result["audit_id"]})
+
+            return result, None
+
+        except Exception as e:
+            error_msg = f"Orchestrator critical failure: {str(e)}"
+            logger.exception("Critical error in pipeline", extra={"correlation_id": correlation_id})
+            res_dict, _ = self._finalize_with_error_deferred(correlation_id, user_id, message, error_msg, "orchestrator_panic", execution_times, query_plan, governor_decision)
+            return res_dict, error_msg
+
+    @staticmethod
+    def _call_stage(profile: Optional[QueryProfile], fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a pipeline stage, under cProfile when the query is sampled."""
+        return profile.call(fn, *args) if profile else fn(*args)
+
+    def _observe_query(self, result: Dict[str, Any], elapsed_ms: float, profile: Optional[QueryProfile]) -> None:
+        """Record stage latencies and outcome counters; keep the profile if among the slowest."""
+        execution_times = result.get("execution_times") or {}
+        for stage in ("router", "governor", "synthesizer"):
+            if f"{stage}_ms" in execution_times and result.get("decision_cache") != "hit":
+                self.metrics.observe(stage, execution_times[f"{stage}_ms"])
+        self.metrics.observe("total", elapsed_ms)
+        self.metrics.increment("queries", status=result.get("processing_status", "unknown"))
+        if result.get("decision_cache"):
+            self.metrics.increment("decision_cache_lookups", result=result["decision_cache"])
+        if profile is not None:
+            self.profiler.record(result.get("correlation_id", "unknown"), elapsed_ms, profile)
+
+    def _decision_cache_key(self, message: str) -> str:
+        """Cache key: normalized message + strategic mode and schema versions."""
+        return decision_cache_key(
+            message,
+            self.strategic_mode_version,
+            self.synthesizer.schema_version,
+            self.synthesizer.strategic_mode_id,
+            self.synthesizer.domain_pack_id,
+        )
+
+    def _cached_result(
+        self,
+        cache_key: str,
+        correlation_id: str,
+        user_id: str,
+        message: str,
+        start_total: datetime
+    ) -> Optional[Dict[str, Any]]:
+        """Result dict for a decision cache hit (fresh ids), or None on a miss."""
+        cached = self.decision_cache.get(cache_key)
+        if cached is None:
+            return None
+
+        query_plan, governor_decision, synthesizer_output = cached
+        query_plan.correlation_id = correlation_id
+        total_time_ms = (datetime.now(timezone.utc) - start_total).total_seconds() * 1000
+        result = self._build_result_dict(
+            correlation_id=correlation_id,
+            user_id=user_id,
+            message=message,
+            query_plan=query_plan,
+            governor_decision=governor_decision,
+            synthesizer_output=synthesizer_output,
+            execution_times={"router_ms": 0.0, "governor_ms": 0.0, "synthesizer_ms": 0.0, "total_ms": total_time_ms},
+            status="success"
+        )
+        result["decision_cache"] = "hit"
+        logger.info("Decision cache hit", extra={"correlation_id": correlation_id, "total_ms": total_time_ms})
+        return result
+
+    def _schedule_audit(self, result: Dict[str, Any]) -> str:
+        """Persist the audit log in a background task; returns "DEFERRED"."""
+        task = asyncio.get_running_loop().create_task(
+            asyncio.to_thread(self._save_audit_transaction, result)
+        )
+        self._pending_audits.add(task)
+        task.add_done_callback(self._pending_audits.discard)
+        return "DEFERRED"
+
+    async def drain_audits(self) -> None:
+        """Wait for in-flight background audit writes (shutdown, tests)."""
+        if self._pending_audits:
+            await asyncio.gather(*list(self._pending_audits), return_exceptions=True)
+
     def _build_result_dict(
         self,
         correlation_id: str,
@@ -186,35 +430,59 @@ class Orchestrator:
         }
 
     def _save_audit_transaction(self, result: Dict[str, Any]) -> str:
-        """Save to audit log with transaction safety."""
+        """
+        Save to audit log with transaction safety.
+
+        With write-behind enabled (default) the signed record is handed to the
+        audit sink and committed in a batch later, and "PENDING:<id>" is
+        returned; otherwise it is committed inline. "LOCAL_ONLY" means the
+        record could not be saved or queued.
+        """
         audit_id = "LOCAL_ONLY"
+        audit_start = time.perf_counter()
         try:
+            fields = self._audit_fields(result)
+            if write_behind_enabled():
+                # Not committed yet: the id is reported as PENDING until the sink writes it.
+                record_id = get_audit_sink().submit(build_audit_record(**fields))
+                audit_id = f"PENDING:{record_id}"
+                logger.info("Audit log queued", extra={"correlation_id": result["correlation_id"], "audit_id": record_id})
+                return audit_id
+
             db_service = get_db_service()
-            success, log_msg = db_service.save_audit_log(
-                correlation_id=result["correlation_id"],
-                user_id=result["user_id"],
-                message=result["message"],
-                query_plan=result["query_plan"] or {},
-                query_plan_id=result.get("query_plan", {}).get("query_plan_id", "unknown") if result["query_plan"] else "unknown",
-                governor_decision=result["governor_decision"] or {},
-                governor_decision_id=result.get("governor_decision", {}).get("decision_id", "unknown") if result["governor_decision"] else "unknown",
-                synthesizer_output=result["synthesizer_output"] or {},
-                synthesizer_output_id=result.get("synthesizer_output", {}).get("output_id", "unknown") if result["synthesizer_output"] else "unknown",
-                status=result["processing_status"],
-                strategic_mode_version=self.strategic_mode_version,
-                confidence_overall=result.get("query_plan", {}).get("confidence", Confidence.LOW) if result["query_plan"] else Confidence.LOW,
-                execution_times=result["execution_times"],
-            )
+            success, log_msg = db_service.save_audit_log(**fields)
             if success and "saved: " in log_msg:
                 audit_id = log_msg.split("saved: ")[1]
                 logger.info("Audit log persisted", extra={"correlation_id": result["correlation_id"], "audit_id": audit_id})
             else:
+                self.metrics.increment("audit_failures", reason="persistence")
                 logger.warning("Audit log persistence failed", extra={"correlation_id": result["correlation_id"], "reason": log_msg})
         except Exception as e:
+            self.metrics.increment("audit_failures", reason="exception")
             logger.error(f"Audit transaction error: {e}", extra={"correlation_id": result["correlation_id"]})
+        finally:
+            self.metrics.observe("audit_save", (time.perf_counter() - audit_start) * 1000)
             
         return audit_id
 
+    def _audit_fields(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Audit log fields for a pipeline result."""
+        return dict(
+            correlation_id=result["correlation_id"],
+            user_id=result["user_id"],
+            message=result["message"],
+            query_plan=result["query_plan"] or {},
+            query_plan_id=result.get("query_plan", {}).get("query_plan_id", "unknown") if result["query_plan"] else "unknown",
+            governor_decision=result["governor_decision"] or {},
+            governor_decision_id=result.get("governor_decision", {}).get("decision_id", "unknown") if result["governor_decision"] else "unknown",
+            synthesizer_output=result["synthesizer_output"] or {},
+            synthesizer_output_id=result.get("synthesizer_output", {}).get("output_id", "unknown") if result["synthesizer_output"] else "unknown",
+            status=result["processing_status"],
+            strategic_mode_version=self.strategic_mode_version,
+            confidence_overall=result.get("query_plan", {}).get("confidence", Confidence.LOW) if result["query_plan"] else Confidence.LOW,
+            execution_times=result["execution_times"],
+        )
+
     def _finalize_with_error(
         self, 
         correlation_id: str, 
@@ -245,6 +513,33 @@ class Orchestrator:
         return result, error
 
 
+    def _finalize_with_error_deferred(
+        self,
+        correlation_id: str,
+        user_id: str,
+        message: str,
+        error: str,
+        status: str,
+        execution_times: Dict[str, float],
+        query_plan: Optional[Any] = None,
+        governor_decision: Optional[Any] = None
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """_finalize_with_error for the async pipeline: the failure audit is deferred."""
+        result = self._build_result_dict(
+            correlation_id=correlation_id,
+            user_id=user_id,
+            message=message,
+            query_plan=query_plan,
+            governor_decision=governor_decision,
+            synthesizer_output=None,
+            execution_times=execution_times,
+            status=status
+        )
+        result["error"] = error
+        self._schedule_audit(result)
+        return result, error
+
+
 # ═══════════════════════════════════════════════════════════════
 # FACTORY FUNCTION
 # ═══════════════════════════════════════════════════════════════
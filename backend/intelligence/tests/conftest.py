@@ -0,0 +1,20 @@
+"""
+Shared fixtures for Intelligence tests.
+"""
+
+import sys
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_audit_sink(tmp_path, monkeypatch):
+    """Spool audit records under tmp_path and stop the sink after each test."""
+    monkeypatch.setenv("AUDIT_SPOOL_DIR", str(tmp_path / "audit-spool"))
+    yield
+    # test_orchestrator imports the package as `intelligence`, others as `backend.intelligence`.
+    for name in ("backend.intelligence.audit_sink", "intelligence.audit_sink"):
+        module = sys.modules.get(name)
+        if module is not None and module._audit_sink is not None:
+            module._audit_sink.close(timeout=5)
+            module._audit_sink = None
@@ -0,0 +1,136 @@
+"""
+Anclora Intelligence v1 — Async pipeline tests
+
+Tests:
+  - process_query_async returns the same result contract as process_query
+  - Concurrent queries overlap instead of serializing on the event loop
+  - Synthesizer retries back off with asyncio.sleep
+  - Audit persistence runs after the response, off the request path
+  - App shutdown drains deferred audits and stops the audit sink
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from backend.api.routes import intelligence as intelligence_routes
+from backend.intelligence import audit_sink as audit_sink_module
+from backend.intelligence.components import synthesizer as synthesizer_module
+from backend.intelligence.orchestrator import create_orchestrator
+from backend.intelligence.intelligence_types import StateEnum
+
+MESSAGE = "¿Es buen momento para solicitar excedencia en CGI?"
+
+
+@pytest.mark.asyncio
+async def test_async_pipeline_result_structure() -> None:
+    orchestrator = create_orchestrator()
+
+    with patch.object(orchestrator, "_save_audit_transaction", return_value="audit-1") as save:
+        result, error = await orchestrator.process_query_async(MESSAGE, user_id="toni")
+        await orchestrator.drain_audits()
+
+    assert error is None
+    assert result["processing_status"] == "success"
+    assert result["audit_id"] == "DEFERRED"
+    for key in ("query_plan", "governor_decision", "synthesizer_output"):
+        assert result[key] is not None
+    assert {"router_ms", "governor_ms", "synthesizer_ms", "total_ms"} <= set(result["execution_times"])
+    save.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_overlap() -> None:
+    orchestrator = create_orchestrator()
+    original = orchestrator.synthesizer._synthesize
+
+    def slow_synthesize(query_plan, governor_decision):
+        time.sleep(0.2)
+        return original(query_plan, governor_decision)
+
+    with patch.object(orchestrator.synthesizer, "_synthesize", side_effect=slow_synthesize), \
+         patch.object(orchestrator, "_save_audit_transaction", return_value="audit-1"):
+        started = time.perf_counter()
+        results = await asyncio.gather(*(orchestrator.process_query_async(MESSAGE) for _ in range(4)))
+        elapsed = time.perf_counter() - started
+        await orchestrator.drain_audits()
+
+    assert all(error is None for _, error in results)
+    assert len({result["correlation_id"] for result, _ in results}) == 4
+    assert elapsed < 0.6
+    assert orchestrator.state == StateEnum.IDLE  # shared instance: no per-query state
+
+
+@pytest.mark.asyncio
+async def test_synthesizer_retry_uses_asyncio_sleep() -> None:
+    orchestrator = create_orchestrator()
+    synthesizer = orchestrator.synthesizer
+    calls = {"n": 0}
+
+    def flaky(query_plan, governor_decision):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise RuntimeError("transient")
+        return None, None
+
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    with patch.object(synthesizer, "_synthesize", side_effect=flaky), \
+         patch.object(synthesizer_module.asyncio, "sleep", side_effect=fake_sleep), \
+         patch.object(synthesizer_module.time, "sleep") as blocking_sleep:
+        assert await synthesizer.synthesize_async(None, None) == (None, None)
+
+    assert calls["n"] == 2
+    assert len(sleeps) == 1
+    blocking_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_audit_runs_off_request_path() -> None:
+    orchestrator = create_orchestrator()
+
+    def slow_audit(result):
+        time.sleep(0.3)
+        return "audit-1"
+
+    with patch.object(orchestrator, "_save_audit_transaction", side_effect=slow_audit) as save:
+        started = time.perf_counter()
+        result, error = await orchestrator.process_query_async(MESSAGE)
+        elapsed = time.perf_counter() - started
+
+        assert error is None
+        assert elapsed < 0.3
+        assert len(orchestrator._pending_audits) == 1
+
+        await orchestrator.drain_audits()
+
+    assert not orchestrator._pending_audits
+    save.assert_called_once_with(result)
+
+
+@pytest.mark.asyncio
+async def test_shutdown_drains_audits_and_closes_sink(monkeypatch) -> None:
+    orchestrator = create_orchestrator()
+    monkeypatch.setattr(intelligence_routes, "_orchestrator", orchestrator)
+    sink = audit_sink_module.get_audit_sink()
+    saved: list[str] = []
+
+    def slow_audit(result):
+        time.sleep(0.1)
+        saved.append(result["correlation_id"])
+        return "audit-1"
+
+    with patch.object(orchestrator, "_save_audit_transaction", side_effect=slow_audit), \
+         patch.object(sink, "close", wraps=sink.close) as close:
+        result, _ = await orchestrator.process_query_async(MESSAGE)
+        await intelligence_routes.shutdown_intelligence()
+
+    assert saved == [result["correlation_id"]]
+    assert not orchestrator._pending_audits
+    close.assert_called_once()
+    assert audit_sink_module._audit_sink is None
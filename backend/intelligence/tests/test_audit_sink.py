@@ -0,0 +1,207 @@
+"""
+Anclora Intelligence v1 — Write-behind audit sink tests
+
+Tests:
+  - Records are committed in bounded multi-row batches and the spool is compacted
+  - Records keep the inline checksum / HMAC semantics
+  - Orphaned spools (dead process) are claimed and replayed; live ones are not
+  - Transient errors are retried idempotently while heartbeating; rejected records are dead-lettered
+  - A process whose spool was claimed continues in a new spool
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+
+from backend.intelligence.audit_sink import AuditRecordRejected, AuditSink
+from backend.intelligence.database import audit_row, build_audit_record
+
+
+def make_record(n: int = 0) -> dict:
+    return build_audit_record(
+        correlation_id=f"corr-{n}",
+        user_id="toni",
+        message=f"mensaje {n}",
+        query_plan={"query_plan_id": "qp"},
+        query_plan_id="qp",
+        governor_decision={"decision_id": "gd"},
+        governor_decision_id="gd",
+        synthesizer_output={"output_id": "so"},
+        synthesizer_output_id="so",
+        status="success",
+        strategic_mode_version="1.0-validation-phase",
+        confidence_overall="medium",
+        execution_times={"router_ms": 1.0, "total_ms": 4.0},
+    )
+
+
+class RecordingWriter:
+    def __init__(self, transient_failures: int = 0, poison: frozenset = frozenset()) -> None:
+        self.transient_failures = transient_failures
+        self.poison = poison
+        self.batches: list[tuple[list[str], bool]] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, records, skip_existing):
+        with self.lock:
+            self.batches.append(([r["id"] for r in records], skip_existing))
+            if self.transient_failures:
+                self.transient_failures -= 1
+                raise ConnectionError("database down")
+        if any(r["id"] in self.poison for r in records):
+            raise AuditRecordRejected("value too long for column")
+
+
+def written_ids(writer: RecordingWriter, poison: frozenset = frozenset()) -> list[str]:
+    """Ids of batches that committed (no transient failure, no poison)."""
+    return [
+        record_id
+        for batch, _ in writer.batches
+        if not poison.intersection(batch)
+        for record_id in batch
+    ]
+
+
+def test_records_are_written_in_batches(tmp_path) -> None:
+    writer = RecordingWriter()
+    sink = AuditSink(writer, spool_dir=tmp_path, batch_size=50, flush_interval=0.01)
+
+    ids = [sink.submit(make_record(n)) for n in range(120)]
+    assert sink.flush(timeout=5)
+    spool = sink.spool_path
+    assert spool.read_text() == ""
+    sink.close()
+
+    assert written_ids(writer) == ids
+    assert all(len(batch) <= 50 for batch, _ in writer.batches)
+    assert not any(skip for _, skip in writer.batches)
+    assert sink.stats()["written"] == 120
+    assert not spool.exists()
+
+
+def test_record_checksum_and_signature(monkeypatch) -> None:
+    monkeypatch.setenv("AUDIT_SECRET", "test-secret")
+    record = make_record(7)
+
+    checksum_data = {
+        "correlation_id": "corr-7",
+        "user_id": "toni",
+        "message": "mensaje 7",
+        "query_plan_id": "qp",
+        "governor_decision_id": "gd",
+        "synthesizer_output_id": "so",
+        "status": "success",
+        "created_at": record["created_at"],
+    }
+    checksum = hashlib.sha256(json.dumps(checksum_data, sort_keys=True).encode()).hexdigest()
+
+    assert record["checksum"] == checksum
+    assert record["signature"] == hmac.new(b"test-secret", checksum.encode(), hashlib.sha256).hexdigest()
+    assert audit_row(record)["created_at"].isoformat() == record["created_at"]
+    assert record["message_length"] == len("mensaje 7")
+
+
+def test_orphaned_spool_is_claimed_and_replayed(tmp_path) -> None:
+    records = [make_record(n) for n in range(3)]
+    acked = make_record(99)
+    orphan = tmp_path / "intelligence_audit.4242-deadbeef.jsonl"
+    with open(orphan, "w", encoding="utf-8") as f:
+        for record in records + [acked]:
+            f.write(json.dumps({"op": "record", "record": record}) + "\n")
+        f.write(json.dumps({"op": "ack", "ids": [acked["id"]]}) + "\n")
+        f.write('{"op": "record", "rec')  # torn write
+    stale = time.time() - 120
+    os.utime(orphan, (stale, stale))
+
+    live = tmp_path / "intelligence_audit.4243-cafecafe.jsonl"
+    live.write_text(json.dumps({"op": "record", "record": make_record(7)}) + "\n")
+
+    writer = RecordingWriter()
+    sink = AuditSink(writer, spool_dir=tmp_path, flush_interval=0.01)
+    sink.start()
+    assert sink.flush(timeout=5)
+    sink.close()
+
+    assert sink.stats()["replayed"] == 3
+    assert writer.batches == [([r["id"] for r in records], True)]
+    assert not orphan.exists()
+    assert live.exists()  # another process's live spool is left alone
+
+
+def test_transient_errors_are_retried(tmp_path) -> None:
+    writer = RecordingWriter(transient_failures=2)
+    sink = AuditSink(writer, spool_dir=tmp_path, flush_interval=0.01, max_backoff=0.01)
+
+    record_id = sink.submit(make_record())
+    assert sink.flush(timeout=5)
+    sink.close()
+
+    assert [batch for batch, _ in writer.batches] == [[record_id]] * 3
+    # A failed attempt may have committed: retries skip ids already stored.
+    assert [skip for _, skip in writer.batches] == [False, True, True]
+    assert sink.stats()["written"] == 1
+    assert sink.stats()["dead_lettered"] == 0
+
+
+def test_retry_backoff_keeps_heartbeating(tmp_path) -> None:
+    writer = RecordingWriter(transient_failures=10**6)
+    sink = AuditSink(writer, spool_dir=tmp_path, flush_interval=0.01, max_backoff=5.0, orphan_after=0.4)
+    sink.submit(make_record())
+    spool = sink.spool_path
+
+    time.sleep(1.2)  # well past orphan_after, inside one long backoff
+    assert time.time() - spool.stat().st_mtime < 0.4
+
+    claimer = AuditSink(RecordingWriter(), spool_dir=tmp_path, orphan_after=0.4)
+    claimer.start()
+    claimer.close()
+    assert claimer.stats()["replayed"] == 0
+    assert spool.exists()
+    sink.close(timeout=5)
+
+
+def test_claimed_spool_is_replaced(tmp_path) -> None:
+    writer = RecordingWriter()
+    sink = AuditSink(writer, spool_dir=tmp_path, flush_interval=0.01)
+    sink.start()
+    old_spool = sink.spool_path
+    old_spool.rename(old_spool.with_name(old_spool.name + ".claimed-1"))
+
+    sink._touch_spool()
+    record_id = sink.submit(make_record())
+    assert sink.flush(timeout=5)
+    new_spool = sink.spool_path
+    sink.close()
+
+    assert new_spool != old_spool
+    # The claimer may replay records we also write: ours must skip existing ids.
+    assert writer.batches == [([record_id], True)]
+
+
+def test_rejected_record_is_isolated_and_dead_lettered(tmp_path) -> None:
+    records = [make_record(n) for n in range(8)]
+    poison = frozenset({records[5]["id"]})
+    writer = RecordingWriter(poison=poison)
+    sink = AuditSink(writer, spool_dir=tmp_path, batch_size=8, flush_interval=0.2)
+
+    for record in records:
+        sink.submit(record)
+    assert sink.flush(timeout=5)
+    dead_letter = sink.dead_letter_path
+    sink.close()
+
+    assert sorted(written_ids(writer, poison)) == sorted(r["id"] for r in records if r["id"] not in poison)
+    assert sink.stats()["dead_lettered"] == 1
+    assert [json.loads(line)["record"]["id"] for line in dead_letter.read_text().splitlines()] == [records[5]["id"]]
+
+
+def test_unwritten_records_stay_spooled_on_close(tmp_path) -> None:
+    sink = AuditSink(RecordingWriter(transient_failures=10**6), spool_dir=tmp_path, flush_interval=0.01, max_backoff=0.01)
+    ids = [sink.submit(make_record(n)) for n in range(3)]
+    spool = sink.spool_path
+    sink.close(timeout=5)
+
+    assert [r["id"] for r in AuditSink._read_unacked(spool)] == ids
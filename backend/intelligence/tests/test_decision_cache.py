@@ -0,0 +1,89 @@
+"""
+Anclora Intelligence v1 — Decision cache tests
+
+Tests:
+  - Repeated (normalized) questions skip Router/Governor/Synthesizer
+  - Cache hits get fresh ids, correlation_id and their own audit row
+  - Degraded synthesizer output is never cached
+  - Message normalization does not change Router output
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from backend.intelligence.components.router import create_router
+from backend.intelligence.decision_cache import decision_cache_key, normalize_message
+from backend.intelligence.orchestrator import create_orchestrator
+
+MESSAGE = "¿Es buen momento para solicitar excedencia en CGI?"
+
+
+def test_repeated_question_is_served_from_cache() -> None:
+    orchestrator = create_orchestrator()
+
+    with patch.object(orchestrator, "_save_audit_transaction", return_value="audit") as save:
+        first, error = orchestrator.process_query(MESSAGE)
+        assert error is None
+        with patch.object(orchestrator.router, "route_query", wraps=orchestrator.router.route_query) as route:
+            second, error = orchestrator.process_query("  ¿es BUEN momento para   solicitar excedencia en cgi?  ")
+            route.assert_not_called()
+
+    assert error is None
+    assert first["decision_cache"] == "miss"
+    assert second["decision_cache"] == "hit"
+    assert second["correlation_id"] != first["correlation_id"]
+    assert second["query_plan"]["correlation_id"] == second["correlation_id"]
+    assert second["query_plan"]["query_plan_id"] != first["query_plan"]["query_plan_id"]
+    assert second["governor_decision"]["decision_id"] != first["governor_decision"]["decision_id"]
+    assert second["synthesizer_output"]["output_id"] != first["synthesizer_output"]["output_id"]
+    assert second["synthesizer_output"]["trace"]["governor_decision_id"] == second["governor_decision"]["decision_id"]
+    assert second["synthesizer_output"]["answer"] == first["synthesizer_output"]["answer"]
+    assert second["governor_decision"]["recommendation"] == first["governor_decision"]["recommendation"]
+    assert save.call_count == 2
+    assert orchestrator.decision_cache.stats()["hits"] == 1
+
+
+def test_degraded_output_is_not_cached() -> None:
+    orchestrator = create_orchestrator()
+
+    with patch.object(orchestrator.synthesizer, "_synthesize", side_effect=lambda qp, gd: orchestrator.synthesizer._generate_fallback_output(qp, gd, "boom")), \
+         patch.object(orchestrator, "_save_audit_transaction", return_value="audit"):
+        result, error = orchestrator.process_query(MESSAGE)
+
+    assert error is None
+    assert "degraded-output" in result["synthesizer_output"]["meta"]["flags"]
+    assert orchestrator.decision_cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_async_pipeline_uses_cache() -> None:
+    orchestrator = create_orchestrator()
+
+    with patch.object(orchestrator, "_save_audit_transaction", return_value="audit") as save:
+        await orchestrator.process_query_async(MESSAGE)
+        result, error = await orchestrator.process_query_async(MESSAGE)
+        await orchestrator.drain_audits()
+
+    assert error is None
+    assert result["decision_cache"] == "hit"
+    assert save.call_count == 2
+
+
+def test_key_depends_on_versions() -> None:
+    assert decision_cache_key(MESSAGE, "1.0") == decision_cache_key(MESSAGE.upper(), "1.0")
+    assert decision_cache_key(MESSAGE, "1.0") != decision_cache_key(MESSAGE, "1.1")
+
+
+@pytest.mark.parametrize("message", [
+    MESSAGE,
+    "Comparar impacto fiscal vs marca?  Precio   del mercado",
+    "lab beta",
+])
+def test_normalization_preserves_router_output(message: str) -> None:
+    router = create_router()
+    plan, _ = router.route_query(message)
+    normalized_plan, _ = router.route_query(normalize_message(message))
+
+    fields = {"mode", "domains_selected", "confidence", "flags", "rationale"}
+    assert plan.model_dump(include=fields) == normalized_plan.model_dump(include=fields)
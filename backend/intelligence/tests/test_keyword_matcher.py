@@ -0,0 +1,96 @@
+"""
+Anclora Intelligence v1 — Keyword matcher tests
+
+Tests:
+  - Terms match whole words and "*" stems match word starts, case- and accent-insensitively
+  - Overlapping terms report every tag in a single scan
+  - The trie-compiled pattern agrees with a naive scan on a large registry
+  - Router domains, mode and flags come from one scan
+"""
+
+import random
+import re
+
+from backend.intelligence.components.keyword_matcher import KeywordMatcher, fold_text
+from backend.intelligence.components.router import create_router
+
+
+def test_whole_word_and_accent_insensitive_matching() -> None:
+    matcher = KeywordMatcher({"brand": ["marca", "reputación"], "market": ["precio"]})
+
+    assert matcher.scan("La REPUTACION de la Marca") == {"brand"}
+    assert matcher.scan("precio, al alza") == {"market"}
+    assert matcher.scan("precios al alza") == set()
+    assert matcher.scan("una comarca sin aprecio") == set()
+
+
+def test_stems_match_word_starts() -> None:
+    matcher = KeywordMatcher({"flag": ["experimen*"], "market": ["precio*"]})
+
+    assert matcher.scan("un EXPERIMENTO con precios") == {"flag", "market"}
+    assert matcher.scan("sin aprecio por la experimentación") == {"flag"}
+
+
+def test_overlapping_terms_report_all_tags() -> None:
+    matcher = KeywordMatcher({
+        "flag": ["lab"],
+        "transition": ["laboral*"],
+        "brand": ["diferencia*"],
+        "mode": ["diferencia"],
+    })
+
+    assert matcher.scan("situación laboral") == {"transition"}
+    assert matcher.scan("acceso al lab") == {"flag"}
+    assert matcher.scan("la diferencia") == {"brand", "mode"}
+    assert matcher.scan("las diferencias") == {"brand"}
+
+
+def test_compiled_pattern_matches_naive_scan() -> None:
+    rng = random.Random(7)
+    alphabet = "abcdeéñ"
+    registry = {
+        f"tag{n}": [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(2, 6))) + rng.choice(("", "*"))
+            for _ in range(100)
+        ]
+        for n in range(5)
+    }
+    matcher = KeywordMatcher(registry)
+
+    def naive_hit(term: str, word: str) -> bool:
+        folded = fold_text(term)
+        return word.startswith(folded[:-1]) if folded.endswith("*") else word == folded
+
+    for _ in range(200):
+        text = " ".join("".join(rng.choice(alphabet) for _ in range(rng.randint(1, 8))) for _ in range(12))
+        words = re.findall(r"\w+", fold_text(text))
+        expected = {
+            tag
+            for tag, terms in registry.items()
+            for term in terms
+            if any(naive_hit(term, word) for word in words)
+        }
+        assert matcher.scan(text) == expected
+
+
+def test_router_uses_single_scan() -> None:
+    router = create_router()
+    calls = []
+    scan = router.keyword_matcher.scan
+    router.keyword_matcher.scan = lambda text: calls.append(text) or scan(text)
+
+    plan, error = router.route_query("Comparar el impacto fiscal de la automatizacion del experimento")
+
+    assert error is None
+    assert len(calls) == 1
+    assert plan.domains_selected == ["tax", "system"]
+    assert plan.mode == "deep"
+    assert "lab-access-requested" in plan.flags
+
+
+def test_router_does_not_flag_lab_for_laboral() -> None:
+    plan, error = create_router().route_query("¿Cómo afecta la excedencia a mi situación laboral?")
+
+    assert error is None
+    assert plan.domains_selected == ["transition"]
+    assert "lab-access-requested" not in plan.flags
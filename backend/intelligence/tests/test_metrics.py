@@ -0,0 +1,137 @@
+"""
+Anclora Intelligence v1 — Metrics & profiler tests
+
+Tests:
+  - Histogram quantiles and Prometheus text exposition
+  - Orchestrator records stage latencies, outcomes and audit failures
+  - Opt-in profiler keeps cProfile stats of the slowest sampled queries
+  - /metrics and /profiles endpoints
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from backend.api.routes import intelligence as intelligence_routes
+from backend.intelligence.metrics import Histogram, MetricsRegistry, SlowQueryProfiler
+from backend.intelligence.orchestrator import create_orchestrator
+
+MESSAGE = "¿Es buen momento para solicitar excedencia en CGI?"
+
+
+def test_histogram_quantiles() -> None:
+    histogram = Histogram(buckets=(10, 100, 1000))
+    for value in [5] * 90 + [50] * 9 + [500]:
+        histogram.observe(value)
+
+    assert histogram.counts == [90, 9, 1, 0]
+    assert histogram.quantile(0.5) <= 10
+    assert 10 < histogram.quantile(0.95) <= 100
+    assert histogram.snapshot()["max_ms"] == 500
+
+
+def test_prometheus_text_format() -> None:
+    registry = MetricsRegistry(buckets=(10, 100))
+    registry.observe("router", 5)
+    registry.observe("router", 50)
+    registry.observe("router", 500)
+    registry.increment("queries", status="success")
+    registry.register_collector("decision_cache", lambda: {"hits": 3, "hit_ratio": 0.5})
+
+    lines = registry.prometheus_text().splitlines()
+
+    assert "# TYPE intelligence_stage_duration_milliseconds histogram" in lines
+    assert 'intelligence_stage_duration_milliseconds_bucket{stage="router",le="10"} 1' in lines
+    assert 'intelligence_stage_duration_milliseconds_bucket{stage="router",le="100"} 2' in lines
+    assert 'intelligence_stage_duration_milliseconds_bucket{stage="router",le="+Inf"} 3' in lines
+    assert 'intelligence_stage_duration_milliseconds_count{stage="router"} 3' in lines
+    assert 'intelligence_stage_duration_milliseconds_sum{stage="router"} 555' in lines
+    assert 'intelligence_queries_total{status="success"} 1' in lines
+    assert "intelligence_decision_cache_hits 3" in lines
+    assert "intelligence_decision_cache_hit_ratio 0.5" in lines
+
+
+def test_orchestrator_records_stage_metrics() -> None:
+    orchestrator = create_orchestrator()
+
+    with patch.object(orchestrator, "_save_audit_transaction", return_value="audit"):
+        orchestrator.process_query(MESSAGE)
+        orchestrator.process_query(MESSAGE)
+
+    snapshot = orchestrator.metrics.snapshot()
+    assert snapshot["stages"]["router"]["count"] == 1  # second query is a cache hit
+    assert snapshot["stages"]["synthesizer"]["count"] == 1
+    assert snapshot["stages"]["total"]["count"] == 2
+    assert snapshot["counters"]["queries"] == {"status=success": 2.0}
+    assert snapshot["counters"]["decision_cache_lookups"] == {"result=miss": 1.0, "result=hit": 1.0}
+    assert snapshot["gauges"]["decision_cache"]["hits"] == 1
+
+
+def test_audit_save_time_and_failures_are_recorded(monkeypatch) -> None:
+    monkeypatch.setenv("INTELLIGENCE_AUDIT_WRITE_BEHIND", "0")
+    orchestrator = create_orchestrator()
+
+    with patch("backend.intelligence.orchestrator.orchestrator.get_db_service", side_effect=RuntimeError("db down")):
+        result, error = orchestrator.process_query(MESSAGE)
+
+    assert error is None
+    assert result["audit_id"] == "LOCAL_ONLY"
+    snapshot = orchestrator.metrics.snapshot()
+    assert snapshot["stages"]["audit_save"]["count"] == 1
+    assert snapshot["counters"]["audit_failures"] == {"reason=exception": 1.0}
+
+
+def test_profiler_keeps_slowest_queries() -> None:
+    orchestrator = create_orchestrator()
+    orchestrator.profiler = SlowQueryProfiler(top_n=2)
+    orchestrator.decision_cache.max_entries = 0
+    original = orchestrator.synthesizer._synthesize
+    delays = iter([0.0, 0.05, 0.02])
+
+    def slow_synthesize(query_plan, governor_decision):
+        time.sleep(next(delays))
+        return original(query_plan, governor_decision)
+
+    with patch.object(orchestrator.synthesizer, "_synthesize", side_effect=slow_synthesize), \
+         patch.object(orchestrator, "_save_audit_transaction", return_value="audit"):
+        ids = [orchestrator.process_query(MESSAGE)[0]["correlation_id"] for _ in range(3)]
+
+    slowest = orchestrator.profiler.slowest()
+    assert [entry["correlation_id"] for entry in slowest] == [ids[1], ids[2]]
+    assert "route_query" in slowest[0]["stats"]
+    assert orchestrator.profiler.stats()["sampled"] == 3
+
+
+@pytest.mark.asyncio
+async def test_async_pipeline_profiles_worker_stages() -> None:
+    orchestrator = create_orchestrator()
+    orchestrator.profiler = SlowQueryProfiler(top_n=1)
+
+    with patch.object(orchestrator, "_save_audit_transaction", return_value="audit"):
+        await orchestrator.process_query_async(MESSAGE)
+        await orchestrator.drain_audits()
+
+    stats = orchestrator.profiler.slowest()[0]["stats"]
+    assert "route_query" in stats
+    assert "_synthesize" in stats
+
+
+def test_metrics_and_profiles_endpoints(monkeypatch) -> None:
+    orchestrator = create_orchestrator()
+    monkeypatch.setattr(intelligence_routes, "_orchestrator", orchestrator)
+    with patch.object(orchestrator, "_save_audit_transaction", return_value="audit"):
+        orchestrator.process_query(MESSAGE)
+
+    response = asyncio.run(intelligence_routes.intelligence_metrics())
+    body = response.body.decode()
+    assert response.media_type.startswith("text/plain")
+    assert 'intelligence_stage_duration_milliseconds_count{stage="total"} 1' in body
+
+    profiles = asyncio.run(intelligence_routes.intelligence_profiles())
+    assert profiles["enabled"] is False
+    assert profiles["queries"] == []
+
+    status = asyncio.run(intelligence_routes.intelligence_status())
+    assert status["metrics"]["stages"]["total"]["count"] == 1
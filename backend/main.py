@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends, HTTPException, Header
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Optional
@@ -14,8 +15,18 @@ from backend.api.routes.automation import router as automation_router
 from backend.api.routes.command_center import router as command_center_router
 from backend.api.routes.deal_margin import router as deal_margin_router
 from backend.api.routes.source_observatory import router as source_observatory_router
+from backend.api.routes.jobs import router as jobs_router
+from backend.api.routes.intelligence import shutdown_intelligence
 
-app = FastAPI(title="Anclora Nexus API", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Deferred Intelligence audits must reach the sink before it stops.
+    await shutdown_intelligence()
+
+
+app = FastAPI(title="Anclora Nexus API", version="0.1.0", lifespan=lifespan)
 
 # CORS Configuration
 app.add_middleware(
@@ -40,6 +51,7 @@ app.include_router(automation_router, prefix="/api/automation", tags=["Automatio
 app.include_router(command_center_router, prefix="/api/command-center", tags=["Command Center"])
 app.include_router(deal_margin_router, prefix="/api/deal-margin", tags=["Deal Margin"])
 app.include_router(source_observatory_router, prefix="/api/source-observatory", tags=["Source Observatory"])
+app.include_router(jobs_router, prefix="/api/jobs", tags=["Jobs"])
 
 @app.get("/health")
 async def health_check():
@@ -37,6 +37,15 @@ class UsageEventResponse(BaseModel):
     metadata: Dict[str, Any]
     created_at: datetime
 
+class LedgerReconcileResponse(BaseModel):
+    org_id: str
+    month_key: str
+    ledger_total_eur: float
+    raw_total_eur: float
+    drift_eur: float
+    event_count: int
+    corrected: bool
+
 class AlertResponse(BaseModel):
     id: str
     org_id: str
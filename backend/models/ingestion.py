@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, EmailStr, Field
 
 class EntityType(str, Enum):
@@ -94,3 +94,27 @@ class IngestionEvent(BaseModel):
     error_detail: Optional[Dict[str, Any]] = None
     processed_at: datetime = Field(default_factory=datetime.utcnow)
     dedupe_key: str
+
+# Max items accepted by a single batch ingestion request.
+MAX_INGESTION_BATCH_ITEMS = 20000
+
+class LeadIngestionBatch(BaseModel):
+    items: List[LeadIngestionPayload] = Field(..., min_length=1, max_length=MAX_INGESTION_BATCH_ITEMS)
+
+class PropertyIngestionBatch(BaseModel):
+    items: List[PropertyIngestionPayload] = Field(..., min_length=1, max_length=MAX_INGESTION_BATCH_ITEMS)
+
+class IngestionBatchItemResult(BaseModel):
+    index: int
+    external_id: str
+    status: IngestionStatus
+    dedupe_key: str
+    entity_id: Optional[str] = None
+    message: Optional[str] = None
+
+class IngestionBatchResponse(BaseModel):
+    total: int
+    succeeded: int
+    duplicates: int
+    errors: int
+    items: List[IngestionBatchItemResult]
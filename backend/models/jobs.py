@@ -0,0 +1,57 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from backend.models.feed_orchestrator import FeedPublishRequest
+
+
+class JobType(str, Enum):
+    MATCH_RECOMPUTE = "match_recompute"
+    DQ_RECOMPUTE = "dq_recompute"
+    FEED_PUBLISH = "feed_publish"
+    PROSPECTION_WEEKLY = "prospection_weekly"
+    RECAP_WEEKLY = "recap_weekly"
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+ACTIVE_JOB_STATUSES = (JobStatus.QUEUED, JobStatus.RUNNING)
+
+
+class JobEnqueueRequest(BaseModel):
+    job_type: JobType
+    params: Dict[str, Any] = Field(default_factory=dict)
+
+
+class JobResponse(BaseModel):
+    id: str
+    org_id: str
+    job_type: JobType
+    status: JobStatus
+    params: Dict[str, Any] = Field(default_factory=dict)
+    progress: float = Field(0.0, ge=0, le=1)
+    progress_message: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    deduplicated: bool = False
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class JobListResponse(BaseModel):
+    jobs: List[JobResponse]
+    total: int
+
+
+class FeedPublishJobParams(FeedPublishRequest):
+    channel: str
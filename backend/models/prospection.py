@@ -234,9 +234,10 @@ class PropertyList(BaseModel):
     """Paginated list of properties."""
 
     items: List[PropertyResponse]
-    total: int
+    total: Optional[int] = None
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -413,6 +414,9 @@ class RecomputeRequest(BaseModel):
 
     property_ids: Optional[List[UUID]] = None
     buyer_ids: Optional[List[UUID]] = None
+    chunk_size: int = Field(500, ge=1, le=5000)
+    incremental: bool = False
+    min_match_score: Optional[float] = Field(None, ge=0, le=100)
 
 
 class RecomputeResponse(BaseModel):
@@ -421,6 +425,12 @@ class RecomputeResponse(BaseModel):
     matches_created: int
     matches_updated: int
     total_computed: int
+    pairs_rescored: int = 0
+    pairs_skipped: int = 0
+    pairs_pruned: int = 0
+    chunks_written: int = 0
+    duration_ms: float = 0.0
+    pairs_per_second: float = 0.0
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
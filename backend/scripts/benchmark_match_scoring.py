@@ -0,0 +1,209 @@
+"""
+Micro-benchmark: baseline match formula vs the current scoring paths.
+
+Scores a synthetic properties x buyers matrix with a frozen copy of the
+original dict-based compute_match_score (before CompiledMatchScorer), with
+today's ScoringService.compute_match_score and with the compiled batch path.
+Checks that every pair scores identically and prints throughput and speedup
+against the baseline.
+
+Usage:
+    python -m backend.scripts.benchmark_match_scoring [--properties 200] [--buyers 500] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Path setup to import backend modules
+sys.path.append(os.getcwd())
+
+from backend.models.prospection import ScoreResult  # noqa: E402
+from backend.services.scoring_service import (  # noqa: E402
+    DEFAULT_HORIZON_SCORE,
+    HORIZON_SCORES,
+    PROPERTY_TYPE_QUALITY,
+    ZONE_PREMIUM_SCORES,
+    CompiledMatchScorer,
+    ScoringService,
+)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# FROZEN BASELINE
+# Copy of the spec v1 match formula as it was before CompiledMatchScorer.
+# Do not route this through ScoringService: it is the reference the current
+# implementation is timed and checked against.
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def _baseline_budget_fit(property_price: Optional[float], budget_min: Optional[float], budget_max: Optional[float]) -> float:
+    if property_price is None:
+        return 50.0
+    p = float(property_price)
+    b_min = float(budget_min or 0)
+    b_max = float(budget_max or float("inf"))
+    if b_min <= p <= b_max:
+        if b_max > b_min:
+            center = (b_min + b_max) / 2
+            distance_ratio = abs(p - center) / ((b_max - b_min) / 2)
+            return max(70.0, 100.0 - (distance_ratio * 30))
+        return 90.0
+    if b_max > 0 and p <= b_max * 1.1:
+        return 55.0
+    if b_min > 0 and p >= b_min * 0.8:
+        return 50.0
+    return 20.0
+
+
+def _baseline_zone_overlap(property_zone: Optional[str], preferred_zones: List[str]) -> float:
+    if not property_zone or not preferred_zones:
+        return 50.0
+    if property_zone in preferred_zones:
+        return 100.0
+    return 20.0
+
+
+def _baseline_type_fit(property_type: Optional[str], preferred_types: List[str]) -> float:
+    score = 50.0
+    if property_type and preferred_types:
+        if property_type.lower() in [t.lower() for t in preferred_types]:
+            score = 90.0
+        else:
+            score = 30.0
+    elif not preferred_types:
+        score = 70.0
+    return score
+
+
+def _baseline_horizon(purchase_horizon: Optional[str]) -> float:
+    if not purchase_horizon:
+        return DEFAULT_HORIZON_SCORE
+    return HORIZON_SCORES.get(purchase_horizon, DEFAULT_HORIZON_SCORE)
+
+
+def baseline_match_score(property_data: Dict[str, Any], buyer_data: Dict[str, Any]) -> ScoreResult:
+    budget_score = _baseline_budget_fit(
+        property_data.get("price"), buyer_data.get("budget_min"), buyer_data.get("budget_max")
+    )
+    zone_score = _baseline_zone_overlap(property_data.get("zone"), buyer_data.get("preferred_zones", []))
+    type_score = _baseline_type_fit(property_data.get("property_type"), buyer_data.get("preferred_types", []))
+    horizon_score = _baseline_horizon(buyer_data.get("purchase_horizon"))
+    motivation = float(buyer_data.get("motivation_score") or 50.0)
+    motivation_score = min(100.0, max(0.0, motivation))
+
+    weighted_budget = budget_score * 0.35
+    weighted_zone = zone_score * 0.25
+    weighted_type = type_score * 0.20
+    weighted_horizon = horizon_score * 0.10
+    weighted_motivation = motivation_score * 0.10
+    total = min(
+        100.0,
+        max(0.0, weighted_budget + weighted_zone + weighted_type + weighted_horizon + weighted_motivation),
+    )
+    breakdown = {
+        "budget": round(weighted_budget, 2),
+        "zone": round(weighted_zone, 2),
+        "type": round(weighted_type, 2),
+        "horizon": round(weighted_horizon, 2),
+        "motivation": round(weighted_motivation, 2),
+    }
+    return ScoreResult(score=round(total, 2), breakdown=breakdown)
+
+
+def synthetic_data(n_properties: int, n_buyers: int, seed: int = 42) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    rng = random.Random(seed)
+    zones = list(ZONE_PREMIUM_SCORES)
+    types = list(PROPERTY_TYPE_QUALITY)
+    horizons = list(HORIZON_SCORES) + [None]
+    properties = [
+        {
+            "price": rng.choice([None, rng.randrange(300_000, 8_000_000, 10_000)]),
+            "zone": rng.choice(zones + [None]),
+            "property_type": rng.choice(types + [None]),
+        }
+        for _ in range(n_properties)
+    ]
+    buyers = []
+    for _ in range(n_buyers):
+        b_min = rng.randrange(200_000, 4_000_000, 50_000)
+        buyers.append({
+            "budget_min": b_min,
+            "budget_max": rng.choice([None, b_min + rng.randrange(0, 3_000_000, 50_000)]),
+            "preferred_zones": rng.sample(zones, rng.randint(0, 3)),
+            "preferred_types": rng.sample(types, rng.randint(0, 2)),
+            "purchase_horizon": rng.choice(horizons),
+            "motivation_score": rng.choice([None, rng.randint(0, 100)]),
+        })
+    return properties, buyers
+
+
+def baseline(properties: List[Dict[str, Any]], buyers: List[Dict[str, Any]]) -> List[tuple]:
+    results = []
+    for prop in properties:
+        for buyer in buyers:
+            result = baseline_match_score(prop, buyer)
+            results.append((result.score, result.breakdown))
+    return results
+
+
+def per_pair(properties: List[Dict[str, Any]], buyers: List[Dict[str, Any]]) -> List[tuple]:
+    results = []
+    for prop in properties:
+        for buyer in buyers:
+            result = ScoringService.compute_match_score(prop, buyer)
+            results.append((result.score, result.breakdown))
+    return results
+
+
+def compiled(properties: List[Dict[str, Any]], buyers: List[Dict[str, Any]]) -> List[tuple]:
+    buyer_features = CompiledMatchScorer.compile_buyers(buyers)
+    score_pair = CompiledMatchScorer.score_pair
+    results: List[tuple] = []
+    for prop in properties:
+        prop_features = CompiledMatchScorer.compile_property(prop)
+        results.extend(score_pair(prop_features, buyer) for buyer in buyer_features)
+    return results
+
+
+def best_of(fn: Callable[[], List[tuple]], repeat: int) -> tuple[float, List[tuple]]:
+    best = float("inf")
+    result: List[tuple] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--properties", type=int, default=200)
+    parser.add_argument("--buyers", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    properties, buyers = synthetic_data(args.properties, args.buyers)
+    pairs = len(properties) * len(buyers)
+
+    ref_time, ref_scores = best_of(lambda: baseline(properties, buyers), args.repeat)
+    timings = {
+        "compute_match_score": best_of(lambda: per_pair(properties, buyers), args.repeat),
+        "CompiledMatchScorer": best_of(lambda: compiled(properties, buyers), args.repeat),
+    }
+    for name, (_, scores) in timings.items():
+        if scores != ref_scores:
+            raise SystemExit(f"[ERROR] {name} scores differ from the baseline formula")
+
+    print(f"=== Match scoring benchmark: {len(properties)} properties x {len(buyers)} buyers = {pairs} pairs ===")
+    print(f"baseline (frozen)   : {ref_time * 1000:9.1f} ms  ({pairs / ref_time:,.0f} pairs/s)")
+    for name, (elapsed, _) in timings.items():
+        print(f"{name:<20}: {elapsed * 1000:9.1f} ms  ({pairs / elapsed:,.0f} pairs/s)  {ref_time / elapsed:.2f}x")
+    print("Scores and breakdowns identical to the baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Async DB — non-blocking access to the synchronous Supabase client.
+
+The supabase-py client used across services is synchronous: calling
+`.execute()` from an `async def` blocks the event loop for a full HTTP
+round-trip. AsyncDataAccess keeps the same fluent query API but runs the
+round-trip on a bounded thread pool:
+
+    rows = (await async_db.bind(client).table("leads").select("id").eq("org_id", org_id).execute()).data
+
+Query building stays local (no I/O); only `execute()` is offloaded and must
+be awaited. Concurrency is bounded per event loop, and every call records
+latency so slow tables show up in `stats()`.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from backend.config import settings
+
+
+class AsyncQuery:
+    """Fluent proxy over a postgrest request builder with an awaitable execute()."""
+
+    __slots__ = ("_db", "_builder", "_label")
+
+    def __init__(self, db: "AsyncDataAccess", builder: Any, label: str) -> None:
+        self._db = db
+        self._builder = builder
+        self._label = label
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._builder, name)
+        if not callable(attr):
+            # Builder-valued properties (e.g. `not_`) keep the proxy.
+            return AsyncQuery(self._db, attr, self._label) if hasattr(attr, "execute") else attr
+
+        @functools.wraps(attr)
+        def chained(*args: Any, **kwargs: Any) -> "AsyncQuery":
+            return AsyncQuery(self._db, attr(*args, **kwargs), self._label)
+
+        return chained
+
+    async def execute(self) -> Any:
+        return await self._db.run(self._builder.execute, label=self._label)
+
+
+class AsyncClient:
+    """Supabase client bound to an AsyncDataAccess; `table()` returns AsyncQuery."""
+
+    __slots__ = ("_db", "_client")
+
+    def __init__(self, db: "AsyncDataAccess", client: Any) -> None:
+        self._db = db
+        self._client = client
+
+    def table(self, name: str) -> AsyncQuery:
+        return AsyncQuery(self._db, self._client.table(name), name)
+
+    def rpc(self, fn: str, params: Optional[Dict[str, Any]] = None) -> AsyncQuery:
+        return AsyncQuery(self._db, self._client.rpc(fn, params or {}), f"rpc:{fn}")
+
+
+class AsyncDataAccess:
+    """Thread-pool backed data access with bounded concurrency and latency metrics."""
+
+    def __init__(self, max_workers: int = 16, max_concurrency: Optional[int] = None) -> None:
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency or max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="nexus-db")
+        # asyncio primitives are loop-bound; background jobs run their own loops.
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Dict[str, float]] = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.total_wait_ms = 0.0
+
+    def bind(self, client: Any) -> AsyncClient:
+        return AsyncClient(self, client)
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                self._semaphores[loop] = semaphore
+            return semaphore
+
+    def _record(self, label: str, elapsed_ms: float, failed: bool) -> None:
+        with self._lock:
+            entry = self._calls.setdefault(label, {"calls": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0})
+            entry["calls"] += 1
+            entry["errors"] += int(failed)
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+
+    async def run(self, fn: Callable[..., Any], *args: Any, label: str = "call", **kwargs: Any) -> Any:
+        """Run a blocking callable on the DB pool."""
+        queued = time.perf_counter()
+        async with self._semaphore():
+            started = time.perf_counter()
+            with self._lock:
+                self.total_wait_ms += (started - queued) * 1000
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            failed = False
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+            except Exception:
+                failed = True
+                raise
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+                self._record(label, (time.perf_counter() - started) * 1000, failed)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            calls = {
+                label: {
+                    "calls": int(entry["calls"]),
+                    "errors": int(entry["errors"]),
+                    "avg_ms": round(entry["total_ms"] / entry["calls"], 2) if entry["calls"] else 0.0,
+                    "max_ms": round(entry["max_ms"], 2),
+                }
+                for label, entry in self._calls.items()
+            }
+            return {
+                "max_workers": self.max_workers,
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "total_wait_ms": round(self.total_wait_ms, 2),
+                "calls": calls,
+            }
+
+
+# Module-level singleton
+async_db = AsyncDataAccess(max_workers=settings.DB_EXECUTOR_WORKERS)
@@ -20,7 +20,9 @@ from backend.models.automation import (
     ScopeMetadata,
 )
 from backend.models.membership import UserRole
+from backend.services.async_db import AsyncClient, async_db
 from backend.services.finops import finops_service
+from backend.services.schema_cache import schema_cache
 from backend.services.supabase_service import supabase_service
 
 
@@ -28,20 +30,19 @@ class AutomationService:
     def __init__(self) -> None:
         self.client = supabase_service.client
 
+    def _db(self) -> AsyncClient:
+        return async_db.bind(self.client)
+
     def _now(self) -> str:
         return datetime.now(timezone.utc).isoformat()
 
-    def _table_exists(self, table: str) -> bool:
-        try:
-            self.client.table(table).select("id").limit(1).execute()
-            return True
-        except Exception:
-            return False
+    async def _table_exists(self, table: str) -> bool:
+        return await schema_cache.table_exists_async(self.client, table)
 
     async def _get_role(self, org_id: str, user_id: str) -> str:
         try:
             result = (
-                self.client.table("organization_members")
+                await self._db().table("organization_members")
                 .select("role,status")
                 .eq("org_id", org_id)
                 .eq("user_id", user_id)
@@ -61,7 +62,7 @@ class AutomationService:
 
     async def _get_rule(self, org_id: str, rule_id: str) -> Optional[Dict[str, Any]]:
         result = (
-            self.client.table("automation_rules")
+            await self._db().table("automation_rules")
             .select("*")
             .eq("org_id", org_id)
             .eq("id", rule_id)
@@ -72,10 +73,10 @@ class AutomationService:
 
     async def list_rules(self, org_id: str, user_id: str) -> RuleListResponse:
         role = await self._get_role(org_id, user_id)
-        if not self._table_exists("automation_rules"):
+        if not await self._table_exists("automation_rules"):
             return RuleListResponse(scope=ScopeMetadata(org_id=org_id, role=role), items=[], total=0)
         result = (
-            self.client.table("automation_rules")
+            await self._db().table("automation_rules")
             .select("*", count="exact")
             .eq("org_id", org_id)
             .order("updated_at", desc=True)
@@ -87,7 +88,7 @@ class AutomationService:
     async def create_rule(self, org_id: str, user_id: str, payload: RuleCreateRequest) -> RuleResponse:
         role = await self._get_role(org_id, user_id)
         self._assert_can_write(role)
-        if not self._table_exists("automation_rules"):
+        if not await self._table_exists("automation_rules"):
             raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="AUTOMATION_SCHEMA_NOT_READY")
         now = self._now()
         data = {
@@ -104,7 +105,7 @@ class AutomationService:
             "created_at": now,
             "updated_at": now,
         }
-        result = self.client.table("automation_rules").insert(data).execute()
+        result = await self._db().table("automation_rules").insert(data).execute()
         created = result.data[0]
         try:
             await supabase_service.insert_audit_log(
@@ -124,7 +125,7 @@ class AutomationService:
     async def update_rule(self, org_id: str, user_id: str, rule_id: str, payload: RuleUpdateRequest) -> Optional[RuleResponse]:
         role = await self._get_role(org_id, user_id)
         self._assert_can_write(role)
-        if not self._table_exists("automation_rules"):
+        if not await self._table_exists("automation_rules"):
             raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="AUTOMATION_SCHEMA_NOT_READY")
         existing = await self._get_rule(org_id, rule_id)
         if not existing:
@@ -134,7 +135,7 @@ class AutomationService:
             return RuleResponse(**existing)
         data["updated_at"] = self._now()
         result = (
-            self.client.table("automation_rules")
+            await self._db().table("automation_rules")
             .update(data)
             .eq("org_id", org_id)
             .eq("id", rule_id)
@@ -195,7 +196,7 @@ class AutomationService:
 
     async def dry_run(self, org_id: str, user_id: str, rule_id: str, payload: DryRunRequest) -> Optional[DryRunResponse]:
         role = await self._get_role(org_id, user_id)
-        if not self._table_exists("automation_rules"):
+        if not await self._table_exists("automation_rules"):
             return None
         rule = await self._get_rule(org_id, rule_id)
         if not rule:
@@ -218,7 +219,7 @@ class AutomationService:
     async def execute(self, org_id: str, user_id: str, rule_id: str, payload: ExecuteRequest) -> Optional[ExecuteResponse]:
         role = await self._get_role(org_id, user_id)
         self._assert_can_write(role)
-        if not self._table_exists("automation_rules") or not self._table_exists("automation_executions"):
+        if not await self._table_exists("automation_rules") or not await self._table_exists("automation_executions"):
             raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="AUTOMATION_SCHEMA_NOT_READY")
         rule = await self._get_rule(org_id, rule_id)
         if not rule:
@@ -248,10 +249,10 @@ class AutomationService:
             "trace_id": trace_id,
             "created_at": self._now(),
         }
-        execution = self.client.table("automation_executions").insert(execution_data).execute().data[0]
+        execution = (await self._db().table("automation_executions").insert(execution_data).execute()).data[0]
 
-        if evaluation["decision"] == "blocked" and self._table_exists("automation_alerts"):
-            self.client.table("automation_alerts").insert(
+        if evaluation["decision"] == "blocked" and await self._table_exists("automation_alerts"):
+            await self._db().table("automation_alerts").insert(
                 {
                     "org_id": org_id,
                     "rule_id": rule_id,
@@ -301,15 +302,15 @@ class AutomationService:
         offset: int = 0,
     ) -> ExecutionLogResponse:
         role = await self._get_role(org_id, user_id)
-        if not self._table_exists("automation_executions"):
+        if not await self._table_exists("automation_executions"):
             return ExecutionLogResponse(scope=ScopeMetadata(org_id=org_id, role=role), items=[], total=0)
-        query = self.client.table("automation_executions").select("*", count="exact").eq("org_id", org_id).order("created_at", desc=True)
+        query = self._db().table("automation_executions").select("*", count="exact").eq("org_id", org_id).order("created_at", desc=True)
         if execution_status:
             query = query.eq("status", execution_status)
         if rule_id:
             query = query.eq("rule_id", rule_id)
         query = query.range(offset, offset + limit - 1)
-        result = query.execute()
+        result = await query.execute()
         return ExecutionLogResponse(
             scope=ScopeMetadata(org_id=org_id, role=role),
             items=result.data or [],
@@ -318,10 +319,10 @@ class AutomationService:
 
     async def list_alerts(self, org_id: str, user_id: str) -> AlertListResponse:
         role = await self._get_role(org_id, user_id)
-        if not self._table_exists("automation_alerts"):
+        if not await self._table_exists("automation_alerts"):
             return AlertListResponse(scope=ScopeMetadata(org_id=org_id, role=role), items=[], total=0)
         result = (
-            self.client.table("automation_alerts")
+            await self._db().table("automation_alerts")
             .select("*", count="exact")
             .eq("org_id", org_id)
             .eq("is_active", True)
@@ -337,10 +338,10 @@ class AutomationService:
     async def acknowledge_alert(self, org_id: str, user_id: str, alert_id: str) -> bool:
         role = await self._get_role(org_id, user_id)
         self._assert_can_write(role)
-        if not self._table_exists("automation_alerts"):
+        if not await self._table_exists("automation_alerts"):
             return False
         result = (
-            self.client.table("automation_alerts")
+            await self._db().table("automation_alerts")
             .update({"is_active": False, "resolved_at": self._now()})
             .eq("org_id", org_id)
             .eq("id", alert_id)
@@ -0,0 +1,86 @@
+"""
+Batch Loader — request-scoped, DataLoader-style key coalescing.
+
+Every `load()` issued during the same event-loop tick is collected and
+resolved by one call to the batch function (one `in_` query per table),
+and results are memoized for the loader's lifetime:
+
+    buyers = BatchLoader(fetch_buyers_by_id, name="buyer_profiles")
+    a, b = await asyncio.gather(buyers.load(id_a), buyers.load(id_b))  # one query
+
+Loaders hold request data and must not outlive the request that created them.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, List
+
+BatchFn = Callable[[List[str]], Awaitable[Dict[str, Any]]]
+
+
+class BatchLoader:
+    """Coalesces key lookups into batched fetches and memoizes the results."""
+
+    def __init__(self, batch_fn: BatchFn, name: str = "loader", max_batch_size: int = 500) -> None:
+        self.name = name
+        self.max_batch_size = max_batch_size
+        self._batch_fn = batch_fn
+        self._cache: Dict[str, "asyncio.Future[Any]"] = {}
+        self._queue: List[str] = []
+        self._scheduled = False
+        self.batches = 0
+        self.keys_fetched = 0
+
+    def load(self, key: Any) -> "asyncio.Future[Any]":
+        """Future resolving to the row for `key`, or None when it does not exist."""
+        key = str(key)
+        future = self._cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._cache[key] = future
+            self._queue.append(key)
+            if not self._scheduled:
+                self._scheduled = True
+                loop.call_soon(self._dispatch)
+        return future
+
+    async def load_many(self, keys: Iterable[Any]) -> Dict[str, Any]:
+        """Rows found for `keys`, by key; missing keys are omitted."""
+        unique = list(dict.fromkeys(str(k) for k in keys if k))
+        values = await asyncio.gather(*(self.load(k) for k in unique))
+        return {k: v for k, v in zip(unique, values) if v is not None}
+
+    def prime(self, rows: Iterable[Dict[str, Any]], key_field: str = "id") -> None:
+        """Seed the cache with rows already read by the request."""
+        loop = asyncio.get_running_loop()
+        for row in rows:
+            key = str(row.get(key_field) or "")
+            if key and key not in self._cache:
+                future = loop.create_future()
+                future.set_result(row)
+                self._cache[key] = future
+
+    def _dispatch(self) -> None:
+        queue, self._queue, self._scheduled = self._queue, [], False
+        for start in range(0, len(queue), self.max_batch_size):
+            asyncio.ensure_future(self._run_batch(queue[start : start + self.max_batch_size]))
+
+    async def _run_batch(self, keys: List[str]) -> None:
+        self.batches += 1
+        self.keys_fetched += len(keys)
+        try:
+            found = await self._batch_fn(keys)
+        except Exception as e:
+            for key in keys:
+                # Failed keys are forgotten so a later load can retry them.
+                future = self._cache.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+        for key in keys:
+            future = self._cache[key]
+            if not future.done():
+                future.set_result(found.get(key))
+
+    def stats(self) -> Dict[str, int]:
+        return {"batches": self.batches, "keys_fetched": self.keys_fetched, "cached": len(self._cache)}
@@ -12,6 +12,7 @@ from backend.models.command_center import (
     TrendPoint,
 )
 from backend.models.membership import UserRole
+from backend.services.async_db import AsyncClient, async_db
 from backend.services.finops import finops_service
 from backend.services.supabase_service import supabase_service
 
@@ -20,9 +21,12 @@ class CommandCenterService:
     def __init__(self) -> None:
         self.client = supabase_service.client
 
+    def _db(self) -> AsyncClient:
+        return async_db.bind(self.client)
+
     async def _get_role(self, org_id: str, user_id: str) -> str:
         result = (
-            self.client.table("organization_members")
+            await self._db().table("organization_members")
             .select("role,status")
             .eq("org_id", org_id)
             .eq("user_id", user_id)
@@ -38,12 +42,12 @@ class CommandCenterService:
         return role == UserRole.AGENT.value
 
     async def _count_entities(self, table: str, org_id: str, role: str, user_id: str, status_filter: List[str] | None = None) -> int:
-        query = self.client.table(table).select("id", count="exact").eq("org_id", org_id)
+        query = self._db().table(table).select("id", count="exact").eq("org_id", org_id)
         if self._is_agent(role):
             query = query.eq("assigned_user_id", user_id)
         if status_filter:
             query = query.in_("status", status_filter)
-        result = query.execute()
+        result = await query.execute()
         return result.count or 0
 
     async def get_snapshot(self, org_id: str, user_id: str) -> CommandCenterSnapshotResponse:
@@ -94,15 +98,15 @@ class CommandCenterService:
         month_keys = self._month_keys(months)
         min_date = f"{month_keys[0]}-01T00:00:00+00:00"
 
-        lead_q = self.client.table("leads").select("created_at,assigned_user_id").eq("org_id", org_id).gte("created_at", min_date)
+        lead_q = self._db().table("leads").select("created_at,assigned_user_id").eq("org_id", org_id).gte("created_at", min_date)
         task_q = (
-            self.client.table("tasks")
+            self._db().table("tasks")
             .select("created_at,status,assigned_user_id")
             .eq("org_id", org_id)
             .gte("created_at", min_date)
         )
         cost_q = (
-            self.client.table("org_cost_usage_events")
+            self._db().table("org_cost_usage_events")
             .select("created_at,cost_eur")
             .eq("org_id", org_id)
             .gte("created_at", min_date)
@@ -111,9 +115,9 @@ class CommandCenterService:
             lead_q = lead_q.eq("assigned_user_id", user_id)
             task_q = task_q.eq("assigned_user_id", user_id)
 
-        leads = lead_q.execute().data or []
-        tasks = task_q.execute().data or []
-        costs = cost_q.execute().data or []
+        leads = (await lead_q.execute()).data or []
+        tasks = (await task_q.execute()).data or []
+        costs = (await cost_q.execute()).data or []
 
         lead_map: Dict[str, int] = defaultdict(int)
         task_map: Dict[str, int] = defaultdict(int)
@@ -13,6 +13,7 @@ from backend.models.deal_margin import (
     SimulationResult,
 )
 from backend.models.membership import UserRole
+from backend.services.async_db import AsyncClient, async_db
 from backend.services.supabase_service import supabase_service
 
 
@@ -20,10 +21,13 @@ class DealMarginService:
     def __init__(self) -> None:
         self.client = supabase_service.client
 
+    def _db(self) -> AsyncClient:
+        return async_db.bind(self.client)
+
     async def _get_role(self, org_id: str, user_id: str) -> str:
         try:
             result = (
-                self.client.table("organization_members")
+                await self._db().table("organization_members")
                 .select("role,status")
                 .eq("org_id", org_id)
                 .eq("user_id", user_id)
@@ -0,0 +1,242 @@
+"""
+Dedupe Index — in-memory membership layer for ingestion dedupe keys.
+
+Owned by IngestionService. An exact LRU of keys this process has seen
+answers repeats without a query. When the index is authoritative, a per-org
+Bloom filter over every stored dedupe key also lets the ingestion hot path
+skip the `ingestion_events` lookup for keys that are certainly new; possible
+hits are confirmed against the database with a narrow select.
+
+A Bloom negative only means "not written by this process since the last
+warm": other workers may have stored the key meanwhile. IngestionService
+trusts it anyway (DEDUPE_INDEX_AUTHORITATIVE, on by default) because the
+ingestion event insert is the final arbiter: UNIQUE(org_id, dedupe_key)
+rejects the race loser, which is then reported as a duplicate. With the
+setting off, every miss is confirmed against the database.
+
+The Bloom filter is warmed per org from existing events in the background and
+is kept in sync as this process writes events. Until an org is warm (or if
+warming fails) every lookup falls back to the database. The org is re-warmed
+after DEDUPE_INDEX_REFRESH_SECONDS.
+"""
+
+import asyncio
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter using double hashing over a 128-bit digest."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class _OrgIndex:
+    def __init__(self) -> None:
+        self.bloom: Optional[BloomFilter] = None
+        self.state = "cold"  # cold | warming | warm
+        self.warmed_at = 0.0
+        self.pending: set[str] = set()
+
+
+class DedupeKeyIndex:
+    """Bloom filter + exact LRU per org for ingestion dedupe keys."""
+
+    def __init__(
+        self,
+        authoritative: bool = False,
+        refresh_seconds: float = 60.0,
+        lru_size: int = 10_000,
+        error_rate: float = 0.01,
+        min_capacity: int = 10_000,
+        page_size: int = 1000,
+    ) -> None:
+        self.authoritative = authoritative
+        self.refresh_seconds = refresh_seconds
+        self.lru_size = lru_size
+        self.error_rate = error_rate
+        self.min_capacity = min_capacity
+        self.page_size = page_size
+        self._orgs: Dict[str, _OrgIndex] = {}
+        self._recent: "OrderedDict[tuple[str, str], None]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.db_lookups_avoided = 0
+        self.bloom_maybe = 0
+        self.false_positives = 0
+        self.cold_fallbacks = 0
+
+    # ─────────────────────────────────────────────────────────────────────
+    # LOOKUPS
+    # ─────────────────────────────────────────────────────────────────────
+
+    def lookup(self, org_id: str, key: str) -> Optional[bool]:
+        """
+        True if the key is known to exist, False if it certainly does not
+        (authoritative index only), None if the caller must check the database.
+        """
+        with self._lock:
+            self.lookups += 1
+            if (org_id, key) in self._recent:
+                self._recent.move_to_end((org_id, key))
+                self.db_lookups_avoided += 1
+                return True
+
+            if not self.authoritative:
+                return None
+
+            index = self._orgs.get(org_id)
+            if index is None or index.state != "warm" or self._expired(index):
+                self.cold_fallbacks += 1
+                return None
+
+            if key not in index.bloom:
+                self.db_lookups_avoided += 1
+                return False
+            self.bloom_maybe += 1
+            return None
+
+    def record_db_result(self, org_id: str, key: str, found: bool) -> None:
+        """Feed back a database answer so Bloom false positives are measured."""
+        with self._lock:
+            index = self._orgs.get(org_id)
+            if not found and index is not None and index.state == "warm" and key in index.bloom:
+                self.false_positives += 1
+            if found:
+                self._remember(org_id, key)
+
+    def add(self, org_id: str, key: str) -> None:
+        """Register a key this process just wrote to ingestion_events."""
+        with self._lock:
+            self._remember(org_id, key)
+            index = self._orgs.get(org_id)
+            if index is None:
+                return
+            if index.state == "warming":
+                index.pending.add(key)
+            elif index.state == "warm":
+                index.bloom.add(key)
+                if index.bloom.count > index.bloom.capacity:
+                    # Over capacity the error rate degrades: rebuild on next use.
+                    index.state = "cold"
+
+    def _remember(self, org_id: str, key: str) -> None:
+        self._recent[(org_id, key)] = None
+        self._recent.move_to_end((org_id, key))
+        while len(self._recent) > self.lru_size:
+            self._recent.popitem(last=False)
+
+    def _expired(self, index: _OrgIndex) -> bool:
+        return self.refresh_seconds <= 0 or time.monotonic() - index.warmed_at > self.refresh_seconds
+
+    # ─────────────────────────────────────────────────────────────────────
+    # WARMING
+    # ─────────────────────────────────────────────────────────────────────
+
+    def needs_warm(self, org_id: str) -> bool:
+        """Only an authoritative index reads the Bloom filter, so only it is warmed."""
+        if not self.authoritative:
+            return False
+        with self._lock:
+            index = self._orgs.get(org_id)
+            if index is None:
+                return self.refresh_seconds > 0
+            return index.state != "warming" and (index.state == "cold" or self._expired(index))
+
+    def warm(self, org_id: str, client: Any) -> bool:
+        """Load every dedupe key of the org from ingestion_events. Returns success."""
+        with self._lock:
+            index = self._orgs.setdefault(org_id, _OrgIndex())
+            if index.state == "warming":
+                return False
+            index.state = "warming"
+            index.pending = set()
+
+        try:
+            keys: list[str] = []
+            last_id = None
+            while True:
+                query = client.table("ingestion_events").select("id,dedupe_key").eq("org_id", org_id)
+                if last_id is not None:
+                    query = query.gt("id", last_id)
+                rows = query.order("id").limit(self.page_size).execute().data or []
+                keys.extend(str(row["dedupe_key"]) for row in rows if row.get("dedupe_key"))
+                if len(rows) < self.page_size:
+                    break
+                last_id = rows[-1]["id"]
+        except Exception:
+            with self._lock:
+                index.state = "cold"
+            return False
+
+        bloom = BloomFilter(max(self.min_capacity, len(keys) * 2), self.error_rate)
+        for key in keys:
+            bloom.add(key)
+
+        with self._lock:
+            for key in index.pending:
+                bloom.add(key)
+            index.pending = set()
+            index.bloom = bloom
+            index.state = "warm"
+            index.warmed_at = time.monotonic()
+        return True
+
+    def schedule_warm(self, org_id: str, client_factory: Callable[[], Any]) -> None:
+        """Warm the org in a worker thread if needed; lookups fall back to the DB meanwhile."""
+        if not self.needs_warm(org_id):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        loop.run_in_executor(None, self.warm, org_id, client_factory())
+
+    def invalidate(self, org_id: Optional[str] = None) -> None:
+        with self._lock:
+            if org_id is None:
+                self._orgs.clear()
+                self._recent.clear()
+                return
+            self._orgs.pop(org_id, None)
+            for entry in [k for k in self._recent if k[0] == org_id]:
+                self._recent.pop(entry, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "authoritative": self.authoritative,
+                "lookups": self.lookups,
+                "db_lookups_avoided": self.db_lookups_avoided,
+                "cold_fallbacks": self.cold_fallbacks,
+                "bloom_maybe": self.bloom_maybe,
+                "false_positives": self.false_positives,
+                "false_positive_rate": round(self.false_positives / self.bloom_maybe, 4) if self.bloom_maybe else 0.0,
+                "warm_orgs": sum(1 for index in self._orgs.values() if index.state == "warm"),
+                "lru_entries": len(self._recent),
+            }
@@ -1,8 +1,9 @@
 import re
 import asyncio
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime
+from backend.services.async_db import AsyncClient, async_db
 from backend.services.supabase_service import supabase_service
 from backend.models.dq import (
     DQQualityIssue, DQEntityCandidate, DQResolutionLog,
@@ -11,10 +12,34 @@ from backend.models.dq import (
     DQIssuesResponse
 )
 
+# Minimum similarity score for a pair to be stored as a duplicate candidate.
+DUPLICATE_CANDIDATE_THRESHOLD = 40.0
+
+# Streaming recompute: rows per keyset page and per bulk insert.
+DQ_PAGE_SIZE = 1000
+DQ_WRITE_CHUNK_SIZE = 500
+
+# Max rows fetched per blocking key when evaluating a single entity.
+DQ_BLOCK_LOOKUP_LIMIT = 200
+
+# Columns read by detect_quality_issues and the similarity scorer.
+DQ_COLUMNS: Dict[EntityType, tuple[str, ...]] = {
+    EntityType.LEAD: ("id", "name", "email", "phone"),
+    EntityType.PROPERTY: ("id", "address", "catastro_ref", "price", "surface_m2", "built_area_m2", "useful_area_m2"),
+}
+
+DQ_TABLES: Dict[EntityType, str] = {
+    EntityType.LEAD: "leads",
+    EntityType.PROPERTY: "properties",
+}
+
 class DQService:
     def __init__(self):
         self.email_regex = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
+    def _db(self) -> AsyncClient:
+        return async_db.bind(supabase_service.client)
+
     def normalize_phone(self, phone: Optional[str]) -> Optional[str]:
         if not phone:
             return None
@@ -30,28 +55,38 @@ class DQService:
             return None
         return email.strip().lower()
 
-    def calculate_similarity_score(self, entity_type: EntityType, e1: Dict[str, Any], e2: Dict[str, Any]) -> float:
+    def _similarity_features(self, entity_type: EntityType, e: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize the fields used by the similarity scorer once per entity."""
+        if entity_type == EntityType.LEAD:
+            return {
+                "email": self.normalize_email(e.get("email")),
+                "phone": self.normalize_phone(e.get("phone")),
+                "name": (e.get("name") or "").strip().lower(),
+            }
+        return {
+            "catastro_ref": (e.get("catastro_ref") or "").strip(),
+            "address": (e.get("address") or "").strip().lower(),
+            "price": float(e.get("price") or 0),
+            "surface_m2": float(e.get("surface_m2") or 0),
+        }
+
+    def _score_features(self, entity_type: EntityType, f1: Dict[str, Any], f2: Dict[str, Any]) -> tuple[float, Dict[str, bool]]:
         score = 0.0
         signals = {}
 
         if entity_type == EntityType.LEAD:
             # Email match (highest priority)
-            email1 = self.normalize_email(e1.get("email"))
-            email2 = self.normalize_email(e2.get("email"))
-            if email1 and email2 and email1 == email2:
+            if f1["email"] and f2["email"] and f1["email"] == f2["email"]:
                 score += 50
                 signals["email_match"] = True
 
             # Phone match
-            phone1 = self.normalize_phone(e1.get("phone"))
-            phone2 = self.normalize_phone(e2.get("phone"))
-            if phone1 and phone2 and phone1 == phone2:
+            if f1["phone"] and f2["phone"] and f1["phone"] == f2["phone"]:
                 score += 35
                 signals["phone_match"] = True
 
             # Name match (simple case insensitive)
-            name1 = (e1.get("name") or "").strip().lower()
-            name2 = (e2.get("name") or "").strip().lower()
+            name1, name2 = f1["name"], f2["name"]
             if name1 and name2 and name1 == name2:
                 score += 15
                 signals["name_match"] = True
@@ -61,30 +96,24 @@ class DQService:
 
         elif entity_type == EntityType.PROPERTY:
             # Catastro match
-            cat1 = (e1.get("catastro_ref") or "").strip()
-            cat2 = (e2.get("catastro_ref") or "").strip()
-            if cat1 and cat2 and cat1 == cat2:
+            if f1["catastro_ref"] and f2["catastro_ref"] and f1["catastro_ref"] == f2["catastro_ref"]:
                 score += 60
                 signals["catastro_match"] = True
 
             # Address match
-            addr1 = (e1.get("address") or "").strip().lower()
-            addr2 = (e2.get("address") or "").strip().lower()
-            if addr1 and addr2 and addr1 == addr2:
+            if f1["address"] and f2["address"] and f1["address"] == f2["address"]:
                 score += 25
                 signals["address_match"] = True
 
             # Price/Surface proximity
-            price1 = float(e1.get("price") or 0)
-            price2 = float(e2.get("price") or 0)
+            price1, price2 = f1["price"], f2["price"]
             if price1 > 0 and price2 > 0:
                 diff = abs(price1 - price2) / max(price1, price2)
                 if diff < 0.05: # 5% tolerance
                     score += 7
                     signals["price_proximity"] = True
 
-            surf1 = float(e1.get("surface_m2") or 0)
-            surf2 = float(e2.get("surface_m2") or 0)
+            surf1, surf2 = f1["surface_m2"], f2["surface_m2"]
             if surf1 > 0 and surf2 > 0:
                 diff = abs(surf1 - surf2) / max(surf1, surf2)
                 if diff < 0.1: # 10% tolerance
@@ -93,6 +122,84 @@ class DQService:
 
         return min(100.0, score), signals
 
+    def calculate_similarity_score(self, entity_type: EntityType, e1: Dict[str, Any], e2: Dict[str, Any]) -> float:
+        return self._score_features(
+            entity_type,
+            self._similarity_features(entity_type, e1),
+            self._similarity_features(entity_type, e2),
+        )
+
+    def _blocking_keys(self, entity_type: EntityType, features: Dict[str, Any]) -> List[tuple]:
+        """
+        Hash-bucket keys for candidate generation. With the current weights a
+        pair can only reach DUPLICATE_CANDIDATE_THRESHOLD if it shares one of
+        these keys (lead: email 50 or phone 35 + name; property: catastro 60
+        or address 25 + price 7 + surface 8). Name, price and surface alone
+        top out at 15, so they never need their own buckets.
+        """
+        fields = ("email", "phone") if entity_type == EntityType.LEAD else ("catastro_ref", "address")
+        return [(field, features[field]) for field in fields if features[field]]
+
+    def find_duplicate_candidates(
+        self,
+        org_id: str,
+        entity_type: EntityType,
+        entities: List[Dict[str, Any]],
+        existing_pairs: Optional[set] = None,
+        threshold: float = DUPLICATE_CANDIDATE_THRESHOLD,
+    ) -> List[Dict[str, Any]]:
+        """
+        Blocked duplicate detection: entities are normalized once, grouped in
+        hash buckets by _blocking_keys, and only pairs sharing a bucket are
+        scored. Left/right keep the input order like the pairwise scan did.
+        """
+        return self._blocked_candidates(
+            org_id,
+            entity_type,
+            [e["id"] for e in entities],
+            [self._similarity_features(entity_type, e) for e in entities],
+            existing_pairs or set(),
+            threshold,
+        )
+
+    def _blocked_candidates(
+        self,
+        org_id: str,
+        entity_type: EntityType,
+        ids: List[Any],
+        features: List[Dict[str, Any]],
+        existing_pairs: set,
+        threshold: float = DUPLICATE_CANDIDATE_THRESHOLD,
+    ) -> List[Dict[str, Any]]:
+        buckets: Dict[tuple, List[int]] = {}
+        for pos, f in enumerate(features):
+            for key in self._blocking_keys(entity_type, f):
+                buckets.setdefault(key, []).append(pos)
+
+        pairs: set[tuple[int, int]] = set()
+        for positions in buckets.values():
+            for a in range(len(positions)):
+                for b in range(a + 1, len(positions)):
+                    pairs.add((positions[a], positions[b]))
+
+        candidates = []
+        for i, j in sorted(pairs):
+            left_id, right_id = ids[i], ids[j]
+            if (left_id, right_id) in existing_pairs or (right_id, left_id) in existing_pairs:
+                continue
+            score, signals = self._score_features(entity_type, features[i], features[j])
+            if score >= threshold:
+                candidates.append({
+                    "org_id": org_id,
+                    "entity_type": entity_type.value,
+                    "left_entity_id": left_id,
+                    "right_entity_id": right_id,
+                    "similarity_score": score,
+                    "signals": signals,
+                    "status": "suggested_merge"
+                })
+        return candidates
+
     def detect_quality_issues(self, entity_type: EntityType, e: Dict[str, Any]) -> List[Dict[str, Any]]:
         issues = []
         if entity_type == EntityType.LEAD:
@@ -144,11 +251,11 @@ class DQService:
         return issues
 
     async def get_issues(self, org_id: str, entity_type: Optional[EntityType] = None, status: IssueStatus = IssueStatus.OPEN, limit: int = 50, offset: int = 0) -> DQIssuesResponse:
-        query = supabase_service.client.table("dq_quality_issues").select("*", count="exact").eq("org_id", org_id).eq("status", status.value)
+        query = self._db().table("dq_quality_issues").select("*", count="exact").eq("org_id", org_id).eq("status", status.value)
         if entity_type:
             query = query.eq("entity_type", entity_type.value)
         
-        response = query.order("severity", desc=True).order("created_at", desc=True).range(offset, offset + limit - 1).execute()
+        response = await query.order("severity", desc=True).order("created_at", desc=True).range(offset, offset + limit - 1).execute()
         
         return DQIssuesResponse(
             issues=[DQQualityIssue(**item) for item in response.data],
@@ -156,8 +263,8 @@ class DQService:
         )
 
     async def get_metrics(self, org_id: str) -> DQMetricsResponse:
-        issues_resp = supabase_service.client.table("dq_quality_issues").select("id, severity, status").eq("org_id", org_id).execute()
-        candidates_resp = supabase_service.client.table("dq_entity_candidates").select("id, status").eq("org_id", org_id).execute()
+        issues_resp = await self._db().table("dq_quality_issues").select("id, severity, status").eq("org_id", org_id).execute()
+        candidates_resp = await self._db().table("dq_entity_candidates").select("id, status").eq("org_id", org_id).execute()
         
         issues = issues_resp.data or []
         candidates = candidates_resp.data or []
@@ -171,87 +278,186 @@ class DQService:
             last_recompute_at=datetime.utcnow() # TODO: Track this in a separate table/config
         )
 
-    async def recompute_all(self, org_id: str):
-        # 1. Fetch all leads and properties
-        leads_resp = supabase_service.client.table("leads").select("*").eq("org_id", org_id).execute()
-        props_resp = supabase_service.client.table("properties").select("*").eq("org_id", org_id).execute()
-        
-        leads = leads_resp.data or []
-        props = props_resp.data or []
-        
-        # 2. Re-detect quality issues
+    def _iter_pages(self, table: str, columns: tuple[str, ...], org_id: str, page_size: int = DQ_PAGE_SIZE):
+        """Keyset-paginate an org's rows ordered by id, yielding one page at a time."""
+        last_id = None
+        while True:
+            query = supabase_service.client.table(table).select(",".join(columns)).eq("org_id", org_id)
+            if last_id is not None:
+                query = query.gt("id", last_id)
+            rows = query.order("id").limit(page_size).execute().data or []
+            if rows:
+                yield rows
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1]["id"]
+
+    def _insert_chunked(self, table: str, rows: List[Dict[str, Any]], chunk_size: Optional[int] = None) -> None:
+        chunk_size = chunk_size or DQ_WRITE_CHUNK_SIZE
+        for start in range(0, len(rows), chunk_size):
+            supabase_service.client.table(table).insert(rows[start:start + chunk_size]).execute()
+
+    async def recompute_all(
+        self,
+        org_id: str,
+        page_size: int = DQ_PAGE_SIZE,
+        progress: Optional[Callable[[float, Optional[str]], None]] = None,
+    ):
+        """
+        Streaming recompute: entities are read page by page with only the
+        columns the issue detector and similarity scorer use. Issues are
+        flushed in bounded chunks per page; only the compact similarity
+        features are kept across pages for blocked duplicate detection.
+        `progress(fraction, message)` is called between phases, from the
+        DB pool thread that runs the paging and scoring.
+        """
+        if progress is not None:
+            progress(0.0, "Detecting quality issues")
+        # 1. Re-detect quality issues
         # Simple strategy: delete current OPEN issues and re-insert
-        supabase_service.client.table("dq_quality_issues").delete().eq("org_id", org_id).eq("status", "open").execute()
-        
-        new_issues = []
-        for l in leads:
-            issues = self.detect_quality_issues(EntityType.LEAD, l)
-            for iss in issues:
-                new_issues.append({**iss, "org_id": org_id, "entity_type": EntityType.LEAD.value, "entity_id": l["id"]})
-        
-        for p in props:
-            issues = self.detect_quality_issues(EntityType.PROPERTY, p)
-            for iss in issues:
-                new_issues.append({**iss, "org_id": org_id, "entity_type": EntityType.PROPERTY.value, "entity_id": p["id"]})
-        
-        if new_issues:
-            # Batch insert (Supabase limit might apply, but for v0 it should be fine)
-             supabase_service.client.table("dq_quality_issues").insert(new_issues).execute()
-        
-        # 3. Find duplicate candidates
+        await self._db().table("dq_quality_issues").delete().eq("org_id", org_id).eq("status", "open").execute()
+        await async_db.run(self._recompute_pages, org_id, page_size, progress, label="dq_recompute")
+
+    def _recompute_pages(
+        self,
+        org_id: str,
+        page_size: int,
+        progress: Optional[Callable[[float, Optional[str]], None]],
+    ) -> None:
+        """Blocking body of recompute_all: paged reads, scoring and chunked inserts."""
+        ids: Dict[EntityType, List[Any]] = {EntityType.LEAD: [], EntityType.PROPERTY: []}
+        features: Dict[EntityType, List[Dict[str, Any]]] = {EntityType.LEAD: [], EntityType.PROPERTY: []}
+
+        for entity_type, table in ((EntityType.LEAD, "leads"), (EntityType.PROPERTY, "properties")):
+            for page in self._iter_pages(table, DQ_COLUMNS[entity_type], org_id, page_size):
+                new_issues = []
+                for e in page:
+                    for iss in self.detect_quality_issues(entity_type, e):
+                        new_issues.append({**iss, "org_id": org_id, "entity_type": entity_type.value, "entity_id": e["id"]})
+                    ids[entity_type].append(e["id"])
+                    features[entity_type].append(self._similarity_features(entity_type, e))
+                self._insert_chunked("dq_quality_issues", new_issues)
+
+        # 2. Find duplicate candidates
+        if progress is not None:
+            progress(0.5, "Finding duplicate candidates")
         # Fetch EXISTING candidates to avoid unique constraint violations
-        existing_candidates_resp = supabase_service.client.table("dq_entity_candidates").select("left_entity_id, right_entity_id").eq("org_id", org_id).execute()
         existing_pairs = set()
-        if existing_candidates_resp.data:
-            for c in existing_candidates_resp.data:
+        for page in self._iter_pages("dq_entity_candidates", ("id", "left_entity_id", "right_entity_id"), org_id, page_size):
+            for c in page:
                 existing_pairs.add((c["left_entity_id"], c["right_entity_id"]))
 
+        for step, entity_type in enumerate((EntityType.LEAD, EntityType.PROPERTY)):
+            if progress is not None and step:
+                progress(0.75, f"Finding duplicate {entity_type.value} candidates")
+            new_candidates = self._blocked_candidates(
+                org_id, entity_type, ids[entity_type], features[entity_type], existing_pairs
+            )
+            self._insert_chunked("dq_entity_candidates", new_candidates)
+
+    def _escape_like(self, value: str) -> str:
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    def _phone_variants(self, raw: Optional[str], normalized: str) -> List[str]:
+        """Common stored spellings of a normalized phone number."""
+        variants = {normalized, f"+{normalized}"}
+        if raw:
+            variants.add(raw.strip())
+        if len(normalized) == 11 and normalized.startswith("34"):
+            national = normalized[2:]
+            variants.update({national, f"+34 {national}", f"+34 {national[:3]} {national[3:6]} {national[6:]}"})
+        return sorted(variants)
+
+    def _blocking_neighbours(self, org_id: str, entity_type: EntityType, entity: Dict[str, Any], features: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Rows sharing a blocking key with the entity, looked up with one narrow
+        indexed query per key. Spellings the lookup cannot normalize in SQL are
+        still caught by the full recompute.
+        """
+        neighbours: Dict[Any, Dict[str, Any]] = {}
+        for field, value in self._blocking_keys(entity_type, features):
+            query = (
+                supabase_service.client.table(DQ_TABLES[entity_type])
+                .select(",".join(DQ_COLUMNS[entity_type]))
+                .eq("org_id", org_id)
+                .neq("id", entity["id"])
+            )
+            if field in ("email", "address"):
+                query = query.ilike(field, self._escape_like(value))
+            elif field == "phone":
+                query = query.in_("phone", self._phone_variants(entity.get("phone"), value))
+            else:
+                query = query.eq(field, value)
+            for row in query.limit(DQ_BLOCK_LOOKUP_LIMIT).execute().data or []:
+                neighbours[row["id"]] = row
+        return list(neighbours.values())
+
+    async def evaluate_entity(self, org_id: str, entity_type: EntityType, entity: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Incremental DQ for one created/updated entity: replace its open issues
+        and add duplicate candidates against the rows sharing a blocking key.
+        recompute_all remains the full fallback.
+        """
+        entity_id = entity["id"]
+
+        # 1. Replace this entity's open issues
+        await self._db().table("dq_quality_issues").delete()\
+            .eq("org_id", org_id)\
+            .eq("entity_type", entity_type.value)\
+            .eq("entity_id", entity_id)\
+            .eq("status", "open")\
+            .execute()
+        new_issues = [
+            {**iss, "org_id": org_id, "entity_type": entity_type.value, "entity_id": entity_id}
+            for iss in self.detect_quality_issues(entity_type, entity)
+        ]
+        if new_issues:
+            await self._db().table("dq_quality_issues").insert(new_issues).execute()
+
+        # 2. Duplicate candidates via blocking lookups
+        features = self._similarity_features(entity_type, entity)
+        neighbours = await async_db.run(
+            self._blocking_neighbours, org_id, entity_type, entity, features, label=DQ_TABLES[entity_type]
+        )
         new_candidates = []
-        
-        # Match leads
-        for i in range(len(leads)):
-            for j in range(i + 1, len(leads)):
-                # Check if pair already exists
-                if (leads[i]["id"], leads[j]["id"]) in existing_pairs or (leads[j]["id"], leads[i]["id"]) in existing_pairs:
+        if neighbours:
+            existing_resp = await self._db().table("dq_entity_candidates")\
+                .select("left_entity_id, right_entity_id")\
+                .eq("org_id", org_id)\
+                .or_(f"left_entity_id.eq.{entity_id},right_entity_id.eq.{entity_id}")\
+                .execute()
+            existing_pairs = {(c["left_entity_id"], c["right_entity_id"]) for c in existing_resp.data or []}
+            for row in neighbours:
+                if (row["id"], entity_id) in existing_pairs or (entity_id, row["id"]) in existing_pairs:
                     continue
-
-                score, signals = self.calculate_similarity_score(EntityType.LEAD, leads[i], leads[j])
-                if score >= 40: # Threshold for candidate
+                score, signals = self._score_features(entity_type, self._similarity_features(entity_type, row), features)
+                if score >= DUPLICATE_CANDIDATE_THRESHOLD:
                     new_candidates.append({
                         "org_id": org_id,
-                        "entity_type": EntityType.LEAD.value,
-                        "left_entity_id": leads[i]["id"],
-                        "right_entity_id": leads[j]["id"],
+                        "entity_type": entity_type.value,
+                        "left_entity_id": row["id"],
+                        "right_entity_id": entity_id,
                         "similarity_score": score,
                         "signals": signals,
                         "status": "suggested_merge"
                     })
-        
-        # Match properties
-        for i in range(len(props)):
-            for j in range(i + 1, len(props)):
-                # Check if pair already exists
-                if (props[i]["id"], props[j]["id"]) in existing_pairs or (props[j]["id"], props[i]["id"]) in existing_pairs:
-                    continue
+            if new_candidates:
+                await self._db().table("dq_entity_candidates").insert(new_candidates).execute()
 
-                score, signals = self.calculate_similarity_score(EntityType.PROPERTY, props[i], props[j])
-                if score >= 40:
-                    new_candidates.append({
-                        "org_id": org_id,
-                        "entity_type": EntityType.PROPERTY.value,
-                        "left_entity_id": props[i]["id"],
-                        "right_entity_id": props[j]["id"],
-                        "similarity_score": score,
-                        "signals": signals,
-                        "status": "suggested_merge"
-                    })
-        
-        if new_candidates:
-            supabase_service.client.table("dq_entity_candidates").insert(new_candidates).execute()
+        return {"issues": len(new_issues), "candidates": len(new_candidates)}
+
+    async def evaluate_entity_safe(self, org_id: str, entity_type: EntityType, entity: Optional[Dict[str, Any]]) -> None:
+        """Best-effort hook for write paths: DQ failures never fail the write."""
+        if not entity or not entity.get("id"):
+            return
+        try:
+            await self.evaluate_entity(org_id, entity_type, entity)
+        except Exception as e:
+            print(f"DQ incremental evaluation failed for {entity_type.value} {entity.get('id')}: {e}")
 
     async def resolve_candidate(self, org_id: str, candidate_id: UUID, action: ResolutionAction, actor_user_id: Optional[UUID] = None, details: Optional[Dict[str, Any]] = None):
         # 1. Fetch candidate
-        resp = supabase_service.client.table("dq_entity_candidates").select("*").eq("id", str(candidate_id)).eq("org_id", org_id).single().execute()
+        resp = await self._db().table("dq_entity_candidates").select("*").eq("id", str(candidate_id)).eq("org_id", org_id).single().execute()
         if not resp.data:
             raise ValueError("Candidate not found")
         
@@ -263,7 +469,7 @@ class DQService:
             new_status = CandidateStatus.AUTO_LINK
         
         # 3. Update candidate
-        supabase_service.client.table("dq_entity_candidates").update({"status": new_status.value}).eq("id", str(candidate_id)).execute()
+        await self._db().table("dq_entity_candidates").update({"status": new_status.value}).eq("id", str(candidate_id)).execute()
         
         # 4. Create resolution log
         log_entry = {
@@ -274,7 +480,7 @@ class DQService:
             "actor_user_id": str(actor_user_id) if actor_user_id else None,
             "details": details or {}
         }
-        supabase_service.client.table("dq_resolution_log").insert(log_entry).execute()
+        await self._db().table("dq_resolution_log").insert(log_entry).execute()
         
         # 5. TODO: Implement actual merge logic if approved
         # For v1, we just mark as approved. Actual merge might be a separate background task or manual.
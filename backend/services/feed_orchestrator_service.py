@@ -10,6 +10,8 @@ from backend.models.feed_orchestrator import (
     FeedValidationResponse,
     FeedWorkspaceResponse,
 )
+from backend.services.async_db import AsyncClient, async_db
+from backend.services.schema_cache import schema_cache
 from backend.services.supabase_service import supabase_service
 
 
@@ -21,19 +23,14 @@ class FeedOrchestratorService:
         "kyero": {"format": "json", "required_fields": ["title", "price", "zone", "property_type"]},
     }
 
-    def _table_exists(self, table: str) -> bool:
-        try:
-            supabase_service.client.table(table).select("id").limit(1).execute()
-            return True
-        except Exception:
-            return False
+    def _db(self) -> AsyncClient:
+        return async_db.bind(supabase_service.client)
+
+    async def _table_exists(self, table: str) -> bool:
+        return await schema_cache.table_exists_async(supabase_service.client, table)
 
-    def _property_tables(self) -> List[str]:
-        tables: List[str] = []
-        for table in ("properties", "prospected_properties"):
-            if self._table_exists(table):
-                tables.append(table)
-        return tables
+    async def _property_tables(self) -> List[str]:
+        return await schema_cache.existing_tables_async(supabase_service.client)
 
     def _row_price(self, row: Dict[str, Any]) -> Optional[float]:
         raw = row.get("price")
@@ -64,10 +61,10 @@ class FeedOrchestratorService:
 
     async def _list_properties(self, org_id: str, limit: int = 500) -> List[Dict[str, Any]]:
         merged: Dict[str, Dict[str, Any]] = {}
-        for table in self._property_tables():
+        for table in await self._property_tables():
             try:
                 rows = (
-                    supabase_service.client.table(table)
+                    await self._db().table(table)
                     .select("*")
                     .eq("org_id", org_id)
                     .order("created_at", desc=True)
@@ -83,7 +80,7 @@ class FeedOrchestratorService:
         return list(merged.values())
 
     async def _channel_configs(self, org_id: str) -> Dict[str, Dict[str, Any]]:
-        if not self._table_exists("feed_channel_configs"):
+        if not await self._table_exists("feed_channel_configs"):
             return {
                 ch: {
                     **cfg,
@@ -95,7 +92,7 @@ class FeedOrchestratorService:
             }
         try:
             rows = (
-                supabase_service.client.table("feed_channel_configs")
+                await self._db().table("feed_channel_configs")
                 .select("channel, format, is_enabled, max_items_per_run, rules_json")
                 .eq("org_id", org_id)
                 .execute()
@@ -183,9 +180,9 @@ class FeedOrchestratorService:
             "rules_json": current["rules_json"] if rules_json is None else rules_json,
         }
 
-        if self._table_exists("feed_channel_configs"):
+        if await self._table_exists("feed_channel_configs"):
             try:
-                supabase_service.client.table("feed_channel_configs").upsert(
+                await self._db().table("feed_channel_configs").upsert(
                     payload,
                     on_conflict="org_id,channel",
                 ).execute()
@@ -229,10 +226,10 @@ class FeedOrchestratorService:
     async def _latest_runs_map(self, org_id: str) -> Dict[str, datetime]:
         latest: Dict[str, datetime] = {}
 
-        if self._table_exists("feed_runs"):
+        if await self._table_exists("feed_runs"):
             try:
                 rows = (
-                    supabase_service.client.table("feed_runs")
+                    await self._db().table("feed_runs")
                     .select("channel, created_at")
                     .eq("org_id", org_id)
                     .order("created_at", desc=True)
@@ -254,10 +251,10 @@ class FeedOrchestratorService:
                 pass
 
         # Legacy fallback
-        if self._table_exists("ingestion_events"):
+        if await self._table_exists("ingestion_events"):
             try:
                 rows = (
-                    supabase_service.client.table("ingestion_events")
+                    await self._db().table("ingestion_events")
                     .select("connector_name, processed_at")
                     .eq("org_id", org_id)
                     .ilike("connector_name", "feed:%")
@@ -399,10 +396,10 @@ class FeedOrchestratorService:
     ) -> str:
         run_id = str(uuid.uuid4())
 
-        if self._table_exists("feed_runs"):
+        if await self._table_exists("feed_runs"):
             try:
                 run_row = (
-                    supabase_service.client.table("feed_runs")
+                    await self._db().table("feed_runs")
                     .insert(
                         {
                             "org_id": org_id,
@@ -427,7 +424,7 @@ class FeedOrchestratorService:
             except Exception:
                 pass
 
-        if self._table_exists("feed_validation_issues") and validation.issues:
+        if await self._table_exists("feed_validation_issues") and validation.issues:
             try:
                 payload = []
                 for issue in validation.issues:
@@ -450,14 +447,14 @@ class FeedOrchestratorService:
                         }
                     )
                 if payload:
-                    supabase_service.client.table("feed_validation_issues").insert(payload).execute()
+                    await self._db().table("feed_validation_issues").insert(payload).execute()
             except Exception:
                 pass
 
         # Legacy fallback logging
-        if self._table_exists("ingestion_events"):
+        if await self._table_exists("ingestion_events"):
             try:
-                supabase_service.client.table("ingestion_events").insert(
+                await self._db().table("ingestion_events").insert(
                     {
                         "org_id": org_id,
                         "entity_type": "property",
@@ -538,9 +535,9 @@ class FeedOrchestratorService:
 
     async def list_runs(self, org_id: str, limit: int = 20, channel: Optional[str] = None) -> Tuple[List[FeedRunItem], int]:
         # Preferred persistence table
-        if self._table_exists("feed_runs"):
+        if await self._table_exists("feed_runs"):
             query = (
-                supabase_service.client.table("feed_runs")
+                self._db().table("feed_runs")
                 .select("id, channel, status, run_mode, published_count, rejected_count, created_at", count="exact")
                 .eq("org_id", org_id)
                 .order("created_at", desc=True)
@@ -549,7 +546,7 @@ class FeedOrchestratorService:
             if channel:
                 query = query.eq("channel", channel)
             try:
-                resp = query.execute()
+                resp = await query.execute()
                 rows = resp.data or []
                 items: List[FeedRunItem] = []
                 for row in rows:
@@ -574,10 +571,10 @@ class FeedOrchestratorService:
                 pass
 
         # Legacy fallback
-        if not self._table_exists("ingestion_events"):
+        if not await self._table_exists("ingestion_events"):
             return [], 0
         query = (
-            supabase_service.client.table("ingestion_events")
+            self._db().table("ingestion_events")
             .select("external_id, connector_name, status, payload, processed_at", count="exact")
             .eq("org_id", org_id)
             .ilike("connector_name", "feed:%")
@@ -587,7 +584,7 @@ class FeedOrchestratorService:
         if channel:
             query = query.eq("connector_name", f"feed:{channel}")
         try:
-            resp = query.execute()
+            resp = await query.execute()
             rows = resp.data or []
         except Exception:
             return [], 0
@@ -1,46 +1,141 @@
+import threading
+import time
 from typing import List, Optional, Dict, Any
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 from uuid import UUID
 
 from backend.config import settings
+from backend.services.async_db import AsyncClient, async_db
+from backend.services.schema_cache import schema_cache
 from backend.services.supabase_service import supabase_service
 from backend.models.finops import (
     BudgetResponse, 
     BudgetUpdate, 
     UsageEventSchema, 
     UsageEventResponse,
-    AlertResponse
+    AlertResponse,
+    LedgerReconcileResponse,
 )
 
+# Running monthly totals, maintained by a trigger on org_cost_usage_events (migration 036).
+LEDGER_TABLE = "org_cost_monthly_ledger"
+
+# Recomputes one ledger row from raw events in a single DB call (migration 041).
+RECONCILE_LEDGER_FN = "reconcile_org_cost_monthly_ledger"
+
+# Raw usage rows per keyset page; at most the PostgREST max_rows cap.
+USAGE_PAGE_SIZE = 1000
+
 class FinOpsService:
     def __init__(self):
         self.client = supabase_service.client
+        # Per-org budget status cache for hot guards (check_budget_hard_stop).
+        # Write-through invalidated by this process; other workers converge within the TTL.
+        self.budget_cache_ttl_seconds: float = settings.BUDGET_STATUS_CACHE_TTL_SECONDS
+        self._budget_cache: Dict[str, tuple[float, BudgetResponse]] = {}
+        self._budget_cache_lock = threading.Lock()
+        self.budget_cache_hits = 0
+        self.budget_cache_misses = 0
+
+    def _db(self) -> AsyncClient:
+        return async_db.bind(self.client)
+
+    def invalidate_budget_status(self, org_id: Optional[str] = None) -> None:
+        with self._budget_cache_lock:
+            if org_id is None:
+                self._budget_cache.clear()
+            else:
+                self._budget_cache.pop(str(org_id), None)
+
+    def budget_cache_stats(self) -> Dict[str, Any]:
+        with self._budget_cache_lock:
+            lookups = self.budget_cache_hits + self.budget_cache_misses
+            return {
+                "hits": self.budget_cache_hits,
+                "misses": self.budget_cache_misses,
+                "hit_ratio": round(self.budget_cache_hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._budget_cache),
+                "ttl_seconds": self.budget_cache_ttl_seconds,
+            }
+
+    def _current_month_key(self) -> str:
+        return datetime.now(timezone.utc).strftime("%Y-%m")
+
+    def _month_bounds(self, month_key: str) -> tuple[str, str]:
+        year, month = (int(part) for part in month_key.split("-"))
+        start = datetime(year, month, 1, tzinfo=timezone.utc)
+        end = datetime(year + 1, 1, 1, tzinfo=timezone.utc) if month == 12 else datetime(year, month + 1, 1, tzinfo=timezone.utc)
+        return start.isoformat(), end.isoformat()
+
+    def _sum_raw_usage(self, org_id: str, month_key: str) -> tuple[float, int]:
+        """Sum raw usage events for a month, in keyset pages. Fallback when the ledger is unavailable."""
+        start, end = self._month_bounds(month_key)
+        total, count = 0.0, 0
+        last_id: Optional[str] = None
+        while True:
+            query = self.client.table("org_cost_usage_events")\
+                .select("id,cost_eur")\
+                .eq("org_id", org_id)\
+                .gte("created_at", start)\
+                .lt("created_at", end)
+            if last_id is not None:
+                query = query.gt("id", last_id)
+            rows = query.order("id").limit(USAGE_PAGE_SIZE).execute().data or []
+            total += sum(float(item["cost_eur"]) for item in rows)
+            count += len(rows)
+            if len(rows) < USAGE_PAGE_SIZE:
+                return total, count
+            last_id = str(rows[-1]["id"])
+
+    def _read_ledger(self, org_id: str, month_key: str) -> Optional[Dict[str, Any]]:
+        """Ledger row for the month, {} when the org has no usage yet, None if the ledger is unavailable."""
+        if not schema_cache.table_exists(self.client, LEDGER_TABLE):
+            return None
+        try:
+            res = self.client.table(LEDGER_TABLE)\
+                .select("total_cost_eur,event_count")\
+                .eq("org_id", org_id)\
+                .eq("month_key", month_key)\
+                .limit(1)\
+                .execute()
+        except Exception:
+            return None
+        return res.data[0] if res.data else {}
+
+    def _month_usage_eur(self, org_id: str, month_key: str) -> float:
+        ledger = self._read_ledger(org_id, month_key)
+        if ledger is None:
+            return self._sum_raw_usage(org_id, month_key)[0]
+        return float(ledger.get("total_cost_eur") or 0)
+
+    async def get_budget_status(self, org_id: str, use_cache: bool = True) -> BudgetResponse:
+        if use_cache and self.budget_cache_ttl_seconds > 0:
+            with self._budget_cache_lock:
+                entry = self._budget_cache.get(str(org_id))
+                if entry is not None and entry[0] > time.monotonic():
+                    self.budget_cache_hits += 1
+                    return entry[1].model_copy()
+                self.budget_cache_misses += 1
 
-    async def get_budget_status(self, org_id: str) -> BudgetResponse:
+        status = await async_db.run(self._compute_budget_status, org_id, label="finops.budget_status")
+        if self.budget_cache_ttl_seconds > 0:
+            with self._budget_cache_lock:
+                self._budget_cache[str(org_id)] = (
+                    time.monotonic() + self.budget_cache_ttl_seconds,
+                    status.model_copy(),
+                )
+        return status
+
+    def _compute_budget_status(self, org_id: str) -> BudgetResponse:
         # 1. Get Policy
         policy_res = self.client.table("org_cost_policies").select("*").eq("org_id", org_id).single().execute()
         # If no policy, we should probably return a default or error, but migration backfilled it.
         # Assuming it exists or handling error could be done here.
         policy = policy_res.data
         
-        # 2. Key for current month aggregation
-        current_month_start = date.today().replace(day=1).isoformat()
-        
-        # 3. Aggregate Usage for current month
-        # Since we don't have a pre-aggregated table in spec (only raw events), we sum raw events.
-        # For huge scale this might be slow, but for v0 it's fine.
-        # Supabase API doesn't support SUM directly easily without RPC, but we can fetch and sum or use a view.
-        # Given "sdd/features/cost-governance-foundation-spec-v1.md" mentions "Retorna presupuesto y consumo acumulado",
-        # and we can't easily change DB schema to add views, we will query raw events.
-        # NOTE: To optimize, we could fetch only 'cost_eur' column.
-        
-        usage_res = self.client.table("org_cost_usage_events")\
-            .select("cost_eur")\
-            .eq("org_id", org_id)\
-            .gte("created_at", current_month_start)\
-            .execute()
-            
-        total_usage_eur = sum(item["cost_eur"] for item in usage_res.data)
+        # 2. Current month usage: O(1) ledger read, raw event scan if the
+        # ledger migration is not applied yet.
+        total_usage_eur = self._month_usage_eur(org_id, self._current_month_key())
         
         monthly_budget = float(policy["monthly_budget_eur"])
         current_pct = (total_usage_eur / monthly_budget * 100) if monthly_budget > 0 else 0
@@ -68,7 +163,8 @@ class FinOpsService:
         if not data:
             return await self.get_budget_status(org_id)
             
-        self.client.table("org_cost_policies").update(data).eq("org_id", org_id).execute()
+        await self._db().table("org_cost_policies").update(data).eq("org_id", org_id).execute()
+        self.invalidate_budget_status(org_id)
         return await self.get_budget_status(org_id)
 
     async def log_usage_event(self, org_id: str, event: UsageEventSchema) -> UsageEventResponse:
@@ -77,8 +173,10 @@ class FinOpsService:
         event_dict["org_id"] = org_id
         # trace_id is optional, logic handles it.
         
-        res = self.client.table("org_cost_usage_events").insert(event_dict).execute()
+        # The monthly ledger row is incremented by trigger in the same transaction.
+        res = await self._db().table("org_cost_usage_events").insert(event_dict).execute()
         inserted_event = res.data[0]
+        self.invalidate_budget_status(org_id)
         
         # 2. Check Thresholds & Manage Alerts
         # We need to re-check budget status.
@@ -91,7 +189,7 @@ class FinOpsService:
         # Spec: "Si consumo >= hard-stop threshold ...: bloquear" (Blocking is handled by the caller or middleware checking status, here we just alert)
         
         # Check active alerts for this month
-        active_alerts_res = self.client.table("org_cost_alerts")\
+        active_alerts_res = await self._db().table("org_cost_alerts")\
             .select("*")\
             .eq("org_id", org_id)\
             .eq("month_key", month_key)\
@@ -103,7 +201,7 @@ class FinOpsService:
         # Hard Stop Alert
         if status.status == "hard_stop":
             if "hard_stop" not in active_alerts:
-                self.client.table("org_cost_alerts").insert({
+                await self._db().table("org_cost_alerts").insert({
                     "org_id": org_id,
                     "alert_type": "hard_stop",
                     "month_key": month_key,
@@ -117,7 +215,7 @@ class FinOpsService:
                 # Only create warning if not already in hard_stop (assuming hard_stop supersedes warning or they coexist? Spec doesn't strictly say, but usually you want at least the highest severity)
                 # However, spec says "Si consumo >= warning ... alerta warning". It doesn't say "unless hard stop".
                 # But let's create it if missing.
-                self.client.table("org_cost_alerts").insert({
+                await self._db().table("org_cost_alerts").insert({
                     "org_id": org_id,
                     "alert_type": "warning",
                     "month_key": month_key,
@@ -133,6 +231,48 @@ class FinOpsService:
         
         return UsageEventResponse(**inserted_event)
 
+    async def reconcile_ledger(self, org_id: str, month_key: Optional[str] = None) -> LedgerReconcileResponse:
+        """
+        Recompute a month's ledger total from raw usage events and overwrite it.
+        The read and the write run as one statement in the database (migration
+        041), so concurrent usage inserts are neither lost nor double counted.
+        Without the ledger the raw total is only reported.
+        """
+        month_key = month_key or self._current_month_key()
+        if not await schema_cache.table_exists_async(self.client, LEDGER_TABLE):
+            raw_total, event_count = await async_db.run(
+                self._sum_raw_usage, org_id, month_key, label="org_cost_usage_events"
+            )
+            return LedgerReconcileResponse(
+                org_id=org_id,
+                month_key=month_key,
+                ledger_total_eur=0.0,
+                raw_total_eur=raw_total,
+                drift_eur=round(-raw_total, 6),
+                event_count=event_count,
+                corrected=False,
+            )
+
+        res = await self._db().rpc(
+            RECONCILE_LEDGER_FN, {"p_org_id": org_id, "p_month_key": month_key}
+        ).execute()
+        data = res.data or {}
+        row = (data[0] if data else {}) if isinstance(data, list) else data
+        ledger_total = float(row.get("ledger_total_eur") or 0)
+        raw_total = float(row.get("raw_total_eur") or 0)
+        drift = round(ledger_total - raw_total, 6)
+        self.invalidate_budget_status(org_id)
+
+        return LedgerReconcileResponse(
+            org_id=org_id,
+            month_key=month_key,
+            ledger_total_eur=ledger_total,
+            raw_total_eur=raw_total,
+            drift_eur=drift,
+            event_count=int(row.get("raw_event_count") or 0),
+            corrected=drift != 0,
+        )
+
     async def get_usage_history(
         self, 
         org_id: str, 
@@ -140,7 +280,7 @@ class FinOpsService:
         start_date: Optional[datetime] = None, 
         end_date: Optional[datetime] = None
     ) -> List[UsageEventResponse]:
-        query = self.client.table("org_cost_usage_events").select("*").eq("org_id", org_id).order("created_at", desc=True)
+        query = self._db().table("org_cost_usage_events").select("*").eq("org_id", org_id).order("created_at", desc=True)
         
         if capability:
             query = query.eq("capability_code", capability)
@@ -149,11 +289,11 @@ class FinOpsService:
         if end_date:
             query = query.lte("created_at", end_date.isoformat())
             
-        res = query.execute()
+        res = await query.execute()
         return [UsageEventResponse(**item) for item in res.data]
 
     async def get_active_alerts(self, org_id: str) -> List[AlertResponse]:
-        res = self.client.table("org_cost_alerts")\
+        res = await self._db().table("org_cost_alerts")\
             .select("*")\
             .eq("org_id", org_id)\
             .eq("is_active", True)\
@@ -1,7 +1,7 @@
 import hashlib
 import json
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from backend.models.ingestion import (
     EntityType,
@@ -10,61 +10,99 @@ from backend.models.ingestion import (
     LeadIngestionPayload,
     PropertyIngestionPayload,
 )
+from backend.models.dq import EntityType as DQEntityType
+from backend.config import settings
+from backend.services.async_db import AsyncClient, async_db
+from backend.services.dedupe_index import DedupeKeyIndex
+from backend.services.dq_service import dq_service
 from backend.services.supabase_service import supabase_service
 
+# Items per bulk insert in batch ingestion.
+INGESTION_BATCH_CHUNK_SIZE = 500
+
+# Dedupe keys per `in_` lookup: 64-char hashes keep the GET URL well under
+# typical proxy limits (~8 KB).
+INGESTION_LOOKUP_CHUNK_SIZE = 100
+
+
+def _is_unique_violation(error: Exception) -> bool:
+    """True if an insert was rejected by a unique constraint (SQLSTATE 23505)."""
+    if str(getattr(error, "code", "") or "") == "23505":
+        return True
+    return "duplicate key value violates unique constraint" in str(error).lower()
+
+
 class IngestionService:
+    def __init__(self) -> None:
+        self.dedupe_index = DedupeKeyIndex(
+            authoritative=settings.DEDUPE_INDEX_AUTHORITATIVE,
+            refresh_seconds=settings.DEDUPE_INDEX_REFRESH_SECONDS,
+        )
+
+    def _db(self) -> AsyncClient:
+        return async_db.bind(supabase_service.client)
+
     def _generate_dedupe_key(self, org_id: str, entity_type: str, source_system: str, external_id: str) -> str:
         """Generates a unique dedupe key for an ingestion item."""
         base = f"{org_id}:{entity_type}:{source_system}:{external_id}"
         return hashlib.sha256(base.encode()).hexdigest()
 
+    def _is_duplicate(self, org_id: str, dedupe_key: str) -> bool:
+        """
+        Dedupe check backed by the in-memory key index. Keys the index knows
+        are new skip the database; everything else is confirmed with a
+        narrow `ingestion_events` lookup. A key another worker stored since
+        the last warm is caught when its event insert hits UNIQUE(org_id,
+        dedupe_key) (see _log_event).
+        """
+        known = self.dedupe_index.lookup(org_id, dedupe_key)
+        if known is None:
+            existing = supabase_service.client.table("ingestion_events").select("id").eq("dedupe_key", dedupe_key).execute()
+            known = bool(existing.data)
+            self.dedupe_index.record_db_result(org_id, dedupe_key, known)
+        return known
+
+    def _log_event(self, event_data: Dict[str, Any]) -> bool:
+        """
+        Insert one ingestion event and register its key in the index. Returns
+        False if the key was already taken (unique violation): another worker
+        ingested the same item first.
+        """
+        try:
+            supabase_service.client.table("ingestion_events").insert(event_data).execute()
+        except Exception as e:
+            if not _is_unique_violation(e):
+                raise
+            self.dedupe_index.add(event_data["org_id"], event_data["dedupe_key"])
+            return False
+        self.dedupe_index.add(event_data["org_id"], event_data["dedupe_key"])
+        return True
+
+    def _discard_entity(self, table: str, entity_id: Any) -> None:
+        """Delete an entity inserted for a dedupe key that turned out to be taken."""
+        if entity_id is not None:
+            supabase_service.client.table(table).delete().eq("id", entity_id).execute()
+
     async def ingest_lead(self, payload: LeadIngestionPayload) -> Dict[str, Any]:
         dedupe_key = self._generate_dedupe_key(
             payload.org_id, "lead", payload.source_system.value, payload.external_id
         )
 
         # 1. Check for duplicate
-        # For v0, we check the ingestion_events table
-        # We use direct client access as the service methods update failed
-        existing = supabase_service.client.table("ingestion_events").select("*").eq("dedupe_key", dedupe_key).execute()
-        
-        if existing.data:
-            event_data = {
-                "org_id": payload.org_id,
-                "entity_type": EntityType.LEAD,
-                "external_id": payload.external_id,
-                "connector_name": f"{payload.source_system.value}:{payload.source_channel.value}",
-                "status": IngestionStatus.DUPLICATE,
-                "message": "Duplicate lead ignored",
-                "payload": payload.dict(),
-                "dedupe_key": dedupe_key,
-                "processed_at": datetime.utcnow().isoformat()
-            }
-            supabase_service.client.table("ingestion_events").insert(event_data).execute()
+        # For v0, we check the ingestion_events table (through the dedupe index).
+        # Duplicates get no event row: their key is already taken under
+        # UNIQUE(org_id, dedupe_key).
+        self.dedupe_index.schedule_warm(payload.org_id, lambda: supabase_service.client)
+        if await async_db.run(self._is_duplicate, payload.org_id, dedupe_key, label="ingestion_events"):
             return {"status": "duplicate", "dedupe_key": dedupe_key}
 
         try:
             # 2. Insert into leads
-            lead_data = {
-                "org_id": payload.org_id,
-                "name": payload.name,
-                "email": str(payload.email) if payload.email else None,
-                "phone": payload.phone,
-                "budget": payload.budget,
-                "notes": payload.notes,
-                "source": payload.source_system.value,
-                "source_channel": payload.source_channel.value,
-                "source_detail": payload.source_detail,
-                "source_url": payload.source_url,
-                "source_referrer": payload.source_referrer,
-                "captured_at": payload.captured_at.isoformat(),
-                "metadata_json": payload.metadata,
-                "status": "new"
-            }
+            lead_data = self._lead_record(payload)
             # We use supabase_service.insert_lead if it matches the schema, but we might need all fields
-            supabase_service.client.table("leads").insert(lead_data).execute()
+            inserted = await self._db().table("leads").insert(lead_data).execute()
 
-            # 3. Log success event
+            # 3. Log success event; a taken key means another worker won the race
             event_data = {
                 "org_id": payload.org_id,
                 "entity_type": EntityType.LEAD,
@@ -76,12 +114,19 @@ class IngestionService:
                 "dedupe_key": dedupe_key,
                 "processed_at": datetime.utcnow().isoformat()
             }
-            supabase_service.client.table("ingestion_events").insert(event_data).execute()
+            if not await async_db.run(self._log_event, event_data, label="ingestion_events"):
+                entity_id = inserted.data[0].get("id") if inserted.data else None
+                await async_db.run(self._discard_entity, "leads", entity_id, label="leads")
+                return {"status": "duplicate", "dedupe_key": dedupe_key}
+
+            # 4. Incremental data-quality check for the new lead
+            if inserted.data:
+                await dq_service.evaluate_entity_safe(payload.org_id, DQEntityType.LEAD, {**lead_data, **inserted.data[0]})
             
             return {"status": "success", "dedupe_key": dedupe_key}
 
         except Exception as e:
-            # 4. Log error event
+            # 5. Log error event
             event_data = {
                 "org_id": payload.org_id,
                 "entity_type": EntityType.LEAD,
@@ -94,7 +139,7 @@ class IngestionService:
                 "dedupe_key": dedupe_key,
                 "processed_at": datetime.utcnow().isoformat()
             }
-            supabase_service.client.table("ingestion_events").insert(event_data).execute()
+            await async_db.run(self._log_event, event_data, label="ingestion_events")
             raise e
 
     async def ingest_property(self, payload: PropertyIngestionPayload) -> Dict[str, Any]:
@@ -102,43 +147,13 @@ class IngestionService:
             payload.org_id, "property", payload.source_system.value, payload.external_id
         )
 
-        existing = supabase_service.client.table("ingestion_events").select("*").eq("dedupe_key", dedupe_key).execute()
-        
-        if existing.data:
-            event_data = {
-                "org_id": payload.org_id,
-                "entity_type": EntityType.PROPERTY,
-                "external_id": payload.external_id,
-                "connector_name": f"{payload.source_system.value}:{payload.source_portal.value}",
-                "status": IngestionStatus.DUPLICATE,
-                "message": "Duplicate property ignored",
-                "payload": payload.dict(),
-                "dedupe_key": dedupe_key,
-                "processed_at": datetime.utcnow().isoformat()
-            }
-            supabase_service.client.table("ingestion_events").insert(event_data).execute()
+        self.dedupe_index.schedule_warm(payload.org_id, lambda: supabase_service.client)
+        if await async_db.run(self._is_duplicate, payload.org_id, dedupe_key, label="ingestion_events"):
             return {"status": "duplicate", "dedupe_key": dedupe_key}
 
         try:
-            property_data = {
-                "org_id": payload.org_id,
-                "title": payload.title,
-                "address": payload.address,
-                "price_eur": payload.price_eur,
-                "zone": payload.zone,
-                "built_area_m2": payload.built_area_m2,
-                "useful_area_m2": payload.useful_area_m2,
-                "plot_area_m2": payload.plot_area_m2,
-                "bedrooms": payload.bedrooms,
-                "bathrooms": payload.bathrooms,
-                "description": payload.description,
-                "status": "prospect",
-                "source": payload.source_system.value,
-                "source_portal": payload.source_portal.value,
-                "captured_at": payload.captured_at.isoformat(),
-                "metadata_json": payload.metadata
-            }
-            supabase_service.client.table("properties").insert(property_data).execute()
+            property_data = self._property_record(payload)
+            inserted = await self._db().table("properties").insert(property_data).execute()
 
             event_data = {
                 "org_id": payload.org_id,
@@ -151,7 +166,13 @@ class IngestionService:
                 "dedupe_key": dedupe_key,
                 "processed_at": datetime.utcnow().isoformat()
             }
-            supabase_service.client.table("ingestion_events").insert(event_data).execute()
+            if not await async_db.run(self._log_event, event_data, label="ingestion_events"):
+                entity_id = inserted.data[0].get("id") if inserted.data else None
+                await async_db.run(self._discard_entity, "properties", entity_id, label="properties")
+                return {"status": "duplicate", "dedupe_key": dedupe_key}
+
+            if inserted.data:
+                await dq_service.evaluate_entity_safe(payload.org_id, DQEntityType.PROPERTY, {**property_data, **inserted.data[0]})
             
             return {"status": "success", "dedupe_key": dedupe_key}
 
@@ -168,11 +189,279 @@ class IngestionService:
                 "dedupe_key": dedupe_key,
                 "processed_at": datetime.utcnow().isoformat()
             }
-            supabase_service.client.table("ingestion_events").insert(event_data).execute()
+            await async_db.run(self._log_event, event_data, label="ingestion_events")
             raise e
 
+    def _lead_record(self, payload: LeadIngestionPayload) -> Dict[str, Any]:
+        return {
+            "org_id": payload.org_id,
+            "name": payload.name,
+            "email": str(payload.email) if payload.email else None,
+            "phone": payload.phone,
+            "budget": payload.budget,
+            "notes": payload.notes,
+            "source": payload.source_system.value,
+            "source_channel": payload.source_channel.value,
+            "source_detail": payload.source_detail,
+            "source_url": payload.source_url,
+            "source_referrer": payload.source_referrer,
+            "captured_at": payload.captured_at.isoformat(),
+            "metadata_json": payload.metadata,
+            "status": "new"
+        }
+
+    def _property_record(self, payload: PropertyIngestionPayload) -> Dict[str, Any]:
+        return {
+            "org_id": payload.org_id,
+            "title": payload.title,
+            "address": payload.address,
+            "price_eur": payload.price_eur,
+            "zone": payload.zone,
+            "built_area_m2": payload.built_area_m2,
+            "useful_area_m2": payload.useful_area_m2,
+            "plot_area_m2": payload.plot_area_m2,
+            "bedrooms": payload.bedrooms,
+            "bathrooms": payload.bathrooms,
+            "description": payload.description,
+            "status": "prospect",
+            "source": payload.source_system.value,
+            "source_portal": payload.source_portal.value,
+            "captured_at": payload.captured_at.isoformat(),
+            "metadata_json": payload.metadata
+        }
+
+    # ─────────────────────────────────────────────────────────────────────
+    # BATCH INGESTION
+    # ─────────────────────────────────────────────────────────────────────
+
+    async def ingest_leads_batch(self, payloads: List[LeadIngestionPayload]) -> Dict[str, Any]:
+        # A batch is a run of blocking Supabase round-trips: it runs on the DB
+        # pool so the event loop keeps serving other requests. Index warming
+        # is scheduled from here, where the loop is available.
+        self._schedule_warm(payloads)
+        return await async_db.run(
+            self._ingest_batch,
+            EntityType.LEAD,
+            "leads",
+            payloads,
+            record_builder=self._lead_record,
+            connector=lambda p: f"{p.source_system.value}:{p.source_channel.value}",
+            label="ingestion_batch",
+        )
+
+    async def ingest_properties_batch(self, payloads: List[PropertyIngestionPayload]) -> Dict[str, Any]:
+        self._schedule_warm(payloads)
+        return await async_db.run(
+            self._ingest_batch,
+            EntityType.PROPERTY,
+            "properties",
+            payloads,
+            record_builder=self._property_record,
+            connector=lambda p: f"{p.source_system.value}:{p.source_portal.value}",
+            label="ingestion_batch",
+        )
+
+    def _schedule_warm(self, payloads: List[Any]) -> None:
+        for org_id in {p.org_id for p in payloads}:
+            self.dedupe_index.schedule_warm(org_id, lambda: supabase_service.client)
+
+    def _ingest_batch(
+        self,
+        entity_type: EntityType,
+        table: str,
+        payloads: List[Any],
+        record_builder: Callable[[Any], Dict[str, Any]],
+        connector: Callable[[Any], str],
+    ) -> Dict[str, Any]:
+        """
+        Bulk ingestion: dedupe keys are computed up front and resolved against
+        the dedupe index, with `in_` queries of INGESTION_LOOKUP_CHUNK_SIZE keys
+        for the ones it cannot answer. New entities and their ingestion events are bulk-inserted, and
+        a per-item status is returned in input order.
+        Duplicates (stored or inside the same batch) are reported but get no
+        event row: their key is already taken under UNIQUE(org_id, dedupe_key).
+        An item whose event insert hits that constraint was stored by another
+        worker meanwhile: its entity is deleted again and it is reported as a
+        duplicate.
+        Data-quality checks for imported rows are left to DQ recompute.
+        """
+        label = entity_type.value.capitalize()
+        results: List[Dict[str, Any]] = []
+        seen_keys: set[str] = set()
+
+        for start in range(0, len(payloads), INGESTION_BATCH_CHUNK_SIZE):
+            chunk = payloads[start:start + INGESTION_BATCH_CHUNK_SIZE]
+            keys = [
+                self._generate_dedupe_key(p.org_id, entity_type.value, p.source_system.value, p.external_id)
+                for p in chunk
+            ]
+
+            stored_keys: set[str] = set()
+            unresolved: set[str] = set()
+            for payload, key in zip(chunk, keys):
+                known = self.dedupe_index.lookup(payload.org_id, key)
+                if known:
+                    stored_keys.add(key)
+                elif known is None:
+                    unresolved.add(key)
+
+            if unresolved:
+                stored_keys.update(self._stored_dedupe_keys(sorted(unresolved)))
+                for payload, key in zip(chunk, keys):
+                    if key in unresolved:
+                        self.dedupe_index.record_db_result(payload.org_id, key, key in stored_keys)
+
+            fresh: List[int] = []
+            chunk_results: List[Dict[str, Any]] = []
+            for offset, (payload, key) in enumerate(zip(chunk, keys)):
+                item = {"index": start + offset, "external_id": payload.external_id, "dedupe_key": key}
+                if key in stored_keys or key in seen_keys:
+                    item.update({"status": IngestionStatus.DUPLICATE.value, "message": f"Duplicate {entity_type.value} ignored"})
+                else:
+                    fresh.append(offset)
+                    item["status"] = IngestionStatus.SUCCESS.value
+                seen_keys.add(key)
+                chunk_results.append(item)
+
+            self._insert_fresh_entities(table, chunk, fresh, chunk_results, record_builder, label)
+
+            events = []
+            logged_items = []
+            for payload, item in zip(chunk, chunk_results):
+                if item["status"] == IngestionStatus.DUPLICATE.value:
+                    continue
+                event = {
+                    "org_id": payload.org_id,
+                    "entity_type": entity_type,
+                    "external_id": payload.external_id,
+                    "connector_name": connector(payload),
+                    "status": item["status"],
+                    "message": item["message"],
+                    "payload": payload.dict(),
+                    "dedupe_key": item["dedupe_key"],
+                    "processed_at": datetime.utcnow().isoformat()
+                }
+                if item["status"] == IngestionStatus.ERROR.value:
+                    event["error_detail"] = {"error": item["message"]}
+                events.append(event)
+                logged_items.append(item)
+            errors, taken_keys = self._log_batch_events(events)
+            for item, error in zip(logged_items, errors):
+                if error is not None:
+                    item["message"] = f"{item['message']} (ingestion event not logged: {error})"
+            if taken_keys:
+                self._mark_taken(table, chunk_results, taken_keys, entity_type)
+
+            results.extend(chunk_results)
+
+        return {
+            "total": len(results),
+            "succeeded": sum(1 for r in results if r["status"] == IngestionStatus.SUCCESS.value),
+            "duplicates": sum(1 for r in results if r["status"] == IngestionStatus.DUPLICATE.value),
+            "errors": sum(1 for r in results if r["status"] == IngestionStatus.ERROR.value),
+            "items": results,
+        }
+
+    def _stored_dedupe_keys(self, keys: List[str]) -> set[str]:
+        """Which of `keys` already have an ingestion event."""
+        stored: set[str] = set()
+        for start in range(0, len(keys), INGESTION_LOOKUP_CHUNK_SIZE):
+            existing = supabase_service.client.table("ingestion_events")\
+                .select("dedupe_key")\
+                .in_("dedupe_key", keys[start:start + INGESTION_LOOKUP_CHUNK_SIZE])\
+                .execute()
+            stored.update(row["dedupe_key"] for row in existing.data or [])
+        return stored
+
+    def _insert_fresh_entities(
+        self,
+        table: str,
+        chunk: List[Any],
+        fresh: List[int],
+        chunk_results: List[Dict[str, Any]],
+        record_builder: Callable[[Any], Dict[str, Any]],
+        label: str,
+    ) -> None:
+        """Bulk-insert new entities; on failure retry one by one to isolate bad rows."""
+        if not fresh:
+            return
+        records = [record_builder(chunk[offset]) for offset in fresh]
+        try:
+            inserted = supabase_service.client.table(table).insert(records).execute().data or []
+        except Exception:
+            inserted = None
+
+        if inserted is not None:
+            # A bulk insert is a single statement: all rows were written.
+            for position, offset in enumerate(fresh):
+                row = inserted[position] if position < len(inserted) else {}
+                chunk_results[offset].update({"entity_id": row.get("id"), "message": f"{label} ingested successfully"})
+            return
+
+        for offset, record in zip(fresh, records):
+            try:
+                row = supabase_service.client.table(table).insert(record).execute().data or [{}]
+                chunk_results[offset].update({"entity_id": row[0].get("id"), "message": f"{label} ingested successfully"})
+            except Exception as e:
+                chunk_results[offset].update({"status": IngestionStatus.ERROR.value, "message": str(e)})
+
+    def _log_batch_events(self, events: List[Dict[str, Any]]) -> tuple[List[Optional[str]], set[str]]:
+        """
+        Insert a chunk's events, skipping keys another worker stored since the
+        lookup; on failure retry one by one to isolate bad rows. Returns, per
+        event, the error that kept it from being written (None if written or
+        skipped), and the keys that were skipped because they were taken.
+        """
+        if not events:
+            return [], set()
+        table = supabase_service.client.table
+        # ON CONFLICT DO NOTHING returns only the rows it inserted.
+        written: set[str] = set()
+        try:
+            rows = table("ingestion_events").upsert(
+                events, on_conflict="org_id,dedupe_key", ignore_duplicates=True
+            ).execute().data or []
+            written.update(row["dedupe_key"] for row in rows)
+            errors: List[Optional[str]] = [None] * len(events)
+        except Exception:
+            errors = []
+            for event in events:
+                try:
+                    rows = table("ingestion_events").upsert(
+                        event, on_conflict="org_id,dedupe_key", ignore_duplicates=True
+                    ).execute().data or []
+                    written.update(row["dedupe_key"] for row in rows)
+                    errors.append(None)
+                except Exception as e:
+                    errors.append(str(e))
+        taken: set[str] = set()
+        for event, error in zip(events, errors):
+            if error is None:
+                self.dedupe_index.add(event["org_id"], event["dedupe_key"])
+                if event["dedupe_key"] not in written:
+                    taken.add(event["dedupe_key"])
+        return errors, taken
+
+    def _mark_taken(
+        self,
+        table: str,
+        chunk_results: List[Dict[str, Any]],
+        taken_keys: set[str],
+        entity_type: EntityType,
+    ) -> None:
+        """Report items whose key another worker stored first as duplicates and drop their entities."""
+        entity_ids = []
+        for item in chunk_results:
+            if item["dedupe_key"] not in taken_keys:
+                continue
+            if item.get("entity_id") is not None:
+                entity_ids.append(item.pop("entity_id"))
+            item.update({"status": IngestionStatus.DUPLICATE.value, "message": f"Duplicate {entity_type.value} ignored"})
+        for start in range(0, len(entity_ids), INGESTION_LOOKUP_CHUNK_SIZE):
+            supabase_service.client.table(table).delete().in_("id", entity_ids[start:start + INGESTION_LOOKUP_CHUNK_SIZE]).execute()
+
     async def get_events(self, org_id: str, limit: int = 50) -> List[Dict[str, Any]]:
-        response = supabase_service.client.table("ingestion_events")\
+        response = await self._db().table("ingestion_events")\
             .select("*")\
             .eq("org_id", org_id)\
             .order("processed_at", desc=True)\
@@ -181,7 +470,7 @@ class IngestionService:
         return response.data
 
     async def get_event_by_id(self, event_id: str) -> Optional[Dict[str, Any]]:
-        response = supabase_service.client.table("ingestion_events")\
+        response = await self._db().table("ingestion_events")\
             .select("*")\
             .eq("id", event_id)\
             .execute()
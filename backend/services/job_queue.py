@@ -0,0 +1,527 @@
+"""
+Job Queue — local background job subsystem for long-running work.
+
+Jobs are persisted in `background_jobs` (migration 037) when the table exists
+and always tracked in memory by the process that runs them. Each job runs on
+a bounded thread pool with its own event loop, so the synchronous Supabase
+client never blocks the API event loop. At most one queued/running job exists
+per (org, job type): enqueueing again returns the active job. The public API
+is async and runs its table reads and writes on the async_db pool; while a job
+runs, its owner heartbeats `updated_at` so other workers never mistake a long,
+silent job for a dead one.
+
+Handlers receive a JobContext; `report(progress, message)` records progress
+and raises JobCancelled once cancellation was requested.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from backend.config import settings
+from backend.models.jobs import (
+    ACTIVE_JOB_STATUSES,
+    FeedPublishJobParams,
+    JobListResponse,
+    JobResponse,
+    JobStatus,
+    JobType,
+)
+from backend.services.async_db import async_db
+from backend.services.schema_cache import schema_cache
+from backend.services.supabase_service import supabase_service
+
+JOBS_TABLE = "background_jobs"
+# Minimum seconds between progress writes to the jobs table.
+JOB_PROGRESS_PERSIST_INTERVAL = 1.0
+# Finished jobs kept in memory for status polling.
+JOB_HISTORY_LIMIT = 500
+
+logger = logging.getLogger(__name__)
+
+
+class JobCancelled(Exception):
+    """Raised inside a handler once cancellation of its job was requested."""
+
+
+class JobContext:
+    def __init__(self, queue: "JobQueueService", job_id: str) -> None:
+        self.queue = queue
+        self.job_id = job_id
+        self._last_persist = 0.0
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self.queue._cancel_requested(self.job_id)
+
+    def report(self, progress: float, message: Optional[str] = None) -> None:
+        """Record progress (0..1); raises JobCancelled if the job was cancelled."""
+        now = time.monotonic()
+        persist = now - self._last_persist >= JOB_PROGRESS_PERSIST_INTERVAL
+        if persist:
+            self._last_persist = now
+        self.queue._update(
+            self.job_id,
+            persist=persist,
+            progress=max(0.0, min(1.0, float(progress))),
+            progress_message=message,
+        )
+        if persist and self.queue._remote_cancel_requested(self.job_id):
+            self.queue._update(self.job_id, persist=False, cancel_requested=True)
+        if self.cancel_requested:
+            raise JobCancelled()
+
+
+JobHandler = Callable[[JobContext, str, Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class JobQueueService:
+    def __init__(
+        self,
+        max_workers: int = 2,
+        stale_seconds: float = 900.0,
+        heartbeat_seconds: Optional[float] = None,
+    ) -> None:
+        self.max_workers = max_workers
+        self.stale_seconds = stale_seconds
+        # Several heartbeats per stale window, so one slow write is not fatal.
+        self.heartbeat_seconds = heartbeat_seconds or max(1.0, stale_seconds / 4)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="nexus-job")
+        self._handlers: Dict[JobType, JobHandler] = {}
+        self._validators: Dict[JobType, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._active: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        job_type: JobType,
+        handler: JobHandler,
+        validate: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    ) -> None:
+        self._handlers[job_type] = handler
+        if validate is not None:
+            self._validators[job_type] = validate
+
+    # ─────────────────────────────────────────────────────────────────────
+    # PERSISTENCE (best effort)
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _table_exists(self) -> bool:
+        return schema_cache.table_exists(supabase_service.client, JOBS_TABLE)
+
+    def _row(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        row = {k: v for k, v in job.items() if k != "deduplicated"}
+        for field in ("created_at", "started_at", "finished_at"):
+            if isinstance(row.get(field), datetime):
+                row[field] = row[field].isoformat()
+        row["job_type"] = JobType(row["job_type"]).value
+        row["status"] = JobStatus(row["status"]).value
+        row["updated_at"] = _now().isoformat()
+        return row
+
+    def _persist(self, job: Dict[str, Any]) -> None:
+        if not self._table_exists():
+            return
+        try:
+            row = self._row(job)
+            if not row.get("cancel_requested"):
+                # Never clear a flag set through another worker.
+                row.pop("cancel_requested", None)
+            supabase_service.client.table(JOBS_TABLE).update(row).eq("id", row["id"]).execute()
+        except Exception as e:
+            logger.warning("Job persist failed for %s: %s", job.get("id"), e)
+
+    def _insert_row(self, job: Dict[str, Any], retry_stale: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Insert the job row. Returns the already active job of another worker
+        when the (org, job type) partial unique index rejects the insert.
+        """
+        if not self._table_exists():
+            return None
+        try:
+            supabase_service.client.table(JOBS_TABLE).insert(self._row(job)).execute()
+            return None
+        except Exception:
+            existing = self._fetch_active_row(job["org_id"], job["job_type"])
+            if existing is None:
+                logger.warning("Job insert failed for %s; continuing in memory only", job["id"])
+                return None
+            if retry_stale and self._is_stale(existing):
+                self._fail_stale(existing)
+                return self._insert_row(job, retry_stale=False)
+            return existing
+
+    def _fetch_active_row(self, org_id: str, job_type: JobType) -> Optional[Dict[str, Any]]:
+        try:
+            rows = (
+                supabase_service.client.table(JOBS_TABLE)
+                .select("*")
+                .eq("org_id", org_id)
+                .eq("job_type", JobType(job_type).value)
+                .in_("status", [s.value for s in ACTIVE_JOB_STATUSES])
+                .limit(1)
+                .execute()
+                .data
+                or []
+            )
+            return rows[0] if rows else None
+        except Exception:
+            return None
+
+    def _is_stale(self, row: Dict[str, Any]) -> bool:
+        try:
+            updated = datetime.fromisoformat(str(row.get("updated_at")).replace("Z", "+00:00"))
+        except ValueError:
+            return False
+        return (_now() - updated).total_seconds() > self.stale_seconds
+
+    def _fail_stale(self, row: Dict[str, Any]) -> None:
+        try:
+            supabase_service.client.table(JOBS_TABLE).update({
+                "status": JobStatus.FAILED.value,
+                "error": "Worker stopped responding",
+                "finished_at": _now().isoformat(),
+                "updated_at": _now().isoformat(),
+            }).eq("id", row["id"]).execute()
+        except Exception:
+            pass
+
+    def _remote_cancel_requested(self, job_id: str) -> bool:
+        """Cancellation requested through another worker's API process."""
+        if not self._table_exists():
+            return False
+        try:
+            rows = (
+                supabase_service.client.table(JOBS_TABLE)
+                .select("cancel_requested")
+                .eq("id", job_id)
+                .limit(1)
+                .execute()
+                .data
+                or []
+            )
+            return bool(rows and rows[0].get("cancel_requested"))
+        except Exception:
+            return False
+
+    def _heartbeat(self, job_id: str) -> None:
+        """Refresh `updated_at` of a running job so it is not judged stale."""
+        if not self._table_exists():
+            return
+        try:
+            supabase_service.client.table(JOBS_TABLE).update({"updated_at": _now().isoformat()}).eq("id", job_id).execute()
+        except Exception as e:
+            logger.warning("Job heartbeat failed for %s: %s", job_id, e)
+
+    def _fetch_row(self, job_id: str) -> Optional[Dict[str, Any]]:
+        if not self._table_exists():
+            return None
+        try:
+            rows = supabase_service.client.table(JOBS_TABLE).select("*").eq("id", job_id).limit(1).execute().data or []
+            return rows[0] if rows else None
+        except Exception:
+            return None
+
+    def _fetch_rows(self, org_id: str, limit: int, job_type: Optional[JobType]) -> List[Dict[str, Any]]:
+        if not self._table_exists():
+            return []
+        try:
+            query = supabase_service.client.table(JOBS_TABLE).select("*").eq("org_id", org_id)
+            if job_type is not None:
+                query = query.eq("job_type", JobType(job_type).value)
+            return query.order("created_at", desc=True).limit(limit).execute().data or []
+        except Exception:
+            return []
+
+    def _flag_remote_cancel(self, job_id: str) -> None:
+        if not self._table_exists():
+            return
+        try:
+            supabase_service.client.table(JOBS_TABLE).update({"cancel_requested": True}).eq("id", job_id).execute()
+        except Exception:
+            pass
+
+    # ─────────────────────────────────────────────────────────────────────
+    # STATE
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _update(self, job_id: str, persist: bool = True, **fields: Any) -> Dict[str, Any]:
+        with self._lock:
+            job = self._jobs[job_id]
+            job.update(fields)
+            if job["status"] not in ACTIVE_JOB_STATUSES:
+                key = (job["org_id"], JobType(job["job_type"]).value)
+                if self._active.get(key) == job_id:
+                    self._active.pop(key, None)
+            snapshot = dict(job)
+        if persist:
+            self._persist(snapshot)
+        return snapshot
+
+    def _cancel_requested(self, job_id: str) -> bool:
+        with self._lock:
+            return bool(self._jobs.get(job_id, {}).get("cancel_requested"))
+
+    def _prune_history(self) -> None:
+        finished = [j for j in self._jobs.values() if j["status"] not in ACTIVE_JOB_STATUSES]
+        if len(finished) <= JOB_HISTORY_LIMIT:
+            return
+        finished.sort(key=lambda j: j["created_at"])
+        for job in finished[: len(finished) - JOB_HISTORY_LIMIT]:
+            self._jobs.pop(job["id"], None)
+
+    def _response(self, job: Dict[str, Any], deduplicated: bool = False) -> JobResponse:
+        data = {**job, "deduplicated": deduplicated}
+        data["org_id"] = str(data["org_id"])
+        data["id"] = str(data["id"])
+        data["params"] = data.get("params") or {}
+        data["progress"] = float(data.get("progress") or 0)
+        return JobResponse(**{k: v for k, v in data.items() if k in JobResponse.model_fields})
+
+    # ─────────────────────────────────────────────────────────────────────
+    # PUBLIC API
+    # ─────────────────────────────────────────────────────────────────────
+
+    async def enqueue(
+        self,
+        org_id: str,
+        job_type: JobType,
+        params: Optional[Dict[str, Any]] = None,
+        requested_by: Optional[str] = None,
+    ) -> JobResponse:
+        """
+        Queue a job, or return the org's active job of the same type.
+        Raises ValueError for unknown job types or invalid params.
+        """
+        job_type = JobType(job_type)
+        if job_type not in self._handlers:
+            raise ValueError(f"No handler registered for job type '{job_type.value}'")
+        params = dict(params or {})
+        validate = self._validators.get(job_type)
+        if validate is not None:
+            params = validate(params)
+
+        key = (str(org_id), job_type.value)
+        with self._lock:
+            active_id = self._active.get(key)
+            if active_id is not None:
+                return self._response(self._jobs[active_id], deduplicated=True)
+            job = {
+                "id": str(uuid.uuid4()),
+                "org_id": str(org_id),
+                "job_type": job_type,
+                "status": JobStatus.QUEUED,
+                "params": params,
+                "progress": 0.0,
+                "progress_message": None,
+                "result": None,
+                "error": None,
+                "cancel_requested": False,
+                "requested_by": requested_by,
+                "created_at": _now(),
+                "started_at": None,
+                "finished_at": None,
+            }
+            self._jobs[job["id"]] = job
+            self._active[key] = job["id"]
+            self._prune_history()
+
+        existing = await async_db.run(self._insert_row, job, label=JOBS_TABLE)
+        if existing is not None:
+            # Another worker owns the active job for this org and type.
+            with self._lock:
+                self._jobs.pop(job["id"], None)
+                self._active.pop(key, None)
+            return self._response(existing, deduplicated=True)
+
+        response = self._response(job)
+        self._executor.submit(self._run, job["id"])
+        return response
+
+    async def get_job(self, org_id: str, job_id: str) -> Optional[JobResponse]:
+        with self._lock:
+            job = dict(self._jobs[job_id]) if job_id in self._jobs else None
+        if job is None:
+            job = await async_db.run(self._fetch_row, job_id, label=JOBS_TABLE)
+        if job is None or str(job["org_id"]) != str(org_id):
+            return None
+        return self._response(job)
+
+    async def list_jobs(
+        self,
+        org_id: str,
+        limit: int = 20,
+        job_type: Optional[JobType] = None,
+    ) -> JobListResponse:
+        jobs: Dict[str, Dict[str, Any]] = {}
+        for row in await async_db.run(self._fetch_rows, org_id, limit, job_type, label=JOBS_TABLE):
+            jobs[str(row["id"])] = row
+        with self._lock:
+            for job in self._jobs.values():
+                if job["org_id"] == str(org_id) and (job_type is None or job["job_type"] == job_type):
+                    jobs[job["id"]] = dict(job)
+
+        responses = sorted((self._response(j) for j in jobs.values()), key=lambda r: r.created_at, reverse=True)
+        return JobListResponse(jobs=responses[:limit], total=len(responses))
+
+    async def cancel(self, org_id: str, job_id: str) -> Optional[JobResponse]:
+        """
+        Request cancellation. Queued jobs are cancelled immediately; running
+        jobs stop at their next progress report.
+        """
+        job = await self.get_job(org_id, job_id)
+        if job is None:
+            return None
+        if job.status not in ACTIVE_JOB_STATUSES:
+            return job
+
+        with self._lock:
+            local = job_id in self._jobs
+        if not local:
+            # Owned by another worker: flag it, the owner picks it up on report().
+            await async_db.run(self._flag_remote_cancel, job_id, label=JOBS_TABLE)
+            return job.model_copy(update={"cancel_requested": True})
+
+        fields: Dict[str, Any] = {"cancel_requested": True}
+        if job.status == JobStatus.QUEUED:
+            fields.update({"status": JobStatus.CANCELLED, "finished_at": _now()})
+        snapshot = self._update(job_id, persist=False, **fields)
+        await async_db.run(self._persist, snapshot, label=JOBS_TABLE)
+        return self._response(snapshot)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # WORKER
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _run(self, job_id: str) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job["status"] != JobStatus.QUEUED:
+                return
+            job_type, org_id, params = job["job_type"], job["org_id"], dict(job["params"])
+        self._update(job_id, status=JobStatus.RUNNING, started_at=_now())
+
+        ctx = JobContext(self, job_id)
+        done = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat_until,
+            args=(job_id, done),
+            name=f"nexus-job-heartbeat-{job_id[:8]}",
+            daemon=True,
+        )
+        heartbeat.start()
+        try:
+            result = asyncio.run(self._handlers[job_type](ctx, org_id, params))
+            self._update(
+                job_id,
+                status=JobStatus.SUCCEEDED,
+                progress=1.0,
+                result=result or {},
+                finished_at=_now(),
+            )
+        except JobCancelled:
+            self._update(job_id, status=JobStatus.CANCELLED, finished_at=_now())
+        except Exception as e:
+            logger.exception("Job %s (%s) failed: %s", job_id, JobType(job_type).value, e)
+            self._update(job_id, status=JobStatus.FAILED, error=str(e), finished_at=_now())
+        finally:
+            done.set()
+            heartbeat.join()
+
+    def _heartbeat_until(self, job_id: str, done: threading.Event) -> None:
+        # Handlers may go long stretches without report() (or block their
+        # loop), so the heartbeat runs on its own thread.
+        while not done.wait(self.heartbeat_seconds):
+            self._heartbeat(job_id)
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# HANDLERS
+# Services are imported lazily so they can enqueue jobs themselves.
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def _validate_match_recompute(params: Dict[str, Any]) -> Dict[str, Any]:
+    from backend.models.prospection import RecomputeRequest
+
+    return RecomputeRequest(**params).model_dump(mode="json")
+
+
+async def _run_match_recompute(ctx: JobContext, org_id: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    from backend.services.prospection_service import prospection_service
+
+    result = await prospection_service.recompute_matches(
+        org_id=org_id,
+        property_ids=params.get("property_ids"),
+        buyer_ids=params.get("buyer_ids"),
+        chunk_size=params["chunk_size"],
+        incremental=params["incremental"],
+        min_match_score=params.get("min_match_score"),
+        progress=ctx.report,
+    )
+    return result.model_dump(mode="json")
+
+
+async def _run_dq_recompute(ctx: JobContext, org_id: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    from backend.services.dq_service import dq_service
+
+    await dq_service.recompute_all(org_id, progress=ctx.report)
+    return {"status": "completed"}
+
+
+def _validate_feed_publish(params: Dict[str, Any]) -> Dict[str, Any]:
+    from backend.services.feed_orchestrator_service import feed_orchestrator_service
+
+    parsed = FeedPublishJobParams(**params)
+    parsed.channel = parsed.channel.lower().strip()
+    if parsed.channel not in feed_orchestrator_service.CHANNELS:
+        raise ValueError(f"Channel '{parsed.channel}' not found")
+    return parsed.model_dump()
+
+
+async def _run_feed_publish(ctx: JobContext, org_id: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    from backend.services.feed_orchestrator_service import feed_orchestrator_service
+
+    result = await feed_orchestrator_service.publish_channel(
+        org_id=org_id,
+        channel=params["channel"],
+        dry_run=params["dry_run"],
+        max_items=params["max_items"],
+    )
+    return result.model_dump(mode="json")
+
+
+async def _run_prospection_weekly(ctx: JobContext, org_id: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    from backend.services.llm_service import llm_service
+    from backend.skills.prospection_weekly import run_prospection_weekly
+
+    return await run_prospection_weekly(params, llm_service, supabase_service)
+
+
+async def _run_recap_weekly(ctx: JobContext, org_id: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    from backend.services.llm_service import llm_service
+    from backend.skills.recap_weekly import run_recap_weekly
+
+    return await run_recap_weekly(params, llm_service, supabase_service)
+
+
+# Module-level singleton
+job_queue = JobQueueService(max_workers=settings.JOB_WORKERS, stale_seconds=settings.JOB_STALE_SECONDS)
+job_queue.register(JobType.MATCH_RECOMPUTE, _run_match_recompute, validate=_validate_match_recompute)
+job_queue.register(JobType.DQ_RECOMPUTE, _run_dq_recompute)
+job_queue.register(JobType.FEED_PUBLISH, _run_feed_publish, validate=_validate_feed_publish)
+job_queue.register(JobType.PROSPECTION_WEEKLY, _run_prospection_weekly)
+job_queue.register(JobType.RECAP_WEEKLY, _run_recap_weekly)
@@ -12,6 +12,7 @@ from backend.models.membership import (
     UserRole, 
     MembershipStatus
 )
+from backend.services.async_db import AsyncClient, async_db
 from backend.services.supabase_service import supabase_service
 
 class MembershipService:
@@ -26,11 +27,14 @@ class MembershipService:
         alphabet = string.ascii_letters + string.digits
         return ''.join(secrets.choice(alphabet) for _ in range(length))
 
-    def _get_active_owner_ids(self, org_id: UUID) -> List[str]:
+    def _db(self) -> AsyncClient:
+        return async_db.bind(supabase_service.client)
+
+    async def _get_active_owner_ids(self, org_id: UUID) -> List[str]:
         """
         Returns active owner membership ids using case-insensitive checks.
         """
-        rows = supabase_service.client.table("organization_members")\
+        rows = await self._db().table("organization_members")\
             .select("id,role,status")\
             .eq("org_id", str(org_id))\
             .execute()
@@ -66,7 +70,7 @@ class MembershipService:
         invited_email = str(payload.email).strip().lower()
 
         # Resolve invited email to an existing user profile if available.
-        profile = supabase_service.client.table("user_profiles")\
+        profile = await self._db().table("user_profiles")\
             .select("id,email")\
             .ilike("email", invited_email)\
             .limit(1)\
@@ -75,7 +79,7 @@ class MembershipService:
         invited_user_id = str(profile.data[0]["id"]) if profile.data else None
 
         # Check duplicates by invited_email first (covers pre-signup invites).
-        existing_by_email = supabase_service.client.table("organization_members")\
+        existing_by_email = await self._db().table("organization_members")\
             .select("*")\
             .eq("org_id", str(org_id))\
             .eq("invited_email", invited_email)\
@@ -91,7 +95,7 @@ class MembershipService:
         # If the user already exists, also check by user_id.
         existing_by_user = None
         if invited_user_id:
-            existing_by_user = supabase_service.client.table("organization_members")\
+            existing_by_user = await self._db().table("organization_members")\
                 .select("*")\
                 .eq("org_id", str(org_id))\
                 .eq("user_id", invited_user_id)\
@@ -127,7 +131,7 @@ class MembershipService:
 
         if reusable:
             # Reactivate a previously removed/suspended member as a new pending invitation.
-            result = supabase_service.client.table("organization_members")\
+            result = await self._db().table("organization_members")\
                 .update({
                     "user_id": invited_user_id,
                     "invited_email": invited_email,
@@ -142,7 +146,7 @@ class MembershipService:
                 .eq("org_id", str(org_id))\
                 .execute()
         else:
-            result = supabase_service.client.table("organization_members").insert(data).execute()
+            result = await self._db().table("organization_members").insert(data).execute()
         if not result.data:
             raise HTTPException(status_code=500, detail="Failed to create invitation")
             
@@ -154,14 +158,14 @@ class MembershipService:
         """
         Lists members of an organization with filtering and pagination.
         """
-        query = supabase_service.client.table("organization_members").select("*", count="exact").eq("org_id", str(org_id))
+        query = self._db().table("organization_members").select("*", count="exact").eq("org_id", str(org_id))
         
         if role:
             query = query.eq("role", role)
         if status:
             query = query.eq("status", status)
             
-        result = query.range(offset, offset + limit - 1).execute()
+        result = await query.range(offset, offset + limit - 1).execute()
 
         members = result.data or []
         user_ids: List[str] = []
@@ -179,7 +183,7 @@ class MembershipService:
 
         profiles_by_id = {}
         if user_ids:
-            profiles = supabase_service.client.table("user_profiles")\
+            profiles = await self._db().table("user_profiles")\
                 .select("id,email,full_name,avatar_url")\
                 .in_("id", list(dict.fromkeys(user_ids)))\
                 .execute()
@@ -215,7 +219,7 @@ class MembershipService:
         # Validate last owner check
         if target_role and target_role != UserRole.OWNER.value:
             # Check if this member IS an owner
-            current = supabase_service.client.table("organization_members")\
+            current = await self._db().table("organization_members")\
                 .select("*")\
                 .eq("id", str(member_id))\
                 .eq("org_id", str(org_id))\
@@ -223,11 +227,11 @@ class MembershipService:
                 .execute()
             
             if current.data and str(current.data[0].get("role") or "").strip().lower() == UserRole.OWNER.value:
-                owner_ids = self._get_active_owner_ids(org_id)
+                owner_ids = await self._get_active_owner_ids(org_id)
                 if len(owner_ids) <= 1:
                     raise HTTPException(status_code=400, detail="Cannot change role of the last owner")
         elif target_role == UserRole.OWNER.value:
-            current = supabase_service.client.table("organization_members")\
+            current = await self._db().table("organization_members")\
                 .select("*")\
                 .eq("id", str(member_id))\
                 .eq("org_id", str(org_id))\
@@ -237,7 +241,7 @@ class MembershipService:
                 raise HTTPException(status_code=404, detail="Member not found")
             current_role = str(current.data[0].get("role") or "").lower()
             if current_role != UserRole.OWNER.value:
-                existing_owner_ids = set(self._get_active_owner_ids(org_id))
+                existing_owner_ids = set(await self._get_active_owner_ids(org_id))
                 if existing_owner_ids and str(member_id) not in existing_owner_ids:
                     raise HTTPException(status_code=400, detail="Organization already has an owner")
 
@@ -248,7 +252,7 @@ class MembershipService:
             update_data["status"] = update_data["status"].value
         update_data["updated_at"] = datetime.utcnow().isoformat()
         
-        result = supabase_service.client.table("organization_members")\
+        result = await self._db().table("organization_members")\
             .update(update_data)\
             .eq("id", str(member_id))\
             .eq("org_id", str(org_id))\
@@ -259,7 +263,7 @@ class MembershipService:
 
         updated_member = result.data[0]
         if payload.role and updated_member.get("user_id"):
-            supabase_service.client.table("user_profiles")\
+            await self._db().table("user_profiles")\
                 .update({"role": payload.role})\
                 .eq("id", str(updated_member["user_id"]))\
                 .execute()
@@ -270,7 +274,7 @@ class MembershipService:
         """
         Removes a member from an organization.
         """
-        existing = supabase_service.client.table("organization_members")\
+        existing = await self._db().table("organization_members")\
             .select("id,role,status")\
             .eq("id", str(member_id))\
             .eq("org_id", str(org_id))\
@@ -282,7 +286,7 @@ class MembershipService:
         if str(member.get("role") or "").strip().lower() == UserRole.OWNER.value:
             raise HTTPException(status_code=400, detail="Cannot remove owner member")
 
-        supabase_service.client.table("organization_members")\
+        await self._db().table("organization_members")\
             .delete()\
             .eq("id", str(member_id))\
             .eq("org_id", str(org_id))\
@@ -292,7 +296,7 @@ class MembershipService:
         """
         Validates an invitation code.
         """
-        result = supabase_service.client.table("organization_members")\
+        result = await self._db().table("organization_members")\
             .select("*, organizations(name)")\
             .eq("invitation_code", code)\
             .eq("status", MembershipStatus.PENDING)\
@@ -307,18 +311,18 @@ class MembershipService:
         if datetime.now(created_at.tzinfo) > created_at + timedelta(days=7):
             raise HTTPException(status_code=404, detail="Invitation code expired")
             
+        email = inv.get("invited_email")
+        if not email and inv.get("user_id"):
+            profile = await self._db().table("user_profiles")\
+                .select("email")\
+                .eq("id", inv["user_id"])\
+                .limit(1)\
+                .execute()
+            email = profile.data[0]["email"]
+
         return {
             "valid": True,
-            "email": inv.get("invited_email") or (
-                supabase_service.client.table("user_profiles")
-                .select("email")
-                .eq("id", inv["user_id"])
-                .limit(1)
-                .execute()
-                .data[0]["email"]
-                if inv.get("user_id")
-                else ""
-            ),
+            "email": email or "",
             "role": inv["role"],
             "org_name": inv.get("organizations", {}).get("name", "Anclora"),
             "expires_at": created_at + timedelta(days=7)
@@ -331,7 +335,7 @@ class MembershipService:
         # First validate
         _ = await self.validate_invitation(code)
 
-        invite = supabase_service.client.table("organization_members")\
+        invite = await self._db().table("organization_members")\
             .select("*")\
             .eq("invitation_code", code)\
             .eq("status", MembershipStatus.PENDING)\
@@ -343,7 +347,7 @@ class MembershipService:
         inv = invite.data[0]
         org_id = inv["org_id"]
 
-        existing_active = supabase_service.client.table("organization_members")\
+        existing_active = await self._db().table("organization_members")\
             .select("id")\
             .eq("org_id", org_id)\
             .eq("user_id", str(user_id))\
@@ -354,7 +358,7 @@ class MembershipService:
             raise HTTPException(status_code=409, detail="User is already an active member of this organization")
 
         # Update membership
-        result = supabase_service.client.table("organization_members")\
+        result = await self._db().table("organization_members")\
             .update({
                 "user_id": str(user_id),
                 "status": MembershipStatus.ACTIVE,
@@ -368,7 +372,7 @@ class MembershipService:
             raise HTTPException(status_code=500, detail="Failed to accept invitation")
 
         accepted = result.data[0]
-        supabase_service.client.table("user_profiles")\
+        await self._db().table("user_profiles")\
             .update({
                 "org_id": accepted["org_id"],
                 "role": accepted["role"]
@@ -0,0 +1,92 @@
+"""
+Opportunity Ranking — composite commercial score and bounded top-K selection.
+
+    opportunity = 0.65 * match_score + 0.20 * commission_norm + 0.15 * motivation
+
+Every component is on a 0-100 scale, so a match can never score more than
+0.65 * match_score + 35. When matches are streamed by match_score descending,
+that bound lets TopKSelector stop as soon as no remaining match can displace
+the current top-K.
+"""
+
+import heapq
+from typing import Any, List, Optional, Tuple
+
+MATCH_WEIGHT: float = 0.65
+COMMISSION_WEIGHT: float = 0.20
+MOTIVATION_WEIGHT: float = 0.15
+COMPONENT_MAX: float = 100.0
+
+HOT_THRESHOLD: float = 75.0
+WARM_THRESHOLD: float = 50.0
+
+
+def normalize_motivation(raw: Any) -> float:
+    """Buyer motivation on the 0-100 scale (legacy rows store 0-10)."""
+    motivation = float(raw or 0)
+    if 0 < motivation <= 10:
+        motivation *= 10.0
+    return motivation
+
+
+def normalize_commission(commission: float, max_commission: float) -> float:
+    return (commission / max_commission * 100) if max_commission > 0 else 0.0
+
+
+def opportunity_score(match_score: float, commission_norm: float, motivation: float) -> float:
+    return (
+        (match_score * MATCH_WEIGHT)
+        + (commission_norm * COMMISSION_WEIGHT)
+        + (motivation * MOTIVATION_WEIGHT)
+    )
+
+
+def opportunity_upper_bound(match_score: float) -> float:
+    """Highest opportunity score reachable by a match with this match_score."""
+    return opportunity_score(match_score, COMPONENT_MAX, COMPONENT_MAX)
+
+
+def priority_band(score: float) -> str:
+    return "hot" if score >= HOT_THRESHOLD else "warm" if score >= WARM_THRESHOLD else "cold"
+
+
+class TopKSelector:
+    """
+    Keeps the k highest-scored items in a min-heap. Ties go to the item
+    pushed first, matching a stable descending sort of the input order.
+    """
+
+    def __init__(self, k: int) -> None:
+        self.k = k
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, score: float, item: Any) -> bool:
+        """Offer an item; returns whether it is (for now) in the top-k."""
+        if self.k <= 0:
+            return False
+        entry = (score, -self._seq, item)
+        self._seq += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            return True
+        if entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def threshold(self) -> Optional[float]:
+        """Score an item must beat to enter, once the selector is full."""
+        return self._heap[0][0] if len(self._heap) >= self.k and self._heap else None
+
+    def can_admit(self, bound: float) -> bool:
+        """Whether an item scoring at most `bound` could still enter."""
+        threshold = self.threshold()
+        return threshold is None or bound > threshold
+
+    def items(self) -> List[Any]:
+        """Selected items, best first."""
+        return [entry[2] for entry in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
@@ -5,10 +5,18 @@ Feature: ANCLORA-PBM-001
 Manages prospected properties, buyer profiles, matches, and activities.
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import asyncio
+import base64
+import functools
+import itertools
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
 from uuid import UUID
 
+from backend.config import settings
+from backend.models.dq import EntityType as DQEntityType
 from backend.models.prospection import (
     ActivityCreate,
     BuyerCreate,
@@ -18,9 +26,100 @@ from backend.models.prospection import (
     PropertyUpdate,
     RecomputeResponse,
 )
-from backend.services.scoring_service import scoring_service
+from backend.services.async_db import AsyncClient, async_db
+from backend.services.batch_loader import BatchLoader
+from backend.services.dq_service import dq_service
+from backend.services.scoring_service import BuyerCandidateIndex, CompiledMatchScorer, scoring_service
+from backend.services.opportunity_ranking import (
+    TopKSelector,
+    normalize_commission,
+    normalize_motivation,
+    opportunity_score,
+    opportunity_upper_bound,
+    priority_band,
+)
 from backend.services.origin_editability_policy import sanitize_payload
+from backend.services.schema_cache import is_missing_schema_error, schema_cache
 from backend.services.supabase_service import supabase_service
+from backend.services.workspace_cache import WorkspaceSnapshotCache, workspace_etag
+
+
+# Rows per bulk upsert request when persisting recomputed matches.
+MATCH_UPSERT_CHUNK_SIZE: int = 500
+
+# Workspace blocks (properties, matches, buyers, agent scope) run at once per request.
+WORKSPACE_BLOCK_CONCURRENCY: int = 3
+
+# Minimum matches read per page while streaming the opportunity ranking.
+RANKING_PAGE_SIZE: int = 100
+
+# Matches read per page when refreshing persisted opportunity scores.
+OPPORTUNITY_REFRESH_PAGE_SIZE: int = 1000
+
+# Rows per keyset page when loading the recompute inputs. Must not exceed the
+# PostgREST max_rows cap (supabase/config.toml), or a short page ends the scan.
+RECOMPUTE_PAGE_SIZE: int = 1000
+
+# Columns written by refresh_opportunity_scores (migration 038).
+OPPORTUNITY_FIELDS = ("opportunity_score", "priority_band", "opportunity_explanation")
+
+# Max commission the stored opportunity scores were normalized against (migration 039).
+OPPORTUNITY_BASIS_COLUMN = "opportunity_basis"
+
+# Bulk write of refreshed opportunity columns, keyed by match id (migration 042).
+UPDATE_OPPORTUNITIES_FN = "update_match_opportunities"
+
+# Matches per update_match_opportunities call.
+OPPORTUNITY_UPDATE_CHUNK_SIZE: int = 500
+
+# Persisted "changed since its last recompute" stamp on property and buyer
+# rows (migration 044).
+MATCH_DIRTY_COLUMN = "match_dirty_at"
+
+# Entity IDs per request when clearing dirty stamps after a recompute.
+DIRTY_CLEAR_CHUNK_SIZE: int = 500
+
+
+def encode_property_cursor(row: Dict[str, Any], score_column: str = "high_ticket_score") -> str:
+    """Opaque keyset cursor for the (score_column, id) position of a row."""
+    score = row.get(score_column)
+    key = [float(score) if score is not None else None, str(row["id"])]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
+
+
+def decode_property_cursor(cursor: str) -> tuple[Optional[float], str]:
+    """Inverse of encode_property_cursor; raises ValueError on malformed input."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        score, last_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return (float(score) if score is not None else None), str(UUID(str(last_id)))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def _property_sort_key(row: Dict[str, Any], score_column: str = "high_ticket_score") -> tuple[int, float, str]:
+    # Mirrors ORDER BY <score_column> DESC NULLS LAST, id DESC under reverse=True.
+    score = row.get(score_column)
+    return (score is not None, float(score or 0), str(row.get("id") or ""))
+
+
+def _keyset_page(
+    rows: List[Dict[str, Any]], limit: int, score_column: str = "high_ticket_score"
+) -> tuple[List[Dict[str, Any]], Optional[str]]:
+    """Split a limit+1 fetch into the page and the cursor of its last row."""
+    page = rows[:limit]
+    next_cursor = encode_property_cursor(page[-1], score_column) if len(rows) > limit and page else None
+    return page, next_cursor
+
+
+class EnrichmentLoaders:
+    """Request-scoped batching loaders for the properties and buyers of one org."""
+
+    def __init__(self, service: "ProspectionService", org_id: str) -> None:
+        self.properties = BatchLoader(
+            functools.partial(service._fetch_properties_by_id, org_id), name="properties"
+        )
+        self.buyers = BatchLoader(functools.partial(service._fetch_buyers_by_id, org_id), name="buyer_profiles")
 
 
 class ProspectionService:
@@ -29,68 +128,124 @@ class ProspectionService:
     All queries are filtered by org_id for isolation.
     """
 
-    def _property_table(self, org_id: Optional[str] = None) -> str:
+    def __init__(self) -> None:
+        # Entity IDs changed since their last recompute, per org, for tables
+        # without the persisted match_dirty_at stamp (before migration 044).
+        # Each mark carries a sequence number so a recompute only clears the
+        # marks it snapshotted.
+        self._dirty_properties: Dict[str, Dict[str, int]] = {}
+        self._dirty_buyers: Dict[str, Dict[str, int]] = {}
+        self._dirty_sequence = itertools.count(1)
+        # Workspace payloads per (org, role, user, filters, page); dropped per
+        # org by every mutation below.
+        self.workspace_cache = WorkspaceSnapshotCache(
+            max_entries=settings.WORKSPACE_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.WORKSPACE_CACHE_TTL_SECONDS,
+        )
+
+    async def _stamp_dirty(self, table: str, record: Dict[str, Any]) -> bool:
         """
-        Resolve property table for prospection flows.
-        Prefer unified properties table, but if org_id is provided choose the
-        table that actually has rows for that org.
+        Add the persisted dirty stamp to an insert/update payload. Returns
+        False when the table has no match_dirty_at column; the entity is then
+        marked in process memory instead.
         """
-        existing_tables: List[str] = []
+        if not await self._table_has_column(table, MATCH_DIRTY_COLUMN):
+            return False
+        record[MATCH_DIRTY_COLUMN] = datetime.now(timezone.utc).isoformat()
+        return True
 
-        # Prefer current unified model first.
-        for table in ("properties", "prospected_properties"):
-            try:
-                supabase_service.client.table(table).select("id").limit(1).execute()
-                existing_tables.append(table)
-            except Exception:
+    def _mark_property_dirty(self, org_id: str, property_id: Any, persisted: bool = False) -> None:
+        if property_id and not persisted:
+            self._dirty_properties.setdefault(str(org_id), {})[str(property_id)] = next(self._dirty_sequence)
+        self._invalidate_workspace(org_id)
+
+    def _mark_buyer_dirty(self, org_id: str, buyer_id: Any, persisted: bool = False) -> None:
+        if buyer_id and not persisted:
+            self._dirty_buyers.setdefault(str(org_id), {})[str(buyer_id)] = next(self._dirty_sequence)
+        self._invalidate_workspace(org_id)
+
+    def _invalidate_workspace(self, org_id: str) -> None:
+        self.workspace_cache.invalidate(str(org_id))
+
+    @staticmethod
+    def _clear_dirty(
+        registry: Dict[str, Dict[str, int]], org_id: str, snapshot: Dict[str, int], ids: set[str]
+    ) -> None:
+        """Drop in-memory marks in `ids` that are unchanged since `snapshot`."""
+        pending = registry.get(str(org_id))
+        if pending is None:
+            return
+        for entity_id in ids:
+            if entity_id in snapshot and pending.get(entity_id) == snapshot[entity_id]:
+                del pending[entity_id]
+        if not pending:
+            registry.pop(str(org_id), None)
+
+    @staticmethod
+    def _dirty_stamps(rows: List[Dict[str, Any]]) -> Dict[str, datetime]:
+        """match_dirty_at of every stamped row, by entity ID."""
+        stamps: Dict[str, datetime] = {}
+        for row in rows:
+            raw = row.get(MATCH_DIRTY_COLUMN)
+            if not raw:
                 continue
+            stamp = datetime.fromisoformat(str(raw).replace("Z", "+00:00"))
+            stamps[str(row["id"])] = stamp if stamp.tzinfo else stamp.replace(tzinfo=timezone.utc)
+        return stamps
+
+    async def _clear_persisted_dirty(
+        self, table: str, org_id: str, stamps: Dict[str, datetime], ids: set[str]
+    ) -> None:
+        """
+        Reset match_dirty_at on the rows of `ids` read as dirty by a recompute.
+        A row is only reset while its stamp is no newer than the one read, so
+        an entity changed while the run was scoring stays dirty for the next.
+        """
+        pending = sorted((stamps[i], i) for i in ids if i in stamps)
+        for start in range(0, len(pending), DIRTY_CLEAR_CHUNK_SIZE):
+            chunk = pending[start:start + DIRTY_CLEAR_CHUNK_SIZE]
+            await (
+                self._db().table(table)
+                .update({MATCH_DIRTY_COLUMN: None})
+                .eq("org_id", org_id)
+                .in_("id", [entity_id for _, entity_id in chunk])
+                .lte(MATCH_DIRTY_COLUMN, chunk[-1][0].isoformat())
+                .execute()
+            )
 
+    async def _property_table(self, org_id: Optional[str] = None) -> str:
+        """
+        Resolve property table for prospection flows.
+        Prefer unified properties table, but if org_id is provided choose the
+        table that actually has rows for that org. Probes are served from the
+        shared schema cache.
+        """
+        client = supabase_service.client
+        existing_tables = await schema_cache.existing_tables_async(client)
         if not existing_tables:
             return "properties"
 
         if org_id is not None:
-            for table in existing_tables:
-                try:
-                    probe = (
-                        supabase_service.client.table(table)
-                        .select("id")
-                        .eq("org_id", org_id)
-                        .limit(1)
-                        .execute()
-                    )
-                    if probe.data:
-                        return table
-                except Exception:
-                    continue
+            resolved = await schema_cache.property_table_for_org_async(client, org_id)
+            if resolved:
+                return resolved
 
         return existing_tables[0]
 
-    def _property_tables(self) -> List[str]:
+    async def _property_tables(self) -> List[str]:
         """Return available property tables in preferred order."""
-        tables: List[str] = []
-        for table in ("properties", "prospected_properties"):
-            try:
-                supabase_service.client.table(table).select("id").limit(1).execute()
-                tables.append(table)
-            except Exception:
-                continue
-        return tables or ["properties"]
+        return await schema_cache.existing_tables_async(supabase_service.client) or ["properties"]
 
-    def _table_has_column(self, table: str, column: str) -> bool:
+    async def _table_has_column(self, table: str, column: str) -> bool:
         """Best-effort check to avoid querying non-existent columns."""
-        try:
-            supabase_service.client.table(table).select(column).limit(1).execute()
-            return True
-        except Exception:
-            return False
+        return await schema_cache.table_has_column_async(supabase_service.client, table, column)
 
-    def _table_exists(self, table: str) -> bool:
+    def _db(self) -> AsyncClient:
+        return async_db.bind(supabase_service.client)
+
+    async def _table_exists(self, table: str) -> bool:
         """Best-effort table existence check."""
-        try:
-            supabase_service.client.table(table).select("id").limit(1).execute()
-            return True
-        except Exception:
-            return False
+        return await schema_cache.table_exists_async(supabase_service.client, table)
 
     def _normalize_property_record(self, row: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -151,10 +306,15 @@ class ProspectionService:
         record["high_ticket_score"] = score_result.score
         record["score_breakdown"] = score_result.breakdown
 
-        response = supabase_service.client.table(self._property_table(org_id)).insert(
+        property_table = await self._property_table(org_id)
+        persisted = await self._stamp_dirty(property_table, record)
+        response = await self._db().table(property_table).insert(
             record
         ).execute()
-        return response.data[0]
+        created = response.data[0]
+        schema_cache.invalidate(org_id=org_id)
+        self._mark_property_dirty(org_id, created.get("id"), persisted)
+        return created
 
     async def list_properties(
         self,
@@ -164,85 +324,46 @@ class ProspectionService:
         min_score: Optional[float] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """List prospected properties with filters."""
-        # First strategy: use the property IDs that are actually referenced by matches
+        """
+        List prospected properties with filters, ordered by
+        (high_ticket_score, id) descending. Properties with matches are
+        listed first when there are any, ranked and filtered by their best
+        match score instead (see _list_matched_properties).
+
+        Filters, ordering and the page bound run in the query. Pass the
+        returned `next_cursor` back as `cursor` for keyset pagination (it
+        takes precedence over `offset`); cursor pages skip the exact count
+        and report total=None.
+        """
+        keyset = decode_property_cursor(cursor) if cursor else None
+        count = None if keyset else "exact"
+        # First strategy: properties that are actually referenced by matches
         # for this org. This keeps prospection cards aligned with the match board.
         try:
-            matches_base = (
-                supabase_service.client.table("property_buyer_matches")
-                .select("property_id, match_score")
-                .eq("org_id", org_id)
-                .limit(5000)
-                .execute()
+            matched_page = await self._list_matched_properties(
+                org_id, zone, status, min_score, limit, offset, keyset, count
             )
-            match_rows = matches_base.data or []
-            matched_property_ids = list(
-                {m.get("property_id") for m in match_rows if m.get("property_id")}
-            )
-            best_match_score: Dict[str, float] = {}
-            for m in match_rows:
-                pid = m.get("property_id")
-                score = m.get("match_score")
-                if pid is None or score is None:
-                    continue
-                best_match_score[pid] = max(best_match_score.get(pid, 0.0), float(score))
-
-            if matched_property_ids:
-                merged: Dict[str, Dict[str, Any]] = {}
-                for property_table in self._property_tables():
-                    try:
-                        rows = (
-                            supabase_service.client.table(property_table)
-                            .select("*")
-                            .in_("id", matched_property_ids)
-                            .limit(5000)
-                            .execute()
-                        ).data or []
-                        for row in rows:
-                            merged[row["id"]] = row
-                    except Exception:
-                        continue
-
-                if merged:
-                    items = list(merged.values())
-                    for item in items:
-                        if item.get("high_ticket_score") is None:
-                            item["high_ticket_score"] = best_match_score.get(item.get("id"), 0)
-
-                    if zone:
-                        items = [i for i in items if (i.get("zone") or "") == zone]
-                    if status:
-                        items = [i for i in items if (i.get("status") or "") == status]
-                    if min_score is not None:
-                        items = [i for i in items if float(i.get("high_ticket_score") or 0) >= min_score]
-
-                    items.sort(key=lambda x: float(x.get("high_ticket_score") or 0), reverse=True)
-                    total = len(items)
-                    page_items = items[offset : offset + limit]
-                    return {
-                        "items": self._normalize_property_items(page_items),
-                        "total": total,
-                        "limit": limit,
-                        "offset": offset,
-                    }
+            if matched_page is not None:
+                return matched_page
         except Exception:
             pass
 
         # Robust strategy: try all available property tables and use
         # the first one that returns rows for this org+filters.
-        tables = self._property_tables()
+        tables = await self._property_tables()
         last_response = None
 
         for property_table in tables:
-            supports_score = self._table_has_column(property_table, "high_ticket_score")
-            supports_status = self._table_has_column(property_table, "status")
-            supports_zone = self._table_has_column(property_table, "zone")
-            supports_source_system = self._table_has_column(property_table, "source_system")
+            supports_score = await self._table_has_column(property_table, "high_ticket_score")
+            supports_status = await self._table_has_column(property_table, "status")
+            supports_zone = await self._table_has_column(property_table, "zone")
+            supports_source_system = await self._table_has_column(property_table, "source_system")
 
             query = (
-                supabase_service.client.table(property_table)
-                .select("*", count="exact")
+                self._db().table(property_table)
+                .select("*", count=count)
                 .eq("org_id", org_id)
             )
 
@@ -257,30 +378,30 @@ class ProspectionService:
             if min_score is not None and supports_score:
                 query = query.gte("high_ticket_score", min_score)
 
-            query = query.range(offset, offset + limit - 1)
-
             try:
                 if supports_score:
-                    response = query.order("high_ticket_score", desc=True).execute()
+                    response = await self._page_properties(query, offset, limit, keyset).execute()
                 else:
-                    response = query.order("created_at", desc=True).execute()
+                    response = await query.order("created_at", desc=True).range(offset, offset + limit).execute()
             except Exception:
-                response = query.execute()
+                response = await query.range(offset, offset + limit).execute()
 
             last_response = response
             if response.data:
+                page_items, next_cursor = _keyset_page(response.data, limit)
                 return {
-                    "items": self._normalize_property_items(response.data),
-                    "total": response.count or len(response.data),
+                    "items": self._normalize_property_items(page_items),
+                    "total": None if keyset else response.count or len(page_items),
                     "limit": limit,
                     "offset": offset,
+                    "next_cursor": next_cursor if supports_score else None,
                 }
 
         # Fallback: if properties are not found by org_id but matches exist,
         # recover property cards by property_id linked to org matches.
         try:
             matches_resp = (
-                supabase_service.client.table("property_buyer_matches")
+                await self._db().table("property_buyer_matches")
                 .select("property_id")
                 .eq("org_id", org_id)
                 .limit(5000)
@@ -288,12 +409,12 @@ class ProspectionService:
             )
             property_ids = list({m.get("property_id") for m in (matches_resp.data or []) if m.get("property_id")})
 
-            if property_ids:
+            if property_ids and not keyset:
                 recovered: List[Dict[str, Any]] = []
                 for property_table in tables:
                     try:
                         resp = (
-                            supabase_service.client.table(property_table)
+                            await self._db().table(property_table)
                             .select("*")
                             .in_("id", property_ids)
                             .range(offset, offset + limit - 1)
@@ -311,6 +432,7 @@ class ProspectionService:
                         "total": len(property_ids),
                         "limit": limit,
                         "offset": offset,
+                        "next_cursor": None,
                     }
         except Exception:
             # Keep standard empty response if fallback path fails.
@@ -320,17 +442,179 @@ class ProspectionService:
         if last_response is not None:
             return {
                 "items": self._normalize_property_items(last_response.data or []),
-                "total": last_response.count or len(last_response.data or []),
+                "total": None if keyset else last_response.count or len(last_response.data or []),
                 "limit": limit,
                 "offset": offset,
+                "next_cursor": None,
             }
-        return {"items": [], "total": 0, "limit": limit, "offset": offset}
+        return {"items": [], "total": 0, "limit": limit, "offset": offset, "next_cursor": None}
+
+    async def _list_matched_properties(
+        self,
+        org_id: str,
+        zone: Optional[str],
+        status: Optional[str],
+        min_score: Optional[float],
+        limit: int,
+        offset: int,
+        keyset: Optional[tuple[Optional[float], str]],
+        count: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Page of the org's matched properties, or None when there are none.
+
+        Matched properties are ordered by (best_match_score, id) descending
+        and `min_score` applies to best_match_score, the score the match
+        board shows for them; cursors encode that position. With migration
+        040 the column is kept current by trigger and each property table
+        answers with one filtered, bounded query. Older schemas fall back to
+        computing the best score from property_buyer_matches and ranking the
+        matched rows in memory.
+        """
+        tables = await self._property_tables()
+        precomputed = [t for t in tables if await self._table_has_column(t, "best_match_score")]
+        if not precomputed:
+            return await self._list_matched_properties_legacy(
+                org_id, tables, zone, status, min_score, limit, offset, keyset
+            )
+
+        # Each table returns at most its first offset+limit+1 rows in key
+        # order; the merged page is cut from those.
+        merged: Dict[str, Dict[str, Any]] = {}
+        total = 0
+        fetch_start = 0 if keyset else offset
+        for property_table in precomputed:
+            try:
+                query = (
+                    self._db().table(property_table)
+                    .select("*", count=count)
+                    .eq("org_id", org_id)
+                    .not_.is_("best_match_score", "null")
+                )
+                if zone:
+                    query = query.eq("zone", zone)
+                if status:
+                    query = query.eq("status", status)
+                if min_score is not None:
+                    query = query.gte("best_match_score", min_score)
+                response = await self._page_properties(
+                    query, 0, fetch_start + limit, keyset, score_column="best_match_score"
+                ).execute()
+                total += response.count or 0
+                for row in response.data or []:
+                    merged[row["id"]] = row
+            except Exception:
+                continue
+
+        if not merged:
+            return None
+        items = sorted(
+            merged.values(), key=functools.partial(_property_sort_key, score_column="best_match_score"), reverse=True
+        )
+        return self._matched_page(items[fetch_start:], limit, offset, None if keyset else total)
+
+    async def _list_matched_properties_legacy(
+        self,
+        org_id: str,
+        tables: List[str],
+        zone: Optional[str],
+        status: Optional[str],
+        min_score: Optional[float],
+        limit: int,
+        offset: int,
+        keyset: Optional[tuple[Optional[float], str]],
+    ) -> Optional[Dict[str, Any]]:
+        """Matched-properties page for schemas without best_match_score (pre-040)."""
+        match_rows = (
+            await self._db().table("property_buyer_matches")
+            .select("property_id, match_score")
+            .eq("org_id", org_id)
+            .limit(5000)
+            .execute()
+        ).data or []
+        best_match_score: Dict[str, float] = {}
+        for m in match_rows:
+            pid = m.get("property_id")
+            if pid is None:
+                continue
+            score = float(m["match_score"]) if m.get("match_score") is not None else 0.0
+            best_match_score[pid] = max(best_match_score.get(pid, 0.0), score)
+        if not best_match_score:
+            return None
+
+        merged: Dict[str, Dict[str, Any]] = {}
+        for property_table in tables:
+            try:
+                query = self._db().table(property_table).select("*").in_("id", list(best_match_score))
+                if zone:
+                    query = query.eq("zone", zone)
+                if status:
+                    query = query.eq("status", status)
+                for row in (await query.limit(len(best_match_score)).execute()).data or []:
+                    merged[row["id"]] = {**row, "best_match_score": best_match_score.get(row["id"], 0.0)}
+            except Exception:
+                continue
+
+        items = [
+            row for row in merged.values()
+            if min_score is None or row["best_match_score"] >= min_score
+        ]
+        if not items:
+            return None
+        sort_key = functools.partial(_property_sort_key, score_column="best_match_score")
+        items.sort(key=sort_key, reverse=True)
+        if keyset is not None:
+            position = (keyset[0] is not None, float(keyset[0] or 0), keyset[1])
+            items = [row for row in items if sort_key(row) < position]
+            return self._matched_page(items, limit, offset, None)
+        return self._matched_page(items[offset:], limit, offset, len(items))
+
+    def _matched_page(
+        self, rows: List[Dict[str, Any]], limit: int, offset: int, total: Optional[int]
+    ) -> Dict[str, Any]:
+        page_items, next_cursor = _keyset_page(rows[: limit + 1], limit, score_column="best_match_score")
+        for item in page_items:
+            if item.get("high_ticket_score") is None:
+                item["high_ticket_score"] = item.get("best_match_score") or 0
+        return {
+            "items": self._normalize_property_items(page_items),
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor,
+        }
+
+    def _page_properties(
+        self,
+        query: Any,
+        start: int,
+        limit: int,
+        keyset: Optional[tuple[Optional[float], str]],
+        score_column: str = "high_ticket_score",
+    ) -> Any:
+        """
+        Order by (score_column DESC NULLS LAST, id DESC) and bound the page
+        to limit+1 rows (the extra row tells whether a next page exists).
+        """
+        query = query.order(score_column, desc=True, nullsfirst=False).order("id", desc=True)
+        if keyset is not None:
+            score, last_id = keyset
+            if score is None:
+                query = query.or_(f"and({score_column}.is.null,id.lt.{last_id})")
+            else:
+                query = query.or_(
+                    f"{score_column}.lt.{score},"
+                    f"and({score_column}.eq.{score},id.lt.{last_id}),"
+                    f"{score_column}.is.null"
+                )
+            start = 0
+        return query.range(start, start + limit)
 
     async def get_property(self, org_id: str, property_id: str) -> Optional[Dict[str, Any]]:
         """Get a single property by ID with org isolation."""
-        property_table = self._property_table(org_id)
+        property_table = await self._property_table(org_id)
         response = (
-            supabase_service.client.table(property_table)
+            await self._db().table(property_table)
             .select("*")
             .eq("id", property_id)
             .eq("org_id", org_id)
@@ -342,7 +626,7 @@ class ProspectionService:
         self, org_id: str, property_id: str, data: PropertyUpdate
     ) -> Optional[Dict[str, Any]]:
         """Update a prospected property with origin-based editability enforcement."""
-        property_table = self._property_table(org_id)
+        property_table = await self._property_table(org_id)
         # 1. Fetch current record to check origin
         existing = await self.get_property(org_id, property_id)
         if not existing:
@@ -372,20 +656,26 @@ class ProspectionService:
                 update_data[field] = float(update_data[field])
 
         # 4. Perform update
+        persisted = await self._stamp_dirty(property_table, update_data)
         response = (
-            supabase_service.client.table(property_table)
+            await self._db().table(property_table)
             .update(update_data)
             .eq("id", property_id)
             .eq("org_id", org_id)
             .execute()
         )
-        return response.data[0] if response.data else None
+        if not response.data:
+            return None
+        self._mark_property_dirty(org_id, property_id, persisted)
+        if property_table == "properties":
+            await dq_service.evaluate_entity_safe(org_id, DQEntityType.PROPERTY, response.data[0])
+        return response.data[0]
 
     async def rescore_property(
         self, org_id: str, property_id: str
     ) -> Optional[Dict[str, Any]]:
         """Recalculate high_ticket_score for a property."""
-        property_table = self._property_table(org_id)
+        property_table = await self._property_table(org_id)
         prop = await self.get_property(org_id, property_id)
         if not prop:
             return None
@@ -399,7 +689,7 @@ class ProspectionService:
         )
 
         response = (
-            supabase_service.client.table(property_table)
+            await self._db().table(property_table)
             .update({
                 "high_ticket_score": score_result.score,
                 "score_breakdown": score_result.breakdown,
@@ -408,6 +698,7 @@ class ProspectionService:
             .eq("org_id", org_id)
             .execute()
         )
+        self._invalidate_workspace(org_id)
         return response.data[0] if response.data else None
 
     # ─────────────────────────────────────────────────────────────────────
@@ -428,10 +719,13 @@ class ProspectionService:
             if field in record and record[field] is not None:
                 record[field] = float(record[field])
 
-        response = supabase_service.client.table("buyer_profiles").insert(
+        persisted = await self._stamp_dirty("buyer_profiles", record)
+        response = await self._db().table("buyer_profiles").insert(
             record
         ).execute()
-        return response.data[0]
+        created = response.data[0]
+        self._mark_buyer_dirty(org_id, created.get("id"), persisted)
+        return created
 
     async def list_buyers(
         self,
@@ -444,7 +738,7 @@ class ProspectionService:
     ) -> Dict[str, Any]:
         """List buyer profiles with filters."""
         query = (
-            supabase_service.client.table("buyer_profiles")
+            self._db().table("buyer_profiles")
             .select("*", count="exact")
             .eq("org_id", org_id)
             .order("motivation_score", desc=True)
@@ -458,7 +752,7 @@ class ProspectionService:
             query = query.lte("budget_min", max_budget)
 
         query = query.range(offset, offset + limit - 1)
-        response = query.execute()
+        response = await query.execute()
 
         return {
             "items": response.data,
@@ -470,7 +764,7 @@ class ProspectionService:
     async def get_buyer(self, org_id: str, buyer_id: str) -> Optional[Dict[str, Any]]:
         """Get a single buyer by ID with org isolation."""
         response = (
-            supabase_service.client.table("buyer_profiles")
+            await self._db().table("buyer_profiles")
             .select("*")
             .eq("id", buyer_id)
             .eq("org_id", org_id)
@@ -488,14 +782,20 @@ class ProspectionService:
             if field in update_data and update_data[field] is not None:
                 update_data[field] = float(update_data[field])
 
+        persisted = await self._stamp_dirty("buyer_profiles", update_data)
         response = (
-            supabase_service.client.table("buyer_profiles")
+            await self._db().table("buyer_profiles")
             .update(update_data)
             .eq("id", buyer_id)
             .eq("org_id", org_id)
             .execute()
         )
-        return response.data[0] if response.data else None
+        if not response.data:
+            return None
+        self._mark_buyer_dirty(org_id, buyer_id, persisted)
+        if "motivation_score" in update_data:
+            await self.refresh_opportunity_scores_safe(org_id, buyer_ids=[buyer_id])
+        return response.data[0]
 
     # ─────────────────────────────────────────────────────────────────────
     # MATCHES
@@ -513,7 +813,7 @@ class ProspectionService:
     ) -> Dict[str, Any]:
         """List matches with optional filters, ordered by score."""
         query = (
-            supabase_service.client.table("property_buyer_matches")
+            self._db().table("property_buyer_matches")
             .select("*", count="exact")
             .eq("org_id", org_id)
             .order("match_score", desc=True)
@@ -529,11 +829,11 @@ class ProspectionService:
             query = query.eq("buyer_id", buyer_id)
 
         query = query.range(offset, offset + limit - 1)
-        response = query.execute()
+        response = await query.execute()
 
         # Denormalize: fetch property titles and buyer names for display
         items = response.data
-        await self._enrich_matches(org_id, items)
+        await self._enrich_matches(org_id, items, EnrichmentLoaders(self, org_id))
 
         return {
             "items": items,
@@ -555,94 +855,342 @@ class ProspectionService:
         - 65% match_score
         - 20% normalized commission estimate
         - 15% buyer motivation
+
+        Reads the persisted opportunity_score with an indexed
+        ORDER BY ... LIMIT k when migration 038 is applied and every match
+        has been scored; otherwise (e.g. matches created since the last
+        refresh) scores matches on the fly.
         """
-        matches_query = (
-            supabase_service.client.table("property_buyer_matches")
-            .select("*")
+        if not await self._opportunity_columns_ready() or await self._unscored_matches_exist(org_id, match_status):
+            return await self._stream_opportunity_ranking(org_id, limit, min_opportunity_score, match_status)
+
+        query = (
+            self._db().table("property_buyer_matches")
+            .select("*", count="exact")
             .eq("org_id", org_id)
-            .order("match_score", desc=True)
-            .limit(max(limit * 5, 100))
+            .not_.is_("opportunity_score", "null")
         )
         if match_status:
-            matches_query = matches_query.eq("match_status", match_status)
-        match_rows = matches_query.execute().data or []
-        await self._enrich_matches(org_id, match_rows)
-
-        if not match_rows:
-            return {
-                "items": [],
-                "total": 0,
-                "limit": limit,
-                "scope": {"org_id": org_id},
-                "totals": {"hot": 0, "warm": 0, "cold": 0},
-            }
-
-        buyer_ids = list({str(m.get("buyer_id")) for m in match_rows if m.get("buyer_id")})
-        buyers = (
-            supabase_service.client.table("buyer_profiles")
-            .select("id,motivation_score,status")
-            .eq("org_id", org_id)
-            .in_("id", buyer_ids)
-            .execute()
-        ).data or []
-        buyer_map = {str(b["id"]): b for b in buyers}
-
-        commissions = [
-            float(m.get("commission_estimate"))
-            for m in match_rows
-            if m.get("commission_estimate") is not None
-        ]
-        max_commission = max(commissions) if commissions else 0.0
-
-        ranked: List[Dict[str, Any]] = []
-        for m in match_rows:
-            match_score = float(m.get("match_score") or 0)
+            query = query.eq("match_status", match_status)
+        if min_opportunity_score is not None:
+            query = query.gte("opportunity_score", min_opportunity_score)
+        response = await query.order("opportunity_score", desc=True).order("id").limit(limit).execute()
+        rows = response.data or []
+
+        loaders = EnrichmentLoaders(self, org_id)
+        await self._enrich_matches(org_id, rows, loaders)
+
+        # Rows backfilled by the migration carry no explanation yet.
+        max_commission: Optional[float] = None
+        items: List[Dict[str, Any]] = []
+        for m in rows:
+            score = float(m["opportunity_score"])
+            explanation = m.get("opportunity_explanation")
+            if not explanation:
+                if max_commission is None:
+                    max_commission = await self._max_commission_estimate(org_id)
+                buyer = await loaders.buyers.load(m.get("buyer_id"))
+                explanation = self._score_opportunity(m, buyer, max_commission)["opportunity_explanation"]
             commission = float(m.get("commission_estimate") or 0)
-            commission_norm = (commission / max_commission * 100) if max_commission > 0 else 0.0
-
-            buyer = buyer_map.get(str(m.get("buyer_id")), {})
-            motivation = float(buyer.get("motivation_score") or 0)
-            if motivation > 0 and motivation <= 10:
-                motivation = motivation * 10.0
+            items.append(self._ranking_record(m, float(m.get("match_score") or 0), commission, score, explanation))
+        return self._ranking_response(
+            org_id, items, limit, response.count or len(items), {"source": "persisted"}
+        )
 
-            opportunity_score = (match_score * 0.65) + (commission_norm * 0.20) + (motivation * 0.15)
+    async def _stream_opportunity_ranking(
+        self,
+        org_id: str,
+        limit: int,
+        min_opportunity_score: Optional[float],
+        match_status: Optional[str],
+    ) -> Dict[str, Any]:
+        """
+        Matches are streamed by match_score descending into a bounded top-K
+        heap; the scan stops once the best score a remaining match could
+        reach cannot enter the top-K (or meet min_opportunity_score).
+        """
+        page_size = max(limit * 2, RANKING_PAGE_SIZE)
+        max_commission = await self._max_commission_estimate(org_id, match_status)
+        loaders = EnrichmentLoaders(self, org_id)
+        top = TopKSelector(limit)
+        scanned = qualified = 0
+        early_stop = False
+
+        while True:
+            matches_query = (
+                self._db().table("property_buyer_matches")
+                .select("*")
+                .eq("org_id", org_id)
+            )
+            if match_status:
+                matches_query = matches_query.eq("match_status", match_status)
+            page = (
+                await matches_query.order("match_score", desc=True)
+                .order("id")
+                .range(scanned, scanned + page_size - 1)
+                .execute()
+            ).data or []
+            if not page:
+                break
+            scanned += len(page)
+
+            buyer_map = await loaders.buyers.load_many(m.get("buyer_id") for m in page)
+            for m in page:
+                scored = self._score_opportunity(m, buyer_map.get(str(m.get("buyer_id"))), max_commission)
+                score = scored["opportunity_score"]
+                if min_opportunity_score is not None and score < min_opportunity_score:
+                    continue
+                qualified += 1
+                top.push(score, (m, scored))
+
+            if len(page) < page_size:
+                break
+            bound = opportunity_upper_bound(float(page[-1].get("match_score") or 0))
+            if not top.can_admit(bound) or (min_opportunity_score is not None and bound < min_opportunity_score):
+                early_stop = True
+                break
+
+        selected = top.items()
+        # Only the winners are enriched with display names.
+        await self._enrich_matches(org_id, [m for m, _ in selected], loaders)
+
+        items = [
+            self._ranking_record(
+                m,
+                float(m.get("match_score") or 0),
+                float(m.get("commission_estimate") or 0),
+                scored["opportunity_score"],
+                scored["opportunity_explanation"],
+            )
+            for m, scored in selected
+        ]
+        meta = {"source": "streamed", "scanned": scanned, "early_stop": early_stop}
+        return self._ranking_response(org_id, items, limit, qualified, meta)
 
-            explanation = self._build_opportunity_explanation(m, match_score, commission_norm, motivation)
-            action = self._recommend_next_action(opportunity_score, str(m.get("match_status") or "candidate"))
+    def _score_opportunity(
+        self, match_row: Dict[str, Any], buyer: Optional[Dict[str, Any]], max_commission: float
+    ) -> Dict[str, Any]:
+        """Opportunity score, band and explanation for one match (OPPORTUNITY_FIELDS)."""
+        match_score = float(match_row.get("match_score") or 0)
+        commission_norm = normalize_commission(float(match_row.get("commission_estimate") or 0), max_commission)
+        motivation = normalize_motivation((buyer or {}).get("motivation_score"))
+        score = round(opportunity_score(match_score, commission_norm, motivation), 2)
+        return {
+            "opportunity_score": score,
+            "priority_band": priority_band(score),
+            "opportunity_explanation": self._build_opportunity_explanation(
+                match_row, match_score, commission_norm, motivation
+            ),
+        }
 
-            record = {
-                "match_id": m.get("id"),
-                "property_id": m.get("property_id"),
-                "buyer_id": m.get("buyer_id"),
-                "property_title": m.get("property_title"),
-                "buyer_name": m.get("buyer_name"),
-                "match_status": m.get("match_status"),
-                "match_score": round(match_score, 2),
-                "commission_estimate": round(commission, 2) if commission else None,
-                "opportunity_score": round(opportunity_score, 2),
-                "priority_band": "hot" if opportunity_score >= 75 else "warm" if opportunity_score >= 50 else "cold",
-                "next_action": action,
-                "explanation": explanation,
-                "updated_at": m.get("updated_at"),
-            }
-            if min_opportunity_score is None or record["opportunity_score"] >= min_opportunity_score:
-                ranked.append(record)
+    def _ranking_record(
+        self,
+        m: Dict[str, Any],
+        match_score: float,
+        commission: float,
+        score: float,
+        explanation: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        return {
+            "match_id": m.get("id"),
+            "property_id": m.get("property_id"),
+            "buyer_id": m.get("buyer_id"),
+            "property_title": m.get("property_title"),
+            "buyer_name": m.get("buyer_name"),
+            "match_status": m.get("match_status"),
+            "match_score": round(match_score, 2),
+            "commission_estimate": round(commission, 2) if commission else None,
+            "opportunity_score": score,
+            "priority_band": priority_band(score),
+            "next_action": self._recommend_next_action(score, str(m.get("match_status") or "candidate")),
+            "explanation": explanation,
+            "updated_at": m.get("updated_at"),
+        }
 
-        ranked.sort(key=lambda r: r["opportunity_score"], reverse=True)
-        sliced = ranked[:limit]
+    def _ranking_response(
+        self, org_id: str, items: List[Dict[str, Any]], limit: int, total: int, meta: Dict[str, Any]
+    ) -> Dict[str, Any]:
         totals = {
-            "hot": len([r for r in sliced if r["priority_band"] == "hot"]),
-            "warm": len([r for r in sliced if r["priority_band"] == "warm"]),
-            "cold": len([r for r in sliced if r["priority_band"] == "cold"]),
+            "hot": len([r for r in items if r["priority_band"] == "hot"]),
+            "warm": len([r for r in items if r["priority_band"] == "warm"]),
+            "cold": len([r for r in items if r["priority_band"] == "cold"]),
         }
         return {
-            "items": sliced,
-            "total": len(ranked),
+            "items": items,
+            "total": total if items else 0,
             "limit": limit,
             "scope": {"org_id": org_id},
             "totals": totals,
+            "meta": meta,
         }
 
+    async def _opportunity_columns_ready(self) -> bool:
+        return await self._table_has_column("property_buyer_matches", "opportunity_score")
+
+    async def _unscored_matches_exist(self, org_id: str, match_status: Optional[str] = None) -> bool:
+        """Whether any (filtered) match has no persisted opportunity_score yet."""
+        query = (
+            self._db().table("property_buyer_matches")
+            .select("id")
+            .eq("org_id", org_id)
+            .is_("opportunity_score", "null")
+        )
+        if match_status:
+            query = query.eq("match_status", match_status)
+        return bool((await query.limit(1).execute()).data)
+
+    async def refresh_opportunity_scores(
+        self,
+        org_id: str,
+        match_ids: Optional[List[str]] = None,
+        buyer_ids: Optional[List[str]] = None,
+        property_ids: Optional[List[str]] = None,
+    ) -> int:
+        """
+        Recompute and persist OPPORTUNITY_FIELDS for the matches selected by
+        the given ID filters (combined with AND; none means the whole org).
+        Commission is normalized against the org-wide max, so when any stored
+        score was normalized against a different max every match of the org
+        is refreshed. Only rows whose stored values change are written, each
+        with an UPDATE keyed by id that touches the opportunity columns only.
+        Returns the rows written.
+        """
+        if not await self._opportunity_columns_ready():
+            return 0
+        max_commission = await self._max_commission_estimate(org_id)
+        track_basis = await self._table_has_column("property_buyer_matches", OPPORTUNITY_BASIS_COLUMN)
+        if await self._opportunity_basis_moved(org_id, max_commission, track_basis):
+            match_ids = buyer_ids = property_ids = None
+        elif any(ids is not None and not ids for ids in (match_ids, buyer_ids, property_ids)):
+            return 0
+
+        loaders = EnrichmentLoaders(self, org_id)
+        changed: List[tuple[str, Dict[str, Any]]] = []
+        stamp = datetime.utcnow().isoformat()
+        last_id: Optional[str] = None
+        while True:
+            query = (
+                self._db().table("property_buyer_matches")
+                .select("*")
+                .eq("org_id", org_id)
+            )
+            if match_ids is not None:
+                query = query.in_("id", match_ids)
+            if buyer_ids is not None:
+                query = query.in_("buyer_id", buyer_ids)
+            if property_ids is not None:
+                query = query.in_("property_id", property_ids)
+            if last_id is not None:
+                query = query.gt("id", last_id)
+            page = (
+                await query.order("id").limit(OPPORTUNITY_REFRESH_PAGE_SIZE).execute()
+            ).data or []
+            if not page:
+                break
+
+            buyer_map = await loaders.buyers.load_many(m.get("buyer_id") for m in page)
+            for m in page:
+                fields = self._score_opportunity(m, buyer_map.get(str(m.get("buyer_id"))), max_commission)
+                if track_basis:
+                    fields[OPPORTUNITY_BASIS_COLUMN] = max_commission
+                if self._opportunity_unchanged(m, fields):
+                    continue
+                changed.append((str(m["id"]), {**fields, "opportunity_updated_at": stamp}))
+            if len(page) < OPPORTUNITY_REFRESH_PAGE_SIZE:
+                break
+            last_id = str(page[-1]["id"])
+
+        if changed:
+            await async_db.run(
+                self._update_opportunity_rows, org_id, changed, label="property_buyer_matches"
+            )
+            self._invalidate_workspace(org_id)
+        return len(changed)
+
+    @staticmethod
+    def _opportunity_unchanged(match_row: Dict[str, Any], fields: Dict[str, Any]) -> bool:
+        stored_score = match_row.get("opportunity_score")
+        stored_basis = match_row.get(OPPORTUNITY_BASIS_COLUMN)
+        return (
+            stored_score is not None
+            and float(stored_score) == fields["opportunity_score"]
+            and match_row.get("priority_band") == fields["priority_band"]
+            and match_row.get("opportunity_explanation") == fields["opportunity_explanation"]
+            and (
+                OPPORTUNITY_BASIS_COLUMN not in fields
+                or (stored_basis is not None and float(stored_basis) == fields[OPPORTUNITY_BASIS_COLUMN])
+            )
+        )
+
+    async def _opportunity_basis_moved(self, org_id: str, max_commission: float, track_basis: bool) -> bool:
+        """
+        Whether any stored score of the org was normalized against another max
+        commission. Without the basis column (pre-039) this cannot be told,
+        so every refresh rescans the org (still writing only changed rows).
+        """
+        if not track_basis:
+            return True
+        rows = (
+            await self._db().table("property_buyer_matches")
+            .select("id")
+            .eq("org_id", org_id)
+            .or_(f"{OPPORTUNITY_BASIS_COLUMN}.is.null,{OPPORTUNITY_BASIS_COLUMN}.neq.{max_commission}")
+            .limit(1)
+            .execute()
+        ).data or []
+        return bool(rows)
+
+    def _update_opportunity_rows(self, org_id: str, rows: List[tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Write refreshed opportunity columns by match id, one bulk RPC per
+        chunk. A match deleted or rescored meanwhile is never re-created and
+        keeps its own match_score. Without migration 042 each row gets its
+        own UPDATE.
+        """
+        payload = [{"id": match_id, **fields} for match_id, fields in rows]
+        for start in range(0, len(payload), OPPORTUNITY_UPDATE_CHUNK_SIZE):
+            try:
+                supabase_service.client.rpc(
+                    UPDATE_OPPORTUNITIES_FN,
+                    {"p_org_id": org_id, "p_rows": payload[start:start + OPPORTUNITY_UPDATE_CHUNK_SIZE]},
+                ).execute()
+            except Exception as e:
+                if not is_missing_schema_error(e):
+                    raise
+                for match_id, fields in rows[start:]:
+                    (
+                        supabase_service.client.table("property_buyer_matches")
+                        .update(fields)
+                        .eq("id", match_id)
+                        .eq("org_id", org_id)
+                        .execute()
+                    )
+                break
+        return len(rows)
+
+    async def refresh_opportunity_scores_safe(self, org_id: str, **kwargs: Any) -> None:
+        """Best-effort hook for write paths: a failed refresh never fails the write."""
+        try:
+            await self.refresh_opportunity_scores(org_id, **kwargs)
+        except Exception as e:
+            # Rows left on the old basis force a full refresh next time.
+            print(f"Opportunity score refresh failed for org {org_id}: {e}")
+
+    async def _max_commission_estimate(self, org_id: str, match_status: Optional[str] = None) -> float:
+        """Largest commission_estimate among the org's (filtered) matches."""
+        query = (
+            self._db().table("property_buyer_matches")
+            .select("commission_estimate")
+            .eq("org_id", org_id)
+            .gt("commission_estimate", 0)
+        )
+        if match_status:
+            query = query.eq("match_status", match_status)
+        rows = (
+            await query.order("commission_estimate", desc=True).limit(1).execute()
+        ).data or []
+        return float(rows[0].get("commission_estimate") or 0) if rows else 0.0
+
     async def update_match(
         self, org_id: str, match_id: str, data: MatchUpdate
     ) -> Optional[Dict[str, Any]]:
@@ -655,12 +1203,15 @@ class ProspectionService:
             update_data["match_status"] = str(update_data["match_status"])
 
         response = (
-            supabase_service.client.table("property_buyer_matches")
+            await self._db().table("property_buyer_matches")
             .update(update_data)
             .eq("id", match_id)
             .eq("org_id", org_id)
             .execute()
         )
+        self._invalidate_workspace(org_id)
+        if response.data and "commission_estimate" in update_data:
+            await self.refresh_opportunity_scores_safe(org_id, match_ids=[match_id])
         return response.data[0] if response.data else None
 
     async def recompute_matches(
@@ -668,88 +1219,283 @@ class ProspectionService:
         org_id: str,
         property_ids: Optional[List[str]] = None,
         buyer_ids: Optional[List[str]] = None,
+        chunk_size: int = MATCH_UPSERT_CHUNK_SIZE,
+        incremental: bool = False,
+        min_match_score: Optional[float] = None,
+        progress: Optional[Callable[[float, Optional[str]], None]] = None,
     ) -> RecomputeResponse:
         """
         Recompute match scores for all (or filtered) property-buyer pairs.
-        Creates new matches and updates existing ones.
+
+        Properties, buyers and existing pairs are fetched once, every pair is
+        scored in memory and results are persisted with chunked bulk upserts
+        keyed on (property_id, buyer_id), so the number of write round-trips
+        is ceil(pairs / chunk_size) instead of one per pair.
+
+        With incremental=True only pairs touching a property or buyer changed
+        since its last recompute (match_dirty_at set, or marked in memory on
+        older schemas) are rescored; every other pair is skipped.
+
+        With min_match_score, new pairs that cannot reach the floor are pruned
+        (blocked by BuyerCandidateIndex or scored below it) and not written.
+
+        `progress(fraction, message)` is called between properties and before
+        writing; background jobs use it to report progress and cancel.
         """
-        property_table = self._property_table(org_id)
+        started = time.perf_counter()
+        chunk_size = max(1, int(chunk_size))
+        # In-memory marks are snapshotted before the reads, like the persisted
+        # stamps on the rows below.
+        memory_properties = dict(self._dirty_properties.get(str(org_id), {}))
+        memory_buyers = dict(self._dirty_buyers.get(str(org_id), {}))
+
+        property_table = await self._property_table(org_id)
+        has_status = await self._table_has_column(property_table, "status")
+
         # Fetch properties
-        prop_query = (
-            supabase_service.client.table(property_table)
-            .select("*")
-            .eq("org_id", org_id)
-        )
-        if self._table_has_column(property_table, "status"):
-            prop_query = prop_query.neq("status", "discarded")
-        if property_ids:
-            prop_query = prop_query.in_("id", property_ids)
-        properties = prop_query.execute().data
+        def property_query() -> Any:
+            query = self._db().table(property_table).select("*").eq("org_id", org_id)
+            if has_status:
+                query = query.neq("status", "discarded")
+            return query.in_("id", property_ids) if property_ids else query
+
+        properties = await self._select_all_pages(property_query)
 
         # Fetch active buyers
-        buyer_query = (
-            supabase_service.client.table("buyer_profiles")
-            .select("*")
-            .eq("org_id", org_id)
-            .eq("status", "active")
-        )
-        if buyer_ids:
-            buyer_query = buyer_query.in_("id", buyer_ids)
-        buyers = buyer_query.execute().data
-
-        # Fetch existing matches for dedup
-        existing_matches_response = (
-            supabase_service.client.table("property_buyer_matches")
-            .select("id, property_id, buyer_id")
-            .eq("org_id", org_id)
-            .execute()
-        )
-        existing_pairs: Dict[tuple[str, str], str] = {
-            (m["property_id"], m["buyer_id"]): m["id"]
-            for m in existing_matches_response.data
-        }
+        def buyer_query() -> Any:
+            query = self._db().table("buyer_profiles").select("*").eq("org_id", org_id).eq("status", "active")
+            return query.in_("id", buyer_ids) if buyer_ids else query
 
-        created: int = 0
-        updated: int = 0
+        buyers = await self._select_all_pages(buyer_query)
 
-        for prop in properties:
-            for buyer in buyers:
-                score_result = scoring_service.compute_match_score(
-                    property_data=prop,
-                    buyer_data=buyer,
-                )
+        # Fetch existing pairs: they decide created vs updated, and an
+        # existing pair must never be re-inserted with the initial status.
+        def pair_query() -> Any:
+            query = (
+                self._db().table("property_buyer_matches")
+                .select("id, property_id, buyer_id")
+                .eq("org_id", org_id)
+            )
+            if property_ids:
+                query = query.in_("property_id", property_ids)
+            if buyer_ids:
+                query = query.in_("buyer_id", buyer_ids)
+            return query
+
+        existing_by_property: Dict[str, set[str]] = {}
+        for m in await self._select_all_pages(pair_query):
+            existing_by_property.setdefault(str(m["property_id"]), set()).add(str(m["buyer_id"]))
+
+        property_stamps = self._dirty_stamps(properties)
+        buyer_stamps = self._dirty_stamps(buyers)
+        dirty_property_ids = set(property_stamps) | set(memory_properties)
+        dirty_buyer_ids = set(buyer_stamps) | set(memory_buyers)
+
+        # Scoring is O(properties x buyers) CPU work: it runs on the DB pool
+        # like the writes below, so the event loop keeps serving requests.
+        new_rows, existing_rows, skipped, pruned = await async_db.run(
+            self._score_recompute_pairs,
+            org_id,
+            properties,
+            buyers,
+            existing_by_property,
+            dirty_property_ids,
+            dirty_buyer_ids,
+            incremental,
+            min_match_score,
+            progress,
+            label="recompute_scoring",
+        )
 
-                pair_key = (prop["id"], buyer["id"])
-                match_data: Dict[str, Any] = {
-                    "match_score": score_result.score,
-                    "score_breakdown": score_result.breakdown,
-                }
+        if progress is not None:
+            progress(0.9, f"Writing {len(new_rows) + len(existing_rows)} matches")
+        # New pairs are inserted with ON CONFLICT DO NOTHING: a pair created
+        # since the read above keeps its pipeline status.
+        chunks_written = await async_db.run(
+            self._upsert_match_rows, new_rows, chunk_size, True, label="property_buyer_matches"
+        )
+        chunks_written += await async_db.run(
+            self._upsert_match_rows, existing_rows, chunk_size, label="property_buyer_matches"
+        )
 
-                if pair_key in existing_pairs:
-                    # Update existing match
-                    supabase_service.client.table("property_buyer_matches").update(
-                        match_data
-                    ).eq("id", existing_pairs[pair_key]).execute()
-                    updated += 1
-                else:
-                    # Create new match
-                    match_data.update({
-                        "org_id": org_id,
-                        "property_id": prop["id"],
-                        "buyer_id": buyer["id"],
-                        "match_status": "candidate",
-                    })
-                    supabase_service.client.table("property_buyer_matches").insert(
-                        match_data
-                    ).execute()
-                    created += 1
+        # An entity is clean once it has been scored against the whole other
+        # axis. Dirty IDs that were not fetched (discarded property, inactive
+        # buyer) have nothing left to score on an unfiltered run. Only marks
+        # snapshotted above are cleared; changes made since stay dirty.
+        clean_property_ids = {str(p["id"]) for p in properties} if not buyer_ids else set()
+        clean_buyer_ids = {str(b["id"]) for b in buyers} if not property_ids else set()
+        if not property_ids and not buyer_ids:
+            clean_property_ids |= set(memory_properties)
+            clean_buyer_ids |= set(memory_buyers)
+        self._clear_dirty(self._dirty_properties, org_id, memory_properties, clean_property_ids)
+        self._clear_dirty(self._dirty_buyers, org_id, memory_buyers, clean_buyer_ids)
+        await self._clear_persisted_dirty(property_table, org_id, property_stamps, clean_property_ids)
+        await self._clear_persisted_dirty("buyer_profiles", org_id, buyer_stamps, clean_buyer_ids)
+        self._invalidate_workspace(org_id)
+        if new_rows or existing_rows:
+            for scope in self._rescored_scopes(
+                property_ids, buyer_ids, incremental, dirty_property_ids, dirty_buyer_ids
+            ):
+                await self.refresh_opportunity_scores_safe(org_id, **scope)
+
+        created = len(new_rows)
+        updated = len(existing_rows)
+        total = created + updated
+        elapsed = time.perf_counter() - started
 
         return RecomputeResponse(
             matches_created=created,
             matches_updated=updated,
-            total_computed=created + updated,
+            total_computed=total,
+            pairs_rescored=total,
+            pairs_skipped=skipped,
+            pairs_pruned=pruned,
+            chunks_written=chunks_written,
+            duration_ms=round(elapsed * 1000, 2),
+            pairs_per_second=round(total / elapsed, 2) if elapsed > 0 else 0.0,
         )
 
+    def _score_recompute_pairs(
+        self,
+        org_id: str,
+        properties: List[Dict[str, Any]],
+        buyers: List[Dict[str, Any]],
+        existing_by_property: Dict[str, set[str]],
+        dirty_property_ids: set[str],
+        dirty_buyer_ids: set[str],
+        incremental: bool,
+        min_match_score: Optional[float],
+        progress: Optional[Callable[[float, Optional[str]], None]],
+    ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]], int, int]:
+        """
+        Score the recompute matrix (blocking, CPU-bound). Returns the rows for
+        new pairs, the rows for existing pairs, and the skipped and pruned
+        pair counts.
+        """
+        # With a score floor, a blocking index restricts each property to the
+        # buyers that can reach it; existing pairs are always rescored so no
+        # stored score goes stale.
+        candidate_index = BuyerCandidateIndex(buyers) if min_match_score is not None else None
+        buyer_positions: Dict[str, int] = {str(b["id"]): pos for pos, b in enumerate(buyers)}
+        # Buyer features are compiled once and each property's once; the
+        # pair loop only combines them.
+        buyer_features = CompiledMatchScorer.compile_buyers(buyers)
+        all_positions = range(len(buyers))
+
+        # New rows carry the initial pipeline status; rows for existing pairs
+        # only refresh the score so the current match_status is preserved.
+        new_rows: List[Dict[str, Any]] = []
+        existing_rows: List[Dict[str, Any]] = []
+        skipped: int = 0
+        pruned: int = 0
+
+        for position, prop in enumerate(properties):
+            if progress is not None and position % 50 == 0:
+                progress(0.9 * position / len(properties), f"Scoring property {position + 1}/{len(properties)}")
+            prop_id = str(prop["id"])
+            property_dirty = prop_id in dirty_property_ids
+            paired_buyers = existing_by_property.get(prop_id, set())
+
+            candidates: Iterable[int] = all_positions
+            if candidate_index is not None:
+                positions = set(candidate_index.candidate_positions(prop, min_match_score))
+                positions.update(
+                    buyer_positions[bid] for bid in paired_buyers if bid in buyer_positions
+                )
+                candidates = sorted(positions)
+                pruned += len(buyers) - len(candidates)
+
+            prop_features = CompiledMatchScorer.compile_property(prop)
+            for buyer_position in candidates:
+                buyer = buyers[buyer_position]
+                buyer_id = str(buyer["id"])
+                if incremental and not property_dirty and buyer_id not in dirty_buyer_ids:
+                    skipped += 1
+                    continue
+                match_score, breakdown = CompiledMatchScorer.score_pair(
+                    prop_features, buyer_features[buyer_position]
+                )
+                is_existing = buyer_id in paired_buyers
+                if (
+                    not is_existing
+                    and min_match_score is not None
+                    and match_score < min_match_score
+                ):
+                    pruned += 1
+                    continue
+                row: Dict[str, Any] = {
+                    "org_id": org_id,
+                    "property_id": prop["id"],
+                    "buyer_id": buyer["id"],
+                    "match_score": match_score,
+                    "score_breakdown": breakdown,
+                }
+                if is_existing:
+                    existing_rows.append(row)
+                else:
+                    row["match_status"] = "candidate"
+                    new_rows.append(row)
+
+        return new_rows, existing_rows, skipped, pruned
+
+    @staticmethod
+    def _rescored_scopes(
+        property_ids: Optional[List[str]],
+        buyer_ids: Optional[List[str]],
+        incremental: bool,
+        dirty_property_ids: set[str],
+        dirty_buyer_ids: set[str],
+    ) -> List[Dict[str, Optional[List[str]]]]:
+        """
+        refresh_opportunity_scores filters covering the pairs a recompute
+        rescored: the requested filters, narrowed on incremental runs to pairs
+        with a dirty property or a dirty buyer.
+        """
+        base = {
+            "property_ids": [str(p) for p in property_ids] if property_ids else None,
+            "buyer_ids": [str(b) for b in buyer_ids] if buyer_ids else None,
+        }
+        if not incremental:
+            return [base]
+        scopes: List[Dict[str, Optional[List[str]]]] = []
+        for key, dirty in (("property_ids", dirty_property_ids), ("buyer_ids", dirty_buyer_ids)):
+            ids = sorted(i for i in dirty if base[key] is None or i in base[key])
+            if ids:
+                scopes.append({**base, key: ids})
+        return scopes
+
+    async def _select_all_pages(self, build_query: Callable[[], Any]) -> List[Dict[str, Any]]:
+        """
+        Every row of `build_query()` (which must select id), read in keyset
+        pages by id so the PostgREST max_rows cap cannot truncate the result.
+        """
+        page_size = RECOMPUTE_PAGE_SIZE
+        rows: List[Dict[str, Any]] = []
+        last_id: Optional[str] = None
+        while True:
+            query = build_query()
+            if last_id is not None:
+                query = query.gt("id", last_id)
+            page = (await query.order("id").limit(page_size).execute()).data or []
+            rows.extend(page)
+            if len(page) < page_size:
+                return rows
+            last_id = str(page[-1]["id"])
+
+    def _upsert_match_rows(
+        self, rows: List[Dict[str, Any]], chunk_size: int, ignore_duplicates: bool = False
+    ) -> int:
+        """Persist match rows in bulk upsert chunks. Returns chunks written."""
+        chunks = 0
+        for start in range(0, len(rows), chunk_size):
+            supabase_service.client.table("property_buyer_matches").upsert(
+                rows[start:start + chunk_size],
+                on_conflict="property_id,buyer_id",
+                ignore_duplicates=ignore_duplicates,
+            ).execute()
+            chunks += 1
+        return chunks
+
     # ─────────────────────────────────────────────────────────────────────
     # ACTIVITIES
     # ─────────────────────────────────────────────────────────────────────
@@ -764,7 +1510,7 @@ class ProspectionService:
         """Log a commercial activity for a match."""
         # Verify match exists and belongs to org
         match_check = (
-            supabase_service.client.table("property_buyer_matches")
+            await self._db().table("property_buyer_matches")
             .select("id")
             .eq("id", match_id)
             .eq("org_id", org_id)
@@ -783,7 +1529,7 @@ class ProspectionService:
         if created_by:
             record["created_by"] = created_by
 
-        response = supabase_service.client.table("match_activity_log").insert(
+        response = await self._db().table("match_activity_log").insert(
             record
         ).execute()
         return response.data[0]
@@ -793,7 +1539,7 @@ class ProspectionService:
     ) -> Dict[str, Any]:
         """List activities for a specific match."""
         response = (
-            supabase_service.client.table("match_activity_log")
+            await self._db().table("match_activity_log")
             .select("*", count="exact")
             .eq("org_id", org_id)
             .eq("match_id", match_id)
@@ -818,68 +1564,135 @@ class ProspectionService:
         min_match_score: Optional[float] = None,
         limit: int = 25,
         offset: int = 0,
+        use_cache: bool = True,
     ) -> Dict[str, Any]:
         """
         Unified workspace payload for prospection operations.
         Scope:
         - owner/manager: full org data
         - agent: assigned data only
+
+        Payloads are served from the snapshot cache until a mutation of the
+        org invalidates them; meta.etag identifies the payload content.
         """
         role_norm = (role or "").strip().lower()
-        is_agent = role_norm == "agent"
+        cache_key = (
+            str(org_id),
+            role_norm,
+            user_id if role_norm == "agent" else None,
+            source_system,
+            property_status,
+            buyer_status,
+            match_status,
+            min_property_score,
+            min_match_score,
+            limit,
+            offset,
+        )
+        if use_cache:
+            cached = self.workspace_cache.get(cache_key)
+            if cached is not None:
+                etag, payload = cached
+                payload["meta"].update({"cache": "hit", "etag": etag})
+                return payload
+
+        payload = await self._build_workspace(
+            org_id=org_id,
+            role=role,
+            user_id=user_id,
+            source_system=source_system,
+            property_status=property_status,
+            buyer_status=buyer_status,
+            match_status=match_status,
+            min_property_score=min_property_score,
+            min_match_score=min_match_score,
+            limit=limit,
+            offset=offset,
+        )
+        etag = self.workspace_cache.put(cache_key, payload) if use_cache else workspace_etag(payload)
+        payload["meta"].update({"cache": "miss" if use_cache else "bypass", "etag": etag})
+        return payload
 
-        property_table = self._property_table(org_id)
-        prop_has_assignee = self._table_has_column(property_table, "assigned_user_id")
-        matches_table_exists = self._table_exists("property_buyer_matches")
-        buyers_table_exists = self._table_exists("buyer_profiles")
-        match_has_assignee = matches_table_exists and self._table_has_column("property_buyer_matches", "assigned_user_id")
-        match_has_status = matches_table_exists and self._table_has_column("property_buyer_matches", "match_status")
-        match_has_score = matches_table_exists and self._table_has_column("property_buyer_matches", "match_score")
-        buyer_has_assignee = buyers_table_exists and self._table_has_column("buyer_profiles", "assigned_user_id")
-        buyer_has_motivation = buyers_table_exists and self._table_has_column("buyer_profiles", "motivation_score")
+    async def _build_workspace(
+        self,
+        org_id: str,
+        role: str,
+        user_id: Optional[str] = None,
+        source_system: Optional[str] = None,
+        property_status: Optional[str] = None,
+        buyer_status: Optional[str] = None,
+        match_status: Optional[str] = None,
+        min_property_score: Optional[float] = None,
+        min_match_score: Optional[float] = None,
+        limit: int = 25,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """Run the workspace blocks and assemble the payload (uncached)."""
+        role_norm = (role or "").strip().lower()
+        is_agent = role_norm == "agent"
 
-        assigned_property_ids: List[str] = []
-        if is_agent and user_id and not match_has_assignee:
-            assigned_property_ids = await self._list_assigned_property_ids(org_id, user_id)
+        property_table = await self._property_table(org_id)
+        prop_has_assignee = await self._table_has_column(property_table, "assigned_user_id")
+        matches_table_exists = await self._table_exists("property_buyer_matches")
+        buyers_table_exists = await self._table_exists("buyer_profiles")
+        match_has_assignee = matches_table_exists and await self._table_has_column("property_buyer_matches", "assigned_user_id")
+        match_has_status = matches_table_exists and await self._table_has_column("property_buyer_matches", "match_status")
+        match_has_score = matches_table_exists and await self._table_has_column("property_buyer_matches", "match_score")
+        buyer_has_assignee = buyers_table_exists and await self._table_has_column("buyer_profiles", "assigned_user_id")
+        buyer_has_motivation = buyers_table_exists and await self._table_has_column("buyer_profiles", "motivation_score")
+
+        # Blocks are independent reads: they run concurrently (bounded per
+        # request) and each one's wall time is reported in meta.timings_ms.
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
+        semaphore = asyncio.Semaphore(WORKSPACE_BLOCK_CONCURRENCY)
+        loaders = EnrichmentLoaders(self, org_id)
+
+        async def timed(name: str, block: Callable[[], Awaitable[Any]]) -> Any:
+            async with semaphore:
+                block_started = time.perf_counter()
+                try:
+                    return await block()
+                finally:
+                    timings[name] = round((time.perf_counter() - block_started) * 1000, 2)
 
         # Properties block
-        prop_query = (
-            supabase_service.client.table(property_table)
-            .select("*", count="exact")
-            .eq("org_id", org_id)
-        )
-        if source_system and self._table_has_column(property_table, "source_system"):
-            prop_query = prop_query.eq("source_system", source_system)
-        if property_status and self._table_has_column(property_table, "status"):
-            prop_query = prop_query.eq("status", property_status)
-        if min_property_score is not None and self._table_has_column(property_table, "high_ticket_score"):
-            prop_query = prop_query.gte("high_ticket_score", min_property_score)
-        if is_agent and user_id and prop_has_assignee:
-            prop_query = prop_query.eq("assigned_user_id", user_id)
-        prop_query = prop_query.range(offset, offset + limit - 1)
-        if self._table_has_column(property_table, "high_ticket_score"):
-            prop_resp = prop_query.order("high_ticket_score", desc=True).execute()
-        else:
-            prop_resp = prop_query.order("created_at", desc=True).execute()
-        prop_items = self._normalize_property_items(prop_resp.data or [])
-        prop_total = prop_resp.count or len(prop_items)
+        async def properties_block() -> tuple[List[Dict[str, Any]], int]:
+            prop_query = (
+                self._db().table(property_table)
+                .select("*", count="exact")
+                .eq("org_id", org_id)
+            )
+            if source_system and await self._table_has_column(property_table, "source_system"):
+                prop_query = prop_query.eq("source_system", source_system)
+            if property_status and await self._table_has_column(property_table, "status"):
+                prop_query = prop_query.eq("status", property_status)
+            if min_property_score is not None and await self._table_has_column(property_table, "high_ticket_score"):
+                prop_query = prop_query.gte("high_ticket_score", min_property_score)
+            if is_agent and user_id and prop_has_assignee:
+                prop_query = prop_query.eq("assigned_user_id", user_id)
+            prop_query = prop_query.range(offset, offset + limit - 1)
+            if await self._table_has_column(property_table, "high_ticket_score"):
+                prop_resp = await prop_query.order("high_ticket_score", desc=True).execute()
+            else:
+                prop_resp = await prop_query.order("created_at", desc=True).execute()
+            loaders.properties.prime(prop_resp.data or [])
+            prop_items = self._normalize_property_items(prop_resp.data or [])
+            return prop_items, prop_resp.count or len(prop_items)
 
         # Matches block
-        match_items: List[Dict[str, Any]] = []
-        match_total = 0
-        if (not matches_table_exists) or (is_agent and user_id and (not match_has_assignee) and (not assigned_property_ids)):
-            match_items = []
-            match_total = 0
-        else:
+        async def matches_block(assigned_property_ids: List[str]) -> tuple[List[Dict[str, Any]], int]:
+            if (not matches_table_exists) or (is_agent and user_id and (not match_has_assignee) and (not assigned_property_ids)):
+                return [], 0
             match_query = (
-                supabase_service.client.table("property_buyer_matches")
+                self._db().table("property_buyer_matches")
                 .select("*", count="exact")
                 .eq("org_id", org_id)
             )
             if match_status:
                 if match_has_status:
                     match_query = match_query.eq("match_status", match_status)
-                elif self._table_has_column("property_buyer_matches", "status"):
+                elif await self._table_has_column("property_buyer_matches", "status"):
                     match_query = match_query.eq("status", match_status)
             if min_match_score is not None and match_has_score:
                 match_query = match_query.gte("match_score", min_match_score)
@@ -893,17 +1706,19 @@ class ProspectionService:
                 match_query = match_query.order("match_score", desc=True)
             else:
                 match_query = match_query.order("created_at", desc=True)
-            match_resp = match_query.execute()
+            match_resp = await match_query.execute()
             match_items = match_resp.data or []
-            match_total = match_resp.count or len(match_items)
-            await self._enrich_matches(org_id, match_items)
+            enrich_started = time.perf_counter()
+            await self._enrich_matches(org_id, match_items, loaders)
+            timings["enrich_matches"] = round((time.perf_counter() - enrich_started) * 1000, 2)
+            return match_items, match_resp.count or len(match_items)
 
         # Buyers block
-        buyer_items: List[Dict[str, Any]] = []
-        buyer_total = 0
-        if buyers_table_exists:
+        async def buyers_block(assigned_property_ids: List[str]) -> tuple[List[Dict[str, Any]], int]:
+            if not buyers_table_exists:
+                return [], 0
             buyer_query = (
-                supabase_service.client.table("buyer_profiles")
+                self._db().table("buyer_profiles")
                 .select("*", count="exact")
                 .eq("org_id", org_id)
             )
@@ -914,7 +1729,7 @@ class ProspectionService:
                     buyer_query = buyer_query.eq("assigned_user_id", user_id)
                 elif matches_table_exists:
                     scoped_matches_query = (
-                        supabase_service.client.table("property_buyer_matches")
+                        self._db().table("property_buyer_matches")
                         .select("buyer_id")
                         .eq("org_id", org_id)
                         .limit(5000)
@@ -924,33 +1739,42 @@ class ProspectionService:
                     elif assigned_property_ids:
                         scoped_matches_query = scoped_matches_query.in_("property_id", assigned_property_ids)
 
-                    scoped_matches_resp = scoped_matches_query.execute()
+                    scoped_matches_resp = await scoped_matches_query.execute()
                     scoped_buyer_ids = list({
                         m.get("buyer_id")
                         for m in (scoped_matches_resp.data or [])
                         if m.get("buyer_id")
                     })
                     if not scoped_buyer_ids:
-                        return {
-                            "scope": {
-                                "org_id": org_id,
-                                "role": role_norm,
-                                "user_id": user_id,
-                            },
-                            "properties": {"items": prop_items, "total": prop_total, "limit": limit, "offset": offset},
-                            "buyers": {"items": [], "total": 0, "limit": limit, "offset": offset},
-                            "matches": {"items": match_items, "total": match_total, "limit": limit, "offset": offset},
-                            "totals": {"properties": prop_total, "buyers": 0, "matches": match_total},
-                        }
+                        return [], 0
                     buyer_query = buyer_query.in_("id", scoped_buyer_ids)
             buyer_query = buyer_query.range(offset, offset + limit - 1)
             if buyer_has_motivation:
                 buyer_query = buyer_query.order("motivation_score", desc=True)
             else:
                 buyer_query = buyer_query.order("created_at", desc=True)
-            buyer_resp = buyer_query.execute()
+            buyer_resp = await buyer_query.execute()
             buyer_items = buyer_resp.data or []
-            buyer_total = buyer_resp.count or len(buyer_items)
+            loaders.buyers.prime(buyer_items)
+            return buyer_items, buyer_resp.count or len(buyer_items)
+
+        async def scoped_blocks() -> List[tuple[List[Dict[str, Any]], int]]:
+            # Matches and buyers share the agent's assigned properties.
+            assigned_property_ids: List[str] = []
+            if is_agent and user_id and not match_has_assignee:
+                assigned_property_ids = await timed(
+                    "assigned_properties", lambda: self._list_assigned_property_ids(org_id, user_id)
+                )
+            return await asyncio.gather(
+                timed("matches", lambda: matches_block(assigned_property_ids)),
+                timed("buyers", lambda: buyers_block(assigned_property_ids)),
+            )
+
+        (prop_items, prop_total), ((match_items, match_total), (buyer_items, buyer_total)) = await asyncio.gather(
+            timed("properties", properties_block),
+            scoped_blocks(),
+        )
+        timings["total"] = round((time.perf_counter() - started) * 1000, 2)
 
         return {
             "scope": {
@@ -962,6 +1786,7 @@ class ProspectionService:
             "buyers": {"items": buyer_items, "total": buyer_total, "limit": limit, "offset": offset},
             "matches": {"items": match_items, "total": match_total, "limit": limit, "offset": offset},
             "totals": {"properties": prop_total, "buyers": buyer_total, "matches": match_total},
+            "meta": {"timings_ms": timings, "block_concurrency": WORKSPACE_BLOCK_CONCURRENCY},
         }
 
     async def create_workspace_followup_task(
@@ -987,8 +1812,9 @@ class ProspectionService:
             "due_date": due_date or datetime.utcnow().isoformat(),
             "ai_generated": False,
         }
-        task_res = supabase_service.client.table("tasks").insert(task_payload).execute()
+        task_res = await self._db().table("tasks").insert(task_payload).execute()
         task_row = task_res.data[0] if task_res.data else {}
+        self._invalidate_workspace(org_id)
 
         try:
             await supabase_service.insert_audit_log(
@@ -1049,6 +1875,7 @@ class ProspectionService:
                 raise ValueError("match not found")
         else:
             raise ValueError("unsupported entity type")
+        self._invalidate_workspace(org_id)
 
         try:
             await supabase_service.insert_audit_log(
@@ -1073,12 +1900,12 @@ class ProspectionService:
     async def _list_assigned_property_ids(self, org_id: str, user_id: str) -> List[str]:
         """Collect assigned property ids across available property tables."""
         assigned_ids: set[str] = set()
-        for property_table in self._property_tables():
-            if not self._table_has_column(property_table, "assigned_user_id"):
+        for property_table in await self._property_tables():
+            if not await self._table_has_column(property_table, "assigned_user_id"):
                 continue
             try:
                 rows = (
-                    supabase_service.client.table(property_table)
+                    await self._db().table(property_table)
                     .select("id")
                     .eq("org_id", org_id)
                     .eq("assigned_user_id", user_id)
@@ -1093,76 +1920,72 @@ class ProspectionService:
                 continue
         return list(assigned_ids)
 
-    async def _enrich_matches(
-        self, org_id: str, matches: List[Dict[str, Any]]
-    ) -> None:
-        """Add property_title and buyer_name to match records."""
-        if not matches:
-            return
-
-        property_ids = list({m["property_id"] for m in matches})
-        buyer_ids = list({m["buyer_id"] for m in matches})
+    async def _fetch_properties_by_id(self, org_id: str, property_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Batch function for EnrichmentLoaders.properties: one in_ query per table."""
 
-        # Fetch property display names from all known property tables.
-        prop_rows: List[Dict[str, Any]] = []
-        seen_ids: set[str] = set()
-        for property_table in self._property_tables():
+        async def fetch(property_table: str, ids: List[str], scoped: bool) -> List[Dict[str, Any]]:
             try:
-                props = (
-                    supabase_service.client.table(property_table)
-                    .select("*")
-                    .eq("org_id", org_id)
-                    .in_("id", property_ids)
-                    .execute()
-                )
-                for row in (props.data or []):
-                    if row["id"] not in seen_ids:
-                        prop_rows.append(row)
-                        seen_ids.add(row["id"])
+                query = self._db().table(property_table).select("*")
+                if scoped:
+                    query = query.eq("org_id", org_id)
+                return (await query.in_("id", ids).execute()).data or []
             except Exception:
-                continue
+                return []
 
-        # Fallback without org filter for legacy data inconsistencies.
-        if len(prop_rows) < len(property_ids):
-            for property_table in self._property_tables():
-                try:
-                    props_any_org = (
-                        supabase_service.client.table(property_table)
-                        .select("*")
-                        .in_("id", property_ids)
-                        .execute()
-                    )
-                    for row in (props_any_org.data or []):
-                        if row["id"] not in seen_ids:
-                            prop_rows.append(row)
-                            seen_ids.add(row["id"])
-                except Exception:
-                    continue
+        property_tables = await self._property_tables()
+        found: Dict[str, Dict[str, Any]] = {}
 
-        prop_map: Dict[str, str] = {}
-        for p in prop_rows:
-            prop_map[p["id"]] = (
-                p.get("title")
-                or p.get("address")
-                or p.get("zone")
-                or "Sin título"
-            )
+        def collect(pages: List[List[Dict[str, Any]]]) -> None:
+            for rows in pages:
+                for row in rows:
+                    found.setdefault(str(row["id"]), row)
+
+        collect(await asyncio.gather(*(fetch(table, property_ids, True) for table in property_tables)))
 
-        # Fetch buyer names
-        buyers = (
-            supabase_service.client.table("buyer_profiles")
-            .select("id, full_name")
+        # Fallback without org filter for legacy data inconsistencies.
+        missing = [pid for pid in property_ids if pid not in found]
+        if missing:
+            collect(await asyncio.gather(*(fetch(table, missing, False) for table in property_tables)))
+        return found
+
+    async def _fetch_buyers_by_id(self, org_id: str, buyer_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Batch function for EnrichmentLoaders.buyers."""
+        rows = (
+            await self._db().table("buyer_profiles")
+            .select("*")
             .eq("org_id", org_id)
             .in_("id", buyer_ids)
             .execute()
+        ).data or []
+        return {str(b["id"]): b for b in rows}
+
+    async def _enrich_matches(
+        self,
+        org_id: str,
+        matches: List[Dict[str, Any]],
+        loaders: Optional[EnrichmentLoaders] = None,
+    ) -> None:
+        """Add property_title and buyer_name to match records."""
+        if not matches:
+            return
+
+        loaders = loaders or EnrichmentLoaders(self, org_id)
+        # Property and buyer batches are dispatched in the same tick and run concurrently.
+        properties, buyers = await asyncio.gather(
+            loaders.properties.load_many(m["property_id"] for m in matches),
+            loaders.buyers.load_many(m["buyer_id"] for m in matches),
         )
-        buyer_map: Dict[str, str] = {
-            b["id"]: b.get("full_name", "Sin nombre") for b in buyers.data
-        }
 
         for match in matches:
-            match["property_title"] = prop_map.get(match["property_id"], "Sin título")
-            match["buyer_name"] = buyer_map.get(match["buyer_id"], "Sin nombre")
+            prop = properties.get(str(match["property_id"])) or {}
+            buyer = buyers.get(str(match["buyer_id"]))
+            match["property_title"] = (
+                prop.get("title")
+                or prop.get("address")
+                or prop.get("zone")
+                or "Sin título"
+            )
+            match["buyer_name"] = buyer.get("full_name", "Sin nombre") if buyer else "Sin nombre"
 
     def _build_opportunity_explanation(
         self,
@@ -0,0 +1,211 @@
+"""
+Schema Cache — shared TTL cache for best-effort schema probes.
+
+Services probe optional tables/columns with `select ... limit(1)` so they can
+run against partially migrated databases. Probe results are stable between
+migrations, so they are cached here with a TTL and explicit invalidation
+instead of being re-issued on every request.
+
+Entries are kept per Supabase client so a swapped client (tests, key
+rotation) never sees another client's answers.
+
+Async handlers use the `*_async` variants: hits are answered inline and a
+miss runs its probe on the async_db pool instead of the event loop.
+"""
+
+import threading
+import time
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from backend.config import settings
+from backend.services.async_db import async_db
+
+
+# Property tables in preferred order (unified model first).
+PROPERTY_TABLE_CANDIDATES: Tuple[str, ...] = ("properties", "prospected_properties")
+
+# PostgreSQL undefined_table / undefined_column and their PostgREST schema-cache
+# counterparts: the only errors that prove a table or column is absent.
+MISSING_SCHEMA_CODES = frozenset({"42P01", "42703", "PGRST204", "PGRST205"})
+MISSING_SCHEMA_MARKERS = ("does not exist", "could not find the")
+
+
+def is_missing_schema_error(error: Exception) -> bool:
+    """True if the error says the probed table/column does not exist (not a transient failure)."""
+    if str(getattr(error, "code", "") or "") in MISSING_SCHEMA_CODES:
+        return True
+    message = " ".join(
+        str(part) for part in (getattr(error, "message", None), getattr(error, "details", None), error) if part
+    ).lower()
+    return any(marker in message for marker in MISSING_SCHEMA_MARKERS)
+
+
+class SchemaCache:
+    """TTL cache for table/column existence and per-org property table resolution."""
+
+    def __init__(self, ttl_seconds: float = 300.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: "weakref.WeakKeyDictionary[Any, Dict[Tuple[Any, ...], Tuple[float, Any]]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ─────────────────────────────────────────────────────────────────────
+    # INTERNAL
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _get(self, client: Any, key: Tuple[Any, ...]) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(client, {}).get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return True, entry[1]
+            self.misses += 1
+            return False, None
+
+    def _set(self, client: Any, key: Tuple[Any, ...], value: Any) -> Any:
+        with self._lock:
+            bucket = self._entries.get(client)
+            if bucket is None:
+                bucket = {}
+                self._entries[client] = bucket
+            bucket[key] = (time.monotonic() + self.ttl_seconds, value)
+        return value
+
+    async def _cached_or_offload(self, client: Any, key: Tuple[Any, ...], probe: Any, *args: Any) -> Any:
+        """Cached value for key, else run the sync `probe` (which fills the cache) on the DB pool."""
+        with self._lock:
+            entry = self._entries.get(client, {}).get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+        return await async_db.run(probe, client, *args, label="schema_probe")
+
+    def _probe(self, client: Any, table: str, column: str = "id") -> Optional[bool]:
+        """True/False when the schema answered, None on a transient (uncacheable) error."""
+        try:
+            client.table(table).select(column).limit(1).execute()
+            return True
+        except Exception as e:
+            return False if is_missing_schema_error(e) else None
+
+    def _set_probe(self, client: Any, key: Tuple[Any, ...], result: Optional[bool]) -> bool:
+        # A transient failure reads as "absent" for this call only.
+        return False if result is None else self._set(client, key, result)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # PROBES
+    # ─────────────────────────────────────────────────────────────────────
+
+    def table_exists(self, client: Any, table: str) -> bool:
+        """Best-effort table existence check (cached)."""
+        key = ("table", table)
+        found, value = self._get(client, key)
+        if found:
+            return value
+        return self._set_probe(client, key, self._probe(client, table))
+
+    def table_has_column(self, client: Any, table: str, column: str) -> bool:
+        """Best-effort column existence check (cached)."""
+        key = ("column", table, column)
+        found, value = self._get(client, key)
+        if found:
+            return value
+        return self._set_probe(client, key, self._probe(client, table, column))
+
+    def existing_tables(
+        self, client: Any, candidates: Iterable[str] = PROPERTY_TABLE_CANDIDATES
+    ) -> List[str]:
+        """Subset of candidate tables that exist, preserving order."""
+        return [table for table in candidates if self.table_exists(client, table)]
+
+    def property_table_for_org(self, client: Any, org_id: str) -> Optional[str]:
+        """
+        Property table that actually holds rows for this org, or None when no
+        candidate table has rows for it (the caller picks its own default).
+        """
+        key = ("org_property_table", str(org_id))
+        found, value = self._get(client, key)
+        if found:
+            return value
+
+        resolved: Optional[str] = None
+        failed = False
+        for table in self.existing_tables(client):
+            try:
+                probe = (
+                    client.table(table)
+                    .select("id")
+                    .eq("org_id", org_id)
+                    .limit(1)
+                    .execute()
+                )
+                if probe.data:
+                    resolved = table
+                    break
+            except Exception:
+                failed = True
+                continue
+        if resolved is None and failed:
+            # Unknown, not "no rows": do not cache.
+            return None
+        # None is cached too; writers invalidate the org after inserting.
+        return self._set(client, key, resolved)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # ASYNC PROBES
+    # ─────────────────────────────────────────────────────────────────────
+
+    async def table_exists_async(self, client: Any, table: str) -> bool:
+        return await self._cached_or_offload(client, ("table", table), self.table_exists, table)
+
+    async def table_has_column_async(self, client: Any, table: str, column: str) -> bool:
+        return await self._cached_or_offload(
+            client, ("column", table, column), self.table_has_column, table, column
+        )
+
+    async def existing_tables_async(
+        self, client: Any, candidates: Iterable[str] = PROPERTY_TABLE_CANDIDATES
+    ) -> List[str]:
+        return [table for table in candidates if await self.table_exists_async(client, table)]
+
+    async def property_table_for_org_async(self, client: Any, org_id: str) -> Optional[str]:
+        return await self._cached_or_offload(
+            client, ("org_property_table", str(org_id)), self.property_table_for_org, org_id
+        )
+
+    # ─────────────────────────────────────────────────────────────────────
+    # INVALIDATION
+    # ─────────────────────────────────────────────────────────────────────
+
+    def invalidate(self, table: Optional[str] = None, org_id: Optional[str] = None) -> None:
+        """
+        Drop cached entries. With no arguments everything is cleared; `table`
+        drops probes for that table, `org_id` drops that org's resolution.
+        """
+        with self._lock:
+            if table is None and org_id is None:
+                self._entries.clear()
+                return
+            for bucket in self._entries.values():
+                for key in list(bucket.keys()):
+                    if table is not None and key[0] in ("table", "column") and key[1] == table:
+                        bucket.pop(key, None)
+                    elif org_id is not None and key[0] == "org_property_table" and key[1] == str(org_id):
+                        bucket.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": sum(len(bucket) for bucket in self._entries.values()),
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+
+# Module-level singleton
+schema_cache = SchemaCache(ttl_seconds=settings.SCHEMA_CACHE_TTL_SECONDS)
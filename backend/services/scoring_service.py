@@ -6,7 +6,8 @@ Pure business logic with no DB dependency.
 Computes high_ticket_score and match_score with full breakdown.
 """
 
-from typing import Any, Dict, List, Optional
+from bisect import bisect_left
+from typing import Any, Collection, Dict, List, Optional, Set
 
 from backend.models.prospection import ScoreResult
 
@@ -167,64 +168,9 @@ class ScoringService:
           10% — motivation/response probability
 
         Returns ScoreResult with score in [0, 100] and breakdown.
+        The formula lives in CompiledMatchScorer.score_pair.
         """
-        # Factor 1: Budget fit (35%)
-        budget_score: float = ScoringService._score_budget_fit(
-            property_price=property_data.get("price"),
-            budget_min=buyer_data.get("budget_min"),
-            budget_max=buyer_data.get("budget_max"),
-        )
-
-        # Factor 2: Zone overlap (25%)
-        zone_score: float = ScoringService._score_zone_overlap(
-            property_zone=property_data.get("zone"),
-            preferred_zones=buyer_data.get("preferred_zones", []),
-        )
-
-        # Factor 3: Type & features fit (20%)
-        type_score: float = ScoringService._score_type_fit(
-            property_type=property_data.get("property_type"),
-            preferred_types=buyer_data.get("preferred_types", []),
-            required_features=buyer_data.get("required_features", {}),
-        )
-
-        # Factor 4: Horizon (10%)
-        horizon_score: float = ScoringService._score_horizon(
-            purchase_horizon=buyer_data.get("purchase_horizon"),
-        )
-
-        # Factor 5: Motivation (10%)
-        motivation: float = float(buyer_data.get("motivation_score") or 50.0)
-        motivation_score: float = min(100.0, max(0.0, motivation))
-
-        # Weighted total
-        weighted_budget: float = budget_score * 0.35
-        weighted_zone: float = zone_score * 0.25
-        weighted_type: float = type_score * 0.20
-        weighted_horizon: float = horizon_score * 0.10
-        weighted_motivation: float = motivation_score * 0.10
-
-        total: float = min(
-            100.0,
-            max(
-                0.0,
-                weighted_budget
-                + weighted_zone
-                + weighted_type
-                + weighted_horizon
-                + weighted_motivation,
-            ),
-        )
-
-        breakdown: Dict[str, float] = {
-            "budget": round(weighted_budget, 2),
-            "zone": round(weighted_zone, 2),
-            "type": round(weighted_type, 2),
-            "horizon": round(weighted_horizon, 2),
-            "motivation": round(weighted_motivation, 2),
-        }
-
-        return ScoreResult(score=round(total, 2), breakdown=breakdown)
+        return CompiledMatchScorer.score(PropertyFeatures(property_data), BuyerFeatures(buyer_data))
 
     # ─────────────────────────────────────────────────────────────────────
     # INTERNAL SCORING FUNCTIONS
@@ -330,7 +276,7 @@ class ScoringService:
     @staticmethod
     def _score_zone_overlap(
         property_zone: Optional[str],
-        preferred_zones: List[str],
+        preferred_zones: Collection[str],
     ) -> float:
         """Score based on zone matching."""
         if not property_zone or not preferred_zones:
@@ -346,14 +292,15 @@ class ScoringService:
     @staticmethod
     def _score_type_fit(
         property_type: Optional[str],
-        preferred_types: List[str],
+        preferred_types: Collection[str],
         required_features: Optional[Dict[str, Any]] = None,
     ) -> float:
         """Score based on property type and features overlap."""
         score: float = 50.0  # Neutral default
 
         if property_type and preferred_types:
-            if property_type.lower() in [t.lower() for t in preferred_types]:
+            type_key = property_type.lower()
+            if any(t.lower() == type_key for t in preferred_types):
                 score = 90.0
             else:
                 score = 30.0
@@ -372,5 +319,180 @@ class ScoringService:
         return HORIZON_SCORES.get(purchase_horizon, DEFAULT_HORIZON_SCORE)
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# COMPILED MATCH SCORER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class PropertyFeatures:
+    """Per-property match inputs, normalized once."""
+
+    __slots__ = ("price", "zone", "type_key")
+
+    def __init__(self, property_data: Dict[str, Any]) -> None:
+        price = property_data.get("price")
+        self.price: Optional[float] = float(price) if price is not None else None
+        self.zone: Optional[str] = property_data.get("zone") or None
+        property_type = property_data.get("property_type")
+        self.type_key: Optional[str] = property_type.lower() if property_type else None
+
+
+class BuyerFeatures:
+    """Per-buyer match inputs with the pair-independent factors pre-weighted."""
+
+    __slots__ = ("b_min", "b_max", "zones", "types", "weighted_horizon", "weighted_motivation")
+
+    def __init__(self, buyer_data: Dict[str, Any]) -> None:
+        self.b_min: float = float(buyer_data.get("budget_min") or 0)
+        self.b_max: float = float(buyer_data.get("budget_max") or float("inf"))
+        self.zones: frozenset = frozenset(buyer_data.get("preferred_zones") or ())
+        self.types: frozenset = frozenset(t.lower() for t in (buyer_data.get("preferred_types") or ()))
+        self.weighted_horizon: float = ScoringService._score_horizon(buyer_data.get("purchase_horizon")) * 0.10
+        motivation: float = float(buyer_data.get("motivation_score") or 50.0)
+        self.weighted_motivation: float = min(100.0, max(0.0, motivation)) * 0.10
+
+
+class CompiledMatchScorer:
+    """
+    Match scoring for many pairs: property and buyer features are compiled
+    once, and each pair only evaluates the budget, zone and type helpers of
+    ScoringService. ScoringService.compute_match_score is the one-pair case.
+    """
+
+    @staticmethod
+    def compile_property(property_data: Dict[str, Any]) -> PropertyFeatures:
+        return PropertyFeatures(property_data)
+
+    @staticmethod
+    def compile_buyers(buyers: List[Dict[str, Any]]) -> List[BuyerFeatures]:
+        return [BuyerFeatures(buyer) for buyer in buyers]
+
+    @staticmethod
+    def score_pair(prop: PropertyFeatures, buyer: BuyerFeatures) -> tuple[float, Dict[str, float]]:
+        """(score, breakdown) for one pair (spec v1 match_score weights)."""
+        # Per-pair factors use the ScoringService helpers on pre-normalized
+        # inputs: budget fit (35%), zone overlap (25%), type fit (20%).
+        budget = ScoringService._score_budget_fit(prop.price, buyer.b_min, buyer.b_max)
+        zone = ScoringService._score_zone_overlap(prop.zone, buyer.zones)
+        type_fit = ScoringService._score_type_fit(prop.type_key, buyer.types)
+
+        weighted_budget = budget * 0.35
+        weighted_zone = zone * 0.25
+        weighted_type = type_fit * 0.20
+        total = min(
+            100.0,
+            max(
+                0.0,
+                weighted_budget + weighted_zone + weighted_type + buyer.weighted_horizon + buyer.weighted_motivation,
+            ),
+        )
+        breakdown = {
+            "budget": round(weighted_budget, 2),
+            "zone": round(weighted_zone, 2),
+            "type": round(weighted_type, 2),
+            "horizon": round(buyer.weighted_horizon, 2),
+            "motivation": round(buyer.weighted_motivation, 2),
+        }
+        return round(total, 2), breakdown
+
+    @staticmethod
+    def score(prop: PropertyFeatures, buyer: BuyerFeatures) -> ScoreResult:
+        score, breakdown = CompiledMatchScorer.score_pair(prop, buyer)
+        return ScoreResult(score=score, breakdown=breakdown)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BUYER CANDIDATE INDEX
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class BuyerCandidateIndex:
+    """
+    Blocking index over buyers for match recompute.
+
+    A buyer is "touched" by a property when at least one factor can score
+    above its floor: price <= 1.1 * budget_max (budget >= 55), zone listed or
+    no zone preference (zone >= 50), type listed or no type preference
+    (type >= 70). Untouched buyers are capped at budget 50, zone 20 (50 if
+    the property has no zone) and type 30 (50 if the property has no type),
+    plus their horizon/motivation contribution, so they can be skipped as a
+    block whenever that cap is below the minimum match score.
+    """
+
+    def __init__(self, buyers: List[Dict[str, Any]]) -> None:
+        self.buyers = buyers
+
+        # Budget: positions sorted by 1.1 * budget_max (inf when open-ended)
+        caps: List[tuple[float, int]] = []
+        for pos, buyer in enumerate(buyers):
+            b_max = float(buyer.get("budget_max") or float("inf"))
+            caps.append((b_max * 1.1, pos))
+        caps.sort()
+        self._budget_caps: List[float] = [cap for cap, _ in caps]
+        self._budget_positions: List[int] = [pos for _, pos in caps]
+
+        # Zone / type: inverted maps plus buyers without preferences
+        self._by_zone: Dict[str, Set[int]] = {}
+        self._any_zone: Set[int] = set()
+        self._by_type: Dict[str, Set[int]] = {}
+        self._any_type: Set[int] = set()
+
+        max_tail: float = 0.0
+        for pos, buyer in enumerate(buyers):
+            zones = buyer.get("preferred_zones") or []
+            if zones:
+                for zone in zones:
+                    self._by_zone.setdefault(zone, set()).add(pos)
+            else:
+                self._any_zone.add(pos)
+
+            types = buyer.get("preferred_types") or []
+            if types:
+                for t in types:
+                    self._by_type.setdefault(str(t).lower(), set()).add(pos)
+            else:
+                self._any_type.add(pos)
+
+            horizon = ScoringService._score_horizon(buyer.get("purchase_horizon"))
+            motivation = min(100.0, max(0.0, float(buyer.get("motivation_score") or 50.0)))
+            max_tail = max(max_tail, horizon * 0.10 + motivation * 0.10)
+
+        # Best horizon + motivation contribution of any buyer
+        self._max_tail: float = max_tail
+
+    def untouched_upper_bound(self, property_data: Dict[str, Any]) -> float:
+        """Highest match_score any untouched buyer can reach for this property."""
+        zone_floor = 20.0 if property_data.get("zone") else 50.0
+        type_floor = 30.0 if property_data.get("property_type") else 50.0
+        return 50.0 * 0.35 + zone_floor * 0.25 + type_floor * 0.20 + self._max_tail
+
+    def candidate_positions(
+        self, property_data: Dict[str, Any], min_score: Optional[float] = None
+    ) -> List[int]:
+        """
+        Positions (in the original buyer list order) of buyers that may reach
+        min_score for this property. Without min_score every buyer is returned.
+        """
+        if min_score is None or round(self.untouched_upper_bound(property_data), 2) >= min_score:
+            return list(range(len(self.buyers)))
+
+        touched: Set[int] = set(self._any_zone) | self._any_type
+
+        price = property_data.get("price")
+        if price is not None:
+            start = bisect_left(self._budget_caps, float(price))
+            touched.update(self._budget_positions[start:])
+
+        zone = property_data.get("zone")
+        if zone:
+            touched |= self._by_zone.get(zone, set())
+
+        property_type = property_data.get("property_type")
+        if property_type:
+            touched |= self._by_type.get(str(property_type).lower(), set())
+
+        return sorted(touched)
+
+
 # Module-level singleton
 scoring_service = ScoringService()
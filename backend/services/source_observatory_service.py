@@ -14,6 +14,8 @@ from backend.models.source_observatory import (
     SourceScorecard,
     TrendPoint,
 )
+from backend.services.async_db import AsyncClient, async_db
+from backend.services.schema_cache import schema_cache
 from backend.services.supabase_service import supabase_service
 
 
@@ -21,17 +23,16 @@ class SourceObservatoryService:
     def __init__(self) -> None:
         self.client = supabase_service.client
 
-    def _table_exists(self, table: str) -> bool:
-        try:
-            self.client.table(table).select("id").limit(1).execute()
-            return True
-        except Exception:
-            return False
+    def _db(self) -> AsyncClient:
+        return async_db.bind(self.client)
+
+    async def _table_exists(self, table: str) -> bool:
+        return await schema_cache.table_exists_async(self.client, table)
 
     async def _get_role(self, org_id: str, user_id: str) -> str:
         try:
             result = (
-                self.client.table("organization_members")
+                await self._db().table("organization_members")
                 .select("role,status")
                 .eq("org_id", org_id)
                 .eq("user_id", user_id)
@@ -52,18 +53,18 @@ class SourceObservatoryService:
     async def _load_source_data(self, org_id: str) -> Tuple[List[dict], List[dict]]:
         events: List[dict] = []
         leads: List[dict] = []
-        if self._table_exists("ingestion_events"):
+        if await self._table_exists("ingestion_events"):
             events = (
-                self.client.table("ingestion_events")
+                await self._db().table("ingestion_events")
                 .select("connector_name,status,processed_at")
                 .eq("org_id", org_id)
                 .execute()
                 .data
                 or []
             )
-        if self._table_exists("leads"):
+        if await self._table_exists("leads"):
             leads = (
-                self.client.table("leads")
+                await self._db().table("leads")
                 .select("source_system,source_channel")
                 .eq("org_id", org_id)
                 .execute()
@@ -140,9 +141,9 @@ class SourceObservatoryService:
         min_date = f"{month_keys[0]}-01T00:00:00+00:00"
 
         events: List[dict] = []
-        if self._table_exists("ingestion_events"):
+        if await self._table_exists("ingestion_events"):
             events = (
-                self.client.table("ingestion_events")
+                await self._db().table("ingestion_events")
                 .select("connector_name,status,processed_at")
                 .eq("org_id", org_id)
                 .gte("processed_at", min_date)
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 from supabase import create_client, Client
 from backend.config import settings
+from backend.services.async_db import AsyncClient, async_db
 from backend.services.origin_editability_policy import sanitize_payload
 
 class SupabaseService:
@@ -16,6 +17,9 @@ class SupabaseService:
         self.audit_secret = settings.OPENAI_API_KEY # Using OpenAI key as a placeholder secret if dedicated not found
         self.fixed_org_id = "00000000-0000-0000-0000-000000000000" # Fixed Org ID for v0
 
+    def _db(self) -> AsyncClient:
+        return async_db.bind(self.client)
+
     def _generate_signature(self, data: Dict[str, Any]) -> str:
         """Generates HMAC-SHA256 signature for audit log integrity."""
         message = json.dumps(data, sort_keys=True)
@@ -26,26 +30,26 @@ class SupabaseService:
         ).hexdigest()
 
     async def insert_lead(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        response = self.client.table("leads").insert(data).execute()
+        response = await self._db().table("leads").insert(data).execute()
         return response.data[0]
 
     async def update_lead(self, lead_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        existing = self.client.table("leads").select("id,source_system").eq("id", lead_id).limit(1).execute()
+        existing = await self._db().table("leads").select("id,source_system").eq("id", lead_id).limit(1).execute()
         existing_row = existing.data[0] if existing.data else {}
         source_system = str(existing_row.get("source_system") or "manual")
         sanitized = sanitize_payload(data, "lead", source_system)
         if not sanitized:
-            fallback = self.client.table("leads").select("*").eq("id", lead_id).limit(1).execute()
+            fallback = await self._db().table("leads").select("*").eq("id", lead_id).limit(1).execute()
             return fallback.data[0] if fallback.data else {}
-        response = self.client.table("leads").update(sanitized).eq("id", lead_id).execute()
+        response = await self._db().table("leads").update(sanitized).eq("id", lead_id).execute()
         if response.data:
             return response.data[0]
-        fallback = self.client.table("leads").select("*").eq("id", lead_id).limit(1).execute()
+        fallback = await self._db().table("leads").select("*").eq("id", lead_id).limit(1).execute()
         return fallback.data[0] if fallback.data else {}
 
     async def update_lead_scoped(self, org_id: str, lead_id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        existing = (
-            self.client.table("leads")
+        existing = await (
+            self._db().table("leads")
             .select("id,org_id,source_system")
             .eq("id", lead_id)
             .eq("org_id", org_id)
@@ -58,8 +62,8 @@ class SupabaseService:
         source_system = str(row.get("source_system") or "manual")
         sanitized = sanitize_payload(data, "lead", source_system)
         if not sanitized:
-            fallback = (
-                self.client.table("leads")
+            fallback = await (
+                self._db().table("leads")
                 .select("*")
                 .eq("id", lead_id)
                 .eq("org_id", org_id)
@@ -67,8 +71,8 @@ class SupabaseService:
                 .execute()
             )
             return fallback.data[0] if fallback.data else None
-        response = (
-            self.client.table("leads")
+        response = await (
+            self._db().table("leads")
             .update(sanitized)
             .eq("id", lead_id)
             .eq("org_id", org_id)
@@ -77,8 +81,8 @@ class SupabaseService:
         return response.data[0] if response.data else None
 
     async def get_lead_scoped(self, org_id: str, lead_id: str) -> Optional[Dict[str, Any]]:
-        response = (
-            self.client.table("leads")
+        response = await (
+            self._db().table("leads")
             .select("*")
             .eq("id", lead_id)
             .eq("org_id", org_id)
@@ -88,11 +92,11 @@ class SupabaseService:
         return response.data[0] if response.data else None
 
     async def insert_task(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        response = self.client.table("tasks").insert(data).execute()
+        response = await self._db().table("tasks").insert(data).execute()
         return response.data[0]
 
     async def insert_agent_log(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        response = self.client.table("agent_logs").insert(data).execute()
+        response = await self._db().table("agent_logs").insert(data).execute()
         return response.data[0]
 
     async def insert_audit_log(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -103,64 +107,64 @@ class SupabaseService:
         # Generate signature before insert
         signature = self._generate_signature(data)
         audit_data = {**data, "signature": signature, "timestamp": datetime.utcnow().isoformat()}
-        response = self.client.table("audit_log").insert(audit_data).execute()
+        response = await self._db().table("audit_log").insert(audit_data).execute()
         return response.data[0]
 
     async def get_constitutional_limits(self, org_id: str) -> Dict[str, Any]:
-        response = self.client.table("constitutional_limits").select("*").eq("org_id", org_id).execute()
+        response = await self._db().table("constitutional_limits").select("*").eq("org_id", org_id).execute()
         return {item["limit_type"]: float(item["limit_value"]) for item in response.data}
 
     async def count_daily_leads(self, org_id: str) -> int:
         today = datetime.utcnow().date().isoformat()
-        response = self.client.table("leads").select("id", count="exact").eq("org_id", org_id).gte("created_at", today).execute()
+        response = await self._db().table("leads").select("id", count="exact").eq("org_id", org_id).gte("created_at", today).execute()
         return response.count or 0
 
     async def get_daily_token_usage(self, org_id: str) -> int:
         today = datetime.utcnow().date().isoformat()
-        response = self.client.table("agent_logs").select("tokens_used").eq("org_id", org_id).gte("timestamp", today).execute()
+        response = await self._db().table("agent_logs").select("tokens_used").eq("org_id", org_id).gte("timestamp", today).execute()
         return sum(item.get("tokens_used", 0) for item in response.data if item.get("tokens_used"))
 
     async def get_active_leads(self, priority_min: int = 3) -> List[Dict[str, Any]]:
-        response = self.client.table("leads").select("*").eq("status", "new").gte("ai_priority", priority_min).execute()
+        response = await self._db().table("leads").select("*").eq("status", "new").gte("ai_priority", priority_min).execute()
         return response.data
 
     async def get_available_properties(self) -> List[Dict[str, Any]]:
-        response = self.client.table("properties").select("*").eq("status", "prospect").execute()
+        response = await self._db().table("properties").select("*").eq("status", "prospect").execute()
         return response.data
 
     async def update_property_matching(self, property_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        response = self.client.table("properties").update(data).eq("id", property_id).execute()
+        response = await self._db().table("properties").update(data).eq("id", property_id).execute()
         return response.data[0]
 
     async def insert_agent_execution(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        response = self.client.table("agent_executions").insert(data).execute()
+        response = await self._db().table("agent_executions").insert(data).execute()
         return response.data[0]
 
     async def insert_weekly_recap(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        response = self.client.table("weekly_recaps").insert(data).execute()
+        response = await self._db().table("weekly_recaps").insert(data).execute()
         return response.data[0]
 
     async def get_recent_leads(self, days: int = 7, org_id: Optional[str] = None) -> List[Dict[str, Any]]:
         threshold = (datetime.utcnow() - timedelta(days=days)).isoformat()
-        query = self.client.table("leads").select("*").gte("created_at", threshold)
+        query = self._db().table("leads").select("*").gte("created_at", threshold)
         if org_id:
             query = query.eq("org_id", org_id)
-        response = query.execute()
+        response = await query.execute()
         return response.data
 
     async def get_recent_executions(self, days: int = 7) -> List[Dict[str, Any]]:
         threshold = (datetime.utcnow() - timedelta(days=days)).isoformat()
-        response = self.client.table("agent_executions").select("*").gte("created_at", threshold).execute()
+        response = await self._db().table("agent_executions").select("*").gte("created_at", threshold).execute()
         return response.data
 
     async def get_recent_properties_updates(self, days: int = 7) -> List[Dict[str, Any]]:
         threshold = (datetime.utcnow() - timedelta(days=days)).isoformat()
-        response = self.client.table("properties").select("*").gte("created_at", threshold).execute()
+        response = await self._db().table("properties").select("*").gte("created_at", threshold).execute()
         return response.data
 
     async def get_active_members(self, org_id: str) -> List[Dict[str, Any]]:
-        response = (
-            self.client.table("organization_members")
+        response = await (
+            self._db().table("organization_members")
             .select("id,user_id,role,status")
             .eq("org_id", org_id)
             .eq("status", "active")
@@ -169,8 +173,8 @@ class SupabaseService:
         return response.data or []
 
     async def get_owner_user_id(self, org_id: str) -> Optional[str]:
-        org_response = (
-            self.client.table("organizations")
+        org_response = await (
+            self._db().table("organizations")
             .select("owner_id")
             .eq("id", org_id)
             .limit(1)
@@ -189,8 +193,8 @@ class SupabaseService:
         if not user_ids:
             return {}
 
-        response = (
-            self.client.table("leads")
+        response = await (
+            self._db().table("leads")
             .select("status,assigned_user_id,notes")
             .eq("org_id", org_id)
             .in_("status", ["new", "contacted", "qualified", "negotiating"])
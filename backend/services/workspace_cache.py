@@ -0,0 +1,90 @@
+"""
+Workspace Cache — LRU snapshots of prospection workspace payloads.
+
+Agents reload the workspace with identical filters; snapshots are keyed by
+(org_id, role, user_id, filters, page) and served until a mutation in
+ProspectionService invalidates the org or the TTL expires (writes made by
+other workers). Each snapshot carries an ETag derived from its content so
+clients can revalidate with If-None-Match.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+def workspace_etag(payload: Dict[str, Any]) -> str:
+    """Content hash of a workspace payload, ignoring per-request metadata."""
+    body = {k: v for k, v in payload.items() if k != "meta"}
+    digest = hashlib.sha1(json.dumps(body, sort_keys=True, default=str).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+class WorkspaceSnapshotCache:
+    """Bounded LRU of workspace payloads with per-org invalidation."""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 30.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, str, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """(etag, payload copy) for a live snapshot, else None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            etag, payload = entry[1], entry[2]
+        return etag, copy.deepcopy(payload)
+
+    def put(self, key: Tuple[Hashable, ...], payload: Dict[str, Any]) -> str:
+        """Store a snapshot and return its ETag."""
+        etag = workspace_etag(payload)
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return etag
+        snapshot = copy.deepcopy(payload)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, etag, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return etag
+
+    def invalidate(self, org_id: Optional[str] = None) -> None:
+        """Drop every snapshot of an org (key[0]), or all snapshots."""
+        with self._lock:
+            self.invalidations += 1
+            if org_id is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] == str(org_id)]:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+            }
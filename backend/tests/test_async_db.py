@@ -0,0 +1,95 @@
+"""
+Unit tests for AsyncDataAccess — non-blocking access to the sync client.
+
+Tests:
+  - Fluent chains are replayed on the wrapped builder and executed off-loop
+  - Concurrency is bounded and slow calls overlap instead of serializing
+  - Per-table latency and error metrics are recorded
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.services.async_db import AsyncDataAccess
+
+
+class SlowBuilder:
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls: list[tuple] = []
+        self.threads: list[str] = []
+
+    def select(self, *args, **kwargs) -> "SlowBuilder":
+        self.calls.append(("select", args))
+        return self
+
+    def eq(self, field, value) -> "SlowBuilder":
+        self.calls.append(("eq", (field, value)))
+        return self
+
+    def execute(self) -> MagicMock:
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        result = MagicMock()
+        result.data = [{"table": self.name}]
+        return result
+
+
+class SlowClient:
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.builders: list[SlowBuilder] = []
+
+    def table(self, name: str) -> SlowBuilder:
+        builder = SlowBuilder(name, self.delay, self.fail)
+        self.builders.append(builder)
+        return builder
+
+
+class TestAsyncDataAccess:
+    @pytest.mark.asyncio
+    async def test_fluent_chain_runs_off_loop(self) -> None:
+        db = AsyncDataAccess(max_workers=2)
+        client = SlowClient()
+
+        result = await db.bind(client).table("leads").select("id").eq("org_id", "org-1").execute()
+
+        assert result.data == [{"table": "leads"}]
+        builder = client.builders[0]
+        assert builder.calls == [("select", ("id",)), ("eq", ("org_id", "org-1"))]
+        assert builder.threads[0].startswith("nexus-db")
+        assert db.stats()["calls"]["leads"]["calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_calls_overlap_up_to_the_limit(self) -> None:
+        db = AsyncDataAccess(max_workers=4, max_concurrency=2)
+        client = SlowClient(delay=0.1)
+        adb = db.bind(client)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(adb.table("properties").select("*").execute() for _ in range(4)))
+        elapsed = time.perf_counter() - started
+
+        assert 0.18 <= elapsed < 0.35
+        stats = db.stats()
+        assert stats["peak_in_flight"] == 2
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_are_counted_and_raised(self) -> None:
+        db = AsyncDataAccess(max_workers=1)
+
+        with pytest.raises(RuntimeError):
+            await db.bind(SlowClient(fail=True)).table("tasks").select("*").execute()
+
+        assert db.stats()["calls"]["tasks"]["errors"] == 1
+        assert await db.run(sum, [1, 2, 3], label="sum") == 6
@@ -0,0 +1,67 @@
+"""
+Unit tests for BatchLoader — request-scoped key coalescing.
+
+Tests:
+  - Loads issued in the same tick are resolved by one batch call
+  - Results (including misses) are memoized and primed rows skip the fetch
+  - Failed batches propagate and can be retried
+"""
+
+import asyncio
+
+import pytest
+
+from backend.services.batch_loader import BatchLoader
+
+
+class RecordingFetch:
+    def __init__(self, rows: dict, fail: bool = False):
+        self.rows = rows
+        self.fail = fail
+        self.batches: list[list[str]] = []
+
+    async def __call__(self, keys: list[str]) -> dict:
+        self.batches.append(list(keys))
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("boom")
+        return {k: self.rows[k] for k in keys if k in self.rows}
+
+
+class TestBatchLoader:
+    @pytest.mark.asyncio
+    async def test_same_tick_loads_are_coalesced(self) -> None:
+        fetch = RecordingFetch({"a": {"id": "a"}, "b": {"id": "b"}})
+        loader = BatchLoader(fetch)
+
+        first, second = await asyncio.gather(loader.load_many(["a", "b"]), loader.load_many(["b", "c"]))
+
+        assert fetch.batches == [["a", "b", "c"]]
+        assert first == {"a": {"id": "a"}, "b": {"id": "b"}}
+        assert second == {"b": {"id": "b"}}
+
+    @pytest.mark.asyncio
+    async def test_results_are_memoized_and_primed(self) -> None:
+        fetch = RecordingFetch({"a": {"id": "a"}})
+        loader = BatchLoader(fetch, max_batch_size=2)
+        loader.prime([{"id": "p", "name": "primed"}])
+
+        await loader.load_many(["a", "missing", "x"])
+        assert await loader.load("a") == {"id": "a"}
+        assert await loader.load("missing") is None
+        assert await loader.load("p") == {"id": "p", "name": "primed"}
+
+        assert fetch.batches == [["a", "missing"], ["x"]]
+        assert loader.stats() == {"batches": 2, "keys_fetched": 3, "cached": 4}
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried(self) -> None:
+        fetch = RecordingFetch({"a": {"id": "a"}}, fail=True)
+        loader = BatchLoader(fetch)
+
+        with pytest.raises(RuntimeError):
+            await loader.load("a")
+
+        fetch.fail = False
+        assert await loader.load("a") == {"id": "a"}
+        assert len(fetch.batches) == 2
@@ -0,0 +1,162 @@
+"""
+Unit tests for DedupeKeyIndex — in-memory dedupe key membership.
+
+Tests:
+  - Bloom filter has no false negatives and a bounded false-positive rate
+  - Cold orgs fall back to the database; warm authoritative orgs skip it for new keys
+  - A non-authoritative index confirms every miss in the database
+  - Warming pages through ingestion_events and keeps concurrent writes
+  - IngestionService skips the dedupe lookup once the index is warm
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.models.ingestion import LeadIngestionPayload, LeadSourceChannel, LeadSourceSystem
+from backend.services.dedupe_index import BloomFilter, DedupeKeyIndex
+from backend.services.ingestion_service import IngestionService
+
+
+class EventsClient:
+    """Supabase client double serving ingestion_events with keyset paging."""
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        self.pages = 0
+
+    def table(self, name: str) -> "EventsQuery":
+        return EventsQuery(self)
+
+
+class EventsQuery:
+    def __init__(self, client: EventsClient):
+        self.client = client
+        self.filters: list = []
+        self.limit_n = None
+
+    def select(self, *args, **kwargs) -> "EventsQuery":
+        return self
+
+    def eq(self, field: str, value) -> "EventsQuery":
+        self.filters.append(lambda r: r.get(field) == value)
+        return self
+
+    def gt(self, field: str, value) -> "EventsQuery":
+        self.filters.append(lambda r: r.get(field) > value)
+        return self
+
+    def order(self, *args, **kwargs) -> "EventsQuery":
+        return self
+
+    def limit(self, n: int) -> "EventsQuery":
+        self.limit_n = n
+        return self
+
+    def execute(self) -> MagicMock:
+        self.client.pages += 1
+        rows = sorted((r for r in self.client.rows if all(f(r) for f in self.filters)), key=lambda r: r["id"])
+        result = MagicMock()
+        result.data = rows[: self.limit_n]
+        return result
+
+
+def _events(org_id: str, count: int) -> list[dict]:
+    return [{"id": f"{org_id}-{i:05d}", "org_id": org_id, "dedupe_key": f"{org_id}-key-{i}"} for i in range(count)]
+
+
+class TestBloomFilter:
+    def test_no_false_negatives_and_bounded_error(self) -> None:
+        bloom = BloomFilter(2000, error_rate=0.01)
+        for i in range(2000):
+            bloom.add(f"key-{i}")
+
+        assert all(f"key-{i}" in bloom for i in range(2000))
+        false_positives = sum(1 for i in range(10000) if f"other-{i}" in bloom)
+        assert false_positives / 10000 < 0.03
+
+
+class TestDedupeKeyIndex:
+    def test_cold_org_falls_back_to_database(self) -> None:
+        index = DedupeKeyIndex(authoritative=True)
+        assert index.lookup("org-1", "k") is None
+        assert index.stats()["cold_fallbacks"] == 1
+
+    def test_warm_pages_and_answers_membership(self) -> None:
+        index = DedupeKeyIndex(authoritative=True, page_size=100)
+        client = EventsClient(_events("org-1", 250) + _events("org-2", 10))
+
+        assert index.warm("org-1", client) is True
+        assert client.pages == 3
+        assert index.lookup("org-1", "org-1-key-0") is None  # Bloom hit: confirm in DB
+        assert index.lookup("org-1", "brand-new") is False
+        assert index.stats()["db_lookups_avoided"] == 1
+
+    def test_added_keys_are_exact_hits(self) -> None:
+        index = DedupeKeyIndex()
+        index.warm("org-1", EventsClient([]))
+        index.add("org-1", "fresh")
+
+        assert index.lookup("org-1", "fresh") is True
+
+    def test_false_positive_rate_is_tracked(self) -> None:
+        index = DedupeKeyIndex(authoritative=True)
+        index.warm("org-1", EventsClient(_events("org-1", 5)))
+
+        assert index.lookup("org-1", "org-1-key-1") is None
+        index.record_db_result("org-1", "org-1-key-1", False)
+        stats = index.stats()
+        assert stats["false_positives"] == 1
+        assert stats["false_positive_rate"] == 1.0
+
+    def test_failed_warm_stays_cold(self) -> None:
+        index = DedupeKeyIndex(authoritative=True)
+        client = MagicMock()
+        client.table.side_effect = Exception("relation ingestion_events does not exist")
+
+        assert index.warm("org-1", client) is False
+        assert index.lookup("org-1", "k") is None
+
+    def test_expired_org_falls_back(self) -> None:
+        index = DedupeKeyIndex(authoritative=True, refresh_seconds=0)
+        index.warm("org-1", EventsClient([]))
+
+        assert index.lookup("org-1", "k") is None
+        assert index.needs_warm("org-1") is True
+
+    def test_shared_index_confirms_misses_in_database(self) -> None:
+        """Other workers may have written a key this process never saw."""
+        index = DedupeKeyIndex()
+        index.warm("org-1", EventsClient([]))
+        index.add("org-1", "mine")
+
+        assert index.lookup("org-1", "written-elsewhere") is None
+        assert index.lookup("org-1", "mine") is True
+        assert index.needs_warm("org-2") is False
+        assert index.stats()["db_lookups_avoided"] == 1
+
+
+@pytest.mark.asyncio
+async def test_warm_index_skips_dedupe_lookup():
+    service = IngestionService()
+    service.dedupe_index.authoritative = True
+    service.dedupe_index.warm("org-1", EventsClient([]))
+    mock_supabase = MagicMock()
+    mock_supabase.client.table.return_value.insert.return_value.execute.return_value.data = [{"id": "new-lead"}]
+    payload = LeadIngestionPayload(
+        org_id="org-1",
+        external_id="ext-warm",
+        source_system=LeadSourceSystem.CTA_WEB,
+        source_channel=LeadSourceChannel.WEBSITE,
+        name="Warm User",
+    )
+
+    with patch("backend.services.ingestion_service.supabase_service", mock_supabase), \
+            patch("backend.services.ingestion_service.dq_service") as mock_dq:
+        mock_dq.evaluate_entity_safe = AsyncMock()
+        first = await service.ingest_lead(payload)
+        second = await service.ingest_lead(payload)
+
+    assert first["status"] == "success"
+    assert second["status"] == "duplicate"
+    mock_supabase.client.table.return_value.select.assert_not_called()
@@ -1,5 +1,9 @@
+import random
+import threading
+from unittest.mock import MagicMock, patch
+
 import pytest
-from backend.services.dq_service import dq_service
+from backend.services.dq_service import DUPLICATE_CANDIDATE_THRESHOLD, dq_service
 from backend.models.dq import EntityType, IssueType, Severity
 
 def test_normalize_phone():
@@ -71,3 +75,174 @@ def test_calculate_similarity_score_property():
     score, signals = dq_service.calculate_similarity_score(EntityType.PROPERTY, p1, p3)
     assert score >= 60
     assert signals["catastro_match"] is True
+
+def _brute_force_pairs(entity_type, entities):
+    pairs = set()
+    for i in range(len(entities)):
+        for j in range(i + 1, len(entities)):
+            score, _ = dq_service.calculate_similarity_score(entity_type, entities[i], entities[j])
+            if score >= DUPLICATE_CANDIDATE_THRESHOLD:
+                pairs.add((entities[i]["id"], entities[j]["id"]))
+    return pairs
+
+def test_blocked_candidates_match_pairwise_scan_leads():
+    rng = random.Random(7)
+    names = ["Toni Nexus", "toni", "Ana Gil", "ana gil ", "Marc", ""]
+    emails = ["a@x.com", " A@X.com", "b@x.com", None, "c@y.es"]
+    phones = ["600111222", "+34 600 111 222", "971000000", None, "611"]
+    leads = [
+        {"id": f"l{i}", "name": rng.choice(names), "email": rng.choice(emails), "phone": rng.choice(phones)}
+        for i in range(120)
+    ]
+    blocked = dq_service.find_duplicate_candidates("org", EntityType.LEAD, leads)
+    assert {(c["left_entity_id"], c["right_entity_id"]) for c in blocked} == _brute_force_pairs(EntityType.LEAD, leads)
+
+def test_blocked_candidates_match_pairwise_scan_properties():
+    rng = random.Random(11)
+    props = [
+        {
+            "id": f"p{i}",
+            "address": rng.choice(["Calle Mayor 1", "calle mayor 1 ", "Cala Vinyes", None]),
+            "catastro_ref": rng.choice(["12345ABC", "99999XYZ", "", None]),
+            "price": rng.choice([500000, 505000, 900000, None]),
+            "surface_m2": rng.choice([100, 102, 300, None]),
+        }
+        for i in range(120)
+    ]
+    blocked = dq_service.find_duplicate_candidates("org", EntityType.PROPERTY, props)
+    assert {(c["left_entity_id"], c["right_entity_id"]) for c in blocked} == _brute_force_pairs(EntityType.PROPERTY, props)
+
+def test_blocked_candidates_skip_existing_pairs():
+    leads = [
+        {"id": "l1", "email": "a@x.com"},
+        {"id": "l2", "email": "a@x.com"},
+        {"id": "l3", "email": "a@x.com"},
+    ]
+    candidates = dq_service.find_duplicate_candidates("org", EntityType.LEAD, leads, existing_pairs={("l2", "l1")})
+    assert {(c["left_entity_id"], c["right_entity_id"]) for c in candidates} == {("l1", "l3"), ("l2", "l3")}
+    assert all(c["org_id"] == "org" and c["status"] == "suggested_merge" for c in candidates)
+
+def test_unblocked_signals_cannot_reach_threshold():
+    # Pairs that share no blocking key may only match on name / price / surface.
+    lead_score, _ = dq_service.calculate_similarity_score(
+        EntityType.LEAD, {"name": "Toni"}, {"name": "Toni"}
+    )
+    prop_score, _ = dq_service.calculate_similarity_score(
+        EntityType.PROPERTY, {"price": 1, "surface_m2": 1}, {"price": 1, "surface_m2": 1}
+    )
+    assert lead_score < DUPLICATE_CANDIDATE_THRESHOLD
+    assert prop_score < DUPLICATE_CANDIDATE_THRESHOLD
+
+class _PagedTable:
+    """In-memory table double supporting the keyset pagination chain."""
+
+    def __init__(self, store, name):
+        self.store = store
+        self.name = name
+        self.rows = list(store["tables"].get(name, []))
+        self.limit_n = None
+
+    def select(self, columns, **kwargs):
+        self.store["selects"].append((self.name, columns))
+        return self
+
+    def eq(self, field, value):
+        return self
+
+    def gt(self, field, value):
+        self.rows = [r for r in self.rows if r[field] > value]
+        return self
+
+    def order(self, field, desc=False):
+        self.rows.sort(key=lambda r: r[field])
+        return self
+
+    def limit(self, n):
+        self.limit_n = n
+        return self
+
+    def delete(self):
+        return self
+
+    def insert(self, rows):
+        self.store["inserts"].append((self.name, list(rows)))
+        return self
+
+    def execute(self):
+        result = MagicMock()
+        result.data = self.rows[: self.limit_n] if self.limit_n else self.rows
+        return result
+
+@pytest.mark.asyncio
+async def test_recompute_all_streams_pages_and_flushes_in_chunks():
+    leads = [{"id": f"l{i:02d}", "name": "Toni", "email": "dup@x.com" if i < 3 else None, "phone": None} for i in range(5)]
+    store = {"tables": {"leads": leads, "properties": []}, "selects": [], "inserts": []}
+
+    threads = []
+
+    def table(name):
+        if name == "leads":
+            threads.append(threading.current_thread())
+        return _PagedTable(store, name)
+
+    with patch("backend.services.dq_service.supabase_service") as mock_sb, \
+            patch("backend.services.dq_service.DQ_WRITE_CHUNK_SIZE", 1):
+        mock_sb.client.table = table
+        await dq_service.recompute_all("org", page_size=2)
+
+    # Paging and scoring run on the DB pool, not on the event loop thread.
+    assert threads and threading.current_thread() not in threads
+
+    lead_selects = [cols for table, cols in store["selects"] if table == "leads"]
+    assert lead_selects == ["id,name,email,phone"] * 3  # 2 + 2 + 1 rows
+    issue_batches = [rows for table, rows in store["inserts"] if table == "dq_quality_issues"]
+    assert [len(rows) for rows in issue_batches] == [1, 1]  # l03, l04 lack contact
+    candidates = [r for table, rows in store["inserts"] if table == "dq_entity_candidates" for r in rows]
+    assert {(c["left_entity_id"], c["right_entity_id"]) for c in candidates} == {("l00", "l01"), ("l00", "l02"), ("l01", "l02")}
+
+class _FilteringTable(_PagedTable):
+    """Adds the filters used by the single-entity blocking lookup."""
+
+    def neq(self, field, value):
+        self.rows = [r for r in self.rows if r.get(field) != value]
+        return self
+
+    def ilike(self, field, pattern):
+        self.rows = [r for r in self.rows if (r.get(field) or "").lower() == pattern.lower()]
+        return self
+
+    def in_(self, field, values):
+        self.rows = [r for r in self.rows if r.get(field) in values]
+        return self
+
+    def or_(self, expr):
+        return self
+
+    def eq(self, field, value):
+        if field != "org_id":
+            self.store["eq"].append((self.name, field, value))
+        return self
+
+@pytest.mark.asyncio
+async def test_evaluate_entity_replaces_issues_and_links_blocked_neighbours():
+    leads = [
+        {"id": "l1", "name": "Toni", "email": "TONI@nexus.ai", "phone": None},
+        {"id": "l2", "name": "Toni", "email": None, "phone": "+34 600 111 222"},
+        {"id": "l3", "name": "Ana", "email": "ana@nexus.ai", "phone": "971000000"},
+    ]
+    store = {"tables": {"leads": leads, "dq_entity_candidates": []}, "selects": [], "inserts": [], "eq": []}
+    new_lead = {"id": "l9", "name": "Toni", "email": "toni@nexus.ai", "phone": "600111222"}
+
+    with patch("backend.services.dq_service.supabase_service") as mock_sb:
+        mock_sb.client.table = lambda name: _FilteringTable(store, name)
+        result = await dq_service.evaluate_entity("org", EntityType.LEAD, new_lead)
+
+    assert ("dq_quality_issues", "entity_id", "l9") in store["eq"]
+    candidates = [r for table, rows in store["inserts"] if table == "dq_entity_candidates" for r in rows]
+    assert {(c["left_entity_id"], c["right_entity_id"]) for c in candidates} == {("l1", "l9"), ("l2", "l9")}
+    assert result == {"issues": 0, "candidates": 2}
+
+@pytest.mark.asyncio
+async def test_evaluate_entity_safe_swallows_errors():
+    with patch.object(dq_service, "evaluate_entity", side_effect=RuntimeError("db down")):
+        await dq_service.evaluate_entity_safe("org", EntityType.LEAD, {"id": "l1"})
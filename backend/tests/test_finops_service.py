@@ -0,0 +1,220 @@
+"""
+Unit tests for FinOpsService — mocked Supabase.
+Feature: ANCLORA-CGF-001
+
+Tests:
+  - Budget status reads the monthly ledger instead of raw events
+  - Raw event scan fallback when the ledger is unavailable
+  - Ledger reconciliation runs in one database call; the raw fallback pages events
+  - Budget status cache hits and write-through invalidation
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from backend.models.finops import BudgetUpdate, UsageEventSchema
+from backend.services.finops import LEDGER_TABLE, RECONCILE_LEDGER_FN, FinOpsService
+
+
+ORG_ID = "00000000-0000-0000-0000-000000000001"
+
+POLICY = {
+    "org_id": ORG_ID,
+    "monthly_budget_eur": 100.0,
+    "warning_threshold_pct": 80.0,
+    "hard_stop_threshold_pct": 100.0,
+    "hard_stop_enabled": True,
+}
+
+
+class MockQuery:
+    """Chainable query double recording the tables that were read."""
+
+    def __init__(self, client: "MockClient", table: str):
+        self.client = client
+        self.table = table
+
+    def __getattr__(self, name):
+        if name in ("select", "eq", "gte", "gt", "lt", "limit", "order", "single"):
+            return lambda *args, **kwargs: self
+        raise AttributeError(name)
+
+    def upsert(self, record, **kwargs):
+        self.client.upserts.append((self.table, record, kwargs))
+        return self
+
+    def execute(self):
+        self.client.reads.append(self.table)
+        if self.table in self.client.missing:
+            raise Exception(f"relation {self.table} does not exist")
+        result = MagicMock()
+        result.data = self.client.data.get(self.table, [])
+        return result
+
+
+class MockClient:
+    def __init__(self, data: dict, missing: set | None = None):
+        self.data = data
+        self.missing = missing or set()
+        self.reads: list[str] = []
+        self.upserts: list = []
+        self.rpcs: list = []
+
+    def table(self, name: str) -> MockQuery:
+        return MockQuery(self, name)
+
+    def rpc(self, fn: str, params: dict) -> MockQuery:
+        self.rpcs.append((fn, params))
+        return MockQuery(self, f"rpc:{fn}")
+
+
+def make_service(client: MockClient) -> FinOpsService:
+    service = FinOpsService()
+    service.client = client
+    return service
+
+
+class TestMonthlyLedger:
+    @pytest.mark.asyncio
+    async def test_budget_status_reads_ledger(self) -> None:
+        client = MockClient({
+            "org_cost_policies": POLICY,
+            LEDGER_TABLE: [{"total_cost_eur": 85.0, "event_count": 3}],
+            "org_cost_usage_events": [{"cost_eur": 1.0}],
+        })
+        status = await make_service(client).get_budget_status(ORG_ID)
+
+        assert status.current_usage_eur == 85.0
+        assert status.status == "warning"
+        assert "org_cost_usage_events" not in client.reads
+
+    @pytest.mark.asyncio
+    async def test_budget_status_without_ledger_row_is_zero(self) -> None:
+        client = MockClient({"org_cost_policies": POLICY, LEDGER_TABLE: []})
+        status = await make_service(client).get_budget_status(ORG_ID)
+
+        assert status.current_usage_eur == 0
+        assert status.status == "ok"
+
+    @pytest.mark.asyncio
+    async def test_budget_status_falls_back_to_raw_events(self) -> None:
+        client = MockClient(
+            {
+                "org_cost_policies": POLICY,
+                "org_cost_usage_events": [{"cost_eur": 60.0}, {"cost_eur": 45.0}],
+            },
+            missing={LEDGER_TABLE},
+        )
+        status = await make_service(client).get_budget_status(ORG_ID)
+
+        assert status.current_usage_eur == 105.0
+        assert status.status == "hard_stop"
+
+    @pytest.mark.asyncio
+    async def test_reconcile_runs_in_database(self) -> None:
+        client = MockClient({
+            LEDGER_TABLE: [{"total_cost_eur": 10.0, "event_count": 1}],
+            f"rpc:{RECONCILE_LEDGER_FN}": [{"ledger_total_eur": 10.0, "raw_total_eur": 12.5, "raw_event_count": 2}],
+        })
+        result = await make_service(client).reconcile_ledger(ORG_ID, month_key="2026-02")
+
+        assert client.rpcs == [(RECONCILE_LEDGER_FN, {"p_org_id": ORG_ID, "p_month_key": "2026-02"})]
+        assert result.raw_total_eur == 12.5
+        assert result.drift_eur == -2.5
+        assert result.event_count == 2
+        assert result.corrected is True
+        # No client-side read-modify-write of the ledger or the raw events.
+        assert client.upserts == []
+        assert "org_cost_usage_events" not in client.reads
+
+    @pytest.mark.asyncio
+    async def test_reconcile_without_ledger_only_reports(self) -> None:
+        client = MockClient({"org_cost_usage_events": [{"id": "e1", "cost_eur": 7.5}]}, missing={LEDGER_TABLE})
+        result = await make_service(client).reconcile_ledger(ORG_ID, month_key="2026-02")
+
+        assert result.raw_total_eur == 7.5
+        assert result.corrected is False
+        assert client.rpcs == [] and client.upserts == []
+
+    def test_raw_usage_is_summed_in_pages(self, monkeypatch) -> None:
+        monkeypatch.setattr("backend.services.finops.USAGE_PAGE_SIZE", 2)
+        events = [{"id": f"e{n}", "cost_eur": 1.5} for n in range(5)]
+        pages = [events[:2], events[2:4], events[4:]]
+
+        class PagedData(dict):
+            def get(self, table, default=None):
+                return pages.pop(0)
+
+        client = MockClient(PagedData())
+
+        assert make_service(client)._sum_raw_usage(ORG_ID, "2026-02") == (7.5, 5)
+        assert client.reads == ["org_cost_usage_events"] * 3
+
+    def test_month_bounds_roll_over_year(self) -> None:
+        start, end = FinOpsService()._month_bounds("2026-12")
+        assert start.startswith("2026-12-01")
+        assert end.startswith("2027-01-01")
+
+
+class TestBudgetStatusCache:
+    @pytest.mark.asyncio
+    async def test_repeated_checks_hit_cache(self) -> None:
+        client = MockClient({"org_cost_policies": POLICY, LEDGER_TABLE: [{"total_cost_eur": 10.0}]})
+        service = make_service(client)
+
+        await service.get_budget_status(ORG_ID)
+        reads = len(client.reads)
+        for _ in range(5):
+            status = await service.get_budget_status(ORG_ID)
+
+        assert status.current_usage_eur == 10.0
+        assert len(client.reads) == reads
+        stats = service.budget_cache_stats()
+        assert stats["hits"] == 5
+        assert stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_policy_update_invalidates(self) -> None:
+        client = MockClient({"org_cost_policies": POLICY, LEDGER_TABLE: [{"total_cost_eur": 90.0}]})
+        service = make_service(client)
+        client.table = lambda name: UpdatableQuery(client, name)
+
+        assert (await service.get_budget_status(ORG_ID)).status == "warning"
+        client.data["org_cost_policies"] = {**POLICY, "monthly_budget_eur": 1000.0}
+        status = await service.update_budget_policy(ORG_ID, BudgetUpdate(monthly_budget_eur=1000.0))
+
+        assert status.status == "ok"
+
+    @pytest.mark.asyncio
+    async def test_log_usage_event_invalidates(self) -> None:
+        service = make_service(MockClient({}))
+        service._budget_cache[ORG_ID] = (float("inf"), MagicMock())
+
+        with patch.object(service, "get_budget_status", side_effect=RuntimeError("stop")):
+            service.client.table = lambda name: UpdatableQuery(service.client, name)
+            service.client.data["org_cost_usage_events"] = [{"id": "e1"}]
+            with pytest.raises(RuntimeError):
+                await service.log_usage_event(
+                    ORG_ID, UsageEventSchema(capability_code="llm", units=1, cost_eur=0.5)
+                )
+
+        assert ORG_ID not in service._budget_cache
+
+    @pytest.mark.asyncio
+    async def test_ttl_zero_disables_cache(self) -> None:
+        client = MockClient({"org_cost_policies": POLICY, LEDGER_TABLE: []})
+        service = make_service(client)
+        service.budget_cache_ttl_seconds = 0
+
+        await service.get_budget_status(ORG_ID)
+        await service.get_budget_status(ORG_ID)
+
+        assert service.budget_cache_stats()["entries"] == 0
+
+
+class UpdatableQuery(MockQuery):
+    def update(self, data):
+        return self
+
+    def insert(self, data):
+        return self
@@ -0,0 +1,173 @@
+"""
+Unit tests for JobQueueService — background job subsystem.
+
+Tests:
+  - Jobs run on the worker pool and record result and progress
+  - Active jobs are deduplicated per org and job type
+  - Queued and running jobs can be cancelled
+  - Handler failures and invalid params are surfaced
+  - Running jobs heartbeat; table access runs off the event loop
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from backend.models.jobs import JobStatus, JobType
+from backend.services.job_queue import JobQueueService, _validate_feed_publish
+
+
+@pytest.fixture(autouse=True)
+def no_jobs_table():
+    with patch.object(JobQueueService, "_table_exists", return_value=False):
+        yield
+
+
+def _wait_for(queue: JobQueueService, org_id: str, job_id: str, *statuses: JobStatus) -> None:
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        with queue._lock:
+            if queue._jobs[job_id]["status"] in statuses:
+                return
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} never reached {statuses}")
+
+
+class TestJobQueue:
+    @pytest.mark.asyncio
+    async def test_job_runs_and_records_result(self) -> None:
+        queue = JobQueueService(max_workers=1)
+
+        async def handler(ctx, org_id, params):
+            ctx.report(0.5, "halfway")
+            return {"org_id": org_id, "value": params["value"]}
+
+        queue.register(JobType.DQ_RECOMPUTE, handler)
+        job = await queue.enqueue("org-1", JobType.DQ_RECOMPUTE, {"value": 3})
+        assert job.status == JobStatus.QUEUED
+
+        _wait_for(queue, "org-1", job.id, JobStatus.SUCCEEDED)
+        done = await queue.get_job("org-1", job.id)
+        assert done.result == {"org_id": "org-1", "value": 3}
+        assert done.progress == 1.0
+        assert await queue.get_job("org-2", job.id) is None
+
+    @pytest.mark.asyncio
+    async def test_active_jobs_are_deduplicated(self) -> None:
+        queue = JobQueueService(max_workers=2)
+        release = threading.Event()
+
+        async def handler(ctx, org_id, params):
+            release.wait(5)
+            return {}
+
+        queue.register(JobType.MATCH_RECOMPUTE, handler)
+        first = await queue.enqueue("org-1", JobType.MATCH_RECOMPUTE)
+        second = await queue.enqueue("org-1", JobType.MATCH_RECOMPUTE)
+        other_org = await queue.enqueue("org-2", JobType.MATCH_RECOMPUTE)
+
+        assert second.id == first.id and second.deduplicated is True
+        assert other_org.id != first.id
+
+        release.set()
+        _wait_for(queue, "org-1", first.id, JobStatus.SUCCEEDED)
+        again = await queue.enqueue("org-1", JobType.MATCH_RECOMPUTE)
+        assert again.id != first.id
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_and_queued_jobs(self) -> None:
+        queue = JobQueueService(max_workers=1)
+        started = threading.Event()
+        ran = []
+
+        async def looping(ctx, org_id, params):
+            started.set()
+            while True:
+                ctx.report(0.1)
+                time.sleep(0.01)
+
+        async def never(ctx, org_id, params):
+            ran.append(org_id)
+            return {}
+
+        queue.register(JobType.DQ_RECOMPUTE, looping)
+        queue.register(JobType.FEED_PUBLISH, never)
+        running = await queue.enqueue("org-1", JobType.DQ_RECOMPUTE)
+        started.wait(5)
+        queued = await queue.enqueue("org-1", JobType.FEED_PUBLISH)
+
+        cancelled = await queue.cancel("org-1", queued.id)
+        assert cancelled.status == JobStatus.CANCELLED
+
+        await queue.cancel("org-1", running.id)
+        _wait_for(queue, "org-1", running.id, JobStatus.CANCELLED)
+        queue.shutdown(wait=True)
+        assert ran == []
+
+    @pytest.mark.asyncio
+    async def test_failures_and_validation(self, caplog) -> None:
+        queue = JobQueueService(max_workers=1)
+
+        async def failing(ctx, org_id, params):
+            raise RuntimeError("boom")
+
+        queue.register(JobType.RECAP_WEEKLY, failing)
+        job = await queue.enqueue("org-1", JobType.RECAP_WEEKLY)
+        _wait_for(queue, "org-1", job.id, JobStatus.FAILED)
+        assert (await queue.get_job("org-1", job.id)).error == "boom"
+        assert any(job.id in r.getMessage() and r.levelname == "ERROR" for r in caplog.records)
+
+        with pytest.raises(ValueError):
+            await queue.enqueue("org-1", JobType.PROSPECTION_WEEKLY)
+        with pytest.raises(ValueError):
+            _validate_feed_publish({"channel": "unknown"})
+        assert _validate_feed_publish({"channel": " Idealista "})["channel"] == "idealista"
+
+    @pytest.mark.asyncio
+    async def test_silent_job_heartbeats_until_it_finishes(self) -> None:
+        queue = JobQueueService(max_workers=1, heartbeat_seconds=0.02)
+        beats = []
+
+        async def silent(ctx, org_id, params):
+            time.sleep(0.2)  # long stretch without report()
+            return {}
+
+        queue.register(JobType.DQ_RECOMPUTE, silent)
+        with patch.object(queue, "_heartbeat", side_effect=beats.append):
+            job = await queue.enqueue("org-1", JobType.DQ_RECOMPUTE)
+            _wait_for(queue, "org-1", job.id, JobStatus.SUCCEEDED)
+            queue.shutdown(wait=True)
+            finished_beats = len(beats)
+            time.sleep(0.1)
+
+        assert finished_beats >= 3 and set(beats) == {job.id}
+        assert len(beats) == finished_beats
+
+    @pytest.mark.asyncio
+    async def test_table_access_runs_off_the_event_loop(self) -> None:
+        queue = JobQueueService(max_workers=1)
+        loop_thread = threading.current_thread()
+        threads = []
+
+        def record(result):
+            def call(*args, **kwargs):
+                threads.append(threading.current_thread())
+                return result
+            return call
+
+        async def handler(ctx, org_id, params):
+            return {}
+
+        queue.register(JobType.DQ_RECOMPUTE, handler)
+        with patch.object(queue, "_insert_row", side_effect=record(None)), \
+                patch.object(queue, "_fetch_row", side_effect=record(None)), \
+                patch.object(queue, "_fetch_rows", side_effect=record([])):
+            job = await queue.enqueue("org-1", JobType.DQ_RECOMPUTE)
+            _wait_for(queue, "org-1", job.id, JobStatus.SUCCEEDED)
+            assert await queue.get_job("org-1", "missing") is None
+            assert (await queue.list_jobs("org-1")).total == 1
+
+        assert len(threads) == 3
+        assert all(t is not loop_thread for t in threads)
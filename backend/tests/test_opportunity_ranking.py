@@ -0,0 +1,56 @@
+"""
+Unit tests for opportunity ranking primitives.
+
+Tests:
+  - Composite score, motivation scaling and priority bands
+  - The score upper bound holds for any commission/motivation
+  - TopKSelector keeps the k best with stable tie-breaking
+"""
+
+import random
+
+from backend.services.opportunity_ranking import (
+    TopKSelector,
+    normalize_motivation,
+    opportunity_score,
+    opportunity_upper_bound,
+    priority_band,
+)
+
+
+class TestOpportunityScore:
+    def test_weights_and_bands(self) -> None:
+        assert opportunity_score(80, 100, 80) == 84.0
+        assert normalize_motivation(8) == 80.0
+        assert normalize_motivation(45) == 45.0
+        assert [priority_band(s) for s in (75, 74.99, 50, 10)] == ["hot", "warm", "warm", "cold"]
+
+    def test_upper_bound_dominates(self) -> None:
+        rng = random.Random(7)
+        for _ in range(500):
+            match_score = rng.uniform(0, 100)
+            score = opportunity_score(match_score, rng.uniform(0, 100), rng.uniform(0, 100))
+            assert score <= opportunity_upper_bound(match_score)
+
+
+class TestTopKSelector:
+    def test_matches_sorted_slice(self) -> None:
+        rng = random.Random(11)
+        scores = [round(rng.uniform(0, 100), 1) for _ in range(1000)]
+        top = TopKSelector(10)
+        for i, score in enumerate(scores):
+            top.push(score, i)
+
+        expected = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:10]
+        assert top.items() == expected
+
+    def test_ties_keep_first_seen_and_threshold(self) -> None:
+        top = TopKSelector(2)
+        assert top.threshold() is None and top.can_admit(0)
+        top.push(50, "a")
+        top.push(50, "b")
+        assert top.push(50, "c") is False
+        assert top.items() == ["a", "b"]
+        assert top.threshold() == 50
+        assert not top.can_admit(50) and top.can_admit(50.01)
+        assert TopKSelector(0).push(99, "x") is False
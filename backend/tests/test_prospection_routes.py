@@ -97,6 +97,26 @@ class TestPropertyEndpoints:
         assert resp.status_code == 200
         assert resp.json()["scope"]["role"] == "owner"
 
+    @patch("backend.api.routes.prospection.verify_org_membership", new_callable=AsyncMock)
+    @patch("backend.api.routes.prospection.prospection_service")
+    def test_workspace_etag_not_modified(self, mock_svc: MagicMock, mock_verify: MagicMock) -> None:
+        mock_verify.return_value = {"role": "owner"}
+        mock_svc.get_workspace = AsyncMock(return_value={
+            "scope": {"org_id": ORG_ID, "role": "owner", "user_id": None},
+            "totals": {"properties": 0, "buyers": 0, "matches": 0},
+            "meta": {"cache": "hit", "etag": 'W/"abc"'},
+        })
+        resp = client.get("/api/prospection/workspace")
+        assert resp.status_code == 200
+        assert resp.headers["etag"] == 'W/"abc"'
+
+        resp = client.get("/api/prospection/workspace", headers={"If-None-Match": 'W/"abc"'})
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+        resp = client.get("/api/prospection/workspace", headers={"If-None-Match": '"stale"'})
+        assert resp.status_code == 200
+
     @patch("backend.api.routes.prospection.prospection_service")
     def test_workspace_followup_task_action(self, mock_svc: MagicMock) -> None:
         task_id = str(uuid4())
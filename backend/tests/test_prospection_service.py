@@ -9,6 +9,10 @@ Tests:
   - Score consistency through service layer
 """
 
+import threading
+import time
+from datetime import datetime
+
 import pytest
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -18,13 +22,19 @@ from backend.models.prospection import (
     ActivityCreate,
     ActivityType,
     BuyerCreate,
+    BuyerUpdate,
     MatchUpdate,
     MatchStatus,
     PropertyCreate,
     PropertyUpdate,
     RecomputeResponse,
 )
-from backend.services.prospection_service import ProspectionService
+from backend.services.prospection_service import (
+    ProspectionService,
+    decode_property_cursor,
+    encode_property_cursor,
+)
+from backend.services.scoring_service import CompiledMatchScorer
 
 
 ORG_A = str(uuid4())
@@ -64,6 +74,9 @@ class MockSupabaseQuery:
     def gte(self, field: str, value) -> "MockSupabaseQuery":
         return self
 
+    def gt(self, field: str, value) -> "MockSupabaseQuery":
+        return self
+
     def lte(self, field: str, value) -> "MockSupabaseQuery":
         return self
 
@@ -166,6 +179,171 @@ class TestPropertyCRUD:
         assert result is None
 
 
+class RecordingQuery(MockSupabaseQuery):
+    """Query mock that records the chain and serves range() slices of its rows."""
+
+    def __init__(self, data: list):
+        super().__init__(data)
+        self.calls: list[tuple] = []
+        self._slice = slice(None)
+
+    def __getattribute__(self, name: str):
+        attr = object.__getattribute__(self, name)
+        if name in {"select", "eq", "in_", "gte", "order", "or_", "limit", "range", "update"}:
+            def recorded(*args, **kwargs):
+                self.calls.append((name, args, kwargs))
+                return attr(*args, **kwargs)
+            return recorded
+        return attr
+
+    def order(self, field: str, desc: bool = False, nullsfirst=None) -> "RecordingQuery":
+        return self
+
+    def or_(self, filters: str) -> "RecordingQuery":
+        return self
+
+    def is_(self, field: str, value) -> "RecordingQuery":
+        return self
+
+    @property
+    def not_(self) -> "RecordingQuery":
+        self.calls.append(("not_", (), {}))
+        return self
+
+    def upsert(self, rows: list, **kwargs) -> "RecordingQuery":
+        self.calls.append(("upsert", (rows,), kwargs))
+        return self
+
+    def limit(self, n: int) -> "RecordingQuery":
+        return self
+
+    def range(self, start: int, end: int) -> "RecordingQuery":
+        self._slice = slice(start, end + 1)
+        return self
+
+    def execute(self) -> MagicMock:
+        result = MagicMock()
+        result.data = self._data[self._slice]
+        result.count = len(self._data)
+        return result
+
+
+class TestPropertyListing:
+    @pytest.fixture()
+    def service(self) -> ProspectionService:
+        return ProspectionService()
+
+    def _rows(self, n: int) -> list[dict]:
+        return [
+            {
+                "id": str(uuid4()),
+                "org_id": ORG_A,
+                "title": f"Villa {i}",
+                "high_ticket_score": 50 + i,
+                "best_match_score": 90 - i,
+            }
+            for i in range(n)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_filters_and_page_bound_are_pushed_down(self, service: ProspectionService) -> None:
+        """A page is one ordered, bounded query; next_cursor points at its last row."""
+        queries: list[RecordingQuery] = []
+
+        def mock_table(name: str):
+            query = RecordingQuery([] if name == "property_buyer_matches" else self._rows(10))
+            queries.append(query)
+            return query
+
+        with patch("backend.services.prospection_service.supabase_service") as mock_sb, patch.object(
+            ProspectionService, "_table_has_column", return_value=True
+        ), patch.object(ProspectionService, "_property_tables", return_value=["properties"]):
+            mock_sb.client.table = mock_table
+            result = await service.list_properties(ORG_A, zone="Andratx", min_score=50, limit=3)
+
+        # The matched set is precomputed (migration 040): no match rows are read.
+        assert len(queries) == 1
+        calls = queries[-1].calls
+        assert ("eq", ("org_id", ORG_A), {}) in calls and ("not_", (), {}) in calls
+        assert ("eq", ("zone", "Andratx"), {}) in calls
+        # Matched properties rank and filter by their best match score.
+        assert ("gte", ("best_match_score", 50), {}) in calls
+        assert ("order", ("best_match_score",), {"desc": True, "nullsfirst": False}) in calls
+        assert ("order", ("id",), {"desc": True}) in calls
+        assert ("range", (0, 3), {}) in calls
+        assert [i["title"] for i in result["items"]] == ["Villa 0", "Villa 1", "Villa 2"]
+        assert result["total"] == 10
+        assert decode_property_cursor(result["next_cursor"]) == (88.0, result["items"][-1]["id"])
+
+    @pytest.mark.asyncio
+    async def test_cursor_page_uses_keyset_filter(self, service: ProspectionService) -> None:
+        last_id = str(uuid4())
+        cursor = encode_property_cursor({"id": last_id, "best_match_score": 75}, "best_match_score")
+        queries: list[RecordingQuery] = []
+
+        def mock_table(name: str):
+            query = RecordingQuery([] if name == "property_buyer_matches" else self._rows(2))
+            queries.append(query)
+            return query
+
+        with patch("backend.services.prospection_service.supabase_service") as mock_sb, patch.object(
+            ProspectionService, "_table_has_column", return_value=True
+        ), patch.object(ProspectionService, "_property_tables", return_value=["properties"]):
+            mock_sb.client.table = mock_table
+            result = await service.list_properties(ORG_A, limit=3, offset=40, cursor=cursor)
+
+        calls = queries[-1].calls
+        assert (
+            "or_",
+            (f"best_match_score.lt.75.0,and(best_match_score.eq.75.0,id.lt.{last_id}),best_match_score.is.null",),
+            {},
+        ) in calls
+        assert ("range", (0, 3), {}) in calls
+        assert ("select", ("*",), {"count": None}) in calls
+        assert result["total"] is None
+        assert result["next_cursor"] is None
+        assert len(result["items"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_matched_ids_fallback_without_precomputed_column(self, service: ProspectionService) -> None:
+        rows = [{k: v for k, v in row.items() if k != "best_match_score"} for row in self._rows(3)]
+        matches = [
+            {"property_id": rows[1]["id"], "match_score": 70},
+            {"property_id": rows[1]["id"], "match_score": 80},
+            {"property_id": rows[0]["id"], "match_score": 40},
+            {"property_id": rows[2]["id"], "match_score": 90},
+        ]
+        queries: dict[str, RecordingQuery] = {}
+
+        def mock_table(name: str):
+            queries[name] = RecordingQuery(matches if name == "property_buyer_matches" else rows)
+            return queries[name]
+
+        async def has_column(_self, table: str, column: str) -> bool:
+            return column != "best_match_score"
+
+        with patch("backend.services.prospection_service.supabase_service") as mock_sb, patch.object(
+            ProspectionService, "_table_has_column", has_column
+        ), patch.object(ProspectionService, "_property_tables", return_value=["properties"]):
+            mock_sb.client.table = mock_table
+            result = await service.list_properties(ORG_A, min_score=50, limit=1)
+            cursor_page = await service.list_properties(ORG_A, min_score=50, limit=1, cursor=result["next_cursor"])
+
+        assert ("in_", ("id", [rows[1]["id"], rows[0]["id"], rows[2]["id"]]), {}) in queries["properties"].calls
+        # Ranked by best match score (90, 80); the 40 match is below min_score.
+        assert [i["id"] for i in result["items"]] == [rows[2]["id"]]
+        assert result["total"] == 2
+        assert decode_property_cursor(result["next_cursor"]) == (90.0, rows[2]["id"])
+        assert [i["id"] for i in cursor_page["items"]] == [rows[1]["id"]]
+        assert cursor_page["next_cursor"] is None
+
+    def test_cursor_round_trip_and_validation(self) -> None:
+        row_id = str(uuid4())
+        assert decode_property_cursor(encode_property_cursor({"id": row_id, "high_ticket_score": None})) == (None, row_id)
+        with pytest.raises(ValueError):
+            decode_property_cursor("not-a-cursor")
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # BUYER CRUD
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -259,6 +437,12 @@ class TestMatchOperations:
             def update(self, data):
                 return self
 
+            def upsert(self, records, **kwargs):
+                nonlocal call_count
+                call_count += 1
+                self.data = list(records)
+                return self
+
             def execute(self):
                 result = MagicMock()
                 result.data = self.data
@@ -281,6 +465,293 @@ class TestMatchOperations:
         assert isinstance(result, RecomputeResponse)
         assert result.matches_created == 1
         assert result.total_computed == 1
+        assert result.chunks_written == 1
+        assert call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_recompute_bulk_upserts_in_chunks(self, service: ProspectionService) -> None:
+        """Recompute writes pairs in bounded upsert chunks and keeps existing status."""
+        properties = [
+            {"id": str(uuid4()), "org_id": ORG_A, "price": 1500000 + i * 100000,
+             "zone": "Andratx", "property_type": "villa", "status": "new"}
+            for i in range(3)
+        ]
+        buyers = [
+            {"id": str(uuid4()), "org_id": ORG_A, "budget_min": 1000000,
+             "budget_max": 3000000, "preferred_zones": ["Andratx"],
+             "preferred_types": ["villa"], "status": "active"}
+            for _ in range(2)
+        ]
+        existing = [{"id": str(uuid4()), "property_id": properties[0]["id"], "buyer_id": buyers[0]["id"]}]
+        upserts: list[tuple[list, dict]] = []
+
+        class MockTableChain:
+            def __init__(self, data=None):
+                self.data = data or []
+
+            def select(self, *args, **kwargs): return self
+            def eq(self, *args): return self
+            def neq(self, *args): return self
+            def gt(self, *args): return self
+            def in_(self, *args): return self
+            def order(self, *args, **kwargs): return self
+            def limit(self, *args): return self
+
+            def upsert(self, records, **kwargs):
+                upserts.append((list(records), kwargs))
+                return self
+
+            def execute(self):
+                result = MagicMock()
+                result.data = self.data
+                return result
+
+        def mock_table(name: str):
+            if name == "prospected_properties":
+                return MockTableChain(properties)
+            elif name == "buyer_profiles":
+                return MockTableChain(buyers)
+            elif name == "property_buyer_matches":
+                return MockTableChain(existing)
+            return MockTableChain()
+
+        scoring_threads: list[str] = []
+        score_pair = CompiledMatchScorer.score_pair
+
+        def recording_score_pair(*args):
+            scoring_threads.append(threading.current_thread().name)
+            return score_pair(*args)
+
+        with patch("backend.services.prospection_service.supabase_service") as mock_sb, patch.object(
+            CompiledMatchScorer, "score_pair", side_effect=recording_score_pair
+        ):
+            mock_sb.client.table = mock_table
+            result = await service.recompute_matches(ORG_A, chunk_size=2)
+
+        # Scoring runs on the DB pool, not on the event loop thread.
+        assert scoring_threads and threading.current_thread().name not in scoring_threads
+        assert result.matches_created == 5
+        assert result.matches_updated == 1
+        assert result.total_computed == 6
+        # 5 new rows -> 3 chunks of <=2, 1 existing row -> 1 chunk
+        assert result.chunks_written == 4
+        assert all(len(rows) <= 2 for rows, _ in upserts)
+        assert all(kw["on_conflict"] == "property_id,buyer_id" for _, kw in upserts)
+        # New pairs never overwrite an existing row (ON CONFLICT DO NOTHING).
+        assert all(kw["ignore_duplicates"] == ("match_status" in rows[0]) for rows, kw in upserts)
+        refreshed = [r for rows, _ in upserts for r in rows if "match_status" not in r]
+        assert len(refreshed) == 1
+        assert refreshed[0]["property_id"] == properties[0]["id"]
+
+    @pytest.mark.asyncio
+    async def test_recompute_reads_existing_pairs_past_the_row_cap(
+        self, service: ProspectionService, monkeypatch
+    ) -> None:
+        """Existing pairs are keyset-paged, so none past one page is re-inserted as a candidate."""
+        monkeypatch.setattr("backend.services.prospection_service.RECOMPUTE_PAGE_SIZE", 2)
+        prop = {"id": str(uuid4()), "org_id": ORG_A, "price": 2000000, "zone": "Andratx",
+                "property_type": "villa", "status": "new"}
+        buyers = [
+            {"id": str(uuid4()), "org_id": ORG_A, "budget_min": 1000000,
+             "budget_max": 3000000, "status": "active"}
+            for _ in range(5)
+        ]
+        existing = [
+            {"id": str(uuid4()), "property_id": prop["id"], "buyer_id": b["id"]} for b in buyers[:4]
+        ]
+        upserts: list[tuple[list, dict]] = []
+
+        class PagedTable:
+            """Honors the gt/limit keyset window, like PostgREST under max_rows."""
+
+            def __init__(self, data):
+                self.rows = sorted(data, key=lambda r: r["id"])
+                self.after = None
+                self.size = None
+
+            def select(self, *args, **kwargs): return self
+            def eq(self, *args): return self
+            def neq(self, *args): return self
+            def in_(self, *args): return self
+            def order(self, *args, **kwargs): return self
+
+            def gt(self, field, value):
+                self.after = value
+                return self
+
+            def limit(self, size):
+                self.size = size
+                return self
+
+            def upsert(self, records, **kwargs):
+                upserts.append((list(records), kwargs))
+                self.rows = []
+                return self
+
+            def execute(self):
+                rows = [r for r in self.rows if self.after is None or r["id"] > self.after]
+                result = MagicMock()
+                result.data = rows[:self.size] if self.size else rows
+                return result
+
+        tables = {"prospected_properties": [prop], "buyer_profiles": buyers, "property_buyer_matches": existing}
+        with patch("backend.services.prospection_service.supabase_service") as mock_sb:
+            mock_sb.client.table = lambda name: PagedTable(tables.get(name, []))
+            result = await service.recompute_matches(ORG_A)
+
+        assert result.matches_created == 1
+        assert result.matches_updated == 4
+        (created,) = [rows for rows, kw in upserts if kw["ignore_duplicates"]]
+        assert [r["buyer_id"] for r in created] == [buyers[4]["id"]]
+
+
+    @staticmethod
+    def _dirty_fixture() -> tuple[list[dict], list[dict]]:
+        properties = [
+            {"id": str(uuid4()), "org_id": ORG_A, "price": 2000000, "zone": "Andratx",
+             "property_type": "villa", "status": "new"}
+            for _ in range(3)
+        ]
+        buyers = [
+            {"id": str(uuid4()), "org_id": ORG_A, "budget_min": 1000000,
+             "budget_max": 3000000, "status": "active"}
+            for _ in range(2)
+        ]
+        return properties, buyers
+
+    @staticmethod
+    def _stateful_tables(tables: dict[str, list[dict]], upserted: list[dict]):
+        """Table mock whose updates apply the eq/in_/lte filters to the stored rows."""
+
+        class StatefulTable:
+            def __init__(self, rows: list[dict]):
+                self.rows = rows
+                self.filters: list = []
+                self.payload: dict | None = None
+
+            def select(self, *args, **kwargs): return self
+            def neq(self, *args): return self
+            def gt(self, *args): return self
+            def order(self, *args, **kwargs): return self
+            def limit(self, *args): return self
+
+            def eq(self, field, value):
+                if field == "id":
+                    self.filters.append(lambda r: r["id"] == value)
+                return self
+
+            def in_(self, field, values):
+                if field == "id":
+                    self.filters.append(lambda r: r["id"] in values)
+                return self
+
+            def lte(self, field, value):
+                self.filters.append(
+                    lambda r: r.get(field) is not None
+                    and datetime.fromisoformat(r[field]) <= datetime.fromisoformat(value)
+                )
+                return self
+
+            def update(self, data):
+                self.payload = data
+                return self
+
+            def upsert(self, records, **kwargs):
+                upserted.extend(records)
+                return self
+
+            def execute(self):
+                matched = [r for r in self.rows if all(f(r) for f in self.filters)]
+                if self.payload is not None:
+                    for row in matched:
+                        row.update(self.payload)
+                result = MagicMock()
+                result.data = [dict(r) for r in matched]
+                return result
+
+        return lambda name: StatefulTable(tables.get(name, []))
+
+    @pytest.mark.asyncio
+    async def test_incremental_recompute_scores_only_dirty_pairs(self, service: ProspectionService) -> None:
+        """Incremental recompute rescores the stamped buyer column and skips stable pairs."""
+        properties, buyers = self._dirty_fixture()
+        upserted: list[dict] = []
+        tables = {"prospected_properties": properties, "buyer_profiles": buyers}
+
+        with patch("backend.services.prospection_service.supabase_service") as mock_sb, patch.object(
+            ProspectionService, "_table_has_column", return_value=True
+        ):
+            mock_sb.client.table = self._stateful_tables(tables, upserted)
+            await service.update_buyer(
+                ORG_A, buyers[0]["id"], BuyerUpdate(budget_max=Decimal("2500000"))
+            )
+            # The mark is persisted on the row, not in this worker's memory.
+            assert buyers[0]["match_dirty_at"]
+            assert not service._dirty_buyers
+            result = await service.recompute_matches(ORG_A, incremental=True)
+            second = await service.recompute_matches(ORG_A, incremental=True)
+
+        assert result.pairs_rescored == 3
+        assert result.pairs_skipped == 3
+        assert {row["buyer_id"] for row in upserted} == {buyers[0]["id"]}
+        # The stamp is cleared by the first run
+        assert buyers[0]["match_dirty_at"] is None
+        assert second.pairs_rescored == 0
+        assert second.pairs_skipped == 6
+
+    @pytest.mark.asyncio
+    async def test_incremental_recompute_keeps_marks_made_during_the_run(
+        self, service: ProspectionService
+    ) -> None:
+        """A row stamped again while a recompute is scoring stays dirty for the next run."""
+        properties, buyers = self._dirty_fixture()
+        upserted: list[dict] = []
+        tables = {"prospected_properties": properties, "buyer_profiles": buyers}
+        buyers[0]["match_dirty_at"] = "2026-01-01T00:00:00+00:00"
+        properties[0]["match_dirty_at"] = "2026-01-01T00:00:00+00:00"
+
+        def touch_buyer(fraction, message):
+            # Another worker updates the buyer after the recompute read it.
+            buyers[0]["match_dirty_at"] = "2026-01-01T00:05:00+00:00"
+
+        with patch("backend.services.prospection_service.supabase_service") as mock_sb:
+            mock_sb.client.table = self._stateful_tables(tables, upserted)
+            first = await service.recompute_matches(ORG_A, incremental=True, progress=touch_buyer)
+            second = await service.recompute_matches(ORG_A, incremental=True)
+
+        assert first.pairs_rescored == 4
+        assert properties[0]["match_dirty_at"] is None
+        assert second.pairs_rescored == 3
+        assert buyers[0]["match_dirty_at"] is None
+
+    @pytest.mark.asyncio
+    async def test_incremental_recompute_falls_back_to_memory_marks(
+        self, service: ProspectionService
+    ) -> None:
+        """Without match_dirty_at, marks live in memory and only the snapshotted ones are cleared."""
+        properties, buyers = self._dirty_fixture()
+        upserted: list[dict] = []
+        tables = {"prospected_properties": properties, "buyer_profiles": buyers}
+
+        def touch_property(fraction, message):
+            service._mark_property_dirty(ORG_A, properties[1]["id"])
+
+        with patch("backend.services.prospection_service.supabase_service") as mock_sb, patch.object(
+            ProspectionService, "_table_has_column", return_value=False
+        ):
+            mock_sb.client.table = self._stateful_tables(tables, upserted)
+            await service.update_buyer(
+                ORG_A, buyers[0]["id"], BuyerUpdate(budget_max=Decimal("2500000"))
+            )
+            result = await service.recompute_matches(ORG_A, incremental=True, progress=touch_property)
+            second = await service.recompute_matches(ORG_A, incremental=True)
+            third = await service.recompute_matches(ORG_A, incremental=True)
+
+        assert "match_dirty_at" not in buyers[0]
+        assert result.pairs_rescored == 3
+        # The property marked mid-run is rescored by the next run, then cleared.
+        assert second.pairs_rescored == 2
+        assert third.pairs_rescored == 0
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -339,3 +810,302 @@ class TestActivityLogging:
             mock_sb.client.table.return_value = mock_query
             with pytest.raises(ValueError, match="not found"):
                 await service.log_activity(ORG_A, str(uuid4()), activity_data)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# WORKSPACE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class SlowSupabaseQuery(MockSupabaseQuery):
+    """Query mock whose execute() takes a fixed time, like a network round-trip."""
+
+    def __init__(self, data: list, delay: float):
+        super().__init__(data)
+        self._delay = delay
+
+    def limit(self, n: int) -> "SlowSupabaseQuery":
+        return self
+
+    def execute(self) -> MagicMock:
+        time.sleep(self._delay)
+        return super().execute()
+
+
+class TestWorkspace:
+    @pytest.fixture()
+    def service(self) -> ProspectionService:
+        return ProspectionService()
+
+    @pytest.mark.asyncio
+    async def test_workspace_blocks_run_concurrently(self, service: ProspectionService) -> None:
+        """Workspace blocks overlap and report per-block timings."""
+        prop_id, buyer_id = str(uuid4()), str(uuid4())
+        rows = {
+            "properties": [{"id": prop_id, "org_id": ORG_A, "title": "Villa", "high_ticket_score": 80}],
+            "buyer_profiles": [{"id": buyer_id, "org_id": ORG_A, "full_name": "Buyer", "motivation_score": 70}],
+            "property_buyer_matches": [{"id": str(uuid4()), "property_id": prop_id, "buyer_id": buyer_id, "match_score": 90}],
+        }
+
+        def mock_table(name: str):
+            return SlowSupabaseQuery([dict(r) for r in rows.get(name, [])], delay=0.05)
+
+        with patch("backend.services.prospection_service.supabase_service") as mock_sb:
+            mock_sb.client.table = mock_table
+            # Warm schema probes so only workspace reads are timed.
+            await service.get_workspace(ORG_A, role="owner")
+            started = time.perf_counter()
+            result = await service.get_workspace(ORG_A, role="owner", use_cache=False)
+            elapsed = time.perf_counter() - started
+
+        # properties + matches + enrich (2 parallel lookups) + buyers serially would be >= 0.2s
+        assert elapsed < 0.18
+        assert result["matches"]["items"][0]["buyer_name"] == "Buyer"
+        assert result["totals"] == {"properties": 1, "buyers": 1, "matches": 1}
+        timings = result["meta"]["timings_ms"]
+        assert {"properties", "matches", "enrich_matches", "buyers", "total"} <= set(timings)
+
+    @pytest.mark.asyncio
+    async def test_workspace_snapshot_cache(self, service: ProspectionService) -> None:
+        """Identical reloads are served from cache until a mutation invalidates the org."""
+        rows = {"properties": [{"id": str(uuid4()), "org_id": ORG_A, "title": "Villa", "high_ticket_score": 80}]}
+        calls: list[str] = []
+
+        def mock_table(name: str):
+            calls.append(name)
+            return SlowSupabaseQuery([dict(r) for r in rows.get(name, [])], delay=0)
+
+        with patch("backend.services.prospection_service.supabase_service") as mock_sb:
+            mock_sb.client.table = mock_table
+            first = await service.get_workspace(ORG_A, role="owner")
+            reads = len(calls)
+            second = await service.get_workspace(ORG_A, role="owner")
+            assert len(calls) == reads
+            assert first["meta"]["cache"] == "miss" and second["meta"]["cache"] == "hit"
+            assert second["meta"]["etag"] == first["meta"]["etag"]
+
+            # Other filters and other orgs are separate snapshots.
+            assert (await service.get_workspace(ORG_A, role="owner", offset=25))["meta"]["cache"] == "miss"
+            service._invalidate_workspace(ORG_B)
+            assert (await service.get_workspace(ORG_A, role="owner"))["meta"]["cache"] == "hit"
+
+            second["properties"]["items"].clear()
+            rows["properties"][0]["title"] = "Villa Renovada"
+            await service.update_match(ORG_A, str(uuid4()), MatchUpdate(notes="called"))
+            third = await service.get_workspace(ORG_A, role="owner")
+
+        assert third["meta"]["cache"] == "miss"
+        assert third["properties"]["items"][0]["title"] == "Villa Renovada"
+        assert third["meta"]["etag"] != first["meta"]["etag"]
+        assert service.workspace_cache.stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_ranking_shares_buyer_batch_with_enrichment(self, service: ProspectionService) -> None:
+        """Opportunity ranking reads buyer_profiles once for names and motivation."""
+        prop_id, buyer_id = str(uuid4()), str(uuid4())
+        rows = {
+            "properties": [{"id": prop_id, "org_id": ORG_A, "title": "Villa"}],
+            "buyer_profiles": [{"id": buyer_id, "org_id": ORG_A, "full_name": "Buyer", "motivation_score": 8}],
+            "property_buyer_matches": [
+                {"id": str(uuid4()), "property_id": prop_id, "buyer_id": buyer_id, "match_score": 80,
+                 "commission_estimate": 10000, "match_status": "candidate"},
+            ],
+        }
+        calls: list[str] = []
+
+        def mock_table(name: str):
+            calls.append(name)
+            return SlowSupabaseQuery([dict(r) for r in rows.get(name, [])], delay=0)
+
+        with patch("backend.services.prospection_service.supabase_service") as mock_sb, patch.object(
+            ProspectionService, "_property_tables", return_value=["properties"]
+        ), patch.object(ProspectionService, "_opportunity_columns_ready", return_value=False):
+            mock_sb.client.table = mock_table
+            result = await service.get_opportunity_ranking(ORG_A)
+
+        assert calls.count("buyer_profiles") == 1
+        assert calls.count("properties") == 1
+        item = result["items"][0]
+        assert item["buyer_name"] == "Buyer" and item["property_title"] == "Villa"
+        # 0.65 * 80 + 0.20 * 100 + 0.15 * 80
+        assert item["opportunity_score"] == 84.0
+
+    @pytest.mark.asyncio
+    async def test_ranking_stops_once_top_k_is_settled(self, service: ProspectionService) -> None:
+        """Pages stop once 0.65 * match_score + 35 cannot beat the k-th best."""
+        matches = [
+            {"id": f"m{i:03d}", "property_id": str(uuid4()), "buyer_id": str(uuid4()), "match_score": 100 - i * 0.25}
+            for i in range(400)
+        ]
+        queries: list[RecordingQuery] = []
+
+        def mock_table(name: str):
+            query = RecordingQuery([dict(m) for m in matches] if name == "property_buyer_matches" else [])
+            queries.append(query)
+            return query
+
+        with patch("backend.services.prospection_service.supabase_service") as mock_sb, patch.object(
+            ProspectionService, "_property_tables", return_value=["properties"]
+        ), patch.object(ProspectionService, "_opportunity_columns_ready", return_value=False):
+            mock_sb.client.table = mock_table
+            result = await service.get_opportunity_ranking(ORG_A, limit=5)
+
+        assert [i["match_id"] for i in result["items"]] == ["m000", "m001", "m002", "m003", "m004"]
+        assert result["items"][0]["opportunity_score"] == 65.0
+        # Page 3 ends at match_score 25.25: 0.65 * 25.25 + 35 < 0.65 * 99.0.
+        assert result["meta"] == {"source": "streamed", "scanned": 300, "early_stop": True}
+        assert result["total"] == 300
+
+    @pytest.mark.asyncio
+    async def test_ranking_reads_persisted_scores(self, service: ProspectionService) -> None:
+        """With migration 038 the ranking is one ordered, limited query on opportunity_score."""
+        explanation = {"drivers": {"match_score": 90.0}, "top_factors": [], "confidence": 25.0}
+        matches = [
+            {"id": "m1", "property_id": str(uuid4()), "buyer_id": str(uuid4()), "match_score": 90,
+             "opportunity_score": 80.5, "priority_band": "hot", "opportunity_explanation": explanation,
+             "match_status": "viewing"},
+        ]
+        queries: list[RecordingQuery] = []
+
+        def mock_table(name: str):
+            query = RecordingQuery([dict(m) for m in matches] if name == "property_buyer_matches" else [])
+            queries.append(query)
+            return query
+
+        with patch("backend.services.prospection_service.supabase_service") as mock_sb, patch.object(
+            ProspectionService, "_property_tables", return_value=["properties"]
+        ), patch.object(ProspectionService, "_opportunity_columns_ready", return_value=True), patch.object(
+            ProspectionService, "_unscored_matches_exist", return_value=False
+        ):
+            mock_sb.client.table = mock_table
+            result = await service.get_opportunity_ranking(ORG_A, limit=5, min_opportunity_score=60)
+
+        calls = queries[0].calls
+        assert ("gte", ("opportunity_score", 60), {}) in calls
+        assert ("order", ("opportunity_score",), {"desc": True}) in calls
+        assert ("limit", (5,), {}) in calls
+        item = result["items"][0]
+        assert item["opportunity_score"] == 80.5 and item["priority_band"] == "hot"
+        assert item["explanation"] == explanation
+        assert item["next_action"] == "schedule_decision_followup"
+        assert result["meta"] == {"source": "persisted"}
+
+    @pytest.mark.asyncio
+    async def test_ranking_scores_on_the_fly_while_matches_are_unscored(self, service: ProspectionService) -> None:
+        """Matches created since the last refresh have no opportunity_score yet and must still rank."""
+        matches = [
+            {"id": "m1", "property_id": str(uuid4()), "buyer_id": str(uuid4()), "match_score": 90,
+             "opportunity_score": None, "match_status": "candidate"},
+            {"id": "m2", "property_id": str(uuid4()), "buyer_id": str(uuid4()), "match_score": 40,
+             "opportunity_score": 30.0, "match_status": "candidate"},
+        ]
+        queries: list[RecordingQuery] = []
+
+        def mock_table(name: str):
+            query = RecordingQuery([dict(m) for m in matches] if name == "property_buyer_matches" else [])
+            queries.append(query)
+            return query
+
+        with patch("backend.services.prospection_service.supabase_service") as mock_sb, patch.object(
+            ProspectionService, "_property_tables", return_value=["properties"]
+        ), patch.object(ProspectionService, "_opportunity_columns_ready", return_value=True):
+            mock_sb.client.table = mock_table
+            result = await service.get_opportunity_ranking(ORG_A, limit=5)
+
+        assert result["meta"]["source"] == "streamed"
+        assert [item["match_id"] for item in result["items"]] == ["m1", "m2"]
+
+    def _refresh_tables(self, service: ProspectionService) -> tuple[str, dict]:
+        buyer_id = str(uuid4())
+        fresh = {"id": "m1", "org_id": ORG_A, "property_id": str(uuid4()), "buyer_id": buyer_id,
+                 "match_score": 80, "commission_estimate": 10000, "opportunity_basis": 10000}
+        fresh.update(service._score_opportunity(fresh, {"motivation_score": 8}, 10000.0))
+        stale = {"id": "m2", "org_id": ORG_A, "property_id": str(uuid4()), "buyer_id": buyer_id,
+                 "match_score": 60, "commission_estimate": 5000, "opportunity_score": 10}
+        return buyer_id, {
+            "property_buyer_matches": [fresh, stale],
+            "buyer_profiles": [{"id": buyer_id, "org_id": ORG_A, "motivation_score": 8}],
+        }
+
+    async def _run_refresh(
+        self, service: ProspectionService, tables: dict, basis_moved: bool, rpc_error: Exception | None = None,
+        **kwargs
+    ) -> tuple[int, list[RecordingQuery]]:
+        queries: list[RecordingQuery] = []
+
+        def mock_table(name: str):
+            query = RecordingQuery([dict(r) for r in tables.get(name, [])])
+            queries.append(query)
+            return query
+
+        def mock_rpc(fn: str, params: dict):
+            if rpc_error is not None:
+                raise rpc_error
+            query = RecordingQuery([])
+            query.calls.append(("rpc", (fn, params), {}))
+            queries.append(query)
+            return query
+
+        with patch("backend.services.prospection_service.supabase_service") as mock_sb, patch.object(
+            ProspectionService, "_opportunity_columns_ready", return_value=True
+        ), patch.object(ProspectionService, "_table_has_column", return_value=True), patch.object(
+            ProspectionService, "_opportunity_basis_moved", AsyncMock(return_value=basis_moved)
+        ):
+            mock_sb.client.table = mock_table
+            mock_sb.client.rpc = mock_rpc
+            written = await service.refresh_opportunity_scores(ORG_A, **kwargs)
+        return written, queries
+
+    @pytest.mark.asyncio
+    async def test_refresh_writes_only_changed_opportunity_scores(self, service: ProspectionService) -> None:
+        _, tables = self._refresh_tables(service)
+        written, queries = await self._run_refresh(service, tables, basis_moved=False, match_ids=["m2"])
+
+        assert written == 1
+        assert not [c for q in queries for c in q.calls if c[0] in ("upsert", "update")]
+        (rpc,) = [c for q in queries for c in q.calls if c[0] == "rpc"]
+        fn, params = rpc[1]
+        assert fn == "update_match_opportunities" and params["p_org_id"] == ORG_A
+        (row,) = params["p_rows"]
+        # Only the refreshed columns, keyed by id: a stale match_score is never written back.
+        assert set(row) == {"id", "opportunity_score", "priority_band", "opportunity_explanation",
+                            "opportunity_basis", "opportunity_updated_at"}
+        assert row["id"] == "m2"
+        # 0.65 * 60 + 0.20 * 50 + 0.15 * 80
+        assert row["opportunity_score"] == 61.0 and row["priority_band"] == "warm"
+        assert row["opportunity_basis"] == 10000.0
+        assert any(("in_", ("id", ["m2"]), {}) in q.calls for q in queries)
+
+    @pytest.mark.asyncio
+    async def test_refresh_updates_rows_one_by_one_without_bulk_function(self, service: ProspectionService) -> None:
+        _, tables = self._refresh_tables(service)
+        missing = Exception("Could not find the function public.update_match_opportunities")
+        written, queries = await self._run_refresh(
+            service, tables, basis_moved=False, rpc_error=missing, match_ids=["m2"]
+        )
+
+        assert written == 1
+        (write,) = [q for q in queries if any(c[0] == "update" for c in q.calls)]
+        assert ("eq", ("id", "m2"), {}) in write.calls
+
+    @pytest.mark.asyncio
+    async def test_refresh_rescans_org_when_basis_moved(self, service: ProspectionService) -> None:
+        _, tables = self._refresh_tables(service)
+        tables["property_buyer_matches"][0]["opportunity_basis"] = 8000
+
+        written, queries = await self._run_refresh(service, tables, basis_moved=True, match_ids=["m2"])
+
+        assert written == 2
+        assert not any(("in_", ("id", ["m2"]), {}) in q.calls for q in queries)
+
+    def test_recompute_refresh_scopes(self) -> None:
+        scopes = ProspectionService._rescored_scopes
+        assert scopes(None, None, False, {"p1"}, {"b1"}) == [{"property_ids": None, "buyer_ids": None}]
+        assert scopes(["p1"], None, False, set(), set()) == [{"property_ids": ["p1"], "buyer_ids": None}]
+        # Incremental: pairs with a dirty property, then pairs with a dirty buyer.
+        assert scopes(None, None, True, {"p2"}, {"b1"}) == [
+            {"property_ids": ["p2"], "buyer_ids": None},
+            {"property_ids": None, "buyer_ids": ["b1"]},
+        ]
+        assert scopes(["p1"], None, True, {"p1", "p9"}, set()) == [{"property_ids": ["p1"], "buyer_ids": None}]
+        assert scopes(None, None, True, set(), set()) == []
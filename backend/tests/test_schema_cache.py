@@ -0,0 +1,173 @@
+"""
+Unit tests for SchemaCache — shared schema probe cache.
+
+Tests:
+  - Probes are issued once per TTL window
+  - Missing tables/columns are cached as False; transient errors are not cached
+  - Per-org property table resolution and invalidation
+  - Entries are isolated per client
+  - Async probes answer hits inline and run misses on the DB pool
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.services.schema_cache import SchemaCache, is_missing_schema_error
+
+
+class ProbeClient:
+    """Minimal Supabase client double that counts probe round-trips."""
+
+    def __init__(self, tables: dict[str, list[dict]], columns: dict[str, set[str]] | None = None):
+        self.tables = tables
+        self.columns = columns or {}
+        self.calls = 0
+        self.threads: set[str] = set()
+        self.outage = False
+
+    def table(self, name: str) -> "ProbeQuery":
+        return ProbeQuery(self, name)
+
+
+class ProbeQuery:
+    def __init__(self, client: ProbeClient, table: str):
+        self.client = client
+        self.table = table
+        self.column = "id"
+        self.org_id = None
+
+    def select(self, column: str, **kwargs) -> "ProbeQuery":
+        self.column = column
+        return self
+
+    def eq(self, field: str, value) -> "ProbeQuery":
+        self.org_id = value
+        return self
+
+    def limit(self, n: int) -> "ProbeQuery":
+        return self
+
+    def execute(self) -> MagicMock:
+        self.client.calls += 1
+        self.client.threads.add(threading.current_thread().name)
+        if self.client.outage:
+            raise ConnectionError("connection reset by peer")
+        if self.table not in self.client.tables:
+            raise Exception(f"relation {self.table} does not exist")
+        allowed = self.client.columns.get(self.table)
+        if allowed is not None and self.column not in allowed:
+            raise Exception(f"column {self.column} does not exist")
+        rows = self.client.tables[self.table]
+        if self.org_id is not None:
+            rows = [r for r in rows if r.get("org_id") == self.org_id]
+        result = MagicMock()
+        result.data = rows[:1]
+        return result
+
+
+class TestSchemaCache:
+    def test_table_exists_probes_once(self) -> None:
+        cache = SchemaCache(ttl_seconds=60)
+        client = ProbeClient({"leads": []})
+
+        assert cache.table_exists(client, "leads") is True
+        assert cache.table_exists(client, "leads") is True
+        assert cache.table_exists(client, "missing") is False
+        assert cache.table_exists(client, "missing") is False
+        assert client.calls == 2
+        assert cache.stats()["hits"] == 2
+
+    def test_expired_entries_are_reprobed(self) -> None:
+        cache = SchemaCache(ttl_seconds=0)
+        client = ProbeClient({"leads": []})
+
+        cache.table_exists(client, "leads")
+        cache.table_exists(client, "leads")
+        assert client.calls == 2
+
+    def test_table_has_column(self) -> None:
+        cache = SchemaCache(ttl_seconds=60)
+        client = ProbeClient({"properties": []}, columns={"properties": {"id", "status"}})
+
+        assert cache.table_has_column(client, "properties", "status") is True
+        assert cache.table_has_column(client, "properties", "zone") is False
+        cache.table_has_column(client, "properties", "zone")
+        assert client.calls == 2
+
+    def test_transient_errors_are_not_cached(self) -> None:
+        cache = SchemaCache(ttl_seconds=60)
+        client = ProbeClient({"leads": [{"id": "l1", "org_id": "org-a"}]})
+
+        client.outage = True
+        assert cache.table_exists(client, "leads") is False
+        client.outage = False
+        assert cache.table_exists(client, "leads") is True
+        assert client.calls == 2
+
+    def test_missing_schema_error_codes(self) -> None:
+        class APIError(Exception):
+            def __init__(self, code: str, message: str) -> None:
+                super().__init__(message)
+                self.code = code
+                self.message = message
+
+        assert is_missing_schema_error(APIError("42P01", 'relation "feed_runs" does not exist'))
+        assert is_missing_schema_error(APIError("PGRST204", "Could not find the 'zone' column of 'properties'"))
+        assert not is_missing_schema_error(APIError("57014", "canceling statement due to statement timeout"))
+        assert not is_missing_schema_error(TimeoutError("read timed out"))
+
+    def test_property_table_for_org_and_invalidation(self) -> None:
+        cache = SchemaCache(ttl_seconds=60)
+        client = ProbeClient({
+            "properties": [{"id": "p1", "org_id": "org-a"}],
+            "prospected_properties": [{"id": "p2", "org_id": "org-b"}],
+        })
+
+        assert cache.existing_tables(client) == ["properties", "prospected_properties"]
+        assert cache.property_table_for_org(client, "org-b") == "prospected_properties"
+        assert cache.property_table_for_org(client, "org-c") is None
+
+        calls = client.calls
+        assert cache.property_table_for_org(client, "org-b") == "prospected_properties"
+        assert client.calls == calls
+
+        client.tables["properties"].append({"id": "p3", "org_id": "org-c"})
+        cache.invalidate(org_id="org-c")
+        assert cache.property_table_for_org(client, "org-c") == "properties"
+
+    def test_invalidate_table(self) -> None:
+        cache = SchemaCache(ttl_seconds=60)
+        client = ProbeClient({})
+
+        assert cache.table_exists(client, "feed_runs") is False
+        client.tables["feed_runs"] = []
+        cache.invalidate(table="feed_runs")
+        assert cache.table_exists(client, "feed_runs") is True
+
+    def test_entries_isolated_per_client(self) -> None:
+        cache = SchemaCache(ttl_seconds=60)
+        with_table = ProbeClient({"leads": []})
+        without_table = ProbeClient({})
+
+        assert cache.table_exists(with_table, "leads") is True
+        assert cache.table_exists(without_table, "leads") is False
+
+    @pytest.mark.asyncio
+    async def test_async_probes_run_off_the_event_loop(self) -> None:
+        cache = SchemaCache(ttl_seconds=60)
+        client = ProbeClient(
+            {"properties": [{"id": "p1", "org_id": "org-a"}]}, columns={"properties": {"id", "status"}}
+        )
+
+        assert await cache.existing_tables_async(client) == ["properties"]
+        assert await cache.table_has_column_async(client, "properties", "zone") is False
+        assert await cache.property_table_for_org_async(client, "org-a") == "properties"
+        assert threading.current_thread().name not in client.threads
+
+        calls = client.calls
+        assert await cache.table_exists_async(client, "properties") is True
+        assert await cache.table_has_column_async(client, "properties", "zone") is False
+        assert client.calls == calls
+        assert cache.stats()["misses"] == 4
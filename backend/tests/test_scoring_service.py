@@ -8,6 +8,7 @@ Tests:
   - Breakdown has expected keys
   - Edge cases: None inputs, extreme values
   - Weight distribution matches spec v1
+  - CompiledMatchScorer reproduces the per-factor spec formula; compute_match_score delegates to it
 """
 
 import pytest
@@ -20,6 +21,10 @@ from backend.services.scoring_service import (
     LIQUIDITY_SCORES,
     PROPERTY_TYPE_QUALITY,
     ZONE_PREMIUM_SCORES,
+    BuyerCandidateIndex,
+    BuyerFeatures,
+    CompiledMatchScorer,
+    PropertyFeatures,
     ScoringService,
 )
 
@@ -385,3 +390,122 @@ class TestScoreBounds:
         }
         result = ScoringService.compute_match_score(prop, buyer)
         assert 0 <= result.score <= 100
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BUYER CANDIDATE INDEX
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestBuyerCandidateIndex:
+    """Blocking index must never drop a buyer that reaches the score floor."""
+
+    ZONES = ["Andratx", "Calvià", "Son Vida", None]
+    TYPES = ["villa", "apartment", "finca", None]
+
+    def _buyers(self) -> list[dict]:
+        buyers = []
+        for i, b_max in enumerate([400_000, 900_000, 1_500_000, 3_000_000, 6_000_000, None]):
+            for zones in (["Andratx"], ["Son Vida", "Calvià"], []):
+                for types in (["villa"], ["apartment", "finca"], []):
+                    buyers.append({
+                        "id": f"b-{len(buyers)}",
+                        "budget_min": (b_max or 2_000_000) * 0.5,
+                        "budget_max": b_max,
+                        "preferred_zones": zones,
+                        "preferred_types": types,
+                        "purchase_horizon": "immediate" if i % 2 else None,
+                        "motivation_score": 40 + i * 10,
+                    })
+        return buyers
+
+    @pytest.mark.parametrize("min_score", [40.0, 55.0, 70.0])
+    @pytest.mark.parametrize("price", [None, 300_000, 1_200_000, 5_000_000])
+    def test_pruned_buyers_stay_below_min_score(self, price, min_score: float) -> None:
+        buyers = self._buyers()
+        index = BuyerCandidateIndex(buyers)
+        for zone in self.ZONES:
+            for ptype in self.TYPES:
+                prop = {"price": price, "zone": zone, "property_type": ptype}
+                kept = set(index.candidate_positions(prop, min_score))
+                for pos, buyer in enumerate(buyers):
+                    if pos in kept:
+                        continue
+                    score = ScoringService.compute_match_score(prop, buyer).score
+                    assert score < min_score, (prop, buyer, score)
+
+    def test_prunes_implausible_buyers(self) -> None:
+        buyers = self._buyers()
+        index = BuyerCandidateIndex(buyers)
+        prop = {"price": 5_000_000, "zone": "Andratx", "property_type": "villa"}
+        kept = index.candidate_positions(prop, 60.0)
+        assert 0 < len(kept) < len(buyers)
+
+    def test_no_min_score_keeps_every_buyer(self) -> None:
+        buyers = self._buyers()
+        index = BuyerCandidateIndex(buyers)
+        prop = {"price": 1_000_000, "zone": "Andratx", "property_type": "villa"}
+        assert index.candidate_positions(prop) == list(range(len(buyers)))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# COMPILED MATCH SCORER
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class TestCompiledMatchScorer:
+    """Compiled pair scores must follow the spec v1 factors, breakdown included."""
+
+    PROPERTIES = [
+        {"price": price, "zone": zone, "property_type": ptype}
+        for price in (None, 0, 450_000, 1_000_000, 1_650_000.5, 3_000_000, "2500000")
+        for zone in ("Andratx", "Son Vida", "", None)
+        for ptype in ("Villa", "apartment", "", None)
+    ]
+
+    BUYERS = [
+        {
+            "budget_min": b_min,
+            "budget_max": b_max,
+            "preferred_zones": zones,
+            "preferred_types": types,
+            "purchase_horizon": horizon,
+            "motivation_score": motivation,
+        }
+        for b_min, b_max in ((None, None), (0, 0), (1_000_000, 1_000_000), (800_000, 2_000_000), (1_500_000, None))
+        for zones in (["Andratx"], [], None)
+        for types in (["villa", "Finca"], [], None)
+        for horizon, motivation in (("immediate", 95), ("12+ months", None), (None, 140), ("unknown", -5))
+    ]
+
+    @staticmethod
+    def _reference(prop: dict, buyer: dict) -> tuple[float, dict]:
+        """Spec v1 match_score from the per-factor helpers applied to the raw dicts."""
+        weighted = {
+            "budget": ScoringService._score_budget_fit(prop["price"], buyer["budget_min"], buyer["budget_max"]) * 0.35,
+            "zone": ScoringService._score_zone_overlap(prop["zone"], buyer["preferred_zones"] or []) * 0.25,
+            "type": ScoringService._score_type_fit(prop["property_type"], buyer["preferred_types"] or []) * 0.20,
+            "horizon": ScoringService._score_horizon(buyer["purchase_horizon"]) * 0.10,
+            "motivation": min(100.0, max(0.0, float(buyer["motivation_score"] or 50.0))) * 0.10,
+        }
+        total = min(100.0, max(0.0, sum(weighted.values())))
+        return round(total, 2), {key: round(value, 2) for key, value in weighted.items()}
+
+    def test_matches_reference_scoring(self) -> None:
+        buyers = CompiledMatchScorer.compile_buyers(self.BUYERS)
+        for prop in self.PROPERTIES:
+            compiled = CompiledMatchScorer.compile_property(prop)
+            for buyer, features in zip(self.BUYERS, buyers):
+                assert CompiledMatchScorer.score_pair(compiled, features) == self._reference(prop, buyer), (prop, buyer)
+
+    def test_compute_match_score_delegates_to_compiled_scorer(self) -> None:
+        prop, buyer = self.PROPERTIES[17], self.BUYERS[-1]
+        expected = CompiledMatchScorer.score(PropertyFeatures(prop), BuyerFeatures(buyer))
+        assert ScoringService.compute_match_score(prop, buyer) == expected
+
+    def test_score_pair_returns_plain_values(self) -> None:
+        prop = CompiledMatchScorer.compile_property({"price": 1_500_000, "zone": "Andratx", "property_type": "villa"})
+        (buyer,) = CompiledMatchScorer.compile_buyers([self.BUYERS[-1]])
+        score, breakdown = CompiledMatchScorer.score_pair(prop, buyer)
+        assert isinstance(score, float)
+        assert set(breakdown) == {"budget", "zone", "type", "horizon", "motivation"}
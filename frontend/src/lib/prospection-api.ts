@@ -87,6 +87,7 @@ export interface PaginatedResponse<T> {
   total: number
   limit: number
   offset: number
+  next_cursor?: string | null
 }
 
 export interface RecomputeResult {
@@ -197,6 +198,7 @@ export async function listProperties(params?: {
   min_score?: number
   limit?: number
   offset?: number
+  cursor?: string
 }): Promise<PaginatedResponse<ProspectedProperty>> {
   const query = new URLSearchParams()
   if (params?.zone) query.set('zone', params.zone)
@@ -204,6 +206,7 @@ export async function listProperties(params?: {
   if (params?.min_score !== undefined) query.set('min_score', String(params.min_score))
   if (params?.limit) query.set('limit', String(params.limit))
   if (params?.offset) query.set('offset', String(params.offset))
+  if (params?.cursor) query.set('cursor', params.cursor)
   const qs = query.toString()
   return apiRequest(`/api/prospection/properties${qs ? `?${qs}` : ''}`)
 }
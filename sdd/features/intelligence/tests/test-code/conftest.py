@@ -20,6 +20,18 @@ from backend.intelligence.intelligence_types import (
     SynthesizerOutput, Meta, PlanView, Trace, EvidenceView, EvidenceStatus, MetaVersion, RiskSummary
 )
 
+# --- Audit sink isolation ---
+
+@pytest.fixture(autouse=True)
+def isolated_audit_sink(tmp_path, monkeypatch):
+    """Spool write-behind audit records under tmp_path and stop the sink after each test."""
+    monkeypatch.setenv("AUDIT_SPOOL_DIR", str(tmp_path / "audit-spool"))
+    yield
+    from backend.intelligence import audit_sink
+    if audit_sink._audit_sink is not None:
+        audit_sink._audit_sink.close(timeout=5)
+        audit_sink._audit_sink = None
+
 # --- Service Mocks ---
 
 @pytest.fixture
@@ -7,7 +7,9 @@ from backend.intelligence.intelligence_types import (
 )
 
 @pytest.fixture
-def orchestrator():
+def orchestrator(monkeypatch):
+    # These cases cover the inline (synchronous) audit save path
+    monkeypatch.setenv("INTELLIGENCE_AUDIT_WRITE_BEHIND", "0")
     # Patch get_db_service to avoid real DB connection during init
     with patch("backend.intelligence.orchestrator.orchestrator.get_db_service") as mock_db:
         mock_db_instance = mock_db.return_value
@@ -225,6 +227,17 @@ async def test_process_query_empty_message(orchestrator, sample_query_plan):
     with patch("backend.intelligence.orchestrator.orchestrator.get_db_service"):
         orchestrator.process_query("")
 
+def test_save_audit_transaction_write_behind_is_pending(orchestrator, monkeypatch):
+    """With write-behind on, the audit id is reported as pending until the sink commits it."""
+    monkeypatch.setenv("INTELLIGENCE_AUDIT_WRITE_BEHIND", "1")
+    with patch("backend.intelligence.orchestrator.orchestrator.get_audit_sink") as mock_sink:
+        mock_sink.return_value.submit.side_effect = lambda record: record["id"]
+        res = {"correlation_id": "1", "user_id": "u", "message": "m", "processing_status": "s", "query_plan": None, "governor_decision": None, "synthesizer_output": None, "execution_times": {}}
+        audit_id = orchestrator._save_audit_transaction(res)
+        assert audit_id.startswith("PENDING:")
+        assert uuid.UUID(audit_id.split(":", 1)[1])
+        mock_sink.return_value.submit.assert_called_once()
+
 def test_create_orchestrator_factory():
     orch = create_orchestrator("2.0")
     assert orch.strategic_mode_version == "2.0"
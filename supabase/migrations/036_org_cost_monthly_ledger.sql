@@ -0,0 +1,107 @@
+-- ============================================================
+-- 036_org_cost_monthly_ledger.sql
+-- Feature: ANCLORA-CGF-001 Cost Governance Foundation
+-- Purpose: Pre-aggregated monthly usage totals per organization so budget
+--          checks read one row instead of scanning raw usage events.
+-- ============================================================
+
+BEGIN;
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 1. Monthly Cost Ledger
+-- ─────────────────────────────────────────────────────────────────────────────
+CREATE TABLE IF NOT EXISTS org_cost_monthly_ledger (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    org_id UUID NOT NULL REFERENCES organizations(id),
+    month_key TEXT NOT NULL, -- Format YYYY-MM (UTC)
+    total_cost_eur NUMERIC(16,6) NOT NULL DEFAULT 0,
+    event_count INTEGER NOT NULL DEFAULT 0,
+    reconciled_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+
+    CONSTRAINT uq_org_cost_monthly_ledger_org_month UNIQUE (org_id, month_key),
+    CONSTRAINT chk_ledger_total_positive CHECK (total_cost_eur >= 0)
+);
+
+COMMENT ON TABLE org_cost_monthly_ledger IS 'Running monthly cost totals per organization, maintained on usage event insert';
+
+-- RLS
+ALTER TABLE org_cost_monthly_ledger ENABLE ROW LEVEL SECURITY;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_policies
+        WHERE tablename = 'org_cost_monthly_ledger' AND policyname = 'org_cost_monthly_ledger_select_members'
+    ) THEN
+        CREATE POLICY "org_cost_monthly_ledger_select_members" ON org_cost_monthly_ledger
+            FOR SELECT
+            USING (
+                org_id IN (
+                    SELECT org_id FROM organization_members
+                    WHERE user_id = auth.uid()
+                    AND status = 'active'
+                )
+            );
+    END IF;
+END
+$$;
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 2. Incremental maintenance
+-- Runs in the same transaction as the usage event insert, so concurrent
+-- log_usage_event calls cannot lose increments.
+-- ─────────────────────────────────────────────────────────────────────────────
+CREATE OR REPLACE FUNCTION increment_org_cost_monthly_ledger()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    INSERT INTO org_cost_monthly_ledger (org_id, month_key, total_cost_eur, event_count, updated_at)
+    VALUES (
+        NEW.org_id,
+        to_char(NEW.created_at AT TIME ZONE 'UTC', 'YYYY-MM'),
+        NEW.cost_eur,
+        1,
+        now()
+    )
+    ON CONFLICT (org_id, month_key) DO UPDATE
+        SET total_cost_eur = org_cost_monthly_ledger.total_cost_eur + EXCLUDED.total_cost_eur,
+            event_count = org_cost_monthly_ledger.event_count + 1,
+            updated_at = now();
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_org_cost_usage_events_ledger ON org_cost_usage_events;
+CREATE TRIGGER trg_org_cost_usage_events_ledger
+    AFTER INSERT ON org_cost_usage_events
+    FOR EACH ROW
+    EXECUTE FUNCTION increment_org_cost_monthly_ledger();
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 3. Backfill from raw events
+-- ─────────────────────────────────────────────────────────────────────────────
+INSERT INTO org_cost_monthly_ledger (org_id, month_key, total_cost_eur, event_count, reconciled_at)
+SELECT
+    org_id,
+    to_char(created_at AT TIME ZONE 'UTC', 'YYYY-MM'),
+    SUM(cost_eur),
+    COUNT(*),
+    now()
+FROM org_cost_usage_events
+GROUP BY org_id, to_char(created_at AT TIME ZONE 'UTC', 'YYYY-MM')
+ON CONFLICT (org_id, month_key) DO UPDATE
+    SET total_cost_eur = EXCLUDED.total_cost_eur,
+        event_count = EXCLUDED.event_count,
+        reconciled_at = EXCLUDED.reconciled_at,
+        updated_at = now();
+
+COMMIT;
+
+-- ============================================================
+-- ROLLBACK (uncomment to revert):
+-- DROP TRIGGER IF EXISTS trg_org_cost_usage_events_ledger ON org_cost_usage_events;
+-- DROP FUNCTION IF EXISTS increment_org_cost_monthly_ledger();
+-- DROP TABLE IF EXISTS org_cost_monthly_ledger;
+-- ============================================================
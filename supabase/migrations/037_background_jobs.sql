@@ -0,0 +1,72 @@
+-- ============================================================
+-- 037_background_jobs.sql
+-- Feature: Background job queue
+-- Purpose: Persisted state for long-running jobs (match/DQ recompute, feed
+--          publishing, weekly skills) so status, progress and cancellation
+--          survive across API workers.
+-- ============================================================
+
+BEGIN;
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 1. Jobs
+-- ─────────────────────────────────────────────────────────────────────────────
+CREATE TABLE IF NOT EXISTS background_jobs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    org_id UUID NOT NULL REFERENCES organizations(id),
+    job_type TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    params JSONB NOT NULL DEFAULT '{}'::jsonb,
+    progress NUMERIC(5,4) NOT NULL DEFAULT 0,
+    progress_message TEXT,
+    result JSONB,
+    error TEXT,
+    cancel_requested BOOLEAN NOT NULL DEFAULT false,
+    requested_by UUID,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    started_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+
+    CONSTRAINT chk_background_jobs_status CHECK (status IN ('queued', 'running', 'succeeded', 'failed', 'cancelled')),
+    CONSTRAINT chk_background_jobs_progress CHECK (progress >= 0 AND progress <= 1)
+);
+
+COMMENT ON TABLE background_jobs IS 'Long-running background jobs with progress and cancellation state';
+
+-- At most one active job per organization and job type.
+CREATE UNIQUE INDEX IF NOT EXISTS uq_background_jobs_active
+    ON background_jobs (org_id, job_type)
+    WHERE status IN ('queued', 'running');
+
+CREATE INDEX IF NOT EXISTS idx_background_jobs_org_created
+    ON background_jobs (org_id, created_at DESC);
+
+-- RLS
+ALTER TABLE background_jobs ENABLE ROW LEVEL SECURITY;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_policies
+        WHERE tablename = 'background_jobs' AND policyname = 'background_jobs_select_members'
+    ) THEN
+        CREATE POLICY "background_jobs_select_members" ON background_jobs
+            FOR SELECT
+            USING (
+                org_id IN (
+                    SELECT org_id FROM organization_members
+                    WHERE user_id = auth.uid()
+                    AND status = 'active'
+                )
+            );
+    END IF;
+END
+$$;
+
+COMMIT;
+
+-- ============================================================
+-- ROLLBACK (uncomment to revert):
+-- DROP TABLE IF EXISTS background_jobs;
+-- ============================================================
@@ -0,0 +1,86 @@
+-- ============================================================
+-- 038_match_opportunity_scores.sql
+-- Feature: ANCLORA-PBM-001 — Opportunity ranking
+-- Purpose: Persist the composite opportunity score (65% match score,
+--          20% normalized commission, 15% buyer motivation), its priority
+--          band and explanation on each match so the ranking endpoint is an
+--          indexed ORDER BY opportunity_score DESC LIMIT k.
+-- ============================================================
+
+BEGIN;
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 1. Columns
+-- ─────────────────────────────────────────────────────────────────────────────
+ALTER TABLE property_buyer_matches
+    ADD COLUMN IF NOT EXISTS opportunity_score NUMERIC(5,2),
+    ADD COLUMN IF NOT EXISTS priority_band TEXT,
+    ADD COLUMN IF NOT EXISTS opportunity_explanation JSONB,
+    ADD COLUMN IF NOT EXISTS opportunity_updated_at TIMESTAMPTZ;
+
+ALTER TABLE property_buyer_matches
+    DROP CONSTRAINT IF EXISTS chk_pbm_opportunity_score_range;
+ALTER TABLE property_buyer_matches
+    ADD CONSTRAINT chk_pbm_opportunity_score_range
+    CHECK (opportunity_score IS NULL OR (opportunity_score >= 0 AND opportunity_score <= 100));
+
+ALTER TABLE property_buyer_matches
+    DROP CONSTRAINT IF EXISTS chk_pbm_priority_band;
+ALTER TABLE property_buyer_matches
+    ADD CONSTRAINT chk_pbm_priority_band
+    CHECK (priority_band IS NULL OR priority_band IN ('hot', 'warm', 'cold'));
+
+COMMENT ON COLUMN property_buyer_matches.opportunity_score IS 'Precomputed commercial opportunity score, refreshed when match, commission or buyer motivation change';
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 2. Ranking index
+-- ─────────────────────────────────────────────────────────────────────────────
+CREATE INDEX IF NOT EXISTS idx_pbm_org_opportunity
+    ON property_buyer_matches (org_id, opportunity_score DESC NULLS LAST, id);
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 3. Backfill scores and bands (explanations are written by the backend on
+--    the next refresh)
+-- ─────────────────────────────────────────────────────────────────────────────
+WITH basis AS (
+    SELECT org_id, MAX(commission_estimate) AS max_commission
+    FROM property_buyer_matches
+    WHERE commission_estimate > 0
+    GROUP BY org_id
+), scored AS (
+    SELECT
+        m.id,
+        LEAST(100, ROUND(
+            m.match_score * 0.65
+            + COALESCE(COALESCE(m.commission_estimate, 0) / NULLIF(b.max_commission, 0) * 100, 0) * 0.20
+            + (CASE
+                   WHEN bp.motivation_score > 0 AND bp.motivation_score <= 10 THEN bp.motivation_score * 10
+                   ELSE COALESCE(bp.motivation_score, 0)
+               END) * 0.15,
+            2
+        )) AS score
+    FROM property_buyer_matches m
+    LEFT JOIN basis b ON b.org_id = m.org_id
+    LEFT JOIN buyer_profiles bp ON bp.id = m.buyer_id AND bp.org_id = m.org_id
+)
+UPDATE property_buyer_matches m
+SET opportunity_score = s.score,
+    priority_band = CASE WHEN s.score >= 75 THEN 'hot' WHEN s.score >= 50 THEN 'warm' ELSE 'cold' END,
+    opportunity_updated_at = now()
+FROM scored s
+WHERE s.id = m.id
+  AND m.opportunity_score IS NULL;
+
+COMMIT;
+
+-- ============================================================
+-- ROLLBACK (uncomment to revert):
+-- DROP INDEX IF EXISTS idx_pbm_org_opportunity;
+-- ALTER TABLE property_buyer_matches
+--     DROP CONSTRAINT IF EXISTS chk_pbm_priority_band,
+--     DROP CONSTRAINT IF EXISTS chk_pbm_opportunity_score_range,
+--     DROP COLUMN IF EXISTS opportunity_updated_at,
+--     DROP COLUMN IF EXISTS opportunity_explanation,
+--     DROP COLUMN IF EXISTS priority_band,
+--     DROP COLUMN IF EXISTS opportunity_score;
+-- ============================================================
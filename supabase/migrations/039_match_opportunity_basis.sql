@@ -0,0 +1,23 @@
+-- ============================================================
+-- 039_match_opportunity_basis.sql
+-- Feature: ANCLORA-PBM-001 — Opportunity ranking
+-- Purpose: Record on each match the org-wide max commission its
+--          opportunity score was normalized against, so any worker can tell
+--          whether a scoped refresh is enough or the max has moved and the
+--          whole org must be rescored. Rows written before this migration
+--          keep a NULL basis and are refreshed on the next pass.
+-- ============================================================
+
+BEGIN;
+
+ALTER TABLE property_buyer_matches
+    ADD COLUMN IF NOT EXISTS opportunity_basis NUMERIC(14,2);
+
+COMMENT ON COLUMN property_buyer_matches.opportunity_basis IS 'Max commission_estimate of the org used to normalize opportunity_score';
+
+COMMIT;
+
+-- ============================================================
+-- ROLLBACK (uncomment to revert):
+-- ALTER TABLE property_buyer_matches DROP COLUMN IF EXISTS opportunity_basis;
+-- ============================================================
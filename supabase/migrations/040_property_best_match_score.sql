@@ -0,0 +1,129 @@
+-- ============================================================
+-- 040_property_best_match_score.sql
+-- Feature: ANCLORA-PBM-001 — Prospection listing
+-- Purpose: Precompute, on each property, the best match_score among its
+--          property_buyer_matches rows. The prospection listing then reads
+--          "properties with matches" as one filtered, keyset-paginated query
+--          (best_match_score IS NOT NULL) instead of first loading the org's
+--          match rows and building an IN (...) filter from them.
+-- ============================================================
+
+BEGIN;
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 1. Columns + partial indexes (both property tables)
+-- ─────────────────────────────────────────────────────────────────────────────
+ALTER TABLE properties
+    ADD COLUMN IF NOT EXISTS best_match_score NUMERIC(5,2);
+ALTER TABLE prospected_properties
+    ADD COLUMN IF NOT EXISTS best_match_score NUMERIC(5,2);
+
+COMMENT ON COLUMN properties.best_match_score IS 'Max property_buyer_matches.match_score for this property (NULL = no matches); maintained by trigger';
+COMMENT ON COLUMN prospected_properties.best_match_score IS 'Max property_buyer_matches.match_score for this property (NULL = no matches); maintained by trigger';
+
+CREATE INDEX IF NOT EXISTS idx_properties_org_matched_score
+    ON properties (org_id, high_ticket_score DESC NULLS LAST, id DESC)
+    WHERE best_match_score IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_pp_org_matched_score
+    ON prospected_properties (org_id, high_ticket_score DESC NULLS LAST, id DESC)
+    WHERE best_match_score IS NOT NULL;
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 2. Maintenance: statement-level triggers, so a bulk upsert chunk refreshes
+--    each touched property once
+-- ─────────────────────────────────────────────────────────────────────────────
+CREATE OR REPLACE FUNCTION refresh_property_best_match_score(p_property_ids UUID[])
+RETURNS VOID AS $$
+BEGIN
+    WITH best AS (
+        SELECT ids.property_id, MAX(m.match_score) AS score
+        FROM unnest(p_property_ids) AS ids(property_id)
+        LEFT JOIN property_buyer_matches m ON m.property_id = ids.property_id
+        GROUP BY ids.property_id
+    )
+    UPDATE properties p
+    SET best_match_score = best.score
+    FROM best
+    WHERE p.id = best.property_id
+      AND p.best_match_score IS DISTINCT FROM best.score;
+
+    WITH best AS (
+        SELECT ids.property_id, MAX(m.match_score) AS score
+        FROM unnest(p_property_ids) AS ids(property_id)
+        LEFT JOIN property_buyer_matches m ON m.property_id = ids.property_id
+        GROUP BY ids.property_id
+    )
+    UPDATE prospected_properties p
+    SET best_match_score = best.score
+    FROM best
+    WHERE p.id = best.property_id
+      AND p.best_match_score IS DISTINCT FROM best.score;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION trg_pbm_best_match_score_ins()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM refresh_property_best_match_score(ARRAY(SELECT DISTINCT property_id FROM new_rows));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION trg_pbm_best_match_score_upd()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM refresh_property_best_match_score(ARRAY(
+        SELECT property_id FROM new_rows
+        UNION
+        SELECT property_id FROM old_rows
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION trg_pbm_best_match_score_del()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM refresh_property_best_match_score(ARRAY(SELECT DISTINCT property_id FROM old_rows));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_pbm_best_match_score_ins ON property_buyer_matches;
+CREATE TRIGGER trg_pbm_best_match_score_ins
+    AFTER INSERT ON property_buyer_matches
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION trg_pbm_best_match_score_ins();
+
+DROP TRIGGER IF EXISTS trg_pbm_best_match_score_upd ON property_buyer_matches;
+CREATE TRIGGER trg_pbm_best_match_score_upd
+    AFTER UPDATE ON property_buyer_matches
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION trg_pbm_best_match_score_upd();
+
+DROP TRIGGER IF EXISTS trg_pbm_best_match_score_del ON property_buyer_matches;
+CREATE TRIGGER trg_pbm_best_match_score_del
+    AFTER DELETE ON property_buyer_matches
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION trg_pbm_best_match_score_del();
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 3. Backfill
+-- ─────────────────────────────────────────────────────────────────────────────
+SELECT refresh_property_best_match_score(ARRAY(SELECT DISTINCT property_id FROM property_buyer_matches));
+
+COMMIT;
+
+-- ============================================================
+-- ROLLBACK (uncomment to revert):
+-- DROP TRIGGER IF EXISTS trg_pbm_best_match_score_del ON property_buyer_matches;
+-- DROP TRIGGER IF EXISTS trg_pbm_best_match_score_upd ON property_buyer_matches;
+-- DROP TRIGGER IF EXISTS trg_pbm_best_match_score_ins ON property_buyer_matches;
+-- DROP FUNCTION IF EXISTS trg_pbm_best_match_score_del();
+-- DROP FUNCTION IF EXISTS trg_pbm_best_match_score_upd();
+-- DROP FUNCTION IF EXISTS trg_pbm_best_match_score_ins();
+-- DROP FUNCTION IF EXISTS refresh_property_best_match_score(UUID[]);
+-- DROP INDEX IF EXISTS idx_pp_org_matched_score, idx_properties_org_matched_score;
+-- ALTER TABLE prospected_properties DROP COLUMN IF EXISTS best_match_score;
+-- ALTER TABLE properties DROP COLUMN IF EXISTS best_match_score;
+-- ============================================================
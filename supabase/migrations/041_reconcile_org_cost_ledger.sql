@@ -0,0 +1,60 @@
+-- ============================================================
+-- 041_reconcile_org_cost_ledger.sql
+-- Feature: ANCLORA-CGF-001 Cost Governance Foundation
+-- Purpose: Reconcile a monthly ledger row against raw usage events inside
+--          the database, in one call. The client no longer reads the raw
+--          events (capped at PostgREST max_rows) and writes back a total
+--          that may miss events inserted in between.
+-- ============================================================
+
+BEGIN;
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 1. Reconciliation
+-- The ledger row is locked before the events are summed. Usage inserts that
+-- already bumped it are committed by then and counted by the SUM; later
+-- ones wait on the lock and add their increment after this commits.
+-- ─────────────────────────────────────────────────────────────────────────────
+CREATE OR REPLACE FUNCTION reconcile_org_cost_monthly_ledger(p_org_id UUID, p_month_key TEXT)
+RETURNS TABLE (ledger_total_eur NUMERIC, raw_total_eur NUMERIC, raw_event_count INTEGER)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_start TIMESTAMPTZ := (p_month_key || '-01')::TIMESTAMP AT TIME ZONE 'UTC';
+    v_end TIMESTAMPTZ := ((p_month_key || '-01')::TIMESTAMP + INTERVAL '1 month') AT TIME ZONE 'UTC';
+BEGIN
+    INSERT INTO org_cost_monthly_ledger (org_id, month_key)
+    VALUES (p_org_id, p_month_key)
+    ON CONFLICT (org_id, month_key) DO NOTHING;
+
+    SELECT l.total_cost_eur INTO ledger_total_eur
+    FROM org_cost_monthly_ledger l
+    WHERE l.org_id = p_org_id AND l.month_key = p_month_key
+    FOR UPDATE;
+
+    SELECT COALESCE(SUM(e.cost_eur), 0), COUNT(*)::INTEGER
+    INTO raw_total_eur, raw_event_count
+    FROM org_cost_usage_events e
+    WHERE e.org_id = p_org_id
+      AND e.created_at >= v_start
+      AND e.created_at < v_end;
+
+    UPDATE org_cost_monthly_ledger l
+    SET total_cost_eur = raw_total_eur,
+        event_count = raw_event_count,
+        reconciled_at = now(),
+        updated_at = now()
+    WHERE l.org_id = p_org_id AND l.month_key = p_month_key;
+
+    RETURN NEXT;
+END;
+$$;
+
+COMMENT ON FUNCTION reconcile_org_cost_monthly_ledger(UUID, TEXT) IS 'Overwrite one org/month ledger row with SUM(cost_eur) of its raw usage events; returns the previous and recomputed totals';
+
+COMMIT;
+
+-- ============================================================
+-- ROLLBACK (uncomment to revert):
+-- DROP FUNCTION IF EXISTS reconcile_org_cost_monthly_ledger(UUID, TEXT);
+-- ============================================================
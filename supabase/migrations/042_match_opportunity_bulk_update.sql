@@ -0,0 +1,49 @@
+-- ============================================================
+-- 042_match_opportunity_bulk_update.sql
+-- Feature: ANCLORA-PBM-001 — Opportunity ranking
+-- Purpose: Write refreshed opportunity columns for many matches in one
+--          statement. refresh_opportunity_scores sends a JSON array of
+--          {id, opportunity_*} rows per call instead of one UPDATE per match.
+--          Only existing matches of the org are touched (no insert path), and
+--          match_score / match_status are never written.
+-- ============================================================
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION update_match_opportunities(p_org_id UUID, p_rows JSONB)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_updated INTEGER;
+BEGIN
+    UPDATE property_buyer_matches m
+    SET opportunity_score = r.opportunity_score,
+        priority_band = r.priority_band,
+        opportunity_explanation = r.opportunity_explanation,
+        opportunity_basis = COALESCE(r.opportunity_basis, m.opportunity_basis),
+        opportunity_updated_at = COALESCE(r.opportunity_updated_at, now())
+    FROM jsonb_to_recordset(p_rows) AS r(
+        id UUID,
+        opportunity_score NUMERIC,
+        priority_band TEXT,
+        opportunity_explanation JSONB,
+        opportunity_basis NUMERIC,
+        opportunity_updated_at TIMESTAMPTZ
+    )
+    WHERE m.id = r.id
+      AND m.org_id = p_org_id;
+
+    GET DIAGNOSTICS v_updated = ROW_COUNT;
+    RETURN v_updated;
+END;
+$$;
+
+COMMENT ON FUNCTION update_match_opportunities(UUID, JSONB) IS 'Bulk write of refreshed opportunity columns, keyed by match id within one org';
+
+COMMIT;
+
+-- ============================================================
+-- ROLLBACK (uncomment to revert):
+-- DROP FUNCTION IF EXISTS update_match_opportunities(UUID, JSONB);
+-- ============================================================
@@ -0,0 +1,33 @@
+-- ============================================================
+-- 043_matched_properties_best_score_order.sql
+-- Feature: ANCLORA-PBM-001 — Prospection listing
+-- Purpose: The matched-properties listing now orders and filters by
+--          best_match_score (the score shown for a matched property) rather
+--          than high_ticket_score. Replace the 040 partial indexes so the
+--          keyset page (best_match_score DESC, id DESC) stays an index scan.
+-- ============================================================
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_properties_org_matched_score;
+DROP INDEX IF EXISTS idx_pp_org_matched_score;
+
+CREATE INDEX IF NOT EXISTS idx_properties_org_best_match_score
+    ON properties (org_id, best_match_score DESC, id DESC)
+    WHERE best_match_score IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_pp_org_best_match_score
+    ON prospected_properties (org_id, best_match_score DESC, id DESC)
+    WHERE best_match_score IS NOT NULL;
+
+COMMIT;
+
+-- ============================================================
+-- ROLLBACK (uncomment to revert):
+-- DROP INDEX IF EXISTS idx_pp_org_best_match_score, idx_properties_org_best_match_score;
+-- CREATE INDEX IF NOT EXISTS idx_properties_org_matched_score
+--     ON properties (org_id, high_ticket_score DESC NULLS LAST, id DESC)
+--     WHERE best_match_score IS NOT NULL;
+-- CREATE INDEX IF NOT EXISTS idx_pp_org_matched_score
+--     ON prospected_properties (org_id, high_ticket_score DESC NULLS LAST, id DESC)
+--     WHERE best_match_score IS NOT NULL;
+-- ============================================================
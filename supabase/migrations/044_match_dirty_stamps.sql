@@ -0,0 +1,41 @@
+-- ============================================================
+-- 044_match_dirty_stamps.sql
+-- Feature: ANCLORA-PBM-001 — Incremental match recompute
+-- Purpose: Persist "changed since its last recompute" on property and buyer
+--          rows. Incremental recomputes read match_dirty_at instead of a
+--          per-process set, so marks are shared by every worker and survive
+--          restarts. A recompute resets only the stamps it read, so rows
+--          stamped again mid-run stay dirty. Existing and newly inserted rows
+--          start dirty (DEFAULT now()), so rows written by paths that do not
+--          stamp explicitly (ingestion, imports) are still picked up.
+-- ============================================================
+
+BEGIN;
+
+ALTER TABLE properties
+    ADD COLUMN IF NOT EXISTS match_dirty_at TIMESTAMPTZ DEFAULT now();
+ALTER TABLE prospected_properties
+    ADD COLUMN IF NOT EXISTS match_dirty_at TIMESTAMPTZ DEFAULT now();
+ALTER TABLE buyer_profiles
+    ADD COLUMN IF NOT EXISTS match_dirty_at TIMESTAMPTZ DEFAULT now();
+
+COMMENT ON COLUMN properties.match_dirty_at IS 'Set when the property changed since its last match recompute; NULL once rescored';
+COMMENT ON COLUMN prospected_properties.match_dirty_at IS 'Set when the property changed since its last match recompute; NULL once rescored';
+COMMENT ON COLUMN buyer_profiles.match_dirty_at IS 'Set when the buyer changed since its last match recompute; NULL once rescored';
+
+CREATE INDEX IF NOT EXISTS idx_properties_org_match_dirty
+    ON properties (org_id) WHERE match_dirty_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_pp_org_match_dirty
+    ON prospected_properties (org_id) WHERE match_dirty_at IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_buyer_profiles_org_match_dirty
+    ON buyer_profiles (org_id) WHERE match_dirty_at IS NOT NULL;
+
+COMMIT;
+
+-- ============================================================
+-- ROLLBACK (uncomment to revert):
+-- DROP INDEX IF EXISTS idx_properties_org_match_dirty, idx_pp_org_match_dirty, idx_buyer_profiles_org_match_dirty;
+-- ALTER TABLE buyer_profiles DROP COLUMN IF EXISTS match_dirty_at;
+-- ALTER TABLE prospected_properties DROP COLUMN IF EXISTS match_dirty_at;
+-- ALTER TABLE properties DROP COLUMN IF EXISTS match_dirty_at;
+-- ============================================================